@@ -0,0 +1,123 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Compares the offline feature retrieval engines ("local" - pandas, and "arrow" - an acero plan) on two parquet
+# feature sets: a plain join, a selective query with order_by, and a join written to a parquet file.
+# Run from the repository root:
+#   PYTHONPATH=. python hack/benchmarks/feature_store_retrieval_benchmark.py [rows]
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+import mlrun.feature_store as fstore
+from mlrun.feature_store.retrieval import ArrowFeatureMerger, LocalFeatureMerger
+from mlrun.features import Feature
+from mlrun.model import DataTarget
+
+num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+num_tickers = 10_000
+
+
+def generate_feature_sets(path: str) -> dict:
+    rng = np.random.default_rng(0)
+    stocks = pd.DataFrame(
+        {
+            "ticker": [f"t{index}" for index in range(num_tickers)],
+            "name": [f"name{index}" for index in range(num_tickers)],
+            "exchange": rng.choice(["NYSE", "NASDAQ"], num_tickers),
+        }
+    )
+    quotes = pd.DataFrame(
+        {
+            "ticker": pd.Series(rng.integers(0, num_tickers, num_rows)).map(
+                lambda index: f"t{index}"
+            ),
+            "time": pd.Timestamp("2024-01-01")
+            + pd.to_timedelta(rng.integers(0, 365 * 24 * 3600, num_rows), unit="s"),
+            "price": rng.uniform(0, 100, num_rows),
+            "volume": rng.integers(0, 1000, num_rows),
+        }
+    )
+
+    feature_sets = {}
+    for name, df, timestamp_key in [
+        ("stocks", stocks, None),
+        ("quotes", quotes, "time"),
+    ]:
+        feature_set = fstore.FeatureSet(
+            name, entities=["ticker"], timestamp_key=timestamp_key
+        )
+        for column in df.columns:
+            if column not in ["ticker", timestamp_key]:
+                feature_set.add_feature(Feature(name=column))
+        target_path = os.path.join(path, f"{name}.parquet")
+        df.to_parquet(target_path, index=False)
+        feature_set.status.update_target(
+            DataTarget(kind="parquet", name="parquet", path=target_path)
+        )
+        feature_sets[name] = feature_set
+    return feature_sets
+
+
+def get_offline_features(merger_class, feature_sets, **kwargs):
+    vector = fstore.FeatureVector(
+        "vector", ["stocks.name", "stocks.exchange", "quotes.*"]
+    )
+    # the feature sets are not stored in the DB, hand them to the vector directly
+    vector.feature_set_objects = dict(feature_sets)
+    return merger_class(vector).start(**kwargs)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as path:
+        feature_sets = generate_feature_sets(path)
+        scenarios = {
+            "join": lambda response: response.to_dataframe(),
+            "query + order_by": lambda response: response.to_dataframe(),
+            "join to parquet": lambda response: response.to_parquet(
+                os.path.join(path, "result.parquet")
+            ),
+        }
+        scenario_args = {
+            "query + order_by": {
+                "query": "exchange == 'NYSE' and price > 99",
+                "order_by": "price",
+            },
+        }
+
+        print(f"{'scenario':<20} {'local (s)':>10} {'arrow (s)':>10}")
+        for name, consume in scenarios.items():
+            durations = []
+            for merger_class in [LocalFeatureMerger, ArrowFeatureMerger]:
+                start = time.perf_counter()
+                consume(
+                    get_offline_features(
+                        merger_class, feature_sets, **scenario_args.get(name, {})
+                    )
+                )
+                durations.append(time.perf_counter() - start)
+            print(f"{name:<20} {durations[0]:>10.2f} {durations[1]:>10.2f}")
+        print(
+            f"arrow memory pool peak: {pa.default_memory_pool().max_memory() / 2**20:,.0f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
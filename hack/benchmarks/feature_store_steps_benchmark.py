@@ -0,0 +1,109 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Measures the rows per second of each of the feature set transformation steps (mlrun.feature_store.steps) - for the
+# pandas engine (a dataframe per call) and for the storey engine (an event per call).
+# Run from the repository root:
+#   PYTHONPATH=. python hack/benchmarks/feature_store_steps_benchmark.py [pandas rows] [storey events]
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from mlrun.feature_store.steps import (
+    DateExtractor,
+    DropFeatures,
+    Imputer,
+    MapValues,
+    OneHotEncoder,
+)
+
+num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+num_events = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+num_categories = 50
+
+
+def generate_data(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    income = rng.uniform(0, 100_000, rows)
+    income[rng.random(rows) < 0.05] = np.nan
+    return pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "age": rng.uniform(0, 100, rows),
+            "income": income,
+            "department": rng.choice(["IT", "RD", "Marketing", "HR", "Sales"], rows),
+            "category": rng.integers(0, num_categories, rows),
+            "gender": rng.choice(["male", "female"], rows),
+            "timestamp": pd.Timestamp("2024-01-01")
+            + pd.to_timedelta(rng.integers(0, 365 * 24 * 3600, rows), unit="s"),
+        }
+    )
+
+
+def get_steps() -> dict:
+    return {
+        "MapValues (values)": lambda: MapValues(
+            mapping={"department": {"IT": 1, "RD": 2, "Marketing": 3}}
+        ),
+        "MapValues (ranges)": lambda: MapValues(
+            mapping={
+                "age": {
+                    "ranges": {
+                        "child": [0, 18],
+                        "adult": [18.000001, 65],
+                        "senior": [65.000001, "inf"],
+                    }
+                }
+            }
+        ),
+        "Imputer": lambda: Imputer(mapping={"income": 0}),
+        "OneHotEncoder": lambda: OneHotEncoder(
+            mapping={
+                "category": list(range(num_categories)),
+                "gender": ["male", "female"],
+            }
+        ),
+        "DateExtractor": lambda: DateExtractor(
+            parts=["hour", "day_of_week"], timestamp_col="timestamp"
+        ),
+        "DropFeatures": lambda: DropFeatures(features=["gender"]),
+    }
+
+
+def main():
+    df = generate_data(num_rows)
+    events = generate_data(num_events).to_dict(orient="records")
+
+    print(f"{'step':<20} {'pandas rows/s':>15} {'storey events/s':>17}")
+    for name, create_step in get_steps().items():
+        step = create_step()
+        event = df.copy()
+        start = time.perf_counter()
+        step._do_pandas(event)
+        pandas_rate = num_rows / (time.perf_counter() - start)
+
+        step = create_step()
+        start = time.perf_counter()
+        for event in events:
+            step._do_storey(dict(event))
+        storey_rate = num_events / (time.perf_counter() - start)
+
+        print(f"{name:<20} {pandas_rate:>15,.0f} {storey_rate:>17,.0f}")
+
+
+if __name__ == "__main__":
+    main()
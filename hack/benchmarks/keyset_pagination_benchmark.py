@@ -0,0 +1,104 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Measures the latency of retrieving the N-th page of list runs with offset/limit pagination compared to keyset
+# (cursor) pagination.
+# Run from the repository root:
+#   PYTHONPATH=.:server/py python hack/benchmarks/keyset_pagination_benchmark.py
+
+import statistics
+import tempfile
+import time
+
+import mlrun
+from mlrun.common.db.sql_session import _init_engine, create_session
+
+from framework.db.init_db import init_db
+from framework.db.sqldb.db import SQLDB
+from framework.db.sqldb.helpers import KeysetPage
+
+project = "benchmark"
+num_runs = 50000
+page_size = 200
+measured_pages = [1, 10, 50, 100, 200]
+repetitions = 20
+
+
+def main():
+    db_file = tempfile.NamedTemporaryFile(suffix="-mlrun.db")
+    mlrun.mlconf.httpdb.dsn = f"sqlite:///{db_file.name}?check_same_thread=false"
+    _init_engine()
+    init_db()
+    session = create_session()
+    db = SQLDB(mlrun.mlconf.httpdb.dsn)
+
+    print(f"Populating {num_runs} runs")
+    for i in range(num_runs):
+        db.store_run(
+            session,
+            {"metadata": {"name": f"run-{i}"}, "status": {"state": "completed"}},
+            f"uid-{i}",
+            project,
+        )
+
+    # collect the cursor of each page by iterating the pages once
+    cursors = {1: None}
+    keyset_page = KeysetPage()
+    for page in range(1, max(measured_pages)):
+        db.list_runs(
+            session,
+            project=project,
+            limit=page_size,
+            keyset_page=keyset_page,
+        )
+        keyset_page = KeysetPage(after=keyset_page.row_keys[-1])
+        cursors[page + 1] = keyset_page.after
+
+    for page in measured_pages:
+        offset = (page - 1) * page_size
+        _benchmark(
+            f"page {page} (offset)",
+            lambda: db.list_runs(
+                session, project=project, offset=offset, limit=page_size + 1
+            ),
+        )
+        _benchmark(
+            f"page {page} (keyset)",
+            lambda: db.list_runs(
+                session,
+                project=project,
+                offset=offset,
+                limit=page_size + 1,
+                keyset_page=KeysetPage(after=cursors[page]),
+            ),
+        )
+
+    session.close()
+
+
+def _benchmark(title, query):
+    latencies = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        query()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    print(
+        f"{title}: median={statistics.median(latencies):.2f}ms "
+        f"max={max(latencies):.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Measures the log calls per second of each formatter kind - for a disabled level, for an enabled level written
+# synchronously, and for an enabled level written by the queue handler (mlrun.mlconf.log_queue).
+# Run from the repository root:
+#   PYTHONPATH=. python hack/benchmarks/logger_benchmark.py
+
+import os
+import time
+
+from mlrun.utils.logger import FormatterKinds, LazyField, create_logger
+
+num_calls = 20_000
+# a typical model monitoring event
+event = {
+    "endpoint_id": "0123456789abcdef",
+    "timestamp": "2024-01-01 00:00:00.000000+00:00",
+    "features": [float(i) for i in range(20)],
+    "named_features": {f"f{i}": float(i) for i in range(20)},
+    "labels": {"env": "benchmark"},
+}
+
+
+def main():
+    with open(os.devnull, "w") as stream:
+        for formatter_kind in FormatterKinds:
+            logger = create_logger(
+                level="info",
+                formatter_kind=formatter_kind.name,
+                name=f"benchmark-{formatter_kind.value}",
+                stream=stream,
+                non_blocking=False,
+            )
+            disabled = _benchmark(lambda: logger.debug("Mapped event", event=event))
+            # a field that is expensive to compute - computed eagerly, or only when the line is emitted
+            disabled_eager = _benchmark(
+                lambda: logger.debug("Mapped event", event=str(event))
+            )
+            disabled_lazy = _benchmark(
+                lambda: logger.debug(
+                    "Mapped event", event=LazyField(lambda: str(event))
+                )
+            )
+            enabled = _benchmark(lambda: logger.info("Mapped event", event=event))
+
+            queue_handler = logger.set_queue_handler(max_size=num_calls)
+            enabled_queued = _benchmark(
+                lambda: logger.info("Mapped event", event=event)
+            )
+            queue_handler.close()
+
+            print(
+                f"{formatter_kind.value}: disabled={disabled:,.0f}/s "
+                f"disabled (eager field)={disabled_eager:,.0f}/s "
+                f"disabled (lazy field)={disabled_lazy:,.0f}/s enabled={enabled:,.0f}/s "
+                f"enabled (queue)={enabled_queued:,.0f}/s "
+                f"(dropped {queue_handler.dropped})"
+            )
+
+
+def _benchmark(log) -> float:
+    start = time.perf_counter()
+    for _ in range(num_calls):
+        log()
+    return num_calls / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Measures the throughput and latency of the ONNX model server under concurrent requests - a single session (the
+# default), and a pool of sessions with tuned threads, IO binding and batching of concurrent requests.
+# Requires onnx and onnxruntime. Run from the repository root:
+#   PYTHONPATH=. python hack/benchmarks/onnx_serving_benchmark.py
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import onnx
+from onnx import TensorProto, helper, numpy_helper
+
+from mlrun.frameworks.onnx import ONNXModelServer
+
+num_features = 300
+hidden_size = 512
+num_classes = 10
+rows_per_request = 4
+num_requests = 2_000
+concurrency = 16
+cores = os.cpu_count() or 1
+
+
+def build_model() -> onnx.ModelProto:
+    """A two layers MLP with a dynamic batch dimension"""
+    rng = np.random.default_rng(0)
+    w1 = rng.standard_normal((num_features, hidden_size), dtype=np.float32)
+    w2 = rng.standard_normal((hidden_size, num_classes), dtype=np.float32)
+    graph = helper.make_graph(
+        nodes=[
+            helper.make_node("MatMul", ["x", "w1"], ["h"]),
+            helper.make_node("Relu", ["h"], ["a"]),
+            helper.make_node("MatMul", ["a", "w2"], ["y"]),
+        ],
+        name="benchmark",
+        inputs=[
+            helper.make_tensor_value_info(
+                "x", TensorProto.FLOAT, ["batch", num_features]
+            )
+        ],
+        outputs=[
+            helper.make_tensor_value_info(
+                "y", TensorProto.FLOAT, ["batch", num_classes]
+            )
+        ],
+        initializer=[
+            numpy_helper.from_array(w1, "w1"),
+            numpy_helper.from_array(w2, "w2"),
+        ],
+    )
+    return helper.make_model(graph)
+
+
+def benchmark(server: ONNXModelServer) -> tuple[float, float, float]:
+    server.load()
+    requests = [
+        {"inputs": [np.random.rand(rows_per_request, num_features).astype(np.float32)]}
+        for _ in range(num_requests)
+    ]
+
+    def predict(request: dict) -> float:
+        start = time.perf_counter()
+        server.predict(request)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = np.array(list(executor.map(predict, requests)))
+    elapsed = time.perf_counter() - start
+    return (
+        num_requests / elapsed,
+        np.percentile(latencies, 50) * 1000,
+        np.percentile(latencies, 99) * 1000,
+    )
+
+
+def main():
+    model = build_model()
+    sessions = max(cores // 2, 1)
+    servers = {
+        "single session": ONNXModelServer(
+            name="benchmark",
+            model=model,
+            model_name="benchmark",
+            execution_providers=["CPUExecutionProvider"],
+        ),
+        "pool + io binding + batching": ONNXModelServer(
+            name="benchmark",
+            model=model,
+            model_name="benchmark",
+            execution_providers=["CPUExecutionProvider"],
+            sessions=sessions,
+            intra_op_num_threads=max(cores // sessions, 1),
+            inter_op_num_threads=1,
+            io_binding=True,
+            max_batch_size=8,
+            batch_timeout_ms=1,
+        ),
+    }
+    print(
+        f"{num_requests} requests of {rows_per_request}x{num_features}, "
+        f"{concurrency} concurrent clients, {cores} cores"
+    )
+    for name, server in servers.items():
+        throughput, p50, p99 = benchmark(server)
+        print(
+            f"{name}: {throughput:,.0f} requests/s, latency p50={p50:.2f}ms p99={p99:.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
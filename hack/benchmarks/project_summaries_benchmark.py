@@ -0,0 +1,130 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Measures the latency of calculating the project summaries counters with a full recalculation of all the projects
+# compared to an incremental refresh, in which only a few projects were modified since the last refresh.
+# Run from the repository root:
+#   PYTHONPATH=.:server/py python hack/benchmarks/project_summaries_benchmark.py
+
+import asyncio
+import statistics
+import tempfile
+import time
+
+import mlrun
+import mlrun.common.formatters
+import mlrun.common.schemas
+from mlrun.common.db.sql_session import _init_engine, create_session
+
+from framework.db.init_db import init_db
+from framework.db.sqldb.db import SQLDB
+
+num_projects = 500
+runs_per_project = 200
+artifacts_per_project = 50
+# number of projects modified between two refreshes
+modified_projects = 5
+repetitions = 5
+
+
+def main():
+    db_file = tempfile.NamedTemporaryFile(suffix="-mlrun.db")
+    mlrun.mlconf.httpdb.dsn = f"sqlite:///{db_file.name}?check_same_thread=false"
+    mlrun.mlconf.monitoring.projects.summaries.refresh_mode = (
+        mlrun.common.schemas.ProjectSummariesRefreshMode.incremental
+    )
+    _init_engine()
+    init_db()
+    session = create_session()
+    db = SQLDB(mlrun.mlconf.httpdb.dsn)
+    # alert activations counters use MySQL specific queries
+    db._calculate_alert_activations_counters = lambda *args: ({}, {}, {})
+
+    print(
+        f"Populating {num_projects} projects with {runs_per_project} runs and {artifacts_per_project} artifacts each"
+    )
+    for project_index in range(num_projects):
+        project = f"project-{project_index}"
+        db.create_project(
+            session,
+            mlrun.common.schemas.Project(
+                metadata=mlrun.common.schemas.ProjectMetadata(name=project)
+            ),
+        )
+        for index in range(runs_per_project):
+            db.store_run(
+                session,
+                {"metadata": {"name": f"run-{index}"}, "status": {"state": "running"}},
+                f"uid-{index}",
+                project,
+            )
+        for index in range(artifacts_per_project):
+            db.store_artifact(
+                session,
+                f"artifact-{index}",
+                {"metadata": {"key": f"artifact-{index}"}, "kind": "model"},
+                producer_id=f"uid-{index}",
+                project=project,
+            )
+
+    projects = db.list_projects(
+        session, format_=mlrun.common.formatters.ProjectFormat.name_and_creation_time
+    ).projects
+    # clean the dirty flags set by the population
+    db.get_project_summaries_to_refresh(session)
+
+    def full_refresh():
+        asyncio.run(db.get_project_resources_counters(projects))
+
+    def modify_projects(repetition):
+        for project_index in range(modified_projects):
+            db.update_run(
+                session,
+                {"status.last_update": repetition},
+                "uid-0",
+                f"project-{project_index}",
+            )
+
+    def incremental_refresh():
+        _, projects_to_refresh = db.get_project_summaries_to_refresh(session)
+        asyncio.run(db.get_project_resources_counters(projects, projects_to_refresh))
+
+    _benchmark("full refresh", full_refresh)
+    _benchmark(
+        f"incremental refresh ({modified_projects} modified projects)",
+        incremental_refresh,
+        modify_projects,
+    )
+
+    session.close()
+
+
+def _benchmark(title, refresh, modify=None):
+    latencies = []
+    for repetition in range(repetitions):
+        # modifications are done between refreshes and are not measured
+        if modify:
+            modify(repetition)
+        start = time.perf_counter()
+        refresh()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    print(
+        f"{title}: median={statistics.median(latencies):.2f}ms "
+        f"max={max(latencies):.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Measures the p50/p99 latency of repeated list runs / artifacts queries (as done by UI polling) with and without
+# the API query result cache (mlrun.mlconf.httpdb.query_cache).
+# Run from the repository root:
+#   PYTHONPATH=.:server/py python hack/benchmarks/query_cache_benchmark.py
+
+import statistics
+import tempfile
+import time
+
+import mlrun
+import mlrun.common.schemas
+from mlrun.common.db.sql_session import _init_engine, create_session
+
+from framework.db.init_db import init_db
+from framework.db.sqldb.db import SQLDB
+
+project = "benchmark"
+num_runs = 2000
+num_artifacts = 2000
+num_polls = 200
+# every write_every polls, a run is updated (invalidating the cached runs of the project)
+write_every = 20
+
+
+def main():
+    db_file = tempfile.NamedTemporaryFile(suffix="-mlrun.db")
+    mlrun.mlconf.httpdb.dsn = f"sqlite:///{db_file.name}?check_same_thread=false"
+    _init_engine()
+    init_db()
+    session = create_session()
+    db = SQLDB(mlrun.mlconf.httpdb.dsn)
+
+    print(f"Populating {num_runs} runs and {num_artifacts} artifacts")
+    for i in range(num_runs):
+        db.store_run(
+            session,
+            {"metadata": {"name": f"run-{i}"}, "status": {"state": "completed"}},
+            f"uid-{i}",
+            project,
+        )
+    for i in range(num_artifacts):
+        db.store_artifact(
+            session,
+            f"artifact-{i}",
+            {"metadata": {"key": f"artifact-{i}"}, "kind": "artifact"},
+            producer_id=f"uid-{i}",
+            project=project,
+        )
+
+    for mode in [
+        mlrun.common.schemas.QueryCacheMode.disabled,
+        mlrun.common.schemas.QueryCacheMode.enabled,
+    ]:
+        mlrun.mlconf.httpdb.query_cache.mode = mode
+        _benchmark(
+            f"list_runs (cache {mode})",
+            lambda: db.list_runs(session, project=project, limit=200),
+            lambda i: db.update_run(session, {"status.last_poll": i}, "uid-0", project),
+        )
+        _benchmark(
+            f"list_artifacts (cache {mode})",
+            lambda: db.list_artifacts(session, project=project, limit=200),
+        )
+        cache_info = db.get_query_result_cache_info()
+        if cache_info:
+            print(
+                f"  cache hits={cache_info.hits} misses={cache_info.misses} "
+                f"evictions={cache_info.evictions} invalidations={cache_info.invalidations} "
+                f"size={cache_info.size_bytes}B"
+            )
+
+    session.close()
+
+
+def _benchmark(title, query, write=None):
+    latencies = []
+    for i in range(num_polls):
+        if write and i and i % write_every == 0:
+            write(i)
+        start = time.perf_counter()
+        query()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{title}: p50={quantiles[49]:.2f}ms p99={quantiles[98]:.2f}ms "
+        f"mean={statistics.mean(latencies):.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
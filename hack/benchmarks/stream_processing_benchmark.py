@@ -0,0 +1,113 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Measures the throughput (rows/sec) of the model monitoring stream processing steps, from the model server event to
+# the data frame written to the Parquet target, with per-row events compared to columnar batches
+# (mlrun.mlconf.model_endpoint_monitoring.columnar_batches).
+# Run from the repository root:
+#   python hack/benchmarks/stream_processing_benchmark.py
+
+import datetime
+import time
+
+import pandas as pd
+import storey
+
+from mlrun.common.schemas.model_monitoring.constants import EndpointType
+from mlrun.model_monitoring.stream_processing import (
+    ColumnarEventBatch,
+    MapFeatureNames,
+    ProcessBeforeParquet,
+    ProcessEndpointEvent,
+)
+
+project = "benchmark"
+endpoint_id = "benchmark-endpoint"
+num_features = 20
+# rows per model invocation
+batch_sizes = [1, 10, 100, 1000]
+rows_per_run = 100_000
+
+
+def main():
+    for batch_size in batch_sizes:
+        for columnar in [False, True]:
+            rows_per_sec = _benchmark(batch_size, columnar)
+            print(
+                f"batch size {batch_size} ({'columnar' if columnar else 'rows'}): "
+                f"{rows_per_sec:,.0f} rows/sec"
+            )
+
+
+def _benchmark(batch_size: int, columnar: bool) -> float:
+    process_endpoint_event, map_feature_names = _init_steps(columnar)
+    process_before_parquet = ProcessBeforeParquet()
+    num_events = max(rows_per_run // batch_size, 1)
+    events = [_model_server_event(i, batch_size) for i in range(num_events)]
+
+    start = time.perf_counter()
+    batches = []
+    rows = []
+    for event in events:
+        body = process_endpoint_event.do(storey.Event(body=event)).body
+        if isinstance(body, ColumnarEventBatch):
+            batches.append(map_feature_names.do(body))
+        else:
+            rows.extend(
+                process_before_parquet.do(map_feature_names.do(row)) for row in body
+            )
+    # the data frame that the Parquet target writes
+    frames = [pd.DataFrame(rows)] if rows else []
+    if batches:
+        frames.append(ColumnarEventBatch.to_dataframe(batches))
+    pd.concat(frames, ignore_index=True)
+    elapsed = time.perf_counter() - start
+    return num_events * batch_size / elapsed
+
+
+def _init_steps(columnar: bool):
+    process_endpoint_event = ProcessEndpointEvent(project=project, columnar=columnar)
+    # skip resuming the endpoint state from the API
+    process_endpoint_event.endpoints.add(endpoint_id)
+
+    map_feature_names = MapFeatureNames(project=project)
+    map_feature_names.feature_names[endpoint_id] = [
+        f"f{i}" for i in range(num_features)
+    ]
+    map_feature_names.label_columns[endpoint_id] = ["label"]
+    map_feature_names.endpoint_type[endpoint_id] = EndpointType.NODE_EP.value
+    map_feature_names.first_request[endpoint_id] = True
+    return process_endpoint_event, map_feature_names
+
+
+def _model_server_event(index: int, batch_size: int) -> dict:
+    return {
+        "endpoint_id": endpoint_id,
+        "function_uri": f"{project}/model-server",
+        "model": "model",
+        "when": str(datetime.datetime.now()),
+        "microsec": 100,
+        "request": {
+            "id": f"request-{index}",
+            "inputs": [
+                [row * num_features + i for i in range(num_features)]
+                for row in range(batch_size)
+            ],
+        },
+        "resp": {"id": f"request-{index}", "outputs": [0] * batch_size},
+    }
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,9 @@
 # limitations under the License.
 
 
+import typing
+
+import sqlalchemy.event
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
@@ -25,6 +28,8 @@ from mlrun.config import config
 # TODO: wrap the following functions in a singleton class
 _engines: dict[str, Engine] = {}
 _session_makers: dict[str, SessionMaker] = {}
+# (event name, listener) pairs which are registered on every session maker, see listen_to_session_events
+_session_listeners: list[tuple[str, typing.Callable]] = []
 
 
 # doing lazy load to allow tests to initialize the engine
@@ -41,6 +46,16 @@ def create_session(dsn=None) -> Session:
     return session_maker()
 
 
+def listen_to_session_events(identifier: str, listener: typing.Callable) -> None:
+    """
+    Register a session events listener (e.g. "before_commit") on the session makers of the DB sessions, including the
+    session makers which are initialized later - so only the sessions created by create_session are listened to.
+    """
+    _session_listeners.append((identifier, listener))
+    for session_maker in _session_makers.values():
+        sqlalchemy.event.listen(session_maker, identifier, listener)
+
+
 # doing lazy load to allow tests to initialize the engine
 def _get_session_maker(dsn) -> SessionMaker:
     global _session_makers
@@ -77,4 +92,7 @@ def _init_engine(dsn=None):
 
 def _init_session_maker(dsn):
     global _session_makers
-    _session_makers[dsn] = SessionMaker(bind=get_engine(dsn=dsn))
+    session_maker = SessionMaker(bind=get_engine(dsn=dsn))
+    for identifier, listener in _session_listeners:
+        sqlalchemy.event.listen(session_maker, identifier, listener)
+    _session_makers[dsn] = session_maker
@@ -68,9 +68,13 @@ from .constants import (
     DeletionStrategy,
     FeatureStorePartitionByField,
     HeaderNames,
+    KeysetPaginationMode,
     LogsCollectorMode,
+    MediaTypes,
     OrderType,
     PatchMode,
+    ProjectSummariesRefreshMode,
+    QueryCacheMode,
     RunPartitionByField,
     SortField,
 )
@@ -186,7 +190,7 @@ from .project import (
     ProjectSummary,
 )
 from .regex import RegexMatchModes
-from .runs import RunIdentifier
+from .runs import RunIdentifier, RunsStatesOutput, RunsStatesRequest, RunState
 from .runtime_resource import (
     GroupedByJobRuntimeResourcesOutput,
     GroupedByProjectRuntimeResourcesOutput,
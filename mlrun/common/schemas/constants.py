@@ -106,6 +106,11 @@ class HeaderNames:
     ui_clear_cache = f"{headers_prefix}ui-clear-cache"
 
 
+class MediaTypes:
+    # newline-delimited JSON, used for streaming list responses
+    ndjson = "application/x-ndjson"
+
+
 class FeatureStorePartitionByField(mlrun.common.types.StrEnum):
     name = "name"  # Supported for feature-store objects
 
@@ -220,3 +225,21 @@ class LogsCollectorMode:
     legacy = "legacy"
     sidecar = "sidecar"
     best_effort = "best-effort"
+
+
+class QueryCacheMode(mlrun.common.types.StrEnum):
+    enabled = "enabled"
+    disabled = "disabled"
+
+
+class KeysetPaginationMode(mlrun.common.types.StrEnum):
+    enabled = "enabled"
+    disabled = "disabled"
+
+
+class ProjectSummariesRefreshMode(mlrun.common.types.StrEnum):
+    # recalculate the counters of all projects on every refresh
+    full = "full"
+    # recalculate only the counters of projects which were modified (or may have changed over time) since the last
+    # refresh, with a periodic full refresh
+    incremental = "incremental"
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import datetime
 import typing
 
 import pydantic.v1
@@ -26,6 +27,25 @@ class RunIdentifier(pydantic.v1.BaseModel):
     iter: typing.Optional[int]
 
 
+class RunState(pydantic.v1.BaseModel):
+    uid: str
+    state: typing.Optional[str]
+    last_update: typing.Optional[datetime.datetime]
+
+
+class RunsStatesRequest(pydantic.v1.BaseModel):
+    uids: list[str]
+    # the run states known to the client (uid -> state), when given with a timeout the request waits until the state
+    # of any of the runs differs from its known state, or until the timeout passes (long poll)
+    known_states: dict[str, str] = {}
+    # seconds to wait for a state change, 0 to return immediately
+    timeout: int = pydantic.v1.Field(0, ge=0)
+
+
+class RunsStatesOutput(pydantic.v1.BaseModel):
+    runs: list[RunState]
+
+
 @deprecated(
     version="1.7.0",
     reason="mlrun.common.schemas.RunsFormat is deprecated and will be removed in 1.9.0. "
@@ -105,6 +105,24 @@ default_config = {
     # custom logger format, workes only with log_formatter: custom
     # Note that your custom format must include those 4 fields - timestamp, level, message and more
     "log_format_override": None,
+    # format and write the log lines in a background thread, so the log calls do not block on the formatting and the
+    # stream writes. Up to max_size lines wait to be written, further lines are dropped
+    "log_queue": {
+        "enabled": False,
+        "max_size": 10000,
+    },
+    # resolving the project functions by load_project / sync_functions
+    "project_functions": {
+        # when enabled, functions that are resolved from local files (yaml, py, ipynb) are cached by the hash of their
+        # definition, file and the function defaults configuration, and reused while they did not change. a function
+        # keeps only the entry of its latest file, and the least recently used entries are deleted above
+        # cache_max_entries
+        "cache_enabled": False,
+        "cache_path": "~/.mlrun/functions-cache",
+        "cache_max_entries": 500,
+        # number of threads for resolving the project functions in parallel
+        "sync_workers": 8,
+    },
     "submit_timeout": "180",  # timeout when submitting a new k8s resource
     # runtimes cleanup interval in seconds
     "runtimes_cleanup_interval": "300",
@@ -123,6 +141,13 @@ default_config = {
         "projects": {
             "summaries": {
                 "cache_interval": "30",
+                # full / incremental
+                # incremental - only the counters of projects whose resources were modified since the last refresh
+                # (or which have time window counters that may have expired) are recalculated
+                "refresh_mode": "incremental",
+                # interval in seconds for a full recalculation of all the projects' counters when running in
+                # incremental mode (to account for modifications not tracked by the DB layer)
+                "full_refresh_interval": "3600",
             },
         },
     },
@@ -387,6 +412,16 @@ default_config = {
                 )
             },
         },
+        # server side write-through cache for hot list queries (list runs / artifacts / functions), entries are
+        # invalidated by writes to the same project, so it is mainly useful for repeated polling (e.g. by the UI).
+        # note that the cache is per API replica, writes made by other replicas are reflected only after the ttl
+        "query_cache": {
+            # enabled / disabled, see mlrun.common.schemas.QueryCacheMode
+            "mode": "disabled",
+            "ttl": 5,  # seconds
+            "max_entries": 1024,
+            "max_size_bytes": 64 * 1024 * 1024,  # 64MB
+        },
         "jobs": {
             # whether to allow to run local runtimes in the API - configurable to allow the scheduler testing to work
             "allow_local_run": False,
@@ -536,12 +571,30 @@ default_config = {
         },
         "pagination": {
             "default_page_size": 200,
+            # enabled / disabled
+            # when enabled, runs and artifacts are paginated by keyset (cursor) with stateless page tokens,
+            # instead of offset/limit with the tokens stored in the pagination cache
+            "keyset": {"mode": "enabled"},
+            # number of objects fetched from the DB per batch when streaming a list response (ndjson)
+            "stream_batch_size": 500,
             "pagination_cache": {
                 "interval": 60,
                 "ttl": 3600,
                 "max_size": 10000,
             },
         },
+        "runs_states": {
+            # maximal number of seconds a runs states request waits for a state change (long poll), larger requested
+            # timeouts are capped
+            "max_wait_timeout": 60,
+            # interval in seconds between the checks of the runs states while waiting for a change
+            "wait_check_interval": 1,
+            # number of seconds the client waits for a state change per request when waiting for runs completion
+            "client_wait_timeout": 20,
+            # initial interval in seconds between the checks of the runs states when the client does not wait for a
+            # state change, it grows while no run changes its state
+            "client_min_check_interval": 0.5,
+        },
     },
     "model_endpoint_monitoring": {
         "serving_stream": {
@@ -609,6 +662,28 @@ default_config = {
         "default_http_sink_app": "http://nuclio-{project}-{application_name}.{namespace}.svc.cluster.local:8080",
         "parquet_batching_max_events": 10_000,
         "parquet_batching_timeout_secs": timedelta(minutes=1).total_seconds(),
+        # Whether the monitoring stream processes each model invocation as a single columnar batch (shared fields are
+        # kept once, the features and predictions as 2-D arrays) instead of splitting it into per-row events. Rows are
+        # expanded only for the TSDB targets
+        "columnar_batches": False,
+        # Histograms of the inputs per time bucket, counted by the monitoring stream against the reference bins of
+        # each endpoint. The monitoring applications merge the buckets of their window instead of recomputing the
+        # statistics from the raw sample data. flush_delay_seconds (the time a bucket waits for late events before it
+        # is written) should be lower than parquet_batching_timeout_secs. The buckets are deleted after
+        # retention_hours, windows with deleted or missing buckets are computed from the sample data
+        "window_histograms": {
+            "enabled": False,
+            "bucket_seconds": 60,
+            "flush_delay_seconds": 30,
+            "retention_hours": 48,
+        },
+        # Cache of the model endpoint records in the monitoring stream. The records of the project are listed once at
+        # startup and each record is fetched again after ttl_seconds. The endpoint updates (e.g. first request) are
+        # coalesced per endpoint and sent in the background every patch_interval_seconds
+        "endpoints_cache": {
+            "ttl_seconds": 300,
+            "patch_interval_seconds": 1,
+        },
         # See mlrun.model_monitoring.db.tsdb.ObjectTSDBFactory for available options
         "tsdb_connection": "",
         # See mlrun.common.schemas.model_monitoring.constants.StreamKind for available options
@@ -616,6 +691,17 @@ default_config = {
         "tdengine": {
             "timeout": 10,
             "retries": 1,
+            # Buffering of the application results and metrics writes (used by the model monitoring writer). The
+            # buffered rows are written with a multi-row insert per subtable once max_rows rows are pending or
+            # flush_interval_seconds passed since the first pending row. 0 max_rows writes every event immediately.
+            # The rows of a subtable that failed max_retries flushes in a row are dropped, and so are the rows that
+            # are written while max_pending_rows rows are pending (0 - 100 times max_rows)
+            "write_buffer": {
+                "max_rows": 0,
+                "flush_interval_seconds": 5,
+                "max_retries": 10,
+                "max_pending_rows": 0,
+            },
         },
     },
     "secret_stores": {
@@ -647,6 +733,15 @@ default_config = {
             "auth_secret_name": "mlrun-auth-secrets.{hashed_access_key}",
             "env_variable_prefix": "MLRUN_K8S_SECRET__",
             "global_function_env_secret_name": None,
+            # in-memory cache of the secrets that are read by the API (the secret values are never written to disk)
+            "cache": {
+                # seconds to cache a secret for, 0 disables the cache
+                "ttl": 30,
+                "max_size": 1000,
+                # watch the secrets of the namespace to invalidate the cached secrets that are modified/deleted by
+                # other API replicas or outside of mlrun before their ttl expires
+                "watch": False,
+            },
         },
     },
     "feature_store": {
@@ -691,6 +786,24 @@ default_config = {
         # e.g. Windows client (on host) and Linux container (Jupyter, Nuclio..) need to access the same files/artifacts
         # need to map container path to host windows paths, e.g. "\data::c:\\mlrun_data" ("::" used as splitter)
         "item_to_real_path": "",
+        # number of threads for reading the files of a directory in parallel (e.g. DataItem.as_df() of a csv directory)
+        "read_workers": 8,
+        "v3io": {
+            # number of byte ranges of an object that are uploaded/downloaded in parallel, 1 transfers them sequentially
+            "transfer_concurrency": 1,
+            # size in bytes of the byte ranges of a transfer
+            "transfer_chunk_size": 1024 * 1024 * 10,
+        },
+        # on-disk read cache of remote objects (DataItem get/local/open/as_df), shared by the processes of the node
+        "cache": {
+            "enabled": False,
+            # cache directory, defaults to "mlrun-block-cache" in the temp directory
+            "path": "",
+            # max size in bytes of the cache, the least recently used objects are evicted beyond it
+            "max_size": 1024 * 1024 * 1024 * 10,
+            # size in bytes of the cached blocks of the byte range reads
+            "block_size": 1024 * 1024 * 4,
+        },
     },
     "default_function_pod_resources": {
         "requests": {"cpu": None, "memory": None, "gpu": None},
@@ -803,6 +916,14 @@ default_config = {
         "max_criteria_count": 100,
         # interval for periodic events generation job
         "events_generation_interval": "30",
+        "events_counter": {
+            # number of time buckets the window of an alert's events counter (the criteria period) is split into,
+            # the window is accurate to the resolution of a single bucket
+            "buckets": 60,
+            # interval (in seconds) for periodically persisting the events counters of the alerts that received events,
+            # 0 disables the periodic persistence (counters are then lost on restart)
+            "snapshot_interval": 30,
+        },
     },
     "auth_with_client_id": {
         "enabled": False,
@@ -823,7 +944,25 @@ default_config = {
         "smtp": {
             "config_secret_name": "mlrun-smtp-config",
             "refresh_interval": "30",
-        }
+        },
+        # the process-wide http transport used by the webhook and slack notifications
+        "transport": {
+            # maximum number of pooled connections, in total and to a single host
+            "max_connections": 100,
+            "max_connections_per_host": 10,
+            # total timeout (in seconds) of a single request
+            "timeout": 30,
+            # retries on connection errors and on the following status codes, the backoff (in seconds) grows
+            # exponentially from retry_backoff up to retry_max_backoff, with full jitter
+            "max_retries": 3,
+            "retry_backoff": 0.5,
+            "retry_max_backoff": 10,
+            "retry_status_codes": [429, 500, 502, 503, 504],
+            # notifications to the same target are merged into a single request when the notification kind supports it
+            # (e.g. slack). the window (in seconds) to wait for more notifications before sending, 0 merges only the
+            # notifications that are pushed together
+            "batch_window": 0,
+        },
     },
 }
 _is_running_as_api = None
@@ -11,9 +11,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import collections
 import tempfile
 import urllib.parse
 from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor
 from os import path, remove
 from typing import Optional, Union
 from urllib.parse import urlparse
@@ -31,6 +33,7 @@ import mlrun.errors
 from mlrun.errors import err_to_str
 from mlrun.utils import StorePrefix, is_jupyter, logger
 
+from .block_cache import BlockCache
 from .store_resources import is_store_uri, parse_store_uri
 from .utils import filter_df_start_end_time, select_columns_from_df
 
@@ -288,11 +291,14 @@ class DataStore:
         end_time=None,
         time_column=None,
         additional_filters=None,
+        iterate_files=False,
         **kwargs,
     ):
         df_module = df_module or pd
         file_url = self._sanitize_url(url)
         is_csv, is_json, drop_time_column = False, False, False
+        # whether the reader already filtered the time range (and dropped the time column if required)
+        filtered_by_reader = False
         file_system = self.filesystem
         if file_url.endswith(".csv") or format == "csv":
             is_csv = True
@@ -310,6 +316,7 @@ class DataStore:
             reader = df_module.read_csv
             if file_system:
                 if file_system.isdir(file_url):
+                    filtered_by_reader = df_module is pd
 
                     def reader(*args, **kwargs):
                         base_path = args[0]
@@ -324,23 +331,24 @@ class DataStore:
                                 filename = file_entry["name"]
                                 filename = filename.split("/")[-1]
                                 filenames.append(filename)
-                        dfs = []
                         if df_module is pd:
                             kwargs.pop("filesystem", None)
                             kwargs.pop("storage_options", None)
-                            for filename in filenames:
-                                fullpath = f"{base_path}/{filename}"
-                                with file_system.open(fullpath) as fhandle:
-                                    updated_args = [fhandle]
-                                    updated_args.extend(args[1:])
-                                    dfs.append(
-                                        df_module.read_csv(*updated_args, **kwargs)
-                                    )
-                        else:
-                            for filename in filenames:
-                                updated_args = [f"{base_path}/{filename}"]
-                                updated_args.extend(args[1:])
-                                dfs.append(df_module.read_csv(*updated_args, **kwargs))
+                            return self._read_csv_files(
+                                file_system,
+                                [f"{base_path}/{filename}" for filename in filenames],
+                                time_column=time_column,
+                                start_time=start_time,
+                                end_time=end_time,
+                                drop_time_column=drop_time_column,
+                                iterate_files=iterate_files,
+                                **kwargs,
+                            )
+                        dfs = []
+                        for filename in filenames:
+                            updated_args = [f"{base_path}/{filename}"]
+                            updated_args.extend(args[1:])
+                            dfs.append(df_module.read_csv(*updated_args, **kwargs))
                         return df_module.concat(dfs)
 
         elif mlrun.utils.helpers.is_parquet_file(file_url, format):
@@ -382,7 +390,7 @@ class DataStore:
             df = reader(temp_file.name, **kwargs)
             remove(temp_file.name)
 
-        if is_json or is_csv:
+        if (is_json or is_csv) and not filtered_by_reader:
             # for parquet file the time filtering is executed in `reader`
             df = filter_df_start_end_time(
                 df,
@@ -395,8 +403,72 @@ class DataStore:
         if is_json:
             # for csv and parquet files the columns select is executed in `reader`.
             df = select_columns_from_df(df, columns=columns)
+        if iterate_files and isinstance(df, pd.DataFrame):
+            # a single file
+            return iter([df])
         return df
 
+    @staticmethod
+    def _read_csv_files(
+        file_system,
+        paths: list[str],
+        time_column=None,
+        start_time=None,
+        end_time=None,
+        drop_time_column=False,
+        iterate_files=False,
+        **kwargs,
+    ):
+        """
+        Read multiple csv files in parallel (mlrun.mlconf.storage.read_workers threads), preserving the files order.
+        The time range is filtered while reading, per chunk when a chunksize is given, so only the matching rows are
+        kept in memory.
+        Returns a single dataframe, or when iterating (iterate_files or a chunksize) an iterator of the per-file
+        dataframes or of the chunks of all the files.
+        """
+        chunksize = kwargs.pop("chunksize", None)
+
+        def filter_time(df):
+            df = filter_df_start_end_time(
+                df, time_column=time_column, start_time=start_time, end_time=end_time
+            )
+            if drop_time_column:
+                df = df.drop(columns=[time_column])
+            return df
+
+        def read_file(path) -> list[pd.DataFrame]:
+            with file_system.open(path) as fhandle:
+                if chunksize:
+                    return [
+                        filter_time(chunk)
+                        for chunk in pd.read_csv(fhandle, chunksize=chunksize, **kwargs)
+                    ]
+                return [filter_time(pd.read_csv(fhandle, **kwargs))]
+
+        def iterate_files_chunks():
+            # keep a bounded number of files in flight, so iterating doesn't load the whole directory to memory
+            max_workers = max(int(mlrun.mlconf.storage.read_workers), 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = collections.deque()
+                for path in paths:
+                    futures.append(executor.submit(read_file, path))
+                    if len(futures) > max_workers:
+                        yield futures.popleft().result()
+                while futures:
+                    yield futures.popleft().result()
+
+        if iterate_files:
+            return (
+                pd.concat(chunks) if len(chunks) > 1 else chunks[0]
+                for chunks in iterate_files_chunks()
+                if chunks
+            )
+        if chunksize:
+            return (chunk for chunks in iterate_files_chunks() for chunk in chunks)
+        return pd.concat(
+            [chunk for chunks in iterate_files_chunks() for chunk in chunks]
+        )
+
     def to_dict(self):
         return {
             "name": self.name,
@@ -463,6 +535,8 @@ class DataItem:
         self._meta = meta
         self._artifact_url = artifact_url
         self._local_path = ""
+        # the object version in the block cache, resolved on the first cached read
+        self._cache_version = None
 
     @property
     def key(self):
@@ -513,7 +587,18 @@ class DataItem:
         :param encoding: encoding (e.g. "utf-8") for converting bytes to str
         :return:         the bytes/str content
         """
-        body = self._store.get(self._path, size=size, offset=offset)
+        cache = self._get_block_cache()
+        if cache:
+            body = cache.get(
+                self._store,
+                self._url,
+                self._path,
+                self._cache_version,
+                size=size,
+                offset=offset,
+            )
+        else:
+            body = self._store.get(self._path, size=size, offset=offset)
         if encoding and isinstance(body, bytes):
             body = body.decode(encoding)
         return body
@@ -549,7 +634,9 @@ class DataItem:
         return self._store.stat(self._path)
 
     def open(self, mode):
-        """return fsspec file handler, if supported"""
+        """return fsspec file handler, if supported (a local file handler when reading through the block cache)"""
+        if mode in ["r", "rb"] and self._get_block_cache():
+            return open(self.local(), mode)
         return self._store.open(self._url, mode)
 
     def ls(self):
@@ -569,6 +656,13 @@ class DataItem:
 
         dot = self._path.rfind(".")
         suffix = "" if dot == -1 else self._path[dot:]
+        cache = self._get_block_cache()
+        if cache:
+            self._local_path = cache.local(
+                self._store, self._url, self._path, self._cache_version, suffix
+            )
+            return self._local_path
+
         temp_file = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
         self._local_path = temp_file.name
         logger.info(f"downloading {self.url} to local temp file")
@@ -581,7 +675,10 @@ class DataItem:
             return
 
         if self._local_path:
-            remove(self._local_path)
+            cache = BlockCache.from_config()
+            # a file of the block cache is shared, and it is evicted by the cache
+            if not cache or not cache.is_cached_path(self._local_path):
+                remove(self._local_path)
             self._local_path = ""
 
     def as_df(
@@ -593,6 +690,7 @@ class DataItem:
         start_time=None,
         end_time=None,
         additional_filters=None,
+        iterate_files=False,
         **kwargs,
     ):
         """return a dataframe object (generated from the dataitem).
@@ -610,7 +708,24 @@ class DataItem:
                                     Example: [("Product", "=", "Computer")]
                                     For all supported filters, please see:
                                     https://arrow.apache.org/docs/python/generated/pyarrow.parquet.ParquetDataset.html
+        :param iterate_files: optional, return an iterator of the per-file dataframes (in the files order) instead of
+                              a single dataframe. A directory of csv files is read in parallel, see
+                              mlrun.mlconf.storage.read_workers.
         """
+        if not self._path.endswith("/") and self._get_block_cache():
+            # read the cached copy of the file
+            return mlrun.datastore.store_manager.object(url=self.local()).as_df(
+                columns=columns,
+                df_module=df_module,
+                format=format,
+                time_column=time_column,
+                start_time=start_time,
+                end_time=end_time,
+                additional_filters=additional_filters,
+                iterate_files=iterate_files,
+                **kwargs,
+            )
+
         df = self._store.as_df(
             self._url,
             self._path,
@@ -621,6 +736,7 @@ class DataItem:
             start_time=start_time,
             end_time=end_time,
             additional_filters=additional_filters,
+            iterate_files=iterate_files,
             **kwargs,
         )
         return df
@@ -657,6 +773,15 @@ class DataItem:
         else:
             logger.error(f"unsupported show() format {suffix} for {self.url}")
 
+    def _get_block_cache(self) -> Optional[BlockCache]:
+        """The block cache, when it is enabled and the object can be cached (a remote file with a version)"""
+        cache = BlockCache.from_config()
+        if not cache:
+            return None
+        if self._cache_version is None:
+            self._cache_version = BlockCache.get_version(self._store, self._path) or ""
+        return cache if self._cache_version else None
+
     def get_artifact_type(self) -> Union[str, None]:
         """
         Check if the data item represents an Artifact (one of Artifact, DatasetArtifact and ModelArtifact). If it does
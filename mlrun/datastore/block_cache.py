@@ -0,0 +1,257 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import hashlib
+import os
+import tempfile
+import time
+import typing
+
+import mlrun.config
+import mlrun.errors
+from mlrun.utils import logger
+
+# the stores of local objects, which are not cached
+_uncached_kinds = ["file", "memory"]
+
+# bytes written to each cache (by path) by this process since its last eviction scan
+_written_since_eviction: dict[str, int] = {}
+
+
+class BlockCache:
+    """
+    On-disk read cache of remote objects, shared by the processes of the node (see mlrun.mlconf.storage.cache).
+
+    An object is cached under a key of its url and its version (the size and modification time from the store stat),
+    so a modified object is never served from the cache and the entries of its old versions are evicted over time.
+    Byte ranges are cached as fixed size blocks, and whole objects (DataItem.local()) as a single file.
+    Every entry is written to a temporary file and renamed into place, so processes that share the cache never read
+    a partial entry, and an entry is validated against its expected size when read. The cache is bounded in size by
+    evicting the least recently used entries.
+    """
+
+    def __init__(self, path: str, max_size: int, block_size: int):
+        self.path = path
+        self.max_size = max_size
+        self.block_size = block_size
+
+    @classmethod
+    def from_config(cls) -> typing.Optional["BlockCache"]:
+        """Get the block cache, or None when it is disabled"""
+        cache_config = mlrun.mlconf.storage.cache
+        if not cache_config.enabled:
+            return None
+        return cls(
+            cache_config.path
+            or os.path.join(tempfile.gettempdir(), "mlrun-block-cache"),
+            int(cache_config.max_size),
+            int(cache_config.block_size),
+        )
+
+    @staticmethod
+    def get_version(store, subpath: str) -> typing.Optional[str]:
+        """The version of an object for the cache key, None when the object can not be cached"""
+        if store.kind in _uncached_kinds:
+            return None
+        try:
+            stats = store.stat(subpath)
+        except Exception as exc:
+            logger.debug(
+                "Failed to stat the object, not caching it",
+                subpath=subpath,
+                exc=mlrun.errors.err_to_str(exc),
+            )
+            return None
+        if not stats or stats.modified is None or stats.size is None:
+            return None
+        return f"{stats.size}-{stats.modified}"
+
+    def get(
+        self,
+        store,
+        url: str,
+        subpath: str,
+        version: str,
+        size: typing.Optional[int] = None,
+        offset: int = 0,
+    ) -> bytes:
+        """Read a byte range of an object through the cache, the missing blocks are read from the store"""
+        object_size = int(version.split("-", 1)[0])
+        end = object_size if size is None else min(offset + size, object_size)
+        if offset >= end:
+            return b""
+
+        entry_dir = self._get_entry_dir(url, version)
+        # a cached whole object (see local()) serves any range
+        object_path = self._find_object(entry_dir, object_size)
+        if object_path:
+            with open(object_path, "rb") as file_obj:
+                file_obj.seek(offset)
+                return file_obj.read(end - offset)
+
+        first_block = offset // self.block_size
+        last_block = (end - 1) // self.block_size
+        blocks = [
+            self._get_block(store, subpath, entry_dir, index, object_size)
+            for index in range(first_block, last_block + 1)
+        ]
+        start = offset - first_block * self.block_size
+        return b"".join(blocks)[start : start + end - offset]
+
+    def local(self, store, url: str, subpath: str, version: str, suffix: str) -> str:
+        """Get the path of the cached copy of a whole object, the object is downloaded if it is not cached"""
+        entry_dir = self._get_entry_dir(url, version)
+        object_path = os.path.join(entry_dir, f"object{suffix}")
+        object_size = int(version.split("-", 1)[0])
+        if self._is_valid(object_path, object_size):
+            return object_path
+
+        logger.info(f"downloading {url} to the local cache")
+        temp_path = self._get_temp_path(entry_dir, suffix)
+        try:
+            store.download(subpath, temp_path)
+            os.replace(temp_path, object_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        self._evict(object_size)
+        return object_path
+
+    def is_cached_path(self, file_path: str) -> bool:
+        return os.path.commonpath(
+            [os.path.abspath(file_path), os.path.abspath(self.path)]
+        ) == os.path.abspath(self.path)
+
+    def _get_entry_dir(self, url: str, version: str) -> str:
+        key = hashlib.sha256(f"{url}\n{version}".encode()).hexdigest()
+        entry_dir = os.path.join(self.path, key)
+        os.makedirs(entry_dir, exist_ok=True)
+        return entry_dir
+
+    def _find_object(self, entry_dir: str, object_size: int) -> typing.Optional[str]:
+        try:
+            names = os.listdir(entry_dir)
+        except FileNotFoundError:
+            return None
+        for name in names:
+            if name.startswith("object"):
+                object_path = os.path.join(entry_dir, name)
+                if self._is_valid(object_path, object_size):
+                    return object_path
+        return None
+
+    def _get_block(
+        self, store, subpath: str, entry_dir: str, index: int, object_size: int
+    ) -> bytes:
+        block_path = os.path.join(entry_dir, f"block-{index}")
+        block_size = min(self.block_size, object_size - index * self.block_size)
+        if self._is_valid(block_path, block_size):
+            try:
+                with open(block_path, "rb") as file_obj:
+                    data = file_obj.read()
+                if len(data) == block_size:
+                    return data
+            except FileNotFoundError:
+                # evicted by another process meanwhile
+                pass
+
+        data = store.get(subpath, size=block_size, offset=index * self.block_size)
+        if isinstance(data, str):
+            data = data.encode()
+        if len(data) != block_size:
+            # the object changed since its stat, serve the data without caching it
+            return data
+        temp_path = self._get_temp_path(entry_dir)
+        try:
+            with open(temp_path, "wb") as file_obj:
+                file_obj.write(data)
+            os.replace(temp_path, block_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        self._evict(block_size)
+        return data
+
+    def _is_valid(self, file_path: str, expected_size: int) -> bool:
+        try:
+            if os.path.getsize(file_path) != expected_size:
+                return False
+        except FileNotFoundError:
+            return False
+        return self._touch(file_path)
+
+    @staticmethod
+    def _touch(file_path: str) -> bool:
+        """Mark a cache entry as recently used (the eviction is by access time)"""
+        try:
+            os.utime(file_path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def _get_temp_path(entry_dir: str, suffix: str = "") -> str:
+        file_descriptor, temp_path = tempfile.mkstemp(
+            suffix=f"{suffix}.tmp", dir=entry_dir
+        )
+        os.close(file_descriptor)
+        return temp_path
+
+    def _evict(self, written_size: int):
+        """
+        Remove the least recently used entries until the cache is within its size.
+        The cache is scanned once a tenth of its size was written by the process since the last scan, so it may
+        temporarily exceed its size by that much (per process).
+        """
+        written_size += _written_since_eviction.get(self.path, 0)
+        if written_size < self.max_size // 10:
+            _written_since_eviction[self.path] = written_size
+            return
+        _written_since_eviction[self.path] = 0
+
+        entries = []
+        total_size = 0
+        for root, _, names in os.walk(self.path):
+            for name in names:
+                if name.endswith(".tmp"):
+                    continue
+                file_path = os.path.join(root, name)
+                try:
+                    stats = os.stat(file_path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stats.st_mtime, stats.st_size, file_path))
+                total_size += stats.st_size
+        if total_size <= self.max_size:
+            return
+
+        for _, file_size, file_path in sorted(entries):
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
+                # removed by another process
+                pass
+            total_size -= file_size
+            if total_size <= self.max_size:
+                break
+
+        # remove the directories of the fully evicted objects
+        now = time.time()
+        for name in os.listdir(self.path):
+            entry_dir = os.path.join(self.path, name)
+            try:
+                # leave the directories that were just created for a new entry
+                if not os.listdir(entry_dir) and now - os.stat(entry_dir).st_mtime > 60:
+                    os.rmdir(entry_dir)
+            except OSError:
+                pass
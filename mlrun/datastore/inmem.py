@@ -84,7 +84,13 @@ class InMemoryStore(DataStore):
         else:
             raise mlrun.errors.MLRunInvalidArgumentError(f"file type unhandled {url}")
         # InMemoryStore store – don't pass filters
-        for field in ["time_column", "start_time", "end_time", "additional_filters"]:
+        for field in [
+            "time_column",
+            "start_time",
+            "end_time",
+            "additional_filters",
+            "iterate_files",
+        ]:
             kwargs.pop(field, None)
 
         return reader(item, **kwargs)
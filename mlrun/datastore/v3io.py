@@ -12,12 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional
 
 import fsspec
+import requests
 import v3io
+from requests.adapters import HTTPAdapter
+from v3io.common.helpers import url_join
 from v3io.dataplane.response import HttpResponseError
 
 import mlrun
@@ -31,6 +37,7 @@ from .base import (
 
 V3IO_LOCAL_ROOT = "v3io"
 V3IO_DEFAULT_UPLOAD_CHUNK_SIZE = 1024 * 1024 * 10
+V3IO_DEFAULT_MAX_CONNECTIONS = 8
 
 
 class V3ioStore(DataStore):
@@ -52,7 +59,14 @@ class V3ioStore(DataStore):
         elif self.endpoint.startswith("http://"):
             self.endpoint = self.endpoint[len("http://") :]
             self.secure = False
-        self.client = v3io.dataplane.Client(access_key=token, endpoint=self.url)
+        self.client = v3io.dataplane.Client(
+            access_key=token,
+            endpoint=self.url,
+            # a connection for each of the byte ranges that are transferred in parallel
+            max_connections=max(
+                self._transfer_concurrency, V3IO_DEFAULT_MAX_CONNECTIONS
+            ),
+        )
         self.object = self.client.object
         self.auth = None
         self.token = token
@@ -71,6 +85,78 @@ class V3ioStore(DataStore):
                 message=mlrun.errors.err_to_str(http_response_error),
             )
 
+    @property
+    def _transfer_concurrency(self) -> int:
+        return max(int(mlrun.mlconf.storage.v3io.transfer_concurrency), 1)
+
+    @property
+    def _transfer_chunk_size(self) -> int:
+        return int(mlrun.mlconf.storage.v3io.transfer_chunk_size)
+
+    def _transfer_ranges(
+        self, size: int, chunk_size: int, transfer: Callable[[int, int], None]
+    ):
+        """Call transfer(offset, length) for each of the byte ranges of the given size, in parallel"""
+        ranges = [
+            (offset, min(chunk_size, size - offset))
+            for offset in range(0, size, chunk_size)
+        ]
+        with ThreadPoolExecutor(
+            max_workers=min(self._transfer_concurrency, len(ranges))
+        ) as executor:
+            # consume the results to raise the error of a failed range
+            list(executor.map(lambda byte_range: transfer(*byte_range), ranges))
+
+    def _parallel_put(
+        self,
+        container: str,
+        path: str,
+        size: int,
+        read_range: Callable[[int, int], bytes],
+        chunk_size: int,
+    ):
+        """
+        Write an object as byte ranges that are sent in parallel.
+        The first range creates (or truncates) the object, and the rest are written at their offset with a ranged PUT,
+        the same request the v3io client sends for an append (with a range of -1).
+        """
+        self._do_object_request(
+            self.object.put,
+            container=container,
+            path=path,
+            body=read_range(0, chunk_size),
+            append=False,
+        )
+        url = f"{self.url}/{url_join(container, path).lstrip('/')}"
+        with requests.Session() as session:
+            session.mount(url, HTTPAdapter(pool_maxsize=self._transfer_concurrency))
+
+            def put_range(offset: int, length: int):
+                offset += chunk_size
+                response = session.put(
+                    url,
+                    data=bytes(read_range(offset, length)),
+                    headers={
+                        **(self.headers or {}),
+                        "Range": f"bytes={offset}-{offset + length - 1}",
+                    },
+                    verify=mlrun.mlconf.httpdb.http.verify,
+                )
+                if not response.ok:
+                    raise mlrun.errors.err_for_status_code(
+                        status_code=response.status_code,
+                        message=f"Failed to write bytes {offset}-{offset + length - 1} of {path}: "
+                        f"{response.text}",
+                    )
+
+            self._transfer_ranges(size - chunk_size, chunk_size, put_range)
+
+    def _get_size(self, container: str, path: str) -> int:
+        response = self._do_object_request(
+            function=self.object.head, container=container, path=path
+        )
+        return int(dict(response.headers).get("Content-Length", "0"))
+
     @staticmethod
     def uri_to_ipython(endpoint, subpath):
         return V3IO_LOCAL_ROOT + subpath
@@ -107,6 +193,18 @@ class V3ioStore(DataStore):
     ):
         """helper function for upload method, allows for controlling max_chunk_size in testing"""
         container, path = split_path(self._join(key))
+        size = os.path.getsize(src_path)
+        if self._transfer_concurrency > 1 and size > max_chunk_size:
+
+            def read_range(offset: int, length: int) -> bytes:
+                # each range is read by its own worker, so only the ranges in flight are held in memory
+                with open(src_path, "rb") as file_obj:
+                    file_obj.seek(offset)
+                    return file_obj.read(length)
+
+            self._parallel_put(container, path, size, read_range, max_chunk_size)
+            return
+
         with open(src_path, "rb") as file_obj:
             append = False
             while True:
@@ -123,10 +221,30 @@ class V3ioStore(DataStore):
                 append = True
 
     def upload(self, key, src_path):
-        return self._upload(key, src_path)
+        return self._upload(key, src_path, max_chunk_size=self._transfer_chunk_size)
 
     def get(self, key, size=None, offset=0):
         container, path = split_path(self._join(key))
+        if self._transfer_concurrency > 1:
+            if size is None:
+                size = max(self._get_size(container, path) - offset, 0)
+            if size > self._transfer_chunk_size:
+                buffer = bytearray(size)
+
+                def get_range(range_offset: int, length: int):
+                    buffer[range_offset : range_offset + length] = (
+                        self._do_object_request(
+                            function=self.object.get,
+                            container=container,
+                            path=path,
+                            offset=offset + range_offset,
+                            num_bytes=length,
+                        ).body
+                    )
+
+                self._transfer_ranges(size, self._transfer_chunk_size, get_range)
+                return bytes(buffer)
+
         return self._do_object_request(
             function=self.object.get,
             container=container,
@@ -135,6 +253,34 @@ class V3ioStore(DataStore):
             num_bytes=size,
         ).body
 
+    def download(self, key, target_path):
+        if self._transfer_concurrency == 1:
+            return super().download(key, target_path)
+
+        container, path = split_path(self._join(key))
+        size = self._get_size(container, path)
+        if size <= self._transfer_chunk_size:
+            return super().download(key, target_path)
+
+        # the ranges are written to the target file as they arrive, instead of holding the whole object in memory
+        lock = threading.Lock()
+        with open(target_path, "wb") as file_obj:
+            file_obj.truncate(size)
+
+            def download_range(offset: int, length: int):
+                data = self._do_object_request(
+                    function=self.object.get,
+                    container=container,
+                    path=path,
+                    offset=offset,
+                    num_bytes=length,
+                ).body
+                with lock:
+                    file_obj.seek(offset)
+                    file_obj.write(data)
+
+            self._transfer_ranges(size, self._transfer_chunk_size, download_range)
+
     def _put(
         self,
         key,
@@ -145,6 +291,20 @@ class V3ioStore(DataStore):
         """helper function for put method, allows for controlling max_chunk_size in testing"""
         data, _ = self._prepare_put_data(data, append)
         container, path = split_path(self._join(key))
+        if self._transfer_concurrency > 1 and not append:
+            if isinstance(data, str):
+                data = data.encode("utf-8")
+            if len(data) > max_chunk_size:
+                data = memoryview(data)
+                self._parallel_put(
+                    container,
+                    path,
+                    len(data),
+                    lambda offset, length: data[offset : offset + length],
+                    max_chunk_size,
+                )
+                return
+
         buffer_size = len(data)  # in bytes
         buffer_offset = 0
         try:
@@ -165,7 +325,7 @@ class V3ioStore(DataStore):
             buffer_offset += chunk_size
 
     def put(self, key, data, append=False):
-        return self._put(key, data, append)
+        return self._put(key, data, append, max_chunk_size=self._transfer_chunk_size)
 
     def stat(self, key):
         container, path = split_path(self._join(key))
@@ -68,6 +68,16 @@ class RunDBInterface(ABC):
     ):
         pass
 
+    @abstractmethod
+    def list_runs_states(
+        self,
+        uids: list[str],
+        project: str = "",
+        known_states: Optional[dict[str, str]] = None,
+        timeout: int = 0,
+    ) -> list[mlrun.common.schemas.RunState]:
+        pass
+
     @abstractmethod
     def list_runs(
         self,
@@ -108,6 +118,10 @@ class RunDBInterface(ABC):
     ):
         pass
 
+    @abstractmethod
+    def iter_runs(self, *args, **kwargs):
+        pass
+
     @abstractmethod
     def del_run(self, uid, project="", iter=0):
         pass
@@ -182,6 +196,10 @@ class RunDBInterface(ABC):
     ):
         pass
 
+    @abstractmethod
+    def iter_artifacts(self, *args, **kwargs):
+        pass
+
     @abstractmethod
     def del_artifact(
         self,
@@ -695,6 +713,7 @@ class RunDBInterface(ABC):
         top_level: bool = False,
         uids: Optional[list[str]] = None,
         latest_only: bool = False,
+        feature_analysis: bool = False,
     ) -> mlrun.common.schemas.ModelEndpointList:
         pass
 
@@ -831,6 +850,14 @@ class RunDBInterface(ABC):
     ):
         pass
 
+    @abstractmethod
+    def generate_events(
+        self,
+        events: list[Union[dict, mlrun.common.schemas.Event]],
+        project="",
+    ):
+        pass
+
     @abstractmethod
     def store_alert_config(
         self,
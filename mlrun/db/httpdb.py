@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import concurrent.futures
 import enum
 import http
 import re
@@ -25,6 +27,7 @@ from os import path, remove
 from typing import Literal, Optional, Union
 from urllib.parse import urlparse
 
+import orjson
 import pydantic.v1
 import requests
 import semver
@@ -202,6 +205,7 @@ class HTTPRunDB(RunDBInterface):
         headers=None,
         timeout=45,
         version=None,
+        stream=False,
     ) -> requests.Response:
         """Perform a direct REST API call on the :py:mod:`mlrun` API server.
 
@@ -219,6 +223,7 @@ class HTTPRunDB(RunDBInterface):
         :param timeout: API call timeout
         :param version: API version to use, None (the default) will mean to use the default value from config,
          for un-versioned api set an empty string.
+        :param stream: Whether to stream the response content instead of downloading it immediately
 
         :returns: `requests.Response` HTTP response object
         """
@@ -279,6 +284,7 @@ class HTTPRunDB(RunDBInterface):
                 url,
                 timeout=timeout,
                 verify=config.httpdb.http.verify,
+                stream=stream,
                 **kw,
             )
         except requests.RequestException as exc:
@@ -303,6 +309,50 @@ class HTTPRunDB(RunDBInterface):
 
         return response
 
+    def stream_api_call(
+        self,
+        method,
+        path,
+        error=None,
+        params=None,
+        headers=None,
+        timeout=45,
+        version=None,
+    ) -> typing.Iterator[dict]:
+        """
+        Calls a list API with a streaming (newline-delimited JSON) response and returns an iterator over the listed
+        objects. The objects are parsed one by one while the response is being read, so the memory usage does not
+        depend on the number of listed objects.
+
+        :param method: The HTTP method (GET, POST, etc.).
+        :param path: The API endpoint path.
+        :param error: Error message used for debugging if the request fails.
+        :param params: The parameters to pass for the API request, including filters.
+        :param headers: Custom headers for the request.
+        :param timeout: Timeout for the request (applies to every read from the stream).
+        :param version: API version, optional.
+        """
+        headers = deepcopy(headers) or {}
+        headers["Accept"] = mlrun.common.schemas.MediaTypes.ndjson
+        response = self.api_call(
+            method=method,
+            path=path,
+            error=error,
+            params=params,
+            headers=headers,
+            timeout=timeout,
+            version=version,
+            stream=True,
+        )
+
+        def _iterate_objects():
+            with response:
+                for line in response.iter_lines():
+                    if line:
+                        yield orjson.loads(line)
+
+        return _iterate_objects()
+
     def paginated_api_call(
         self,
         method,
@@ -394,6 +444,111 @@ class HTTPRunDB(RunDBInterface):
             data.extend(response.json().get(key, []))
         return data, page_token
 
+    def iter_pages(
+        self,
+        paginated_list_method: typing.Callable[..., tuple[list, Optional[str]]],
+        *args,
+        prefetch: bool = True,
+        **kwargs,
+    ) -> typing.Iterator[list]:
+        """
+        Iterate over all the pages of a paginated list method, e.g. :py:func:`~paginated_list_runs`,
+        :py:func:`~paginated_list_artifacts` or :py:func:`~paginated_list_functions`.
+
+        When `prefetch` is enabled, the next page is requested on a background thread while the caller handles the
+        current page, so iterating over many pages is not bound by the sum of the request round trips. At most one
+        page is fetched ahead, so the memory usage is bounded by two pages.
+
+        Example::
+
+            for runs in db.iter_pages(
+                db.paginated_list_runs, project="my-project", page_size=500
+            ):
+                process(runs)
+
+        :param paginated_list_method: The paginated list method to call, returns the page and the next page token.
+        :param prefetch:              Whether to request the next page while the current page is handled.
+        :param args:                  Positional arguments for the list method.
+        :param kwargs:                Keyword arguments for the list method (filters, page size).
+
+        :returns: An iterator over the pages (lists of objects).
+        """
+        if not prefetch:
+            page_token = None
+            while True:
+                page, page_token = paginated_list_method(
+                    *args, page_token=page_token, **kwargs
+                )
+                yield page
+                if not page_token:
+                    return
+
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="mlrun-page-prefetch"
+        )
+        try:
+            next_page = executor.submit(paginated_list_method, *args, **kwargs)
+            while next_page:
+                page, page_token = next_page.result()
+                next_page = (
+                    executor.submit(
+                        paginated_list_method, *args, page_token=page_token, **kwargs
+                    )
+                    if page_token
+                    else None
+                )
+                yield page
+        finally:
+            # the caller may stop iterating early, don't wait for the page being prefetched
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def async_iter_pages(
+        self,
+        paginated_list_method: typing.Callable[..., tuple[list, Optional[str]]],
+        *args,
+        **kwargs,
+    ) -> typing.AsyncIterator[list]:
+        """
+        Asynchronously iterate over all the pages of a paginated list method, without blocking the event loop.
+        The next page is requested (on the loop's default executor) while the caller handles the current page.
+        See :py:func:`~iter_pages` for more details.
+
+        Example::
+
+            async for artifacts in db.async_iter_pages(
+                db.paginated_list_artifacts, project="my-project"
+            ):
+                process(artifacts)
+
+        :param paginated_list_method: The paginated list method to call, returns the page and the next page token.
+        :param args:                  Positional arguments for the list method.
+        :param kwargs:                Keyword arguments for the list method (filters, page size).
+
+        :returns: An async iterator over the pages (lists of objects).
+        """
+        next_page = asyncio.ensure_future(
+            mlrun.utils.run_in_threadpool(paginated_list_method, *args, **kwargs)
+        )
+        try:
+            while next_page:
+                page, page_token = await next_page
+                next_page = (
+                    asyncio.ensure_future(
+                        mlrun.utils.run_in_threadpool(
+                            paginated_list_method,
+                            *args,
+                            page_token=page_token,
+                            **kwargs,
+                        )
+                    )
+                    if page_token
+                    else None
+                )
+                yield page
+        finally:
+            if next_page:
+                next_page.cancel()
+
     def _init_session(self, retry_on_post: bool = False):
         return mlrun.utils.HTTPSessionWithRetry(
             retry_on_exception=config.httpdb.retry_api_call_on_exception
@@ -779,6 +934,35 @@ class HTTPRunDB(RunDBInterface):
         resp = self.api_call("GET", path, error, params=params)
         return resp.json()["data"]
 
+    def list_runs_states(
+        self,
+        uids: list[str],
+        project: str = "",
+        known_states: Optional[dict[str, str]] = None,
+        timeout: int = 0,
+    ) -> list[mlrun.common.schemas.RunState]:
+        """Retrieve the states of multiple runs in a single request, without their full details.
+
+        :param uids:         The runs' unique IDs.
+        :param project:      Project name.
+        :param known_states: The run states known to the caller (uid -> state). When given with a timeout, the
+                             request waits until the state of any of the runs differs from its known state (long poll).
+        :param timeout:      Seconds to wait for a state change, 0 to return immediately.
+
+        :returns: The state and last update time of each of the runs that were found.
+        """
+        project = project or config.default_project
+        path = f"projects/{project}/runs-states"
+        body = mlrun.common.schemas.RunsStatesRequest(
+            uids=uids, known_states=known_states or {}, timeout=timeout
+        )
+        error = f"list runs states {project}"
+        # the request may be held by the server for up to the given timeout
+        response = self.api_call(
+            "POST", path, error, json=body.dict(), timeout=45 + timeout
+        )
+        return mlrun.common.schemas.RunsStatesOutput(**response.json()).runs
+
     def del_run(self, uid, project="", iter=0):
         """Delete details of a specific run from DB.
 
@@ -946,6 +1130,25 @@ class HTTPRunDB(RunDBInterface):
             **kwargs,
         )
 
+    def iter_runs(self, *args, **kwargs) -> typing.Iterator[dict]:
+        """Iterate over runs filtered by various options, without loading all of them to memory.
+
+        The runs are streamed from the API and parsed one by one, which keeps the memory usage flat regardless of the
+        number of runs, e.g. when exporting all the runs of a large project.
+
+        For detailed information about the parameters, refer to the list_runs method:
+            See :py:func:`~list_runs` for more details.
+
+        Example::
+
+            for run in db.iter_runs(project="my-project", states=["error"]):
+                print(run["metadata"]["uid"])
+
+        :returns: An iterator over the runs (as dictionaries).
+        """
+        runs, _ = self._list_runs(*args, stream=True, **kwargs)
+        return runs
+
     def del_runs(
         self,
         name: Optional[str] = None,
@@ -1282,6 +1485,25 @@ class HTTPRunDB(RunDBInterface):
             **kwargs,
         )
 
+    def iter_artifacts(self, *args, **kwargs) -> typing.Iterator[dict]:
+        """Iterate over artifacts filtered by various parameters, without loading all of them to memory.
+
+        The artifacts are streamed from the API and parsed one by one, which keeps the memory usage flat regardless of
+        the number of artifacts, e.g. when exporting all the artifacts of a large project.
+
+        For detailed information about the parameters, refer to the list_artifacts method:
+            See :py:func:`~list_artifacts` for more details. The `limit` parameter is not supported.
+
+        Example::
+
+            for artifact in db.iter_artifacts(project="my-project", kind="model"):
+                print(artifact["metadata"]["key"])
+
+        :returns: An iterator over the artifacts (as dictionaries).
+        """
+        artifacts, _ = self._list_artifacts(*args, stream=True, **kwargs)
+        return artifacts
+
     def del_artifacts(
         self,
         name: Optional[str] = None,
@@ -3644,6 +3866,7 @@ class HTTPRunDB(RunDBInterface):
         top_level: bool = False,
         uids: Optional[list[str]] = None,
         latest_only: bool = False,
+        feature_analysis: bool = False,
     ) -> mlrun.common.schemas.ModelEndpointList:
         """
         List model endpoints with optional filtering by name, function name, model name, labels, and time range.
@@ -3660,6 +3883,8 @@ class HTTPRunDB(RunDBInterface):
         :param top_level:       Whether to return only top level model endpoints.
         :param uids:            A list of unique ids to filter by.
         :param latest_only:     Whether to return only the latest model endpoint version.
+        :param feature_analysis: Whether to include feature analysis data (feature_stats, current_stats &
+                                 drift_measures).
         :return:                A list of model endpoints.
         """
         path = f"projects/{project}/model-endpoints"
@@ -3680,6 +3905,7 @@ class HTTPRunDB(RunDBInterface):
                 "top-level": top_level,
                 "uid": uids,
                 "latest_only": latest_only,
+                "feature_analysis": feature_analysis,
             },
         )
 
@@ -4630,6 +4856,32 @@ class HTTPRunDB(RunDBInterface):
             "POST", endpoint_path, error_message, body=dict_to_json(event_data)
         )
 
+    def generate_events(
+        self,
+        events: list[Union[dict, mlrun.common.schemas.Event]],
+        project="",
+    ):
+        """
+        Generate multiple events in a single request. Each event is named by its kind.
+
+        :param events:  The data of the events.
+        :param project: The project that the events belong to.
+        """
+        if mlrun.mlconf.alerts.mode == mlrun.common.schemas.alert.AlertsModes.disabled:
+            logger.warning("Alerts are disabled, events will not be generated")
+
+        if not events:
+            return
+
+        project = project or config.default_project
+        endpoint_path = f"projects/{project}/events"
+        error_message = f"post events {project}/events"
+        events = [
+            event.dict() if isinstance(event, mlrun.common.schemas.Event) else event
+            for event in events
+        ]
+        self.api_call("POST", endpoint_path, error_message, body=dict_to_json(events))
+
     def store_alert_config(
         self,
         alert_name: str,
@@ -4934,8 +5186,9 @@ class HTTPRunDB(RunDBInterface):
         page_size: Optional[int] = None,
         page_token: Optional[str] = None,
         return_all: bool = False,
-    ) -> tuple[ArtifactList, Optional[str]]:
-        """Handles list artifacts, both paginated and not."""
+        stream: bool = False,
+    ) -> tuple[Union[ArtifactList, typing.Iterator[dict]], Optional[str]]:
+        """Handles list artifacts, paginated, streamed or not."""
 
         project = project or config.default_project
         labels = self._parse_labels(labels)
@@ -4971,6 +5224,11 @@ class HTTPRunDB(RunDBInterface):
         error = "list artifacts"
         endpoint_path = f"projects/{project}/artifacts"
 
+        if stream:
+            return self.stream_api_call(
+                "GET", endpoint_path, error, params=params, version="v2"
+            ), None
+
         # Fetch the responses, either one page or all based on `return_all`
         responses = self.paginated_api_call(
             "GET",
@@ -5062,8 +5320,9 @@ class HTTPRunDB(RunDBInterface):
         page_size: Optional[int] = None,
         page_token: Optional[str] = None,
         return_all: bool = False,
-    ) -> tuple[RunList, Optional[str]]:
-        """Handles list runs, both paginated and not."""
+        stream: bool = False,
+    ) -> tuple[Union[RunList, typing.Iterator[dict]], Optional[str]]:
+        """Handles list runs, paginated, streamed or not."""
 
         project = project or config.default_project
         if with_notifications:
@@ -5142,6 +5401,9 @@ class HTTPRunDB(RunDBInterface):
         error = "list runs"
         _path = self._path_of("runs", project)
 
+        if stream:
+            return self.stream_api_call("GET", _path, error, params=params), None
+
         # Fetch the responses, either one page or all based on `return_all`
         responses = self.paginated_api_call(
             "GET", _path, error, params=params, return_all=return_all
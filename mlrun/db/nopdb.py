@@ -100,6 +100,15 @@ class NopDB(RunDBInterface):
     ):
         pass
 
+    def list_runs_states(
+        self,
+        uids: list[str],
+        project: str = "",
+        known_states: Optional[dict[str, str]] = None,
+        timeout: int = 0,
+    ) -> list[mlrun.common.schemas.RunState]:
+        return []
+
     def list_runs(
         self,
         name: Optional[str] = None,
@@ -138,6 +147,9 @@ class NopDB(RunDBInterface):
     ):
         return mlrun.lists.RunList(), None
 
+    def iter_runs(self, *args, **kwargs):
+        return iter([])
+
     def del_run(self, uid, project="", iter=0):
         pass
 
@@ -206,6 +218,9 @@ class NopDB(RunDBInterface):
     ):
         return mlrun.lists.ArtifactList(), None
 
+    def iter_artifacts(self, *args, **kwargs):
+        return iter([])
+
     def del_artifact(
         self,
         key,
@@ -602,6 +617,7 @@ class NopDB(RunDBInterface):
         top_level: bool = False,
         uids: Optional[list[str]] = None,
         latest_only: bool = False,
+        feature_analysis: bool = False,
     ) -> mlrun.common.schemas.ModelEndpointList:
         pass
 
@@ -869,6 +885,13 @@ class NopDB(RunDBInterface):
     ):
         pass
 
+    def generate_events(
+        self,
+        events: list[Union[dict, mlrun.common.schemas.Event]],
+        project="",
+    ):
+        pass
+
     def store_alert_config(
         self,
         alert_name: str,
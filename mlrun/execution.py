@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import logging
 import os
 import uuid
@@ -20,7 +21,6 @@ from copy import deepcopy
 from typing import Optional, Union, cast
 
 import numpy as np
-import yaml
 from dateutil import parser
 
 import mlrun
@@ -85,6 +85,8 @@ class MLClientCtx:
         # Runtime db service interfaces
         self._rundb = None
         self._tmpfile = tmp
+        # Whether the tmpfile holds a full run written by this context, so updates can be appended to its journal
+        self._tmpfile_written = False
         self._logger = log_stream or logger
         self._log_level = "info"
         self._autocommit = autocommit
@@ -497,7 +499,7 @@ class MLClientCtx:
         if key not in self._parameters:
             self._parameters[key] = default
             if default:
-                self._update_run()
+                self._update_run(updates={("spec", "parameters", key): default})
             return default
         return self._parameters[key]
 
@@ -564,8 +566,11 @@ class MLClientCtx:
         :param value:  Result value
         :param commit: Commit (write to DB now vs wait for the end of the run)
         """
-        self._results[str(key)] = _cast_result(value)
-        self._update_run(commit=commit)
+        key = str(key)
+        self._results[key] = _cast_result(value)
+        self._update_run(
+            commit=commit, updates={("status", "results", key): self._results[key]}
+        )
 
     def log_results(self, results: dict, commit=False):
         """Log a set of scalar result values
@@ -580,9 +585,12 @@ class MLClientCtx:
         if not isinstance(results, dict):
             raise MLRunInvalidArgumentError("Results must be in the form of dict")
 
+        updates = {}
         for p in results.keys():
-            self._results[str(p)] = _cast_result(results[p])
-        self._update_run(commit=commit)
+            key = str(p)
+            self._results[key] = _cast_result(results[p])
+            updates[("status", "results", key)] = self._results[key]
+        self._update_run(commit=commit, updates=updates)
 
     def log_iteration_results(self, best, summary: list, task: dict, commit=False):
         """Reserved for internal use"""
@@ -1144,14 +1152,19 @@ class MLClientCtx:
         # Single worker is always the logging worker:
         return True
 
-    def _update_run(self, commit=False, message=""):
+    def _update_run(self, commit=False, message="", updates: Optional[dict] = None):
         """
         Update the required fields in the run object instead of overwriting existing values with empty ones
 
         :param commit:  Commit the changes to the DB if autocommit is not set or update the tmpfile alone
         :param message: Commit message
+        :param updates: The changed fields of the run (as key path tuple -> value). When given and not committing,
+                        they are appended to the tmpfile journal instead of rewriting the whole tmpfile
         """
-        self._merge_tmpfile()
+        if updates is not None and not commit:
+            self._append_tmpfile_updates(updates)
+        else:
+            self._merge_tmpfile()
         if commit or self._autocommit:
             self._commit = message
             if self._rundb:
@@ -1235,6 +1248,7 @@ class MLClientCtx:
         if not self._tmpfile:
             return
 
+        # The journaled updates are part of the run sections that are rewritten below, so only the snapshot is read
         loaded_run = self._read_tmpfile()
         dict_run = self.to_dict()
         if loaded_run:
@@ -1248,7 +1262,8 @@ class MLClientCtx:
     def _read_tmpfile(self):
         if self._tmpfile:
             with open(self._tmpfile) as fp:
-                return yaml.safe_load(fp)
+                data = fp.read()
+            return json.loads(data) if data else None
 
         return None
 
@@ -1259,6 +1274,65 @@ class MLClientCtx:
             with open(self._tmpfile, "w") as fp:
                 fp.write(data)
                 fp.close()
+            # The snapshot is up-to-date, drop the journaled updates
+            if os.path.exists(_tmpfile_journal_path(self._tmpfile)):
+                os.remove(_tmpfile_journal_path(self._tmpfile))
+            self._tmpfile_written = True
+
+    def _append_tmpfile_updates(self, updates: dict):
+        if not self._tmpfile:
+            return
+        if not self._tmpfile_written:
+            # The journal is applied on top of the run this context wrote
+            self._merge_tmpfile()
+            return
+
+        with open(_tmpfile_journal_path(self._tmpfile), "a") as fp:
+            fp.write(dict_to_json([[list(key), val] for key, val in updates.items()]))
+            fp.write("\n")
+
+
+def _tmpfile_journal_path(tmpfile: str) -> str:
+    return f"{tmpfile}.journal"
+
+
+def read_run_tmpfile(tmpfile: str) -> Optional[dict]:
+    """
+    Read the run written by an execution context to its tmpfile, with the updates that were appended to its journal
+    and were not compacted into it yet (the journal is compacted on commit)
+
+    :param tmpfile: The tmpfile path (MLRUN_META_TMPFILE)
+
+    :return: The run dictionary, or None if the execution did not write the run
+    """
+    if not os.path.isfile(tmpfile):
+        return None
+    with open(tmpfile) as fp:
+        data = fp.read()
+    if not data:
+        return None
+    run = json.loads(data)
+
+    journal_path = _tmpfile_journal_path(tmpfile)
+    if os.path.isfile(journal_path):
+        with open(journal_path) as fp:
+            for line in fp:
+                try:
+                    updates = json.loads(line)
+                except json.JSONDecodeError:
+                    # A partially written record of an execution that was killed
+                    logger.debug("Skipping a corrupted run tmpfile journal record")
+                    continue
+                for key, val in updates:
+                    update_in(run, key, val)
+    return run
+
+
+def remove_run_tmpfile(tmpfile: str):
+    """Remove the tmpfile of an execution context and its journal"""
+    for path in (tmpfile, _tmpfile_journal_path(tmpfile)):
+        if os.path.isfile(path):
+            os.remove(path)
 
 
 def _cast_result(value):
@@ -165,7 +165,7 @@ def get_offline_features(
                                     (default False)
     :param update_stats:            update features statistics from the requested feature sets on the vector.
                                     (default False).
-    :param engine:                  processing engine kind ("local", "dask", or "spark")
+    :param engine:                  processing engine kind ("local", "dask", "spark" or "arrow")
     :param engine_args:             kwargs for the processing engine
     :param query:                   The query string used to filter rows on the output
     :param spark_service:           Name of the spark service to be used (when using a remote-spark runtime)
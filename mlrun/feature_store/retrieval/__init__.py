@@ -13,6 +13,7 @@
 # limitations under the License.
 import mlrun.errors
 
+from .arrow_merger import ArrowFeatureMerger
 from .dask_merger import DaskFeatureMerger
 from .job import RemoteVectorResponse, run_merge_job  # noqa
 from .local_merger import LocalFeatureMerger
@@ -23,6 +24,7 @@ mergers = {
     "local": LocalFeatureMerger,
     "dask": DaskFeatureMerger,
     "spark": SparkFeatureMerger,
+    "arrow": ArrowFeatureMerger,
     "storey": StoreyFeatureMerger,
 }
 
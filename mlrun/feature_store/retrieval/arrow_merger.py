@@ -0,0 +1,672 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import ast
+import os
+import typing
+import urllib.parse
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv
+import pyarrow.dataset
+import pyarrow.parquet as pq
+import pytz
+
+import mlrun
+from mlrun.datastore.targets import TargetTypes, get_offline_target
+from mlrun.datastore.utils import transform_list_filters_to_tuple
+
+from ...utils import logger
+from .base import BaseMerger, _is_row_wise, _parse_query
+
+try:
+    import pyarrow.acero as acero
+
+    # the scan node options are not exported by pyarrow.dataset (pyarrow.acero imports them the same way)
+    from pyarrow._dataset import ScanNodeOptions
+except ImportError:
+    acero = None
+
+_join_types = {
+    "inner": "inner",
+    "left": "left outer",
+    "right": "right outer",
+    "outer": "full outer",
+}
+
+# an as-of join matches the latest right row at or before the left row, with no limit on how far before
+_asof_join_tolerance = -(2**63 - 1)
+
+_comparison_operators = {
+    ast.Eq: pc.equal,
+    ast.NotEq: pc.not_equal,
+    ast.Lt: pc.less,
+    ast.LtE: pc.less_equal,
+    ast.Gt: pc.greater,
+    ast.GtE: pc.greater_equal,
+}
+
+_arithmetic_operators = {
+    ast.Add: pc.add,
+    ast.Sub: pc.subtract,
+    ast.Mult: pc.multiply,
+    ast.Pow: pc.power,
+}
+
+
+class _ArrowRelation:
+    """
+    A lazily evaluated relation of the arrow engine - an acero declaration (a query plan) and the schema of its
+    output. Nothing is read or computed until the relation is executed by to_reader() or to_table(), so all the
+    operations of the retrieval (scans, filters, joins, projections and sorting) are executed as one plan.
+    """
+
+    def __init__(self, declaration, schema: pa.Schema):
+        self.declaration = declaration
+        self.schema = schema
+
+    @classmethod
+    def from_table(cls, table: pa.Table) -> "_ArrowRelation":
+        return cls(
+            acero.Declaration("table_source", acero.TableSourceNodeOptions(table)),
+            table.schema,
+        )
+
+    @property
+    def columns(self) -> list[str]:
+        return self.schema.names
+
+    def add_node(
+        self, node_name: str, options, *others: "_ArrowRelation"
+    ) -> "_ArrowRelation":
+        """Add a node to the plan whose inputs are this relation (and others, e.g. the right side of a join)"""
+        declaration = acero.Declaration(
+            node_name,
+            options,
+            inputs=[self.declaration] + [other.declaration for other in others],
+        )
+        # the output schema of a node is the schema of its output for empty inputs
+        empty_inputs = [
+            acero.Declaration(
+                "table_source", acero.TableSourceNodeOptions(schema.empty_table())
+            )
+            for schema in [self.schema] + [other.schema for other in others]
+        ]
+        schema = (
+            acero.Declaration(node_name, options, inputs=empty_inputs).to_table().schema
+        )
+        return _ArrowRelation(declaration, schema)
+
+    def filter(self, expression: pc.Expression) -> "_ArrowRelation":
+        return self.add_node("filter", acero.FilterNodeOptions(expression))
+
+    def project(
+        self, expressions: list[pc.Expression], names: list[str]
+    ) -> "_ArrowRelation":
+        return self.add_node("project", acero.ProjectNodeOptions(expressions, names))
+
+    def select(self, columns: list[str], names: typing.Optional[list[str]] = None):
+        return self.project([pc.field(column) for column in columns], names or columns)
+
+    def dropna(self, subset: list[str]) -> "_ArrowRelation":
+        expression = None
+        for column in subset:
+            valid = pc.field(column).is_valid()
+            if pa.types.is_floating(self.schema.field(column).type):
+                valid = valid & ~pc.field(column).is_nan()
+            expression = valid if expression is None else expression & valid
+        return self.filter(expression) if expression is not None else self
+
+    def to_reader(self) -> pa.RecordBatchReader:
+        return self.declaration.to_reader()
+
+    def to_table(self) -> pa.Table:
+        return self.declaration.to_table()
+
+
+class _UnsupportedQueryError(Exception):
+    pass
+
+
+def _fill_null(expression: pc.Expression, value) -> pc.Expression:
+    return pc.coalesce(expression, pc.scalar(value))
+
+
+def _query_to_expression(
+    node: ast.expr, columns: typing.Optional[dict[str, str]] = None
+) -> pc.Expression:
+    """
+    Translate a (row-wise) pandas query to an arrow expression with the same results. The columns are resolved by
+    `columns` (the names in the query mapped to the names in the relation), or by their names in the query.
+    Missing values never match a comparison (except for `!=`), like NaN values in pandas.
+    """
+    columns = columns or {}
+
+    def translate(node):
+        if isinstance(node, ast.Name):
+            return pc.field(columns.get(node.id, node.id))
+        if isinstance(node, ast.Constant):
+            return pc.scalar(node.value)
+        if isinstance(node, ast.BoolOp):
+            values = [_fill_null(translate(value), False) for value in node.values]
+            result = values[0]
+            for value in values[1:]:
+                result = (
+                    result & value if isinstance(node.op, ast.And) else result | value
+                )
+            return result
+        if isinstance(node, ast.UnaryOp):
+            operand = translate(node.operand)
+            if isinstance(node.op, (ast.Not, ast.Invert)):
+                return ~_fill_null(operand, False)
+            if isinstance(node.op, ast.USub):
+                return pc.negate(operand)
+            if isinstance(node.op, ast.UAdd):
+                return operand
+        if isinstance(node, ast.BinOp):
+            left, right = translate(node.left), translate(node.right)
+            if isinstance(node.op, ast.Div):
+                # true division, like python and pandas
+                return pc.divide(left.cast(pa.float64()), right.cast(pa.float64()))
+            operator = _arithmetic_operators.get(type(node.op))
+            if operator:
+                return operator(left, right)
+        if isinstance(node, ast.Compare):
+            result = None
+            left = node.left
+            for operator, right in zip(node.ops, node.comparators):
+                if isinstance(operator, (ast.In, ast.NotIn)):
+                    if not isinstance(right, (ast.List, ast.Tuple)) or not all(
+                        isinstance(element, ast.Constant) for element in right.elts
+                    ):
+                        raise _UnsupportedQueryError(ast.unparse(node))
+                    comparison = _fill_null(
+                        pc.is_in(
+                            translate(left),
+                            value_set=pa.array(
+                                [element.value for element in right.elts]
+                            ),
+                        ),
+                        False,
+                    )
+                    if isinstance(operator, ast.NotIn):
+                        comparison = ~comparison
+                elif type(operator) in _comparison_operators:
+                    comparison = _fill_null(
+                        _comparison_operators[type(operator)](
+                            translate(left), translate(right)
+                        ),
+                        isinstance(operator, ast.NotEq),
+                    )
+                else:
+                    raise _UnsupportedQueryError(ast.unparse(node))
+                result = comparison if result is None else result & comparison
+                left = right
+            return result
+        raise _UnsupportedQueryError(ast.unparse(node))
+
+    return translate(node)
+
+
+class ArrowFeatureMerger(BaseMerger):
+    """
+    Offline feature merger that runs the retrieval as one arrow (acero) query plan.
+
+    The offline (parquet) targets of the feature sets are scanned as arrow datasets with the time and additional
+    filters pushed down to the scan, and the joins, the query, the renames and the sorting are nodes of the plan.
+    The result is written to a parquet or csv target by streaming the record batches of the plan, so it is never
+    materialized as a pandas dataframe (other targets are written from a pandas dataframe).
+    Unlike the local engine, the order of the rows is not kept unless `order_by` is specified, and timestamps are
+    written to csv targets in arrow's ISO format.
+    """
+
+    engine = "arrow"
+    support_offline = True
+    support_query_pushdown = True
+
+    def __init__(self, vector, **engine_args):
+        super().__init__(vector, **engine_args)
+        if acero is None or not hasattr(acero, "AsofJoinNodeOptions"):
+            raise ImportError(
+                "Using 'ArrowFeatureMerger' requires pyarrow>=16 with acero support. "
+                "Use pip install 'pyarrow>=16' to install it."
+            )
+
+    def _asof_join(
+        self,
+        entity_df,
+        entity_timestamp_column: str,
+        featureset_name,
+        featureset_timestamp,
+        featureset_df,
+        left_keys: list,
+        right_keys: list,
+    ):
+        suffix = f"_{featureset_name}_"
+        entity_df = self._to_timestamp(entity_df, entity_timestamp_column)
+        on_type = entity_df.schema.field(entity_timestamp_column).type
+
+        # the "on" and "by" keys of the right side are not in the output of the join, so the join is done on copies of
+        # them, and the right columns are renamed to avoid collisions (like the suffixes of pandas merge_asof)
+        right_on = "__mlrun_asof_on__"
+        right_by = [f"__mlrun_asof_by_{index}__" for index in range(len(right_keys))]
+        expressions = []
+        names = []
+        for column in featureset_df.columns:
+            if column in left_keys and column in right_keys:
+                continue
+            if column == featureset_timestamp == entity_timestamp_column:
+                continue
+            expressions.append(pc.field(column))
+            names.append(f"{column}{suffix}" if column in entity_df.columns else column)
+        expressions.append(pc.field(featureset_timestamp).cast(on_type))
+        names.append(right_on)
+        for left_key, right_key, name in zip(left_keys, right_keys, right_by):
+            expressions.append(
+                pc.field(right_key).cast(entity_df.schema.field(left_key).type)
+            )
+            names.append(name)
+        featureset_df = featureset_df.project(expressions, names)
+
+        merged_df = entity_df.add_node(
+            "order_by",
+            acero.OrderByNodeOptions([(entity_timestamp_column, "ascending")]),
+        ).add_node(
+            "asofjoin",
+            acero.AsofJoinNodeOptions(
+                entity_timestamp_column,
+                left_keys,
+                right_on,
+                right_by,
+                _asof_join_tolerance,
+            ),
+            featureset_df.add_node(
+                "order_by", acero.OrderByNodeOptions([(right_on, "ascending")])
+            ),
+        )
+        for column in merged_df.columns:
+            if column.endswith(suffix):
+                self._append_drop_column(column)
+        return merged_df
+
+    def _join(
+        self,
+        entity_df,
+        entity_timestamp_column: str,
+        featureset_name,
+        featureset_timestamp,
+        featureset_df,
+        left_keys: list,
+        right_keys: list,
+    ):
+        suffix = f"_{featureset_name}_"
+        join_type = _join_types[self._join_type]
+        # keys with the same name on both sides are a single column of the result, like in pandas merge
+        common_keys = {
+            left_key
+            for left_key, right_key in zip(left_keys, right_keys)
+            if left_key == right_key
+        }
+        coalesce_keys = join_type in ["right outer", "full outer"]
+        right_columns = [
+            column
+            for column in featureset_df.columns
+            if column not in common_keys or coalesce_keys
+        ]
+
+        # the key types must be identical
+        casts = {
+            right_key: entity_df.schema.field(left_key).type
+            for left_key, right_key in zip(left_keys, right_keys)
+            if entity_df.schema.field(left_key).type
+            != featureset_df.schema.field(right_key).type
+        }
+        if casts:
+            featureset_df = featureset_df.project(
+                [
+                    pc.field(column).cast(casts[column])
+                    if column in casts
+                    else pc.field(column)
+                    for column in featureset_df.columns
+                ],
+                featureset_df.columns,
+            )
+
+        merged_df = entity_df.add_node(
+            "hashjoin",
+            acero.HashJoinNodeOptions(
+                join_type,
+                left_keys,
+                right_keys,
+                entity_df.columns,
+                right_columns,
+                output_suffix_for_left="",
+                output_suffix_for_right=suffix,
+            ),
+            featureset_df,
+        )
+        if coalesce_keys and common_keys:
+            # the key is taken from the right side for the rows that have no left side
+            right_common_keys = [f"{key}{suffix}" for key in common_keys]
+            columns = [
+                column
+                for column in merged_df.columns
+                if column not in right_common_keys
+            ]
+            merged_df = merged_df.project(
+                [
+                    pc.coalesce(pc.field(column), pc.field(f"{column}{suffix}"))
+                    if column in common_keys
+                    else pc.field(column)
+                    for column in columns
+                ],
+                columns,
+            )
+        for column in merged_df.columns:
+            if column.endswith(suffix):
+                self._append_drop_column(column)
+        return merged_df
+
+    def _normalize_timestamp_column(
+        self,
+        entity_timestamp_column,
+        reference_df,
+        featureset_timestamp,
+        featureset_df,
+        featureset_name,
+    ):
+        # the timestamp of the feature set is cast to the type of the entity timestamp as part of the as-of join
+        return featureset_df
+
+    @staticmethod
+    def _to_timestamp(df: _ArrowRelation, column: str) -> _ArrowRelation:
+        """Convert a column to a timestamp (like pd.to_datetime), e.g. when the entity rows have string timestamps"""
+        if pa.types.is_timestamp(df.schema.field(column).type):
+            return df
+        return df.project(
+            [
+                pc.field(name).cast(pa.timestamp("ns"))
+                if name == column
+                else pc.field(name)
+                for name in df.columns
+            ],
+            df.columns,
+        )
+
+    def get_df(self, to_pandas=True):
+        """return the result as a dataframe (pandas by default, otherwise an arrow table)"""
+        table = self._result_df.to_table()
+        if not to_pandas:
+            return table
+        df = table.to_pandas()
+        self._set_indexes(df)
+        return df
+
+    def _write_result_to_target(self, target, timestamp_key=None, **kwargs):
+        if (
+            target.kind not in [TargetTypes.parquet, TargetTypes.csv]
+            or not target.is_single_file()
+            or target.storage_options
+            or kwargs
+        ):
+            # partitioned targets and writer arguments are handled by the pandas writer of the target
+            return target.write_dataframe(
+                self._result_df.to_table().to_pandas(),
+                timestamp_key=timestamp_key,
+                **kwargs,
+            )
+
+        store, _, target_path = target._get_store_and_path()
+        file_system = store.filesystem
+        if file_system.protocol == "file" or (
+            isinstance(file_system.protocol, (tuple, list))
+            and "file" in file_system.protocol
+        ):
+            target_dir = os.path.dirname(target_path)
+            if target_dir:
+                os.makedirs(target_dir, exist_ok=True)
+
+        reader = self._result_df.to_reader()
+        with file_system.open(target_path, "wb") as file_obj:
+            if target.kind == TargetTypes.parquet:
+                writer = pq.ParquetWriter(file_obj, reader.schema)
+            else:
+                writer = pyarrow.csv.CSVWriter(file_obj, reader.schema)
+            with writer:
+                for batch in reader:
+                    writer.write_batch(batch)
+        try:
+            return file_system.size(target_path)
+        except Exception:
+            return None
+
+    def _create_engine_env(self):
+        pass
+
+    def _get_engine_df(
+        self,
+        feature_set,
+        feature_set_name,
+        column_names=None,
+        start_time=None,
+        end_time=None,
+        time_column=None,
+        additional_filters=None,
+    ):
+        dataset, url, file_system = self._get_dataset(feature_set)
+        if dataset is None:
+            # the target can't be scanned by arrow, read it as a dataframe
+            df = feature_set.to_dataframe(
+                columns=column_names,
+                start_time=start_time,
+                end_time=end_time,
+                time_column=time_column,
+                additional_filters=additional_filters,
+            )
+            if df.index.names[0]:
+                df.reset_index(inplace=True)
+            return _ArrowRelation.from_table(
+                pa.Table.from_pandas(df, preserve_index=False)
+            )
+
+        # the same columns as FeatureSet.to_dataframe()
+        columns = list(feature_set.spec.entities.keys())
+        if column_names:
+            if (
+                feature_set.spec.timestamp_key
+                and feature_set.spec.timestamp_key not in columns
+            ):
+                columns.append(feature_set.spec.timestamp_key)
+            columns += column_names
+        else:
+            columns += dataset.schema.names
+        columns = list(dict.fromkeys(columns))
+
+        expression = self._get_scan_filter(
+            dataset,
+            url,
+            file_system,
+            time_column,
+            start_time,
+            end_time,
+            additional_filters,
+        )
+        relation = _ArrowRelation(
+            acero.Declaration("scan", ScanNodeOptions(dataset, filter=expression)),
+            dataset.schema,
+        )
+        # the filter of the scan only skips the files and row groups that don't match
+        if expression is not None:
+            relation = relation.filter(expression)
+        return relation.select(columns)
+
+    @staticmethod
+    def _get_dataset(feature_set):
+        """
+        Get the arrow dataset of the offline parquet target of a feature set (and its url and file system),
+        None if the feature set has no such target
+        """
+        if feature_set.spec.passthrough:
+            return None, None, None
+        target = get_offline_target(feature_set)
+        if not target or target.kind != TargetTypes.parquet:
+            return None, None, None
+        store, _, url = mlrun.store_manager.get_or_create_store(
+            target.get_target_path()
+        )
+        file_system = store.filesystem
+        if file_system is None:
+            return None, None, None
+        if url.startswith("ds://"):
+            path = urllib.parse.urlparse(url).path
+            if store.using_bucket:
+                path = path[1:]
+        else:
+            path = file_system._strip_protocol(url)
+        return (
+            pyarrow.dataset.dataset(
+                path, filesystem=file_system, format="parquet", partitioning="hive"
+            ),
+            url,
+            file_system,
+        )
+
+    @staticmethod
+    def _get_scan_filter(
+        dataset,
+        url,
+        file_system,
+        time_column,
+        start_time,
+        end_time,
+        additional_filters,
+    ) -> typing.Optional[pc.Expression]:
+        """The filter of the feature set's rows, the same as the filters of the parquet reader of the datastore"""
+        from storey.utils import find_filters, find_partitions
+
+        filters = []
+        if start_time or end_time:
+            if time_column is None:
+                raise mlrun.errors.MLRunInvalidArgumentError(
+                    "When providing start_time or end_time, must provide time_column"
+                )
+            if (
+                start_time
+                and end_time
+                and start_time.utcoffset() != end_time.utcoffset()
+            ):
+                raise mlrun.errors.MLRunInvalidArgumentError(
+                    "start_time and end_time must have the same time zone"
+                )
+            # timestamps with and without a time zone can't be compared, so like the parquet reader of the
+            # datastore, the time zone of the times is replaced when only one side has a time zone
+            time_type = dataset.schema.field(time_column).type
+            if pa.types.is_timestamp(time_type):
+                start_time, end_time = (
+                    time.replace(tzinfo=pytz.utc if time_type.tz else None)
+                    if time and bool(time.tzinfo) != bool(time_type.tz)
+                    else time
+                    for time in (start_time, end_time)
+                )
+            find_filters(
+                find_partitions(url, file_system),
+                start_time,
+                end_time,
+                filters,
+                time_column,
+            )
+        expression = pq.filters_to_expression(filters) if filters else None
+        if additional_filters:
+            additional_expression = pq.filters_to_expression(
+                transform_list_filters_to_tuple(additional_filters)
+            )
+            expression = (
+                additional_expression
+                if expression is None
+                else expression & additional_expression
+            )
+        return expression
+
+    def _rename_columns_and_select(self, df, rename_col_dict, columns=None):
+        return df.select(
+            df.columns,
+            [rename_col_dict.get(column) or column for column in df.columns],
+        )
+
+    def _drop_columns_from_result(self):
+        self._result_df = self._result_df.select(
+            [
+                column
+                for column in self._result_df.columns
+                if column not in self._drop_columns
+            ]
+        )
+
+    def _filter_engine_df(self, df, predicate, columns):
+        expression = _query_to_expression(_parse_query(predicate), columns)
+        # fail on unsupported types (e.g. a timestamp compared to a string) before the plan is executed
+        df.schema.empty_table().filter(expression)
+        return df.filter(expression)
+
+    def _filter(self, query):
+        node = _parse_query(query)
+        if node is not None and _is_row_wise(node):
+            try:
+                self._result_df = self._filter_engine_df(self._result_df, query, {})
+                return
+            except (
+                _UnsupportedQueryError,
+                pa.ArrowException,
+                TypeError,
+                ValueError,
+            ) as exc:
+                logger.debug(
+                    "Query is not supported by arrow, filtering with pandas",
+                    query=query,
+                    exc=mlrun.errors.err_to_str(exc),
+                )
+
+        # the query is evaluated by pandas on the materialized result, by record batch when it is row-wise.
+        # the matching rows are taken from the arrow batch, since converting the pandas result back to arrow may
+        # change the column types (e.g. an empty string column or an integer column with nulls)
+        reader = self._result_df.to_reader()
+        if node is not None and _is_row_wise(node):
+            batches = (
+                batch.take(pa.array(batch.to_pandas().query(query).index, pa.int64()))
+                for batch in reader
+            )
+            table = pa.Table.from_batches(batches, schema=reader.schema)
+        else:
+            table = pa.Table.from_pandas(
+                reader.read_pandas().query(query), preserve_index=False
+            )
+        self._result_df = _ArrowRelation.from_table(table)
+
+    def _order_by(self, order_by_active):
+        self._result_df = self._result_df.add_node(
+            "order_by",
+            acero.OrderByNodeOptions(
+                [(column, "ascending") for column in order_by_active]
+            ),
+        )
+
+    def _convert_entity_rows_to_engine_df(self, entity_rows):
+        if isinstance(entity_rows, _ArrowRelation):
+            return entity_rows
+        if isinstance(entity_rows, pa.Table):
+            return _ArrowRelation.from_table(entity_rows)
+        return _ArrowRelation.from_table(
+            pa.Table.from_pandas(entity_rows, preserve_index=False)
+        )
@@ -13,6 +13,9 @@
 # limitations under the License.
 #
 import abc
+import ast
+import io
+import tokenize
 import typing
 from datetime import datetime
 
@@ -26,6 +29,74 @@ from mlrun.feature_store.feature_vector import JoinGraph
 from ...utils import logger, str_to_timestamp
 from ..feature_vector import OfflineVectorResponse
 
+# the query expression nodes that are evaluated row by row, only predicates made of them are pushed down
+_row_wise_nodes = (
+    ast.BoolOp,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Compare,
+    ast.Name,
+    ast.Constant,
+    ast.List,
+    ast.Tuple,
+    ast.expr_context,
+    ast.boolop,
+    ast.operator,
+    ast.unaryop,
+    ast.cmpop,
+)
+
+# pandas parses the bitwise operators of a query with the precedence of their boolean counterparts
+_query_boolean_operators = {"&": "and", "|": "or"}
+
+# the join types that keep every row of the left side by the row of the left side (no rows are added)
+_pushdown_join_types = ["inner", "left"]
+
+
+def _parse_query(query: str) -> typing.Optional[ast.expr]:
+    """Parse a pandas query into a python expression tree, None when the query can not be analyzed"""
+    if "`" in query or "@" in query:
+        return None
+    try:
+        tokens = [
+            (tokenize.NAME, _query_boolean_operators[token.string])
+            if token.type == tokenize.OP and token.string in _query_boolean_operators
+            else (token.type, token.string)
+            for token in tokenize.generate_tokens(io.StringIO(query).readline)
+        ]
+        return ast.parse(tokenize.untokenize(tokens).strip(), mode="eval").body
+    except (SyntaxError, tokenize.TokenError, ValueError):
+        return None
+
+
+def _is_row_wise(node: ast.expr) -> bool:
+    return all(isinstance(child, _row_wise_nodes) for child in ast.walk(node))
+
+
+def _split_query(query: str) -> list[tuple[str, set[str]]]:
+    """
+    Split a pandas query into its top level conjunctions (`and`/`&`), which can each be evaluated on its own.
+    Returns the (predicate, column names) of the conjunctions that only use row-wise operations (no function calls,
+    attributes or local variables), or an empty list when the query can not be analyzed.
+    """
+    expression = _parse_query(query)
+    if expression is None:
+        return []
+
+    conjunctions = [expression]
+    predicates = []
+    while conjunctions:
+        node = conjunctions.pop(0)
+        if isinstance(node, ast.BoolOp) and isinstance(node.op, ast.And):
+            conjunctions = node.values + conjunctions
+        elif _is_row_wise(node):
+            names = {
+                child.id for child in ast.walk(node) if isinstance(child, ast.Name)
+            }
+            if names:
+                predicates.append((ast.unparse(node), names))
+    return predicates
+
 
 class BaseMerger(abc.ABC):
     """abstract feature merger class"""
@@ -36,6 +107,10 @@ class BaseMerger(abc.ABC):
     # In order to be an offline merger, the merger should implement
     # `_order_by`, `_filter`, `_drop_columns_from_result`, `_rename_columns_and_select`, `_get_engine_df` functions.
     support_offline = False
+
+    # In order to filter the data frames by the query before they are joined, the merger should implement
+    # `_filter_engine_df` (the whole query is still applied to the joined result by `_filter`).
+    support_query_pushdown = False
     engine = None
 
     def __init__(self, vector, **engine_args):
@@ -52,6 +127,7 @@ class BaseMerger(abc.ABC):
         self._alias = dict()
         self._origin_alias = dict()
         self._entity_rows_node_name = "__mlrun__$entity_rows$"
+        self._pushdown_predicates = []
 
     def _append_drop_column(self, key):
         if key and key not in self._drop_columns:
@@ -155,8 +231,8 @@ class BaseMerger(abc.ABC):
                     "target path was not specified"
                 )
             self._target.set_resource(self.vector)
-            size = self._target.write_dataframe(
-                self._result_df, timestamp_key=self.vector.status.timestamp_key
+            size = self._write_result_to_target(
+                self._target, timestamp_key=self.vector.status.timestamp_key
             )
             if is_persistent_vector:
                 target_status = self._target.update_resource_status("ready", size=size)
@@ -318,6 +394,9 @@ class BaseMerger(abc.ABC):
                 "a timestamp column, or when the at least one feature_set has a timestamp key"
             )
 
+        if query and self.support_query_pushdown:
+            self._pushdown_predicates = self._get_pushdown_predicates(query)
+
         # join the feature data frames
         result_timestamp = self.merge(
             entity_timestamp_column=entity_timestamp_column,
@@ -424,11 +503,24 @@ class BaseMerger(abc.ABC):
     ):
         """join the entities and feature set features into a result dataframe"""
 
+        # the timestamp columns are converted by the joins, so they are never filtered before the joins
+        timestamp_columns = {entity_timestamp_column} | {
+            featureset.spec.timestamp_key for featureset in featuresets if featureset
+        }
+        # filtering before a join that adds rows (right/outer) would change the result
+        push_down = bool(self._pushdown_predicates) and all(
+            join_type[0] in _pushdown_join_types + [self._default_join_type]
+            for join_type in join_types[1:]
+        )
+
         merged_df = featureset_dfs.pop(0)
         featureset = featuresets.pop(0)
         keys.pop(0)
         join_types.pop(0)
 
+        if push_down:
+            merged_df = self._push_down_query(merged_df, timestamp_columns)
+
         if not entity_timestamp_column and featureset:
             entity_timestamp_column = featureset.spec.timestamp_key
 
@@ -451,6 +543,16 @@ class BaseMerger(abc.ABC):
                 self._join_type = join_type
                 merge_func = self._asof_join
 
+            # the right side of an inner join can be filtered as well (an as-of join would match other rows)
+            if push_down and merge_func == self._join and self._join_type == "inner":
+                featureset_df = self._push_down_query(
+                    featureset_df,
+                    timestamp_columns,
+                    left_df=merged_df,
+                    left_keys=lr_key[0],
+                    right_keys=lr_key[1],
+                )
+
             merged_df = merge_func(
                 merged_df,
                 entity_timestamp_column,
@@ -472,6 +574,66 @@ class BaseMerger(abc.ABC):
         self._result_df = merged_df
         return entity_timestamp_column
 
+    def _get_pushdown_predicates(self, query: str) -> list[tuple[str, set[str]]]:
+        """
+        Get the predicates of the query that can filter the data frames before they are joined, each is a
+        conjunction of the query that only uses columns of the result (by their name in the result).
+        """
+        result_columns = list(self._alias.values())
+        ambiguous_columns = {
+            column for column in result_columns if result_columns.count(column) > 1
+        }
+        return [
+            (predicate, names)
+            for predicate, names in _split_query(query)
+            if not names & ambiguous_columns
+        ]
+
+    def _push_down_query(
+        self,
+        df,
+        timestamp_columns: set,
+        left_df=None,
+        left_keys: typing.Optional[list] = None,
+        right_keys: typing.Optional[list] = None,
+    ):
+        """
+        Filter a data frame before it is joined by the query predicates that only use its columns. The data frame is
+        the right side of an inner join with `left_df`, or the first data frame (which all the others are joined to)
+        when `left_df` is None. Only the columns whose values are kept by the joins are filtered on.
+        """
+        joined_keys = {
+            left_key
+            for left_key, right_key in zip(left_keys or [], right_keys or [])
+            if left_key == right_key
+        }
+        left_columns = set(left_df.columns) if left_df is not None else set()
+        columns = {}
+        for column in df.columns:
+            if column in timestamp_columns or (
+                column in left_columns and column not in joined_keys
+            ):
+                continue
+            result_column = self._alias.get(column) or column
+            if result_column not in self._drop_columns:
+                columns[result_column] = column
+
+        for predicate, names in self._pushdown_predicates:
+            if not names.issubset(columns):
+                continue
+            try:
+                df = self._filter_engine_df(
+                    df, predicate, {name: columns[name] for name in names}
+                )
+            except Exception as exc:
+                # the query is applied to the result anyway, which raises the error if it is invalid
+                logger.debug(
+                    "Failed to filter the data frame before the join",
+                    predicate=predicate,
+                    exc=mlrun.errors.err_to_str(exc),
+                )
+        return df
+
     def _asof_join(
         self,
         entity_df,
@@ -509,14 +671,20 @@ class BaseMerger(abc.ABC):
 
     def to_parquet(self, target_path, **kw):
         """return results as parquet file"""
-        size = ParquetTarget(path=target_path).write_dataframe(self._result_df, **kw)
+        size = self._write_result_to_target(ParquetTarget(path=target_path), **kw)
         return size
 
     def to_csv(self, target_path, **kw):
         """return results as csv file"""
-        size = CSVTarget(path=target_path).write_dataframe(self._result_df, **kw)
+        size = self._write_result_to_target(CSVTarget(path=target_path), **kw)
         return size
 
+    def _write_result_to_target(self, target, timestamp_key=None, **kwargs):
+        """write `self._result_df` to a target, returns the size of the written data (if known)"""
+        return target.write_dataframe(
+            self._result_df, timestamp_key=timestamp_key, **kwargs
+        )
+
     def _get_graph(
         self, feature_set_objects, feature_set_fields, entity_rows_keys=None
     ):
@@ -811,6 +979,18 @@ class BaseMerger(abc.ABC):
         """
         raise NotImplementedError
 
+    def _filter_engine_df(self, df, predicate: str, columns: dict[str, str]):
+        """
+        filter a data frame by a predicate of the query before it is joined
+
+        :param df:        the data frame to filter
+        :param predicate: a conjunction of the query (see `_split_query`)
+        :param columns:   the names of the predicate's columns in the result mapped to their names in `df`
+
+        :return: the filtered data frame
+        """
+        raise NotImplementedError
+
     def _order_by(self, order_by_active: list[str]):
         """
         Order by `order_by_active` along all axis.
@@ -22,6 +22,7 @@ from .base import BaseMerger
 class LocalFeatureMerger(BaseMerger):
     engine = "local"
     support_offline = True
+    support_query_pushdown = True
 
     def __init__(self, vector, **engine_args):
         super().__init__(vector, **engine_args)
@@ -139,6 +140,11 @@ class LocalFeatureMerger(BaseMerger):
     def _filter(self, query):
         self._result_df.query(query, inplace=True)
 
+    def _filter_engine_df(self, df, predicate, columns):
+        # resolve the predicate's columns by their names in the result, before the columns are renamed
+        resolvers = {name: df[column] for name, column in columns.items()}
+        return df.query(predicate, resolvers=(resolvers,))
+
     def _order_by(self, order_by_active):
         self._result_df.sort_values(by=order_by_active, ignore_index=True, inplace=True)
 
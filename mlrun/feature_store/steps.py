@@ -221,30 +221,80 @@ class MapValues(StepToDict, MLRunStep):
             feature_map = self.mapping.get(feature, {})
             if "ranges" in feature_map:
                 # create and apply range map
-                for val, val_range in feature_map.get("ranges", {}).items():
-                    min_val = val_range[0] if val_range[0] != "-inf" else -np.inf
-                    max_val = val_range[1] if val_range[1] != "inf" else np.inf
-                    feature_map["ranges"][val] = [min_val, max_val]
-
-                matchdf = pd.DataFrame.from_dict(
-                    feature_map["ranges"], "index"
-                ).reset_index()
-                matchdf.index = pd.IntervalIndex.from_arrays(
-                    left=matchdf[0], right=matchdf[1], closed="both"
+                df[self._get_feature_name(feature)] = self._map_ranges_pandas(
+                    event[feature], feature_map["ranges"]
                 )
-                df[self._get_feature_name(feature)] = matchdf.loc[event[feature]][
-                    "index"
-                ].values
             elif feature_map:
                 # create and apply simple map
-                df[self._get_feature_name(feature)] = event[feature].map(
-                    lambda x: feature_map.get(x, None)
+                df[self._get_feature_name(feature)] = self._map_values_pandas(
+                    event[feature], feature_map
                 )
 
         if self.with_original_features:
             df = pd.concat([event, df], axis=1)
         return df
 
+    @staticmethod
+    def _map_values_pandas(values: pd.Series, feature_map: dict) -> pd.Series:
+        def map_value(value):
+            return feature_map.get(value, None)
+
+        if not isinstance(values.dtype, np.dtype):
+            # extension types (e.g. categorical) are mapped by their own map()
+            return values.map(map_value)
+
+        # map each distinct value once and broadcast the results by the value codes, the missing values (code -1) are
+        # mapped one by one as they may be None or NaN
+        codes, uniques = pd.factorize(values)
+        mapped_uniques = np.empty(len(uniques), dtype=object)
+        mapped_uniques[:] = [map_value(value) for value in uniques]
+        mapped = mapped_uniques.take(codes, mode="clip")
+        missing = codes == -1
+        if missing.any():
+            mapped[missing] = [map_value(value) for value in values.values[missing]]
+        # infer the result type the same way as the element-wise map()
+        return pd.Series(mapped, index=values.index).infer_objects()
+
+    @staticmethod
+    def _map_ranges_pandas(values: pd.Series, ranges: dict) -> np.ndarray:
+        names = pd.Index(list(ranges.keys())).values
+        bounds = [
+            (
+                val_range[0] if val_range[0] != "-inf" else -np.inf,
+                val_range[1] if val_range[1] != "inf" else np.inf,
+            )
+            for val_range in ranges.values()
+        ]
+
+        if pd.api.types.is_numeric_dtype(
+            values.dtype
+        ) and not pd.api.types.is_bool_dtype(values.dtype):
+            lefts = np.array([left for left, _ in bounds], dtype=float)
+            rights = np.array([right for _, right in bounds], dtype=float)
+            order = np.argsort(lefts, kind="stable")
+            lefts, rights, names_by_left = lefts[order], rights[order], names[order]
+            # the ranges are closed on both ends, so with sorted and non-overlapping ranges a value is in the last range
+            # that starts before it
+            if np.all(lefts[1:] >= rights[:-1]):
+                array = values.to_numpy(dtype=float, na_value=np.nan)
+                # the number of ranges that contain each value (ranges that start before it and don't end before it)
+                containing = np.searchsorted(
+                    lefts, array, side="right"
+                ) - np.searchsorted(rights, array, side="left")
+                if np.all(containing == 1):
+                    return names_by_left[
+                        np.searchsorted(lefts, array, side="right") - 1
+                    ]
+
+        # a value that is out of the ranges or in more than one of them raises
+        matchdf = pd.DataFrame({"index": names})
+        matchdf.index = pd.IntervalIndex.from_arrays(
+            left=[left for left, _ in bounds],
+            right=[right for _, right in bounds],
+            closed="both",
+        )
+        return matchdf.loc[values]["index"].values
+
     def _do_spark(self, event):
         from itertools import chain
 
@@ -478,17 +528,30 @@ class OneHotEncoder(StepToDict, MLRunStep):
         return encoded_values
 
     def _do_pandas(self, event):
+        encoded_columns = {}
         for key, values in self.mapping.items():
-            event[key] = pd.Categorical(event[key], categories=list(values))
-            encoded = pd.get_dummies(event[key], prefix=key, dtype=np.int64)
-            col_rename = {
-                name: OneHotEncoder._sanitized_category(name)
-                for name in encoded.columns
-            }
-            encoded.rename(columns=col_rename, inplace=True)
-            event = pd.concat([event.loc[:, :key], encoded, event.loc[:, key:]], axis=1)
-        event.drop(columns=list(self.mapping.keys()), inplace=True)
-        return event
+            codes = pd.Categorical(event[key], categories=list(values)).codes
+            encoded_columns[key] = pd.DataFrame(
+                (codes[:, np.newaxis] == np.arange(len(values))).astype(np.int64),
+                index=event.index,
+                columns=[
+                    OneHotEncoder._sanitized_category(f"{key}_{category}")
+                    for category in values
+                ],
+            )
+
+        # replace each encoded column with its binary columns in place, with a single concat of the frame
+        parts = []
+        start = 0
+        for position, column in enumerate(event.columns):
+            if column in encoded_columns:
+                if start < position:
+                    parts.append(event.iloc[:, start:position])
+                parts.append(encoded_columns[column])
+                start = position + 1
+        if start < len(event.columns):
+            parts.append(event.iloc[:, start:])
+        return pd.concat(parts, axis=1)
 
     def _do_spark(self, event):
         from pyspark.sql.functions import lit, when
@@ -17,4 +17,5 @@ from .mlrun_interface import MLRunInterface
 from .model_handler import ModelHandler, with_mlrun_interface, without_mlrun_interface
 from .plan import Plan
 from .producer import Producer
+from .requests_batcher import RequestsBatcher
 from .utils import CommonTypes, CommonUtils, LoggingMode
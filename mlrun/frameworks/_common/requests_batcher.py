@@ -0,0 +1,102 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable
+
+import numpy as np
+
+
+class RequestsBatcher:
+    """
+    Merge concurrent requests into a single run: the first request of a batch waits up to the timeout for more
+    requests, concatenates their inputs along the first axis, runs them and splits the outputs back.
+    """
+
+    def __init__(
+        self,
+        run: Callable[[list[np.ndarray]], list[np.ndarray]],
+        max_batch_size: int,
+        timeout_seconds: float,
+    ):
+        self._run = run
+        self._max_batch_size = max_batch_size
+        self._timeout_seconds = timeout_seconds
+        self._pending: list[tuple[list[np.ndarray], Future]] = []
+        self._condition = threading.Condition()
+
+    def run(self, inputs: list[np.ndarray]) -> list[np.ndarray]:
+        future = Future()
+        batch = None
+        with self._condition:
+            self._pending.append((inputs, future))
+            if len(self._pending) == 1:
+                # The first request of the batch collects the next requests and runs the batch
+                deadline = time.monotonic() + self._timeout_seconds
+                while len(self._pending) < self._max_batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                batch, self._pending = self._pending, []
+            elif len(self._pending) >= self._max_batch_size:
+                self._condition.notify_all()
+
+        if batch:
+            self._run_batch(batch)
+        return future.result()
+
+    def _run_batch(self, batch: list[tuple[list[np.ndarray], Future]]):
+        if len(batch) == 1:
+            self._run_single(*batch[0])
+            return
+
+        try:
+            rows = [inputs[0].shape[0] for inputs, _ in batch]
+            merged_inputs = [
+                np.concatenate([inputs[i] for inputs, _ in batch])
+                for i in range(len(batch[0][0]))
+            ]
+        except (ValueError, IndexError):
+            # Requests that can not be concatenated (e.g. different shapes) are run one by one
+            for inputs, future in batch:
+                self._run_single(inputs, future)
+            return
+
+        try:
+            outputs = self._run(merged_inputs)
+        except Exception as exc:
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+
+        total_rows = sum(rows)
+        if any(output.ndim == 0 or output.shape[0] != total_rows for output in outputs):
+            # Outputs that are not per row can not be split back
+            for inputs, future in batch:
+                self._run_single(inputs, future)
+            return
+
+        offsets = np.cumsum(rows)[:-1]
+        splits = [np.split(output, offsets) for output in outputs]
+        for i, (_, future) in enumerate(batch):
+            future.set_result([split[i] for split in splits])
+
+    def _run_single(self, inputs: list[np.ndarray], future: Future):
+        try:
+            future.set_result(self._run(inputs))
+        except Exception as exc:
+            future.set_exception(exc)
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from typing import Any
+from typing import Any, Union
 
 import numpy as np
 import pandas as pd
@@ -34,7 +34,7 @@ class PickleModelServer(V2ModelServer):
         model_file, extra_data = self.get_model(".pkl")
         self.model = load(open(model_file, "rb"))
 
-    def predict(self, request: dict) -> list:
+    def predict(self, request: dict) -> Union[list, np.ndarray]:
         """
         Infer the inputs through the model using MLRun's PyTorch interface and return its output. The inferred data will
         be read from the "inputs" key of the request.
@@ -47,9 +47,13 @@ class PickleModelServer(V2ModelServer):
 
                         * As a dictionary: `{"inputs": [{"x": [1, 2], "y": [3, 5.5]}]}`
                         * As a list: `{"inputs": [[1, 2], [3, 5.5]]}`
-        :return: The model's prediction on the given input.
+                        * As a numpy array, decoded from a request with binary tensor data.
+        :return: The model's prediction on the given input (a numpy array for binary tensor data requests).
         """
         inputs = request["inputs"]
+        if isinstance(inputs, np.ndarray):
+            # Binary tensor data - the prediction is encoded back as binary tensor data
+            return self.model.predict(inputs)
         if inputs and isinstance(inputs[0], dict):
             x = pd.DataFrame(inputs[0])
         else:
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import queue
 from typing import Any, Optional, Union
 
 import numpy as np
@@ -21,6 +22,7 @@ import onnxruntime
 import mlrun
 from mlrun.serving.v2_serving import V2ModelServer
 
+from .._common import RequestsBatcher
 from .model_handler import ONNXModelHandler
 
 
@@ -28,6 +30,12 @@ class ONNXModelServer(V2ModelServer):
     """
     ONNX Model serving class, inheriting the V2ModelServer class for being initialized automatically by the model server
     and be able to run locally as part of a nuclio serverless function, or as part of a real-time pipeline.
+
+    The serving graph calls `predict` with one event at a time, so the sessions pool (`sessions`) and the requests
+    batching (`max_batch_size`) only take effect when `predict` is called concurrently from several threads, for
+    example by a multi-threaded server or application that holds a single loaded model server and calls `predict`
+    directly. Within a serving graph, a single session (the default) should be used, and the parallelism is set by the
+    number of function workers instead.
     """
 
     def __init__(
@@ -41,6 +49,12 @@ class ONNXModelServer(V2ModelServer):
             list[Union[str, tuple[str, dict[str, Any]]]]
         ] = None,
         protocol: Optional[str] = None,
+        sessions: int = 1,
+        intra_op_num_threads: Optional[int] = None,
+        inter_op_num_threads: Optional[int] = None,
+        io_binding: bool = False,
+        max_batch_size: int = 1,
+        batch_timeout_ms: float = 2.0,
         **class_args,
     ):
         """
@@ -76,6 +90,22 @@ class ONNXModelServer(V2ModelServer):
                                     ]
                                     Default: None - will prefer CUDA Execution Provider over CPU Execution Provider.
         :param protocol:            -
+        :param sessions:            Number of inference sessions in the pool, so requests that call `predict` from
+                                    several threads run in parallel (the serving graph calls it with one event at a
+                                    time). Default: 1.
+        :param intra_op_num_threads: Number of threads each session uses to run a single operator. On a multi-core CPU
+                                     with a pool of sessions, the cores should be divided between the sessions.
+                                     Default: None - the onnxruntime default (all cores).
+        :param inter_op_num_threads: Number of threads each session uses to run independent operators in parallel.
+                                     Default: None - the onnxruntime default.
+        :param io_binding:          Whether to bind the inputs and outputs to numpy arrays instead of feeding the
+                                    inputs per run. The outputs are written straight into the returned arrays.
+                                    Default: False.
+        :param max_batch_size:      Maximum number of concurrent requests (calling `predict` from several threads) to
+                                    merge into a single inference run (the inputs are concatenated along the first
+                                    axis). Requests that are called one at a time wait for `batch_timeout_ms` before
+                                    they run on their own. Default: 1 - no batching.
+        :param batch_timeout_ms:    Maximum time to wait for more concurrent requests to merge into a batch.
         :param class_args:          -
         """
         super().__init__(
@@ -97,10 +127,22 @@ class ONNXModelServer(V2ModelServer):
             else execution_providers
         )
 
+        # Store the serving mode:
+        self.sessions = sessions
+        self.intra_op_num_threads = intra_op_num_threads
+        self.inter_op_num_threads = inter_op_num_threads
+        self.io_binding = io_binding
+        self.max_batch_size = max_batch_size
+        self.batch_timeout_ms = batch_timeout_ms
+
         # Prepare inference parameters:
         self._model_handler: ONNXModelHandler = None
         self._inference_session: onnxruntime.InferenceSession = None
+        self._sessions_pool: queue.Queue = None
+        self._io_bindings: dict[int, _IOBinding] = {}
+        self._batcher: RequestsBatcher = None
         self._input_layers: list[str] = None
+        self._input_dtypes: list[Optional[np.dtype]] = None
         self._output_layers: list[str] = None
 
     def load(self):
@@ -120,22 +162,49 @@ class ONNXModelServer(V2ModelServer):
             self._model_handler.load()
         self.model = self._model_handler.model
 
-        # initialize the onnx run time session:
-        self._inference_session = onnxruntime.InferenceSession(
-            onnx._serialize(self._model_handler.model),
-            providers=self.execution_providers,
-        )
+        # Set the threading options of the sessions:
+        session_options = onnxruntime.SessionOptions()
+        if self.intra_op_num_threads is not None:
+            session_options.intra_op_num_threads = self.intra_op_num_threads
+        if self.inter_op_num_threads is not None:
+            session_options.inter_op_num_threads = self.inter_op_num_threads
+
+        # initialize the onnx run time sessions pool:
+        serialized_model = onnx._serialize(self._model_handler.model)
+        self._sessions_pool = queue.Queue()
+        for _ in range(max(self.sessions, 1)):
+            session = onnxruntime.InferenceSession(
+                serialized_model,
+                sess_options=session_options,
+                providers=self.execution_providers,
+            )
+            if self.io_binding:
+                self._io_bindings[id(session)] = _IOBinding(session)
+            self._sessions_pool.put(session)
+        self._inference_session = session
 
-        # Get the input layers names:
+        # Get the input layers names and types:
         self._input_layers = [
             input_layer.name for input_layer in self._inference_session.get_inputs()
         ]
+        self._input_dtypes = [
+            _tensor_types.get(input_layer.type)
+            for input_layer in self._inference_session.get_inputs()
+        ]
 
         # Get the outputs layers names:
         self._output_layers = [
             output_layer.name for output_layer in self._inference_session.get_outputs()
         ]
 
+        # Merge concurrent requests into batches:
+        if self.max_batch_size > 1:
+            self._batcher = RequestsBatcher(
+                run=self._run,
+                max_batch_size=self.max_batch_size,
+                timeout_seconds=self.batch_timeout_ms / 1000,
+            )
+
     def predict(self, request: dict[str, Any]) -> np.ndarray:
         """
         Infer the inputs through the model using ONNXRunTime and return its output. The inferred data will be
@@ -145,17 +214,35 @@ class ONNXModelServer(V2ModelServer):
 
         :return: The ONNXRunTime session returned output on the given inputs.
         """
-        # Read the inputs from the request:
-        inputs = request["inputs"]
+        # Read the inputs from the request (converted once to arrays of the input layers types):
+        inputs = [
+            np.ascontiguousarray(data, dtype=dtype)
+            for data, dtype in zip(request["inputs"], self._input_dtypes)
+        ]
 
         # Infer the inputs through the model:
-        return self._inference_session.run(
-            output_names=self._output_layers,
-            input_feed={
-                input_layer: data
-                for input_layer, data in zip(self._input_layers, inputs)
-            },
-        )
+        if self._batcher:
+            return self._batcher.run(inputs)
+        return self._run(inputs)
+
+    def _run(self, inputs: list[np.ndarray]) -> list[np.ndarray]:
+        """
+        Infer the inputs through one of the pool sessions.
+
+        :param inputs: The input arrays, ordered as the input layers.
+
+        :return: The output arrays, ordered as the output layers.
+        """
+        session = self._sessions_pool.get()
+        try:
+            if self.io_binding:
+                return self._io_bindings[id(session)].run(inputs)
+            return session.run(
+                output_names=self._output_layers,
+                input_feed=dict(zip(self._input_layers, inputs)),
+            )
+        finally:
+            self._sessions_pool.put(session)
 
     def explain(self, request: dict[str, Any]) -> str:
         """
@@ -166,3 +253,81 @@ class ONNXModelServer(V2ModelServer):
         :return: Explanation string.
         """
         return f"The '{self.model.name}' model serving function named '{self.name}'"
+
+
+# ONNX tensor types to numpy data types:
+_tensor_types = {
+    "tensor(bool)": np.dtype(np.bool_),
+    "tensor(int8)": np.dtype(np.int8),
+    "tensor(int16)": np.dtype(np.int16),
+    "tensor(int32)": np.dtype(np.int32),
+    "tensor(int64)": np.dtype(np.int64),
+    "tensor(uint8)": np.dtype(np.uint8),
+    "tensor(uint16)": np.dtype(np.uint16),
+    "tensor(uint32)": np.dtype(np.uint32),
+    "tensor(uint64)": np.dtype(np.uint64),
+    "tensor(float16)": np.dtype(np.float16),
+    "tensor(float)": np.dtype(np.float32),
+    "tensor(double)": np.dtype(np.float64),
+}
+
+
+class _IOBinding:
+    """
+    IO binding of an inference session. The inputs are bound to the request arrays, and the outputs with a static
+    shape (except the batch dimension of the inputs) are bound to numpy arrays that are allocated per run, so
+    onnxruntime writes the outputs straight into the returned arrays instead of copying them out of its own memory.
+    The returned arrays are owned by the caller - they are not reused by the next runs of the session. The other
+    outputs are allocated by onnxruntime.
+    """
+
+    def __init__(self, session: onnxruntime.InferenceSession):
+        self._session = session
+        self._binding = session.io_binding()
+        self._input_layers = [input_layer.name for input_layer in session.get_inputs()]
+        batch_dimension = session.get_inputs()[0].shape[0]
+
+        # Output name -> (data type, shape without the batch dimension), None if not pre-allocated:
+        self._outputs: dict[str, Optional[tuple[np.dtype, tuple[int, ...]]]] = {}
+        for output_layer in session.get_outputs():
+            shape = output_layer.shape
+            dtype = _tensor_types.get(output_layer.type)
+            if (
+                dtype is not None
+                and shape
+                and shape[0] == batch_dimension
+                and all(isinstance(dimension, int) for dimension in shape[1:])
+            ):
+                self._outputs[output_layer.name] = (dtype, tuple(shape[1:]))
+            else:
+                self._outputs[output_layer.name] = None
+
+    def run(self, inputs: list[np.ndarray]) -> list[np.ndarray]:
+        rows = inputs[0].shape[0] if inputs[0].ndim else 1
+        for name, data in zip(self._input_layers, inputs):
+            self._binding.bind_cpu_input(name, data)
+        buffers: dict[str, np.ndarray] = {}
+        for name, output in self._outputs.items():
+            if output is None:
+                self._binding.bind_output(name, "cpu")
+                continue
+            dtype, shape = output
+            buffer = buffers[name] = np.empty((rows, *shape), dtype=dtype)
+            self._binding.bind_output(
+                name=name,
+                device_type="cpu",
+                device_id=0,
+                element_type=dtype.type,
+                shape=(rows, *shape),
+                buffer_ptr=buffer.ctypes.data,
+            )
+
+        self._session.run_with_iobinding(self._binding)
+
+        results = [
+            buffers[name] if name in buffers else ort_value.numpy()
+            for ort_value, name in zip(self._binding.get_outputs(), self._outputs)
+        ]
+        self._binding.clear_binding_inputs()
+        self._binding.clear_binding_outputs()
+        return results
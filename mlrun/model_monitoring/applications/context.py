@@ -29,6 +29,7 @@ import mlrun.utils
 from mlrun.artifacts import Artifact, DatasetArtifact, ModelArtifact, get_model
 from mlrun.common.model_monitoring.helpers import FeatureStats
 from mlrun.common.schemas import ModelEndpoint
+from mlrun.model_monitoring.db._window_histograms import get_window_feature_stats
 from mlrun.model_monitoring.helpers import (
     calculate_inputs_statistics,
 )
@@ -226,11 +227,26 @@ class MonitoringApplicationContext:
 
     @property
     def sample_df_stats(self) -> FeatureStats:
-        """statistics of the sample dataframe"""
+        """
+        statistics of the sample dataframe. If window histograms are enabled and no sample dataframe was set, they are
+        merged from the histograms that the monitoring stream counted per time bucket, without reading the sample data
+        """
         if not self._sample_df_stats:
-            self._sample_df_stats = calculate_inputs_statistics(
-                self.feature_stats, self.sample_df
-            )
+            if (
+                self._sample_df is None
+                and mlrun.mlconf.model_endpoint_monitoring.window_histograms.enabled
+            ):
+                self._sample_df_stats = get_window_feature_stats(
+                    project=self.project_name,
+                    endpoint_id=self.endpoint_id,
+                    feature_stats=self.feature_stats,
+                    start=int(self.start_infer_time.timestamp()),
+                    end=int(self.end_infer_time.timestamp()),
+                )
+            if not self._sample_df_stats:
+                self._sample_df_stats = calculate_inputs_statistics(
+                    self.feature_stats, self.sample_df
+                )
         return self._sample_df_stats
 
     @property
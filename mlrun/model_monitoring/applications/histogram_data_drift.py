@@ -37,6 +37,7 @@ from mlrun.model_monitoring.metrics.histogram_distance import (
     HistogramDistanceMetric,
     KullbackLeiblerDivergence,
     TotalVarianceDistance,
+    compute_histogram_distances,
 )
 
 
@@ -141,27 +142,23 @@ class HistogramDataDriftApplication(ModelMonitoringApplicationBase):
         self, monitoring_context: mm_context.MonitoringApplicationContext
     ) -> DataFrame:
         """Compute the metrics for the different features and labels"""
-        metrics_per_feature = DataFrame(
-            columns=[metric_class.NAME for metric_class in self.metrics]
-        )
         feature_stats = monitoring_context.dict_to_histogram(
             monitoring_context.feature_stats
         )
         sample_df_stats = monitoring_context.dict_to_histogram(
             monitoring_context.sample_df_stats
         )
-        for feature_name in feature_stats:
-            sample_hist = np.asarray(sample_df_stats[feature_name])
-            reference_hist = np.asarray(feature_stats[feature_name])
-            monitoring_context.logger.info(
-                "Computing metrics for feature", feature_name=feature_name
-            )
-            metrics_per_feature.loc[feature_name] = {  # pyright: ignore[reportCallIssue,reportArgumentType]
-                metric.NAME: metric(
-                    distrib_t=sample_hist, distrib_u=reference_hist
-                ).compute()
-                for metric in self.metrics
-            }
+        feature_names = list(feature_stats.columns)
+        monitoring_context.logger.info(
+            "Computing metrics for features", features_count=len(feature_names)
+        )
+        # Features x bins matrices, all the metrics are computed for all the features at once
+        metrics_per_feature = compute_histogram_distances(
+            distribs_t=sample_df_stats[feature_names].to_numpy().T,
+            distribs_u=feature_stats.to_numpy().T,
+            metrics=self.metrics,
+            features=feature_names,
+        )
         monitoring_context.logger.info("Finished computing the metrics")
 
         return metrics_per_feature
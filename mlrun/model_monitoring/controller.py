@@ -84,10 +84,16 @@ class _BatchWindow:
         )
         # max between one day and the base period
         first_period_in_seconds = max(_SECONDS_IN_DAY, self._step)
-        return max(
+        last_analyzed = max(
             self._first_request,
             self._stop - first_period_in_seconds,
         )
+        window_histograms = mlrun.mlconf.model_endpoint_monitoring.window_histograms
+        if window_histograms.enabled:
+            # Align the windows to the histograms buckets, so the applications can merge the buckets of their windows
+            bucket_seconds = int(window_histograms.bucket_seconds)
+            last_analyzed -= last_analyzed % bucket_seconds
+        return last_analyzed
 
     def _get_last_analyzed(self) -> int:
         saved_last_analyzed = self._get_saved_last_analyzed()
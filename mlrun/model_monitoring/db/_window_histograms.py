@@ -0,0 +1,309 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import posixpath
+import uuid
+from typing import Optional
+
+import numpy as np
+
+import mlrun.datastore
+from mlrun.common.model_monitoring.helpers import FeatureStats
+from mlrun.model_monitoring.helpers import get_monitoring_stats_directory_path
+from mlrun.utils import logger
+
+
+class WindowHistograms:
+    def __init__(self, edges: dict[str, list[float]]) -> None:
+        """
+        Mergeable statistics of features over a time bucket: the counts of the values per bin, where the bins are the
+        reference bins of each feature (the training set histogram edges), and the count, sum, sum of squares, minimum
+        and maximum of the values. The bins follow `np.histogram` semantics - the last bin includes its right edge,
+        and values outside the edges are not counted in the histogram.
+
+        :param edges: Dictionary of feature name to its reference histogram edges.
+        """
+        self.edges = {
+            name: np.asarray(bins, dtype=float) for name, bins in edges.items()
+        }
+        self.counts = {
+            name: np.zeros(len(bins) - 1, dtype=np.int64)
+            for name, bins in self.edges.items()
+        }
+        self.count = dict.fromkeys(self.edges, 0)
+        self.sum = dict.fromkeys(self.edges, 0.0)
+        self.sum_sq = dict.fromkeys(self.edges, 0.0)
+        self.min = dict.fromkeys(self.edges, np.inf)
+        self.max = dict.fromkeys(self.edges, -np.inf)
+
+    @classmethod
+    def from_feature_stats(cls, feature_stats: FeatureStats) -> "WindowHistograms":
+        """Initialize empty histograms with the bins of the features that have a histogram in the reference stats"""
+        return cls(
+            {
+                name: stats["hist"][1]
+                for name, stats in feature_stats.items()
+                if isinstance(stats, dict) and "hist" in stats
+            }
+        )
+
+    def add(self, names: list[str], values: np.ndarray) -> None:
+        """
+        Count the values of the features.
+
+        :param names:  The names of the columns of `values`.
+        :param values: 2-D array of (rows, columns). Columns without reference bins or with non-numeric values are
+                       ignored.
+        """
+        if not len(values):
+            return
+        for index, name in enumerate(names):
+            if name not in self.edges:
+                continue
+            try:
+                column = np.asarray(values[:, index], dtype=float)
+            except (TypeError, ValueError):
+                continue
+            column = column[~np.isnan(column)]
+            if not len(column):
+                continue
+
+            edges = self.edges[name]
+            bins = np.searchsorted(edges, column, side="right") - 1
+            # The last bin includes its right edge
+            bins[column == edges[-1]] = len(edges) - 2
+            in_range = (bins >= 0) & (bins < len(edges) - 1)
+            self.counts[name] += np.bincount(bins[in_range], minlength=len(edges) - 1)
+
+            self.count[name] += len(column)
+            self.sum[name] += float(column.sum())
+            self.sum_sq[name] += float(np.square(column).sum())
+            self.min[name] = min(self.min[name], float(column.min()))
+            self.max[name] = max(self.max[name], float(column.max()))
+
+    def merge(self, other: "WindowHistograms") -> None:
+        """Add the statistics of other histograms with the same bins"""
+        for name in self.edges.keys() & other.edges.keys():
+            if not np.array_equal(self.edges[name], other.edges[name]):
+                raise mlrun.errors.MLRunValueError(
+                    f"Cannot merge the histograms of '{name}' with different bins"
+                )
+            self.counts[name] += other.counts[name]
+            self.count[name] += other.count[name]
+            self.sum[name] += other.sum[name]
+            self.sum_sq[name] += other.sum_sq[name]
+            self.min[name] = min(self.min[name], other.min[name])
+            self.max[name] = max(self.max[name], other.max[name])
+
+    def to_feature_stats(self) -> FeatureStats:
+        """
+        The statistics in the format of `calculate_inputs_statistics`, without the quantiles that cannot be merged.
+        Features without values are omitted.
+        """
+        feature_stats = {}
+        for name, count in self.count.items():
+            if not count:
+                continue
+            mean = self.sum[name] / count
+            stats = {"count": float(count), "mean": mean}
+            if count > 1:
+                # The sample standard deviation, as in `pd.DataFrame.describe`
+                variance = (self.sum_sq[name] - count * mean**2) / (count - 1)
+                stats["std"] = float(np.sqrt(max(variance, 0.0)))
+            stats["min"] = self.min[name]
+            stats["max"] = self.max[name]
+            stats["hist"] = [self.counts[name].tolist(), self.edges[name].tolist()]
+            feature_stats[name] = stats
+        return FeatureStats(feature_stats)
+
+    def to_dict(self) -> dict:
+        return {
+            name: {
+                "edges": self.edges[name].tolist(),
+                "counts": self.counts[name].tolist(),
+                "count": self.count[name],
+                "sum": self.sum[name],
+                "sum_sq": self.sum_sq[name],
+                "min": self.min[name],
+                "max": self.max[name],
+            }
+            for name in self.edges
+            if self.count[name]
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "WindowHistograms":
+        histograms = cls({name: stats["edges"] for name, stats in data.items()})
+        for name, stats in data.items():
+            histograms.counts[name] += np.asarray(stats["counts"], dtype=np.int64)
+            histograms.count[name] = stats["count"]
+            histograms.sum[name] = stats["sum"]
+            histograms.sum_sq[name] = stats["sum_sq"]
+            histograms.min[name] = stats["min"]
+            histograms.max[name] = stats["max"]
+        return histograms
+
+
+class WindowHistogramsFiles:
+    # The bucket files are partitioned by the hour, so reading a window lists only the partitions of the window
+    _partition_seconds = 3600
+
+    def __init__(self, project: str, endpoint_id: str) -> None:
+        """
+        The histograms files of a model endpoint. Each file holds the histograms of a single time bucket, named by the
+        bucket start time, in the folder of the hour the bucket starts in. A bucket may have more than one file, when
+        events arrive after the bucket was written.
+
+        :param project:     Project name.
+        :param endpoint_id: Model endpoint ID.
+        """
+        self._folder = posixpath.join(
+            get_monitoring_stats_directory_path(project),
+            "window_histograms",
+            endpoint_id,
+        )
+
+    def _partition_path(self, partition_start: int) -> str:
+        return posixpath.join(self._folder, str(partition_start))
+
+    def _get_filesystem(self):
+        return mlrun.datastore.store_manager.object(self._folder).store.filesystem
+
+    def write(self, bucket_start: int, histograms: WindowHistograms) -> None:
+        """Write the histograms of the bucket that starts at `bucket_start` (seconds since the epoch)"""
+        path = posixpath.join(
+            self._partition_path(bucket_start - bucket_start % self._partition_seconds),
+            f"{bucket_start}-{uuid.uuid4().hex}.json",
+        )
+        mlrun.datastore.store_manager.object(path).put(json.dumps(histograms.to_dict()))
+
+    def read(
+        self, start: int, end: int, bucket_seconds: int
+    ) -> Optional[WindowHistograms]:
+        """
+        Read and merge the histograms of the buckets that start in [start, end). Returns None if a bucket of this time
+        range was not written (e.g. it had no events or it was deleted), as the merged statistics would be partial.
+        """
+        fs = self._get_filesystem()
+        if fs is None:
+            return None
+
+        merged = None
+        bucket_starts = set()
+        for partition_start in range(
+            start - start % self._partition_seconds, end, self._partition_seconds
+        ):
+            try:
+                paths = fs.ls(self._partition_path(partition_start), detail=False)
+            except FileNotFoundError:
+                continue
+            for path in paths:
+                bucket_start = int(os.path.basename(path).split("-", 1)[0])
+                if not start <= bucket_start < end:
+                    continue
+                with fs.open(path, "r") as file:
+                    histograms = WindowHistograms.from_dict(json.load(file))
+                bucket_starts.add(bucket_start)
+                if merged is None:
+                    merged = histograms
+                else:
+                    merged.merge(histograms)
+
+        missing_buckets = set(range(start, end, bucket_seconds)) - bucket_starts
+        if missing_buckets:
+            logger.debug(
+                "Some of the window histograms buckets were not written",
+                folder=self._folder,
+                missing_buckets=len(missing_buckets),
+                min_missing_bucket=min(missing_buckets),
+            )
+            return None
+        return merged
+
+    def delete_before(self, timestamp: int) -> None:
+        """Delete the partitions of the buckets that start before `timestamp` (seconds since the epoch)"""
+        fs = self._get_filesystem()
+        if fs is None:
+            return
+        try:
+            paths = fs.ls(self._folder, detail=False)
+        except FileNotFoundError:
+            return
+        for path in paths:
+            name = os.path.basename(path.rstrip("/"))
+            if name.isdigit() and int(name) + self._partition_seconds <= timestamp:
+                fs.rm(path, recursive=True)
+
+
+def get_window_feature_stats(
+    project: str,
+    endpoint_id: str,
+    feature_stats: FeatureStats,
+    start: int,
+    end: int,
+) -> Optional[FeatureStats]:
+    """
+    Get the statistics of the inputs of a model endpoint in the [start, end) time range (seconds since the epoch) by
+    merging the histograms that the monitoring stream wrote per time bucket.
+    Returns None if the time range is not aligned to the buckets, some of its buckets were not written or the buckets
+    were counted with different bins than the reference `feature_stats` - the statistics should then be calculated
+    from the sample data.
+    """
+    bucket_seconds = int(
+        mlrun.mlconf.model_endpoint_monitoring.window_histograms.bucket_seconds
+    )
+    if start % bucket_seconds or end % bucket_seconds:
+        logger.debug(
+            "The window is not aligned to the histograms buckets",
+            endpoint_id=endpoint_id,
+            start=start,
+            end=end,
+            bucket_seconds=bucket_seconds,
+        )
+        return None
+
+    try:
+        histograms = WindowHistogramsFiles(project, endpoint_id).read(
+            start, end, bucket_seconds
+        )
+    except mlrun.errors.MLRunValueError as err:
+        logger.warning(
+            "Failed to merge the window histograms",
+            endpoint_id=endpoint_id,
+            err=mlrun.errors.err_to_str(err),
+        )
+        return None
+    if histograms is None:
+        return None
+
+    reference = WindowHistograms.from_feature_stats(feature_stats)
+    for name, edges in histograms.edges.items():
+        if name in reference.edges and not np.array_equal(edges, reference.edges[name]):
+            logger.debug(
+                "The window histograms bins differ from the reference bins",
+                endpoint_id=endpoint_id,
+                feature=name,
+            )
+            return None
+    window_feature_stats = histograms.to_feature_stats()
+    if reference.edges.keys() - window_feature_stats.keys():
+        logger.debug(
+            "The window histograms do not cover all the reference features",
+            endpoint_id=endpoint_id,
+            missing=list(reference.edges.keys() - window_feature_stats.keys()),
+        )
+        return None
+    return window_feature_stats
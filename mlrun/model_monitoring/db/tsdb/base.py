@@ -79,6 +79,13 @@ class TSDBConnector(ABC):
         :raise mlrun.errors.MLRunRuntimeError: If an error occurred while writing the event.
         """
 
+    def flush_application_events(self) -> None:
+        """
+        Write the application events that are buffered by the connector, if any.
+        Connectors which write the events immediately do not need to implement it.
+        """
+        pass
+
     @abstractmethod
     def delete_tsdb_resources(self):
         """
@@ -99,6 +99,24 @@ class TDEngineSchema:
         self,
         subtable: str,
         values: dict[str, Union[str, int, float, datetime.datetime]],
+    ) -> str:
+        return f"CREATE TABLE {self._subtable_definition(subtable, values)};"
+
+    def _create_subtables_sql(
+        self,
+        subtables: dict[str, dict[str, Union[str, int, float, datetime.datetime]]],
+    ) -> str:
+        """Create multiple subtables (mapped to the values of their tags) in a single statement"""
+        definitions = " ".join(
+            self._subtable_definition(subtable, values)
+            for subtable, values in subtables.items()
+        )
+        return f"CREATE TABLE {definitions};"
+
+    def _subtable_definition(
+        self,
+        subtable: str,
+        values: dict[str, Union[str, int, float, datetime.datetime]],
     ) -> str:
         try:
             tags = ", ".join(f"'{values[val]}'" for val in self.tags)
@@ -106,24 +124,24 @@ class TDEngineSchema:
             raise mlrun.errors.MLRunInvalidArgumentError(
                 f"values must contain all tags: {self.tags.keys()}"
             )
-        return f"CREATE TABLE if NOT EXISTS {self.database}.{subtable} USING {self.super_table} TAGS ({tags});"
+        return f"if NOT EXISTS {self.database}.{subtable} USING {self.super_table} TAGS ({tags})"
 
     @staticmethod
-    def _insert_subtable_stmt(
+    def _insert_subtable_rows_stmt(
         statement: taosws.TaosStmt,
         columns: dict[str, _TDEngineColumn],
         subtable: str,
-        values: dict[str, Union[str, int, float, datetime.datetime]],
+        rows: list[dict[str, Union[str, int, float, datetime.datetime]]],
     ) -> taosws.TaosStmt:
+        """Insert multiple rows into a subtable, binding each column to the values of all the rows"""
         question_marks = ", ".join("?" * len(columns))
         statement.prepare(f"INSERT INTO ? VALUES ({question_marks});")
         statement.set_tbname(subtable)
 
-        bind_params = []
-
-        for col_name, col_type in columns.items():
-            val = values[col_name]
-            bind_params.append(values_to_column([val], col_type))
+        bind_params = [
+            values_to_column([row[col_name] for row in rows], col_type)
+            for col_name, col_type in columns.items()
+        ]
 
         statement.bind_param(bind_params)
         statement.add_batch()
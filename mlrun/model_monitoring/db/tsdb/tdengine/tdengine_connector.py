@@ -27,6 +27,10 @@ import mlrun.model_monitoring.db.tsdb.tdengine.schemas as tdengine_schemas
 import mlrun.model_monitoring.db.tsdb.tdengine.stream_graph_steps
 from mlrun.model_monitoring.db import TSDBConnector
 from mlrun.model_monitoring.db.tsdb.tdengine.schemas import TDEngineSchema
+from mlrun.model_monitoring.db.tsdb.tdengine.write_buffer import (
+    SubtablesRows,
+    TDEngineWriteBuffer,
+)
 from mlrun.model_monitoring.helpers import get_invocations_fqn
 from mlrun.utils import logger
 
@@ -58,6 +62,21 @@ class TDEngineConnector(TSDBConnector):
         self._timeout = mlrun.mlconf.model_endpoint_monitoring.tdengine.timeout
         self._retries = mlrun.mlconf.model_endpoint_monitoring.tdengine.retries
 
+        # (super table, subtable) pairs which are known to exist, their creation is skipped on write
+        self._existing_subtables: set[tuple[str, str]] = set()
+        write_buffer_config = (
+            mlrun.mlconf.model_endpoint_monitoring.tdengine.write_buffer
+        )
+        self._write_buffer = None
+        if int(write_buffer_config.max_rows) > 0:
+            self._write_buffer = TDEngineWriteBuffer(
+                write_rows=self._write_subtables_rows,
+                max_rows=int(write_buffer_config.max_rows),
+                flush_interval=float(write_buffer_config.flush_interval_seconds),
+                max_retries=int(write_buffer_config.max_retries),
+                max_pending_rows=int(write_buffer_config.max_pending_rows),
+            )
+
     @property
     def connection(self) -> TDEngineConnection:
         if not self._connection:
@@ -110,7 +129,8 @@ class TDEngineConnector(TSDBConnector):
         kind: mm_schemas.WriterEventKind = mm_schemas.WriterEventKind.RESULT,
     ) -> None:
         """
-        Write a single result or metric to TSDB.
+        Write a single result or metric to TSDB. If the write buffer is enabled
+        (mlrun.mlconf.model_endpoint_monitoring.tdengine.write_buffer), the event is written on the next flush.
         """
 
         table_name = (
@@ -144,40 +164,78 @@ class TDEngineConnector(TSDBConnector):
             val=event[mm_schemas.WriterEvent.START_INFER_TIME]
         )
 
-        create_table_sql = table._create_subtable_sql(subtable=table_name, values=event)
+        if self._write_buffer:
+            self._write_buffer.append(table=table, subtable=table_name, row=event)
+        else:
+            self._write_subtables_rows(
+                {(table.super_table, table_name): (table, [event])}
+            )
 
-        insert_statement = Statement(
-            TDEngineSchema._insert_subtable_stmt,
-            dict(columns=table.columns, subtable=table_name, values=event),
-        )
+    def flush_application_events(self) -> None:
+        if self._write_buffer:
+            self._write_buffer.flush()
 
-        self.connection.run(
-            statements=[
-                create_table_sql,
-                insert_statement,
-            ],
-            timeout=self._timeout,
-            retries=self._retries,
+    def _write_subtables_rows(self, subtables_rows: SubtablesRows) -> None:
+        """
+        Write the rows of the given subtables in a single run - one statement that creates the subtables which are not
+        known to exist yet (per super table), and a multi-row insert per subtable.
+        """
+        subtables_to_create: dict[str, tuple[TDEngineSchema, dict[str, dict]]] = {}
+        insert_statements = []
+        for (super_table, subtable), (table, rows) in subtables_rows.items():
+            if (super_table, subtable) not in self._existing_subtables:
+                subtables_to_create.setdefault(super_table, (table, {}))[1][
+                    subtable
+                ] = rows[0]
+            insert_statements.append(
+                Statement(
+                    TDEngineSchema._insert_subtable_rows_stmt,
+                    dict(columns=table.columns, subtable=subtable, rows=rows),
+                )
+            )
+
+        create_statements = [
+            table._create_subtables_sql(subtables=subtables)
+            for table, subtables in subtables_to_create.values()
+        ]
+        try:
+            self.connection.run(
+                statements=create_statements + insert_statements,
+                timeout=self._timeout,
+                retries=self._retries,
+            )
+        except Exception:
+            # The subtables may have been dropped since they were created, so they are created again on the next write
+            self._existing_subtables.difference_update(subtables_rows)
+            raise
+        self._existing_subtables.update(
+            (super_table, subtable)
+            for super_table, (_, subtables) in subtables_to_create.items()
+            for subtable in subtables
         )
 
     @staticmethod
     def _convert_to_datetime(val: typing.Union[str, datetime]) -> datetime:
         return datetime.fromisoformat(val) if isinstance(val, str) else val
 
-    def apply_monitoring_stream_steps(self, graph, **kwarg):
+    def apply_monitoring_stream_steps(
+        self, graph, after: str = "MapFeatureNames", **kwarg
+    ):
         """
         Apply TSDB steps on the provided monitoring graph. Throughout these steps, the graph stores live data of
         different key metric dictionaries. This data is being used by the monitoring dashboards in
         grafana. At the moment, we store two types of data:
         - prediction latency.
         - custom metrics.
+
+        :param after: The name of the graph step that the TSDB steps are added after.
         """
 
         def apply_process_before_tsdb():
             graph.add_step(
                 "mlrun.model_monitoring.db.tsdb.tdengine.stream_graph_steps.ProcessBeforeTDEngine",
                 name="ProcessBeforeTDEngine",
-                after="MapFeatureNames",
+                after=after,
             )
 
         def apply_tdengine_target(name, after):
@@ -252,6 +310,7 @@ class TDEngineConnector(TSDBConnector):
         drop_statements = []
         for table in self.tables:
             drop_statements.append(self.tables[table].drop_supertable_query())
+        self._existing_subtables.clear()
 
         try:
             self.connection.run(
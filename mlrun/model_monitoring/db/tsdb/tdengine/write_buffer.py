@@ -0,0 +1,218 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+import typing
+
+import mlrun.errors
+from mlrun.model_monitoring.db.tsdb.tdengine.schemas import TDEngineSchema
+from mlrun.utils import logger
+
+# (super table, subtable) -> (schema, rows)
+SubtablesRows = dict[tuple[str, str], tuple[TDEngineSchema, list[dict]]]
+
+
+class TDEngineWriteBuffer:
+    """
+    Buffers rows of TDEngine subtables, grouped by subtable, so they are written with a multi-row insert per subtable.
+    The pending rows are flushed once `max_rows` rows are pending, or `flush_interval` seconds after the first pending
+    row was added (by a timer, so rows are not held back when no more rows arrive).
+    Rows that failed to be written are kept pending and retried by the timer. Until they are written, reaching
+    `max_rows` does not trigger a flush, so the rows of the following appends are not held up by a failing database.
+    When the write of several subtables fails, each subtable is written on its own, so a single failing subtable does
+    not hold back the rows of the others. The rows of a subtable that failed `max_retries` flushes in a row are dropped,
+    and so are the rows that are appended while `max_pending_rows` rows are pending.
+    """
+
+    def __init__(
+        self,
+        write_rows: typing.Callable[[SubtablesRows], None],
+        max_rows: int,
+        flush_interval: float,
+        max_retries: int = 10,
+        max_pending_rows: typing.Optional[int] = None,
+    ):
+        """
+        Initialize a TDEngine write buffer instance
+        :param write_rows:       A function which writes the rows of the given subtables
+        :param max_rows:         Number of pending rows that triggers a flush
+        :param flush_interval:   Maximum number of seconds a row is pending before it is written
+        :param max_retries:      Number of failed flushes in a row after which the rows of a subtable are dropped
+        :param max_pending_rows: Number of pending rows after which appended rows are dropped, 100 * `max_rows` by
+                                 default
+        """
+        self._write_rows = write_rows
+        self.max_rows = max_rows
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.max_pending_rows = max_pending_rows or 100 * max_rows
+
+        self._pending: SubtablesRows = {}
+        self._pending_rows = 0
+        # (super table, subtable) -> number of failed flushes in a row
+        self._failures: dict[tuple[str, str], int] = {}
+        self._timer: typing.Optional[threading.Timer] = None
+        self._flush_failed = False
+        # writes are serialized, the rows are appended by the writer while the timer flushes them
+        self._lock = threading.RLock()
+
+        self.rows_written = 0
+        self.rows_dropped = 0
+        self.flushes = 0
+        self.flush_seconds = 0.0
+
+    def append(self, table: TDEngineSchema, subtable: str, row: dict) -> None:
+        with self._lock:
+            if self._pending_rows >= self.max_pending_rows:
+                if not self.rows_dropped:
+                    logger.warning(
+                        "Too many rows are pending to be written to TDEngine, dropping the appended rows",
+                        max_pending_rows=self.max_pending_rows,
+                    )
+                self.rows_dropped += 1
+                return
+
+            _, rows = self._pending.setdefault(
+                (table.super_table, subtable), (table, [])
+            )
+            rows.append(row)
+            self._pending_rows += 1
+
+            if self._pending_rows >= self.max_rows and not self._flush_failed:
+                self._flush_and_log()
+            else:
+                self._start_timer()
+
+    def flush(self) -> None:
+        """
+        Write all the pending rows.
+
+        :raise Exception: If the rows failed to be written, in which case they are kept pending and retried later.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                return
+
+            pending, rows = self._pending, self._pending_rows
+            self._pending, self._pending_rows = {}, 0
+
+            start = time.perf_counter()
+            try:
+                self._write_rows(pending)
+                errors = {}
+            except Exception as exc:
+                errors = (
+                    self._write_per_subtable(pending)
+                    if len(pending) > 1
+                    else dict.fromkeys(pending, exc)
+                )
+            flush_seconds = time.perf_counter() - start
+
+            for key in pending.keys() - errors.keys():
+                self._failures.pop(key, None)
+            written = rows - sum(len(pending[key][1]) for key in errors)
+            self.rows_written += written
+            self.flushes += 1
+            self.flush_seconds += flush_seconds
+
+            if errors:
+                self._restore({key: pending[key] for key in errors})
+                self._flush_failed = bool(self._pending)
+                if self._pending:
+                    self._start_timer()
+                raise next(iter(errors.values()))
+            self._flush_failed = False
+
+            if self.rows_dropped:
+                logger.warning(
+                    "Rows were dropped while too many rows were pending to be written to TDEngine",
+                    rows_dropped=self.rows_dropped,
+                )
+                self.rows_dropped = 0
+            logger.debug(
+                "Flushed rows to TDEngine",
+                rows=rows,
+                subtables=len(pending),
+                flush_latency_ms=round(flush_seconds * 1000, 2),
+                rows_per_sec=round(rows / flush_seconds) if flush_seconds else None,
+            )
+
+    def stats(self) -> dict[str, typing.Optional[float]]:
+        """Get the write statistics of the buffer - rows per second and average flush latency"""
+        with self._lock:
+            return {
+                "rows_written": self.rows_written,
+                "flushes": self.flushes,
+                "rows_per_sec": self.rows_written / self.flush_seconds
+                if self.flush_seconds
+                else None,
+                "avg_flush_latency_ms": self.flush_seconds / self.flushes * 1000
+                if self.flushes
+                else None,
+            }
+
+    def _start_timer(self) -> None:
+        if self._timer is None:
+            self._timer = threading.Timer(self.flush_interval, self._flush_and_log)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _write_per_subtable(
+        self, pending: SubtablesRows
+    ) -> dict[tuple[str, str], Exception]:
+        """Write the rows of each subtable on its own, and return the errors of the subtables that failed"""
+        errors = {}
+        for key, subtable_rows in pending.items():
+            try:
+                self._write_rows({key: subtable_rows})
+            except Exception as exc:
+                errors[key] = exc
+        return errors
+
+    def _restore(self, pending: SubtablesRows) -> None:
+        """
+        Put back rows that failed to be written, before the rows that were appended since. The rows of subtables that
+        failed `max_retries` flushes in a row are dropped.
+        """
+        for key in list(pending):
+            self._failures[key] = self._failures.get(key, 0) + 1
+            if self._failures[key] >= self.max_retries:
+                _, subtable_rows = pending.pop(key)
+                self._failures.pop(key)
+                logger.error(
+                    "Dropping the rows of a TDEngine subtable that failed to be written too many times",
+                    super_table=key[0],
+                    subtable=key[1],
+                    rows=len(subtable_rows),
+                    retries=self.max_retries,
+                )
+        for key, (table, subtable_rows) in self._pending.items():
+            pending.setdefault(key, (table, []))[1].extend(subtable_rows)
+        self._pending = pending
+        self._pending_rows = sum(len(rows) for _, rows in pending.values())
+
+    def _flush_and_log(self) -> None:
+        try:
+            self.flush()
+        except Exception as exc:
+            logger.error(
+                "Failed to flush the buffered rows to TDEngine, retrying later",
+                pending_rows=self._pending_rows,
+                retry_in_seconds=self.flush_interval,
+                err=mlrun.errors.err_to_str(exc),
+            )
@@ -170,6 +170,7 @@ class V3IOTSDBConnector(TSDBConnector):
         sample_window: int = 10,
         aggregate_windows: Optional[list[str]] = None,
         aggregate_period: str = "1m",
+        after: str = "MapFeatureNames",
         **kwarg,
     ):
         """
@@ -180,6 +181,8 @@ class V3IOTSDBConnector(TSDBConnector):
         - base_metrics (average latency and predictions over time)
         - endpoint_features (Prediction and feature names and values)
         - custom_metrics (user-defined metrics)
+
+        :param after: The name of the graph step that the TSDB steps are added after.
         """
         aggregate_windows = aggregate_windows or ["5m", "1h"]
 
@@ -198,7 +201,7 @@ class V3IOTSDBConnector(TSDBConnector):
                     }
                 ],
                 name=EventFieldType.LATENCY,
-                after="MapFeatureNames",
+                after=after,
                 step_name="Aggregates",
                 table=".",
                 key_field=EventFieldType.ENDPOINT_ID,
@@ -219,7 +222,7 @@ class V3IOTSDBConnector(TSDBConnector):
         graph.add_step(
             "storey.TSDBTarget",
             name="tsdb_predictions",
-            after="MapFeatureNames",
+            after=after,
             path=f"{self.container}/{self.tables[mm_schemas.FileTargetKind.PREDICTIONS]}",
             rate="1/s",
             time_col=mm_schemas.EventFieldType.TIMESTAMP,
@@ -14,9 +14,11 @@
 
 import abc
 import dataclasses
+from collections.abc import Sequence
 from typing import ClassVar, Optional
 
 import numpy as np
+import pandas as pd
 
 
 @dataclasses.dataclass
@@ -44,6 +46,27 @@ class HistogramDistanceMetric(abc.ABC):
     def compute(self) -> float:
         raise NotImplementedError
 
+    @classmethod
+    def compute_batch(
+        cls, distribs_t: np.ndarray, distribs_u: np.ndarray
+    ) -> np.ndarray:
+        """
+        Compute the metric of many features at once. Computes the metric of each feature by default, metrics override
+        it with a vectorized calculation.
+
+        :param distribs_t: features x bins matrix of distributions t, each row is the distribution of a feature.
+        :param distribs_u: features x bins matrix of distributions u, in the same order as `distribs_t`.
+
+        :returns: 1-D array of the metric per feature.
+        """
+        return np.array(
+            [
+                cls(distrib_t=distrib_t, distrib_u=distrib_u).compute()
+                for distrib_t, distrib_u in zip(distribs_t, distribs_u)
+            ],
+            dtype=float,
+        )
+
 
 class TotalVarianceDistance(HistogramDistanceMetric, metric_name="tvd"):
     """
@@ -60,6 +83,17 @@ class TotalVarianceDistance(HistogramDistanceMetric, metric_name="tvd"):
         """
         return np.sum(np.abs(self.distrib_t - self.distrib_u)) / 2
 
+    @classmethod
+    def compute_batch(
+        cls, distribs_t: np.ndarray, distribs_u: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate Total Variance distance.
+
+        :returns:  Total Variance Distance per feature.
+        """
+        return np.sum(np.abs(distribs_t - distribs_u), axis=1) / 2
+
 
 class HellingerDistance(HistogramDistanceMetric, metric_name="hellinger"):
     """
@@ -83,6 +117,23 @@ class HellingerDistance(HistogramDistanceMetric, metric_name="hellinger"):
             )
         )
 
+    @classmethod
+    def compute_batch(
+        cls, distribs_t: np.ndarray, distribs_u: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate Hellinger Distance
+
+        :returns: Hellinger Distance per feature
+        """
+        return np.sqrt(
+            np.maximum(
+                1 - np.sum(np.sqrt(distribs_u * distribs_t), axis=1),
+                0,  # numerical errors may produce small negative numbers, e.g. -1e-16.
+                # However, Cauchy-Schwarz inequality assures this number is in the range [0, 1]
+            )
+        )
+
 
 class KullbackLeiblerDivergence(HistogramDistanceMetric, metric_name="kld"):
     """
@@ -94,12 +145,8 @@ class KullbackLeiblerDivergence(HistogramDistanceMetric, metric_name="kld"):
     @staticmethod
     def _calc_kl_div(
         actual_dist: np.ndarray, expected_dist: np.ndarray, zero_scaling: float
-    ) -> float:
-        """Return the asymmetric KL divergence"""
-        # We take 0*log(0) == 0 for this calculation
-        mask = actual_dist != 0
-        actual_dist = actual_dist[mask]
-        expected_dist = expected_dist[mask]
+    ) -> np.ndarray:
+        """Return the asymmetric KL divergence per row"""
         with np.errstate(over="ignore"):
             # Ignore overflow warnings when dividing by small numbers,
             # resulting in inf:
@@ -107,7 +154,11 @@ class KullbackLeiblerDivergence(HistogramDistanceMetric, metric_name="kld"):
             relative_prob = actual_dist / np.where(
                 expected_dist != 0, expected_dist, zero_scaling
             )
-        return np.sum(actual_dist * np.log(relative_prob))
+        # We take 0*log(0) == 0 for this calculation
+        log_relative_prob = np.log(
+            relative_prob, out=np.zeros_like(relative_prob), where=actual_dist != 0
+        )
+        return np.sum(actual_dist * log_relative_prob, axis=1)
 
     def compute(
         self, capping: Optional[float] = None, zero_scaling: float = 1e-4
@@ -119,9 +170,67 @@ class KullbackLeiblerDivergence(HistogramDistanceMetric, metric_name="kld"):
 
         :returns: symmetric KL Divergence
         """
-        t_u = self._calc_kl_div(self.distrib_t, self.distrib_u, zero_scaling)
-        u_t = self._calc_kl_div(self.distrib_u, self.distrib_t, zero_scaling)
+        return float(
+            self.compute_batch(
+                np.atleast_2d(self.distrib_t),
+                np.atleast_2d(self.distrib_u),
+                capping=capping,
+                zero_scaling=zero_scaling,
+            )[0]
+        )
+
+    @classmethod
+    def compute_batch(
+        cls,
+        distribs_t: np.ndarray,
+        distribs_u: np.ndarray,
+        capping: Optional[float] = None,
+        zero_scaling: float = 1e-4,
+    ) -> np.ndarray:
+        """
+        :param distribs_t:   features x bins matrix of distributions t.
+        :param distribs_u:   features x bins matrix of distributions u.
+        :param capping:      A bounded value for the KL Divergence. For infinite distance, the result is replaced with
+                             the capping value which indicates a huge differences between the distributions.
+        :param zero_scaling: Will be used to replace 0 values for executing the logarithmic operation.
+
+        :returns: symmetric KL Divergence per feature
+        """
+        t_u = cls._calc_kl_div(distribs_t, distribs_u, zero_scaling)
+        u_t = cls._calc_kl_div(distribs_u, distribs_t, zero_scaling)
         result = t_u + u_t
-        if capping and result == float("inf"):
-            return capping
+        if capping:
+            result[result == float("inf")] = capping
         return result
+
+
+def compute_histogram_distances(
+    distribs_t: np.ndarray,
+    distribs_u: np.ndarray,
+    metrics: Sequence[type[HistogramDistanceMetric]],
+    features: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """
+    Compute the histogram distance metrics of many features at once.
+
+    :param distribs_t: features x bins matrix of distributions t (usually the latest dataset distributions).
+    :param distribs_u: features x bins matrix of distributions u (usually the sample dataset distributions), in the
+                       same order as `distribs_t`.
+    :param metrics:    The metric classes to compute.
+    :param features:   The feature names of the rows, used as the index of the result.
+
+    :returns: Data frame of the metrics (columns) per feature (index).
+    """
+    distribs_t = np.asarray(distribs_t, dtype=float)
+    distribs_u = np.asarray(distribs_u, dtype=float)
+    if distribs_t.shape != distribs_u.shape:
+        raise ValueError(
+            f"The distributions have different shapes: {distribs_t.shape} and {distribs_u.shape}"
+        )
+    return pd.DataFrame(
+        {
+            metric.NAME: metric.compute_batch(distribs_t, distribs_u)
+            for metric in metrics
+        },
+        index=pd.Index(features) if features is not None else None,
+    )
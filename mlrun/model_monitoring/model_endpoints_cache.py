@@ -0,0 +1,291 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+import typing
+
+import mlrun
+import mlrun.common.model_monitoring.helpers
+import mlrun.common.schemas
+import mlrun.errors
+from mlrun.utils import logger
+
+
+class ModelEndpointsCache:
+    def __init__(
+        self,
+        project: str,
+        ttl_seconds: typing.Optional[float] = None,
+        patch_interval_seconds: typing.Optional[float] = None,
+    ) -> None:
+        """
+        Cache of the model endpoint records (as flat dictionaries) of a project, shared by the steps of the monitoring
+        stream. A record is fetched from the API when it is missing or older than `ttl_seconds`, and the records of
+        all the project endpoints can be listed at once with `prefetch`. The reference feature stats of the endpoints
+        are cached the same way, and only when they are asked for (`get_feature_stats`), as they are large.
+        The endpoint updates are applied to the cached records immediately, and sent to the API in the background
+        every `patch_interval_seconds` - the updates of an endpoint within an interval are coalesced into a single
+        PATCH, so the event processing never waits for the API.
+
+        :param project:                Project name.
+        :param ttl_seconds:            The time a cached record is used before it is fetched again.
+        :param patch_interval_seconds: The interval of sending the pending updates.
+        """
+        config = mlrun.mlconf.model_endpoint_monitoring.endpoints_cache
+        self.project = project
+        self.ttl_seconds = float(
+            config.ttl_seconds if ttl_seconds is None else ttl_seconds
+        )
+        self.patch_interval_seconds = float(
+            config.patch_interval_seconds
+            if patch_interval_seconds is None
+            else patch_interval_seconds
+        )
+
+        # endpoint_id -> (fetch time, record)
+        self._records: dict[str, tuple[float, dict[str, typing.Any]]] = {}
+        # endpoint_id -> (fetch time, reference feature stats), None if the endpoint has no reference stats
+        self._feature_stats: dict[
+            str,
+            tuple[
+                float,
+                typing.Optional[mlrun.common.model_monitoring.helpers.FeatureStats],
+            ],
+        ] = {}
+        # endpoint_id -> (endpoint name, attributes to update)
+        self._pending_updates: dict[str, tuple[str, dict[str, typing.Any]]] = {}
+        self._timer: typing.Optional[threading.Timer] = None
+        # the records are read by the graph while the timer sends the updates
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.patches = 0
+
+    def prefetch(self, feature_analysis: bool = False) -> None:
+        """
+        Cache the records of all the model endpoints of the project with a single list request.
+
+        :param feature_analysis: Cache the reference feature stats of the endpoints too.
+        """
+        try:
+            endpoints = mlrun.db.get_run_db().list_model_endpoints(
+                project=self.project, feature_analysis=feature_analysis
+            )
+        except Exception as exc:
+            logger.warning(
+                "Failed to prefetch the model endpoints, they will be fetched one by one",
+                project=self.project,
+                err=mlrun.errors.err_to_str(exc),
+            )
+            return
+        if not endpoints:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            for endpoint in endpoints.endpoints:
+                self._records[endpoint.metadata.uid] = (
+                    now,
+                    self._with_pending_updates(
+                        endpoint.metadata.uid, endpoint.flat_dict()
+                    ),
+                )
+                if feature_analysis:
+                    self._feature_stats[endpoint.metadata.uid] = (
+                        now,
+                        self._to_feature_stats(endpoint),
+                    )
+        logger.info(
+            "Prefetched the model endpoints",
+            project=self.project,
+            endpoints=len(endpoints.endpoints),
+        )
+
+    def get(self, endpoint_id: str, endpoint_name: str) -> dict[str, typing.Any]:
+        """Get the record of the model endpoint, from the cache if it is fresh"""
+        with self._lock:
+            fetch_time, record = self._records.get(endpoint_id, (None, None))
+            if (
+                fetch_time is not None
+                and time.monotonic() - fetch_time < self.ttl_seconds
+            ):
+                self.hits += 1
+                return record
+            self.misses += 1
+
+        record = (
+            mlrun.db.get_run_db()
+            .get_model_endpoint(
+                project=self.project,
+                endpoint_id=endpoint_id,
+                name=endpoint_name,
+            )
+            .flat_dict()
+        )
+        with self._lock:
+            record = self._with_pending_updates(endpoint_id, record)
+            self._records[endpoint_id] = (time.monotonic(), record)
+        return record
+
+    def get_feature_stats(
+        self, endpoint_id: str, endpoint_name: str
+    ) -> typing.Optional[mlrun.common.model_monitoring.helpers.FeatureStats]:
+        """
+        Get the reference feature stats of the model endpoint, from the cache if they are fresh. Returns None if the
+        endpoint or its reference stats do not exist (yet) - they are fetched again once `ttl_seconds` passed.
+        """
+        with self._lock:
+            fetch_time, feature_stats = self._feature_stats.get(
+                endpoint_id, (None, None)
+            )
+            if (
+                fetch_time is not None
+                and time.monotonic() - fetch_time < self.ttl_seconds
+            ):
+                self.hits += 1
+                return feature_stats
+            self.misses += 1
+
+        try:
+            endpoint = mlrun.db.get_run_db().get_model_endpoint(
+                project=self.project,
+                endpoint_id=endpoint_id,
+                name=endpoint_name,
+                tsdb_metrics=False,
+                feature_analysis=True,
+            )
+        except mlrun.errors.MLRunNotFoundError:
+            endpoint = None
+        feature_stats = self._to_feature_stats(endpoint)
+        if feature_stats is None:
+            logger.info(
+                "The model endpoint has no reference feature stats",
+                endpoint_id=endpoint_id,
+                retry_in_seconds=self.ttl_seconds,
+            )
+        with self._lock:
+            self._feature_stats[endpoint_id] = (time.monotonic(), feature_stats)
+        return feature_stats
+
+    def update(
+        self, endpoint_id: str, endpoint_name: str, attributes: dict[str, typing.Any]
+    ) -> None:
+        """
+        Update the attributes of the model endpoint. The cached record is updated immediately, the API is updated in
+        the background.
+        """
+        with self._lock:
+            if endpoint_id in self._records:
+                self._records[endpoint_id][1].update(attributes)
+            _, pending = self._pending_updates.setdefault(
+                endpoint_id, (endpoint_name, {})
+            )
+            pending.update(attributes)
+            if self._timer is None:
+                self._start_timer()
+
+    def flush(self) -> None:
+        """Send the pending updates of the model endpoints"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            pending_updates, self._pending_updates = self._pending_updates, {}
+
+        for endpoint_id, (endpoint_name, attributes) in pending_updates.items():
+            try:
+                mlrun.db.get_run_db().patch_model_endpoint(
+                    project=self.project,
+                    endpoint_id=endpoint_id,
+                    attributes=dict(attributes),
+                    name=endpoint_name,
+                )
+                self.patches += 1
+            except mlrun.errors.MLRunNotFoundError:
+                logger.warning(
+                    "The model endpoint was not found, dropping its update",
+                    endpoint_id=endpoint_id,
+                    attributes=list(attributes),
+                )
+                self.invalidate(endpoint_id)
+            except Exception as exc:
+                logger.error(
+                    "Failed to update the model endpoint, the update will be retried",
+                    endpoint_id=endpoint_id,
+                    attributes=list(attributes),
+                    err=mlrun.errors.err_to_str(exc),
+                )
+                # Retry with the next updates, unless the attributes were updated again in the meantime
+                with self._lock:
+                    _, pending = self._pending_updates.setdefault(
+                        endpoint_id, (endpoint_name, {})
+                    )
+                    for key, value in attributes.items():
+                        pending.setdefault(key, value)
+
+    def invalidate(self, endpoint_id: typing.Optional[str] = None) -> None:
+        """Drop the cached record of the model endpoint, or all the cached records"""
+        with self._lock:
+            if endpoint_id is None:
+                self._records.clear()
+                self._feature_stats.clear()
+            else:
+                self._records.pop(endpoint_id, None)
+                self._feature_stats.pop(endpoint_id, None)
+
+    @staticmethod
+    def _to_feature_stats(
+        endpoint: typing.Optional[mlrun.common.schemas.ModelEndpoint],
+    ) -> typing.Optional[mlrun.common.model_monitoring.helpers.FeatureStats]:
+        if endpoint is None or not endpoint.spec.feature_stats:
+            return None
+        return mlrun.common.model_monitoring.helpers.FeatureStats(
+            endpoint.spec.feature_stats
+        )
+
+    def _with_pending_updates(
+        self, endpoint_id: str, record: dict[str, typing.Any]
+    ) -> dict[str, typing.Any]:
+        """Apply the updates that were not sent yet to a record that was fetched from the API"""
+        if endpoint_id in self._pending_updates:
+            record.update(self._pending_updates[endpoint_id][1])
+        return record
+
+    def _start_timer(self) -> None:
+        self._timer = threading.Timer(self.patch_interval_seconds, self._flush_on_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _flush_on_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+        self.flush()
+        with self._lock:
+            # Updates that failed or arrived during the flush
+            if self._pending_updates and self._timer is None:
+                self._start_timer()
+
+
+_caches: dict[str, ModelEndpointsCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_model_endpoints_cache(project: str) -> ModelEndpointsCache:
+    """Get the model endpoints cache of the project, shared by all the steps of the process"""
+    with _caches_lock:
+        if project not in _caches:
+            _caches[project] = ModelEndpointsCache(project)
+        return _caches[project]
@@ -15,8 +15,12 @@
 import collections
 import datetime
 import os
+import threading
+import time
 import typing
 
+import numpy as np
+import pandas as pd
 import storey
 
 import mlrun
@@ -35,6 +39,11 @@ from mlrun.common.schemas.model_monitoring.constants import (
     ProjectSecretKeys,
 )
 from mlrun.model_monitoring.db import TSDBConnector
+from mlrun.model_monitoring.db._window_histograms import (
+    WindowHistograms,
+    WindowHistogramsFiles,
+)
+from mlrun.model_monitoring.model_endpoints_cache import get_model_endpoints_cache
 from mlrun.utils import logger
 
 
@@ -49,11 +58,25 @@ class EventStreamProcessor:
         aggregate_windows: typing.Optional[list[str]] = None,
         aggregate_period: str = "5m",
         model_monitoring_access_key: typing.Optional[str] = None,
+        columnar_batches: typing.Optional[bool] = None,
+        window_histograms: typing.Optional[bool] = None,
     ):
         # General configurations, mainly used for the storey steps in the future serving graph
         self.project = project
         self.aggregate_windows = aggregate_windows or ["5m", "1h"]
         self.aggregate_period = aggregate_period
+        # Whether each model invocation flows through the graph as a single ColumnarEventBatch
+        self.columnar_batches = (
+            mlrun.mlconf.model_endpoint_monitoring.columnar_batches
+            if columnar_batches is None
+            else columnar_batches
+        )
+        # Whether the inputs histograms are counted per time bucket for the monitoring applications
+        self.window_histograms = (
+            mlrun.mlconf.model_endpoint_monitoring.window_histograms.enabled
+            if window_histograms is None
+            else window_histograms
+        )
 
         # Parquet path and configurations
         self.parquet_path = parquet_target
@@ -64,6 +87,8 @@ class EventStreamProcessor:
             "Initializing model monitoring event stream processor",
             parquet_path=self.parquet_path,
             parquet_batching_max_events=self.parquet_batching_max_events,
+            columnar_batches=self.columnar_batches,
+            window_histograms=self.window_histograms,
         )
 
         self.storage_options = None
@@ -144,6 +169,13 @@ class EventStreamProcessor:
            the default parquet path is under mlrun.mlconf.model_endpoint_monitoring.user_space. Note that if you are
            using CE, the parquet target path is based on the defined MLRun artifact path.
 
+        If columnar batches are enabled, each model invocation is kept as a single ColumnarEventBatch event instead of
+        being split into sub-events, and it is written as is to the Parquet target. The batch is expanded into rows only
+        for the TSDB steps.
+
+        If window histograms are enabled, the inputs and predictions are also counted per time bucket against the
+        reference bins of each endpoint, and the histograms of each bucket are written to the monitoring stats folder.
+
         :param fn: A serving function.
         :param tsdb_connector: Time series database connector.
         """
@@ -177,6 +209,7 @@ class EventStreamProcessor:
                 after="FilterError",
                 full_event=True,
                 project=self.project,
+                columnar=self.columnar_batches,
             )
 
         apply_process_endpoint_event()
@@ -191,9 +224,12 @@ class EventStreamProcessor:
                 after="ProcessEndpointEvent",
             )
 
-            # flatten the events
+            # flatten the events, columnar batches are kept as is
             graph.add_step(
-                "storey.FlatMap", "flatten_events", _fn="(event)", after="filter_none"
+                "storey.FlatMap",
+                "flatten_events",
+                _fn="(event if isinstance(event, list) else [event])",
+                after="filter_none",
             )
 
         apply_storey_filter_and_flatmap()
@@ -209,10 +245,40 @@ class EventStreamProcessor:
             )
 
         apply_map_feature_names()
+        mapped_step = "MapFeatureNames"
+
+        # Count the inputs histograms per time bucket for the monitoring applications
+        def apply_accumulate_window_histograms():
+            graph.add_step(
+                "AccumulateWindowHistograms",
+                name="AccumulateWindowHistograms",
+                project=self.project,
+                after="MapFeatureNames",
+            )
+
+        if self.window_histograms:
+            apply_accumulate_window_histograms()
+            mapped_step = "AccumulateWindowHistograms"
+
+        # The TSDB steps aggregate and sample single rows, expand the columnar batches into rows
+        def apply_expand_columnar_batch():
+            graph.add_step(
+                "storey.FlatMap",
+                "ExpandColumnarBatch",
+                _fn="(event.to_rows() if hasattr(event, 'to_rows') else [event])",
+                after=mapped_step,
+            )
+
+        tsdb_steps_after = mapped_step
+        if self.columnar_batches:
+            apply_expand_columnar_batch()
+            tsdb_steps_after = "ExpandColumnarBatch"
+
         tsdb_connector.apply_monitoring_stream_steps(
             graph=graph,
             aggregate_windows=self.aggregate_windows,
             aggregate_period=self.aggregate_period,
+            after=tsdb_steps_after,
         )
 
         # Parquet branch
@@ -221,7 +287,7 @@ class EventStreamProcessor:
             graph.add_step(
                 "ProcessBeforeParquet",
                 name="ProcessBeforeParquet",
-                after="MapFeatureNames",
+                after=mapped_step,
                 _fn="(event)",
             )
 
@@ -230,7 +296,9 @@ class EventStreamProcessor:
         # Write the Parquet target file, partitioned by key (endpoint_id) and time.
         def apply_parquet_target():
             graph.add_step(
-                "storey.ParquetTarget",
+                "ColumnarParquetTarget"
+                if self.columnar_batches
+                else "storey.ParquetTarget",
                 name="ParquetTarget",
                 after="ProcessBeforeParquet",
                 graph_shape="cylinder",
@@ -261,7 +329,11 @@ class ProcessBeforeParquet(mlrun.feature_store.steps.MapClass):
         super().__init__(**kwargs)
 
     def do(self, event):
-        logger.info("ProcessBeforeParquet1", event=event)
+        if isinstance(event, ColumnarEventBatch):
+            # Columnar batches are converted as a whole by ColumnarParquetTarget
+            return event
+
+        logger.debug("ProcessBeforeParquet1", event=event)
         # Remove the following keys from the event
         for key in [
             EventFieldType.FEATURES,
@@ -284,14 +356,149 @@ class ProcessBeforeParquet(mlrun.feature_store.steps.MapClass):
         ]:
             if not event.get(key):
                 event[key] = None
-        logger.info("ProcessBeforeParquet2", event=event)
+        logger.debug("ProcessBeforeParquet2", event=event)
         return event
 
 
+class ColumnarParquetTarget(storey.ParquetTarget):
+    """
+    Parquet target that also accepts ColumnarEventBatch events. The batches are kept as is until they are written,
+    and then converted together into a single data frame, without creating a dictionary per row.
+    Note that max_events counts the events (model invocations) and not the rows.
+    """
+
+    def _event_to_batch_entry(self, event):
+        if isinstance(event.body, ColumnarEventBatch):
+            return event.body
+        return super()._event_to_batch_entry(event)
+
+    async def _emit(
+        self, batch, batch_key, batch_time, batch_events, last_event_time=None
+    ):
+        columnar_batches = [
+            entry for entry in batch if isinstance(entry, ColumnarEventBatch)
+        ]
+        if columnar_batches:
+            df = ColumnarEventBatch.to_dataframe(columnar_batches)
+            rows = [
+                entry for entry in batch if not isinstance(entry, ColumnarEventBatch)
+            ]
+            if rows:
+                df = pd.concat([df, pd.DataFrame(rows)], ignore_index=True)
+            batch = df
+        await super()._emit(batch, batch_key, batch_time, batch_events, last_event_time)
+
+
+class ColumnarEventBatch:
+    def __init__(
+        self,
+        fields: dict[str, typing.Any],
+        features: np.ndarray,
+        predictions: np.ndarray,
+    ):
+        """
+        A model invocation in a columnar layout. The fields that are shared by all the rows of the invocation
+        (endpoint_id, timestamp, latency, etc.) are kept once, while the features and the predictions are kept as 2-D
+        arrays of (rows, features) and (rows, predictions). The batch is expanded into per-row events only by the steps
+        that require it.
+
+        :param fields:      The fields that are shared by all the rows.
+        :param features:    2-D array of the feature values.
+        :param predictions: 2-D array of the prediction values.
+        """
+        self.fields = fields
+        self.features = features
+        self.predictions = predictions
+
+        # Set by MapFeatureNames
+        self.feature_names: list[str] = []
+        self.label_names: list[str] = []
+
+    def __len__(self):
+        return len(self.features)
+
+    def __getitem__(self, key):
+        return self.fields[key]
+
+    def __setitem__(self, key, value):
+        self.fields[key] = value
+
+    def get(self, key, default=None):
+        return self.fields.get(key, default)
+
+    def to_rows(self) -> list[dict]:
+        """Expand the batch into the per-row events that MapFeatureNames generates in the row layout"""
+        rows = []
+        for feature_values, label_values in zip(
+            self.features.tolist(), self.predictions.tolist()
+        ):
+            named_features = dict(zip(self.feature_names, feature_values))
+            named_predictions = dict(zip(self.label_names, label_values))
+            rows.append(
+                {
+                    **self.fields,
+                    EventFieldType.FEATURES: feature_values,
+                    EventFieldType.PREDICTION: label_values,
+                    **named_features,
+                    EventFieldType.NAMED_FEATURES: named_features,
+                    **named_predictions,
+                    EventFieldType.NAMED_PREDICTIONS: named_predictions,
+                }
+            )
+        return rows
+
+    def parquet_columns(self) -> dict[str, typing.Any]:
+        """
+        The columns of the batch as written to the Parquet target (see ProcessBeforeParquet). Shared fields are
+        returned as scalars, the named features and predictions as 1-D arrays.
+        """
+        columns = {**(self.fields.get(EventFieldType.ENTITIES) or {}), **self.fields}
+        columns.update(zip(self.feature_names, self.features.T))
+        columns.update(zip(self.label_names, self.predictions.T))
+        for key in [
+            EventFieldType.LABELS,
+            EventFieldType.METRICS,
+            EventFieldType.ENTITIES,
+        ]:
+            if not columns.get(key):
+                columns[key] = None
+        return columns
+
+    @staticmethod
+    def to_dataframe(batches: list["ColumnarEventBatch"]) -> pd.DataFrame:
+        """Convert the batches into a single data frame, column by column"""
+        batches_columns = [batch.parquet_columns() for batch in batches]
+        names = list(
+            dict.fromkeys(name for columns in batches_columns for name in columns)
+        )
+        lengths = [len(batch) for batch in batches]
+        data = {}
+        for name in names:
+            values = [columns.get(name) for columns in batches_columns]
+            is_array = [isinstance(value, np.ndarray) for value in values]
+            if all(is_array):
+                data[name] = np.concatenate(values)
+            elif not any(is_array):
+                # Shared fields are repeated by the number of rows of each batch
+                data[name] = pd.Series(values).repeat(lengths).reset_index(drop=True)
+            else:
+                data[name] = [
+                    item
+                    for value, length in zip(values, lengths)
+                    for item in (
+                        value.tolist()
+                        if isinstance(value, np.ndarray)
+                        else [value] * length
+                    )
+                ]
+        return pd.DataFrame(data)
+
+
 class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
     def __init__(
         self,
         project: str,
+        columnar: bool = False,
         **kwargs,
     ):
         """
@@ -299,7 +506,10 @@ class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
         Adding important details to the event such as endpoint_id, handling errors coming from the stream, validation
         of event data such as inputs and outputs, and splitting model event into sub-events.
 
-        :param project: Project name.
+        :param project:  Project name.
+        :param columnar: If true, the model event is returned as a single ColumnarEventBatch instead of being split
+                         into sub-events. Single row events and events with inputs or outputs that cannot be
+                         represented as 2-D arrays are still split into sub-events.
 
         :returns: A Storey event object which is the basic unit of data in Storey. Note that the next steps of
                   the monitoring serving graph are based on Storey operations.
@@ -308,6 +518,7 @@ class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
         super().__init__(**kwargs)
 
         self.project: str = project
+        self.columnar = columnar
 
         # First and last requests timestamps (value) of each endpoint (key)
         self.first_request: dict[str, str] = dict()
@@ -319,6 +530,12 @@ class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
         # Set of endpoints in the current events
         self.endpoints: set[str] = set()
 
+        self._endpoints_cache = get_model_endpoints_cache(project)
+
+    def post_init(self, mode="sync", **kwargs):
+        # Fetch the records of all the project endpoints at once, instead of an API request per endpoint
+        self._endpoints_cache.prefetch()
+
     def do(self, full_event):
         event = full_event.body
         # Getting model version and function uri from event
@@ -422,6 +639,37 @@ class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
                 else [predictions]
             )
 
+        # Fields that are shared by all the sub events of the model invocation
+        fields = {
+            EventFieldType.FUNCTION_URI: function_uri,
+            EventFieldType.MODEL: versioned_model,
+            EventFieldType.ENDPOINT_NAME: event.get(EventFieldType.MODEL),
+            EventFieldType.MODEL_CLASS: model_class,
+            EventFieldType.TIMESTAMP: timestamp,
+            EventFieldType.ENDPOINT_ID: endpoint_id,
+            EventFieldType.REQUEST_ID: request_id,
+            EventFieldType.LATENCY: latency,
+            EventFieldType.FIRST_REQUEST: self.first_request[endpoint_id],
+            EventFieldType.LAST_REQUEST: self.last_request[endpoint_id],
+            EventFieldType.LAST_REQUEST_TIMESTAMP: mlrun.utils.enrich_datetime_with_tz_info(
+                self.last_request[endpoint_id]
+            ).timestamp(),
+            EventFieldType.ERROR_COUNT: self.error_count[endpoint_id],
+            EventFieldType.LABELS: event.get(EventFieldType.LABELS, {}),
+            EventFieldType.METRICS: event.get(EventFieldType.METRICS, {}),
+            EventFieldType.ENTITIES: event.get("request", {}).get(
+                EventFieldType.ENTITIES, {}
+            ),
+        }
+
+        # Single row invocations are kept as rows, the columnar layout has no benefit for them
+        if self.columnar and len(features) > 1:
+            batch = self._to_columnar_batch(fields, features, predictions)
+            if batch is not None:
+                if not len(batch):
+                    return None
+                return storey.Event(body=batch, key=endpoint_id)
+
         events = []
         for i, (feature, prediction) in enumerate(zip(features, predictions)):
             if not isinstance(prediction, list):
@@ -432,27 +680,9 @@ class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
 
             events.append(
                 {
-                    EventFieldType.FUNCTION_URI: function_uri,
-                    EventFieldType.MODEL: versioned_model,
-                    EventFieldType.ENDPOINT_NAME: event.get(EventFieldType.MODEL),
-                    EventFieldType.MODEL_CLASS: model_class,
-                    EventFieldType.TIMESTAMP: timestamp,
-                    EventFieldType.ENDPOINT_ID: endpoint_id,
-                    EventFieldType.REQUEST_ID: request_id,
-                    EventFieldType.LATENCY: latency,
+                    **fields,
                     EventFieldType.FEATURES: feature,
                     EventFieldType.PREDICTION: prediction,
-                    EventFieldType.FIRST_REQUEST: self.first_request[endpoint_id],
-                    EventFieldType.LAST_REQUEST: self.last_request[endpoint_id],
-                    EventFieldType.LAST_REQUEST_TIMESTAMP: mlrun.utils.enrich_datetime_with_tz_info(
-                        self.last_request[endpoint_id]
-                    ).timestamp(),
-                    EventFieldType.ERROR_COUNT: self.error_count[endpoint_id],
-                    EventFieldType.LABELS: event.get(EventFieldType.LABELS, {}),
-                    EventFieldType.METRICS: event.get(EventFieldType.METRICS, {}),
-                    EventFieldType.ENTITIES: event.get("request", {}).get(
-                        EventFieldType.ENTITIES, {}
-                    ),
                 }
             )
 
@@ -461,20 +691,38 @@ class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
         storey_event = storey.Event(body=events, key=endpoint_id)
         return storey_event
 
+    @staticmethod
+    def _to_columnar_batch(
+        fields: dict[str, typing.Any], features: list, predictions: list
+    ) -> typing.Optional[ColumnarEventBatch]:
+        """
+        Convert the normalized inputs and outputs of a model invocation into a columnar batch. Returns None if they
+        cannot be represented as 2-D arrays (e.g. rows of different lengths or nested values).
+        """
+        num_rows = min(len(features), len(predictions))
+        arrays = []
+        for values in [features[:num_rows], predictions[:num_rows]]:
+            try:
+                array = np.asarray(values)
+                if array.dtype.kind not in "biuf":
+                    array = np.asarray(values, dtype=object)
+            except ValueError:
+                return None
+            if array.ndim == 1:
+                array = array.reshape(-1, 1)
+            if array.ndim != 2:
+                return None
+            arrays.append(array)
+        return ColumnarEventBatch(
+            fields=fields, features=arrays[0], predictions=arrays[1]
+        )
+
     def resume_state(self, endpoint_id, endpoint_name):
         # Make sure process is resumable, if process fails for any reason, be able to pick things up close to where we
         # left them
         if endpoint_id not in self.endpoints:
             logger.info("Trying to resume state", endpoint_id=endpoint_id)
-            endpoint_record = (
-                mlrun.db.get_run_db()
-                .get_model_endpoint(
-                    project=self.project,
-                    endpoint_id=endpoint_id,
-                    name=endpoint_name,
-                )
-                .flat_dict()
-            )
+            endpoint_record = self._endpoints_cache.get(endpoint_id, endpoint_name)
 
             # If model endpoint found, get first_request, last_request and error_count values
             if endpoint_record:
@@ -536,7 +784,8 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
 
 
         :returns: A single event as a dictionary that includes metadata (endpoint_id, model_class, etc.) and also
-                  feature names and values (as well as the prediction results).
+                  feature names and values (as well as the prediction results). Columnar batches are returned as
+                  batches, with the feature names and label columns set on them.
         """
         super().__init__(**kwargs)
 
@@ -552,23 +801,24 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
         # Dictionary to manage the model endpoint types - important for the V3IO TSDB
         self.endpoint_type = {}
 
-    def _infer_feature_names_from_data(self, event):
+        self._endpoints_cache = get_model_endpoints_cache(project)
+
+    def _infer_feature_names_from_data(self, feature_values: list):
         for endpoint_id in self.feature_names:
-            if len(self.feature_names[endpoint_id]) >= len(
-                event[EventFieldType.FEATURES]
-            ):
+            if len(self.feature_names[endpoint_id]) >= len(feature_values):
                 return self.feature_names[endpoint_id]
         return None
 
-    def _infer_label_columns_from_data(self, event):
+    def _infer_label_columns_from_data(self, label_values: list):
         for endpoint_id in self.label_columns:
-            if len(self.label_columns[endpoint_id]) >= len(
-                event[EventFieldType.PREDICTION]
-            ):
+            if len(self.label_columns[endpoint_id]) >= len(label_values):
                 return self.label_columns[endpoint_id]
         return None
 
-    def do(self, event: dict):
+    def do(self, event: typing.Union[dict, ColumnarEventBatch]):
+        if isinstance(event, ColumnarEventBatch):
+            return self._do_columnar(event)
+
         endpoint_id = event[EventFieldType.ENDPOINT_ID]
 
         feature_values = event[EventFieldType.FEATURES]
@@ -579,18 +829,76 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
             if isinstance(feature_value, int):
                 feature_values[index] = float(feature_value)
 
+        self._update_endpoint_record(
+            event=event, feature_values=feature_values, label_values=label_values
+        )
+
+        # Add feature_name:value pairs along with a mapping dictionary of all of these pairs
+        feature_names = self.feature_names[endpoint_id]
+        self._map_dictionary_values(
+            event=event,
+            named_iters=feature_names,
+            values_iters=feature_values,
+            mapping_dictionary=EventFieldType.NAMED_FEATURES,
+        )
+
+        # Add label_name:value pairs along with a mapping dictionary of all of these pairs
+        label_names = self.label_columns[endpoint_id]
+        self._map_dictionary_values(
+            event=event,
+            named_iters=label_names,
+            values_iters=label_values,
+            mapping_dictionary=EventFieldType.NAMED_PREDICTIONS,
+        )
+
+        # Add endpoint type to the event
+        event[EventFieldType.ENDPOINT_TYPE] = self.endpoint_type[endpoint_id]
+
+        logger.debug("Mapped event", event=event)
+        return event
+
+    def _do_columnar(self, batch: ColumnarEventBatch) -> ColumnarEventBatch:
+        endpoint_id = batch[EventFieldType.ENDPOINT_ID]
+
+        # Cast integer (and boolean) features to floats in a single operation
+        if batch.features.dtype.kind in "biu":
+            batch.features = batch.features.astype(float)
+
+        # The endpoint record is updated based on the values of the first row
+        self._update_endpoint_record(
+            event=batch,
+            feature_values=batch.features[0].tolist(),
+            label_values=batch.predictions[0].tolist(),
+        )
+
+        batch.feature_names = self.feature_names[endpoint_id]
+        batch.label_names = self.label_columns[endpoint_id]
+        batch[EventFieldType.ENDPOINT_TYPE] = self.endpoint_type[endpoint_id]
+
+        logger.debug(
+            "Mapped columnar batch",
+            endpoint_id=endpoint_id,
+            rows=len(batch),
+        )
+        return batch
+
+    def _update_endpoint_record(
+        self,
+        event: typing.Union[dict, ColumnarEventBatch],
+        feature_values: list,
+        label_values: list,
+    ):
+        """
+        Get the feature names and label columns of the event endpoint, generate and store them in the endpoint record
+        if they are not initialized yet, and update the first request time of the endpoint.
+        """
+        endpoint_id = event[EventFieldType.ENDPOINT_ID]
         attributes_to_update = {}
         endpoint_record = None
         # Get feature names and label columns
         if endpoint_id not in self.feature_names:
-            endpoint_record = (
-                mlrun.db.get_run_db()
-                .get_model_endpoint(
-                    project=self.project,
-                    endpoint_id=endpoint_id,
-                    name=event[EventFieldType.ENDPOINT_NAME],
-                )
-                .flat_dict()
+            endpoint_record = self._endpoints_cache.get(
+                endpoint_id, event[EventFieldType.ENDPOINT_NAME]
             )
             feature_names = endpoint_record.get(EventFieldType.FEATURE_NAMES)
 
@@ -599,7 +907,7 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
             # If feature names were not found,
             # try to retrieve them from the previous events of the current process
             if not feature_names and self._infer_columns_from_data:
-                feature_names = self._infer_feature_names_from_data(event)
+                feature_names = self._infer_feature_names_from_data(feature_values)
 
             endpoint_type = int(endpoint_record.get(EventFieldType.ENDPOINT_TYPE))
             if not feature_names:
@@ -607,9 +915,7 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
                     "Feature names are not initialized, they will be automatically generated",
                     endpoint_id=endpoint_id,
                 )
-                feature_names = [
-                    f"f{i}" for i, _ in enumerate(event[EventFieldType.FEATURES])
-                ]
+                feature_names = [f"f{i}" for i, _ in enumerate(feature_values)]
 
                 # Update the endpoint record with the generated features
                 attributes_to_update[EventFieldType.FEATURE_NAMES] = feature_names
@@ -623,16 +929,14 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
 
             # Similar process with label columns
             if not label_columns and self._infer_columns_from_data:
-                label_columns = self._infer_label_columns_from_data(event)
+                label_columns = self._infer_label_columns_from_data(label_values)
 
             if not label_columns:
                 logger.warn(
                     "label column names are not initialized, they will be automatically generated",
                     endpoint_id=endpoint_id,
                 )
-                label_columns = [
-                    f"p{i}" for i, _ in enumerate(event[EventFieldType.PREDICTION])
-                ]
+                label_columns = [f"p{i}" for i, _ in enumerate(label_values)]
                 attributes_to_update[EventFieldType.LABEL_NAMES] = label_columns
                 if endpoint_type != EndpointType.ROUTER.value:
                     update_monitoring_feature_set(
@@ -656,14 +960,8 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
 
         # Update the first request time in the endpoint record
         if endpoint_id not in self.first_request:
-            endpoint_record = endpoint_record or (
-                mlrun.db.get_run_db()
-                .get_model_endpoint(
-                    project=self.project,
-                    endpoint_id=endpoint_id,
-                    name=event[EventFieldType.ENDPOINT_NAME],
-                )
-                .flat_dict()
+            endpoint_record = endpoint_record or self._endpoints_cache.get(
+                endpoint_id, event[EventFieldType.ENDPOINT_NAME]
             )
             if not endpoint_record.get(EventFieldType.FIRST_REQUEST):
                 attributes_to_update[EventFieldType.FIRST_REQUEST] = (
@@ -678,37 +976,13 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
                 endpoint_id=endpoint_id,
                 attributes=attributes_to_update,
             )
-            update_endpoint_record(
-                project=self.project,
+            # The endpoint record is updated in the background
+            self._endpoints_cache.update(
                 endpoint_id=endpoint_id,
-                attributes=attributes_to_update,
                 endpoint_name=event[EventFieldType.ENDPOINT_NAME],
+                attributes=attributes_to_update,
             )
 
-        # Add feature_name:value pairs along with a mapping dictionary of all of these pairs
-        feature_names = self.feature_names[endpoint_id]
-        self._map_dictionary_values(
-            event=event,
-            named_iters=feature_names,
-            values_iters=feature_values,
-            mapping_dictionary=EventFieldType.NAMED_FEATURES,
-        )
-
-        # Add label_name:value pairs along with a mapping dictionary of all of these pairs
-        label_names = self.label_columns[endpoint_id]
-        self._map_dictionary_values(
-            event=event,
-            named_iters=label_names,
-            values_iters=label_values,
-            mapping_dictionary=EventFieldType.NAMED_PREDICTIONS,
-        )
-
-        # Add endpoint type to the event
-        event[EventFieldType.ENDPOINT_TYPE] = self.endpoint_type[endpoint_id]
-
-        logger.info("Mapped event", event=event)
-        return event
-
     @staticmethod
     def _map_dictionary_values(
         event: dict,
@@ -735,6 +1009,219 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
             event[mapping_dictionary][name] = value
 
 
+class AccumulateWindowHistograms(mlrun.feature_store.steps.MapClass):
+    def __init__(
+        self,
+        project: str,
+        bucket_seconds: typing.Optional[int] = None,
+        flush_delay_seconds: typing.Optional[float] = None,
+        retention_hours: typing.Optional[float] = None,
+        **kwargs,
+    ):
+        """
+        Count the inputs and predictions of each model endpoint per time bucket, with the reference bins of the
+        endpoint features (the training set histograms), and write the histograms of each bucket once it is complete.
+        The monitoring applications merge the buckets of their window instead of recomputing the statistics from the
+        raw sample data (see mlrun.mlconf.model_endpoint_monitoring.window_histograms).
+        The events are only counted by the graph, the buckets are written by a timer thread: a bucket is written
+        `flush_delay_seconds` after both its end time and its last event passed, and it is kept and written again
+        by the next timer run if the write failed. Events that arrive after their bucket was written are written to
+        an additional file of the same bucket. The buckets of an endpoint that are older than `retention_hours` are
+        deleted once an hour, when a bucket of the endpoint is written.
+        The reference stats of the endpoints are served by the model endpoints cache of the project, so endpoints
+        that get their reference stats later are counted once the cached stats expire.
+
+        :param project:             Project name.
+        :param bucket_seconds:      The length of the time buckets.
+        :param flush_delay_seconds: The time to wait for late events before a bucket is written.
+        :param retention_hours:     The time to keep the written buckets.
+
+        :returns: The event, unchanged.
+        """
+        super().__init__(**kwargs)
+        self.project = project
+        config = mlrun.mlconf.model_endpoint_monitoring.window_histograms
+        self.bucket_seconds = int(bucket_seconds or config.bucket_seconds)
+        self.flush_delay_seconds = float(
+            config.flush_delay_seconds
+            if flush_delay_seconds is None
+            else flush_delay_seconds
+        )
+        self.retention_seconds = int(
+            3600
+            * float(
+                config.retention_hours if retention_hours is None else retention_hours
+            )
+        )
+
+        self._endpoints_cache = get_model_endpoints_cache(project)
+        # (endpoint_id, bucket start) -> histograms of the bucket
+        self._buckets: dict[tuple[str, int], WindowHistograms] = {}
+        # (endpoint_id, bucket start) -> (column names, rows that were not counted yet)
+        self._pending_rows: dict[tuple[str, int], tuple[list[str], list[list]]] = {}
+        # (endpoint_id, bucket start) -> the last time (seconds since the epoch) an event of the bucket arrived
+        self._last_event_time: dict[tuple[str, int], float] = {}
+        # endpoint_id -> the hour (seconds since the epoch) the old buckets of the endpoint were last deleted in
+        self._last_cleanup: dict[str, int] = {}
+        self._timer: typing.Optional[threading.Timer] = None
+        # events are counted by the graph while the timer writes the complete buckets
+        self._lock = threading.RLock()
+        # a single writer at a time - the timer or an explicit flush
+        self._flush_lock = threading.Lock()
+
+    def post_init(self, mode="sync", **kwargs):
+        # Fetch the reference stats of all the project endpoints at once, instead of an API request per endpoint
+        self._endpoints_cache.prefetch(feature_analysis=True)
+
+    def do(self, event: typing.Union[dict, ColumnarEventBatch]):
+        endpoint_id = event[EventFieldType.ENDPOINT_ID]
+        feature_stats = self._endpoints_cache.get_feature_stats(
+            endpoint_id, event[EventFieldType.ENDPOINT_NAME]
+        )
+        if not feature_stats:
+            return event
+
+        timestamp = event[EventFieldType.TIMESTAMP]
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=datetime.timezone.utc)
+        bucket_start = (
+            int(timestamp.timestamp()) // self.bucket_seconds * self.bucket_seconds
+        )
+        key = (endpoint_id, bucket_start)
+
+        with self._lock:
+            if key not in self._buckets:
+                self._buckets[key] = WindowHistograms.from_feature_stats(feature_stats)
+            if isinstance(event, ColumnarEventBatch):
+                self._buckets[key].add(event.feature_names, event.features)
+                self._buckets[key].add(event.label_names, event.predictions)
+            else:
+                names, rows = self._pending_rows.setdefault(
+                    key,
+                    (
+                        list(event[EventFieldType.NAMED_FEATURES])
+                        + list(event[EventFieldType.NAMED_PREDICTIONS]),
+                        [],
+                    ),
+                )
+                rows.append(
+                    event[EventFieldType.FEATURES] + event[EventFieldType.PREDICTION]
+                )
+                # The rows are counted in chunks, a single row is not worth the array conversion
+                if len(rows) >= 1000:
+                    self._count_pending_rows(key)
+            self._last_event_time[key] = time.time()
+            if self._timer is None:
+                self._start_timer()
+        return event
+
+    def flush(self) -> None:
+        """Write the histograms of all the buckets, including the incomplete ones"""
+        self._flush(None)
+
+    def _count_pending_rows(self, key: tuple[str, int]) -> None:
+        names, rows = self._pending_rows.pop(key, (None, None))
+        if not rows:
+            return
+        try:
+            values = np.asarray(rows, dtype=float)
+        except (TypeError, ValueError):
+            # Non-numeric values, the columns are converted one by one
+            values = np.asarray(rows, dtype=object)
+        if values.ndim == 2:
+            self._buckets[key].add(names, values)
+
+    def _flush(self, now: typing.Optional[float]) -> None:
+        """Write the buckets that are complete at `now`, or all the buckets if `now` is None"""
+        with self._flush_lock:
+            with self._lock:
+                complete = {}
+                for key in list(self._buckets):
+                    if now is not None and now < (
+                        max(
+                            key[1] + self.bucket_seconds,
+                            self._last_event_time[key],
+                        )
+                        + self.flush_delay_seconds
+                    ):
+                        continue
+                    self._count_pending_rows(key)
+                    # Taken out of the buckets, so the events that arrive during the write count a new histograms
+                    complete[key] = (
+                        self._buckets.pop(key),
+                        self._last_event_time.pop(key),
+                    )
+
+            # The files are written without holding the lock, so the graph is not blocked by the storage
+            for (endpoint_id, bucket_start), (
+                histograms,
+                last_event_time,
+            ) in complete.items():
+                try:
+                    WindowHistogramsFiles(self.project, endpoint_id).write(
+                        bucket_start, histograms
+                    )
+                except Exception as exc:
+                    logger.error(
+                        "Failed to write the window histograms, the bucket will be written again",
+                        endpoint_id=endpoint_id,
+                        bucket_start=bucket_start,
+                        err=mlrun.errors.err_to_str(exc),
+                    )
+                    self._restore(
+                        (endpoint_id, bucket_start), histograms, last_event_time
+                    )
+                    continue
+                logger.debug(
+                    "Wrote the window histograms",
+                    endpoint_id=endpoint_id,
+                    bucket_start=bucket_start,
+                )
+                self._delete_old_buckets(endpoint_id, bucket_start)
+
+    def _restore(
+        self, key: tuple[str, int], histograms: WindowHistograms, last_event_time: float
+    ) -> None:
+        """Put back the histograms of a bucket that failed to be written, with the events counted since"""
+        with self._lock:
+            if key in self._buckets:
+                histograms.merge(self._buckets[key])
+                last_event_time = max(last_event_time, self._last_event_time[key])
+            self._buckets[key] = histograms
+            self._last_event_time[key] = last_event_time
+
+    def _delete_old_buckets(self, endpoint_id: str, bucket_start: int) -> None:
+        hour = bucket_start - bucket_start % 3600
+        if self._last_cleanup.get(endpoint_id) == hour:
+            return
+        self._last_cleanup[endpoint_id] = hour
+        try:
+            WindowHistogramsFiles(self.project, endpoint_id).delete_before(
+                bucket_start - self.retention_seconds
+            )
+        except Exception as exc:
+            logger.warning(
+                "Failed to delete the old window histograms",
+                endpoint_id=endpoint_id,
+                err=mlrun.errors.err_to_str(exc),
+            )
+
+    def _start_timer(self) -> None:
+        self._timer = threading.Timer(
+            min(self.bucket_seconds, self.flush_delay_seconds) or 1,
+            self._flush_on_timer,
+        )
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _flush_on_timer(self) -> None:
+        self._flush(time.time())
+        with self._lock:
+            self._timer = None
+            if self._buckets:
+                self._start_timer()
+
+
 class InferSchema(mlrun.feature_store.steps.MapClass):
     def __init__(
         self,
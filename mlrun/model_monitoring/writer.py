@@ -235,6 +235,11 @@ class ModelMonitoringWriter(StepToDict):
             stats_kind=stat_kind,
         )
 
+    def on_termination(self) -> None:
+        """Write the events which are buffered by the TSDB connector when the writer's flow is terminated"""
+        logger.info("Flushing the buffered application events on termination")
+        self._tsdb_connector.flush_application_events()
+
     def do(self, event: _RawEvent) -> None:
         event, kind = self._reconstruct_event(event)
         logger.info("Starting to write event", event=event)
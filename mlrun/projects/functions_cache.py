@@ -0,0 +1,171 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import os
+import tempfile
+import typing
+
+import mlrun
+import mlrun.utils
+from mlrun.utils import logger
+
+# The configurations which the function specs are enriched with when they are resolved (e.g. the default resources,
+# preemption mode and image pull secret), so the cached functions are resolved again when they change
+_function_defaults_config = [
+    "function",
+    "function_defaults",
+    "default_function_pod_resources",
+    "default_function_priority_class_name",
+    "default_function_node_selector",
+    "preemptible_nodes",
+    "storage",
+    "httpdb.nuclio",
+    "igz_version",
+]
+
+
+class FunctionsCache:
+    def __init__(self, path: str, max_entries: int):
+        """
+        Cache of the functions that are resolved from the local files of the project function definitions (yaml,
+        py and ipynb files). A function is stored by a key of its definition and the content of its file, so it is
+        reused by the next project loads as long as the file did not change. A function has a single entry - the
+        entry of its previous file content is deleted when it is stored again, and the least recently used entries
+        are deleted when there are more than `max_entries`.
+
+        :param path:        The directory of the cached functions.
+        :param max_entries: The maximum number of cached functions.
+        """
+        self.path = os.path.expanduser(path)
+        self.max_entries = max_entries
+
+    def get_key(
+        self, function_definition: dict, name: str, file_path: str
+    ) -> typing.Optional[str]:
+        """
+        Get the cache key of a function definition, or None if its file is not a local file. The key starts with the
+        id of the function (by its name and file), followed by the hash of its definition, file content and the
+        configurations the function is enriched with.
+
+        :param function_definition: The function definition (of the project spec).
+        :param name:                The function name.
+        :param file_path:           The absolute path of the function file.
+        """
+        if not os.path.isfile(file_path):
+            return None
+
+        function_id = hashlib.sha256(
+            json.dumps([name, file_path]).encode()
+        ).hexdigest()[:16]
+        key = hashlib.sha256()
+        key.update(
+            json.dumps(
+                [
+                    mlrun.__version__,
+                    name,
+                    function_definition,
+                    self._get_function_defaults_config(),
+                ],
+                sort_keys=True,
+                default=str,
+            ).encode()
+        )
+        with open(file_path, "rb") as fp:
+            for chunk in iter(lambda: fp.read(1024 * 1024), b""):
+                key.update(chunk)
+        return f"{function_id}-{key.hexdigest()}"
+
+    @staticmethod
+    def _get_function_defaults_config() -> dict:
+        config = {}
+        for path in _function_defaults_config:
+            value = mlrun.mlconf
+            for attribute in path.split("."):
+                value = getattr(value, attribute, None)
+            config[path] = value.to_dict() if hasattr(value, "to_dict") else value
+        return config
+
+    def get(self, key: str) -> typing.Optional[dict]:
+        """Get the cached function dictionary, or None if it is not cached"""
+        path = self._get_path(key)
+        try:
+            with open(path) as fp:
+                function = json.load(fp)
+            # The modification time orders the entries by their last use
+            os.utime(path)
+            return function
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.debug(
+                "Failed to read a cached function, ignoring",
+                key=key,
+                error=mlrun.utils.err_to_str(exc),
+            )
+            return None
+
+    def set(self, key: str, function: "mlrun.runtimes.BaseRuntime"):
+        """Cache the function"""
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            # Written to a temporary file first, as the functions of a project are resolved in parallel
+            fd, temp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+            with os.fdopen(fd, "w") as fp:
+                fp.write(mlrun.utils.dict_to_json(function.to_dict()))
+            os.replace(temp_path, self._get_path(key))
+            self._delete_old_entries(key)
+        except OSError as exc:
+            logger.debug(
+                "Failed to cache the function, ignoring",
+                name=function.metadata.name,
+                error=mlrun.utils.err_to_str(exc),
+            )
+
+    def _delete_old_entries(self, key: str):
+        """Delete the previous entries of the function of the key and the least recently used entries over the limit"""
+        function_id = key.split("-", 1)[0]
+        entries = []
+        for entry in os.scandir(self.path):
+            if not entry.name.endswith(".json"):
+                continue
+            if entry.name.startswith(f"{function_id}-") and entry.name != f"{key}.json":
+                self._delete(entry.path)
+                continue
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except FileNotFoundError:
+                # Deleted by a parallel resolve
+                continue
+        for _, path in sorted(entries)[: max(len(entries) - self.max_entries, 0)]:
+            self._delete(path)
+
+    @staticmethod
+    def _delete(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.path, f"{key}.json")
+
+
+def get_functions_cache() -> typing.Optional[FunctionsCache]:
+    """Get the project functions cache, or None if it is disabled"""
+    config = mlrun.mlconf.project_functions
+    if not config.cache_enabled or not config.cache_path:
+        return None
+    return FunctionsCache(config.cache_path, int(config.cache_max_entries))
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
 import datetime
 import getpass
 import glob
@@ -22,6 +23,7 @@ import os
 import pathlib
 import shutil
 import tempfile
+import time
 import typing
 import uuid
 import warnings
@@ -100,6 +102,7 @@ from ..utils.helpers import (
     resolve_git_reference_from_source,
 )
 from ..utils.notifications import CustomNotificationPusher, NotificationTypes
+from .functions_cache import get_functions_cache
 from .operations import (
     BuildStatus,
     DeployStatus,
@@ -3034,6 +3037,7 @@ class MlrunProject(ModelObj):
             functions = {}
 
         origin = mlrun.runtimes.utils.add_code_metadata(self.spec.context)
+        loaded_functions = self._load_function_definitions(names, always)
         for name in names:
             function_definition = self.spec._function_definitions.get(name)
             if not function_definition:
@@ -3059,9 +3063,10 @@ class MlrunProject(ModelObj):
                 name, func = _init_function_from_obj(function_definition, self, name)
             elif isinstance(function_definition, dict):
                 try:
-                    name, func = _init_function_from_dict(
-                        function_definition, self, name
-                    )
+                    loaded_function = loaded_functions[name]
+                    if isinstance(loaded_function, Exception):
+                        raise loaded_function
+                    name, func = loaded_function
                 except FileNotFoundError as exc:
                     message = f"File {exc.filename} not found while syncing project functions."
                     if silent:
@@ -3097,6 +3102,66 @@ class MlrunProject(ModelObj):
         self._initialized = True
         return self.spec._function_objects
 
+    def _load_function_definitions(
+        self, names: typing.Iterable[str], always: bool
+    ) -> dict[str, typing.Union[tuple[str, mlrun.runtimes.BaseRuntime], Exception]]:
+        """
+        Resolve the dict function definitions to function objects in parallel (reading their files, importing their
+        yaml, etc.).
+
+        :returns: Dictionary of function name to the resolved (name, function object), or to the resolving exception
+        """
+        to_load = []
+        for name in names:
+            function_definition = self.spec._function_definitions.get(name)
+            if not isinstance(function_definition, dict):
+                continue
+            if not always and isinstance(
+                self.spec._function_objects.get(name), mlrun.runtimes.base.BaseRuntime
+            ):
+                continue
+            to_load.append((name, function_definition))
+        if not to_load:
+            return {}
+
+        def load(name: str, function_definition: dict):
+            start = time.monotonic()
+            try:
+                return _init_function_from_dict(function_definition, self, name)
+            except Exception as exc:
+                return exc
+            finally:
+                logger.debug(
+                    "Resolved project function",
+                    name=name,
+                    duration=round(time.monotonic() - start, 3),
+                )
+
+        start = time.monotonic()
+        workers = min(int(mlrun.mlconf.project_functions.sync_workers), len(to_load))
+        if workers > 1:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    name: executor.submit(load, name, function_definition)
+                    for name, function_definition in to_load
+                }
+                loaded_functions = {
+                    name: future.result() for name, future in futures.items()
+                }
+        else:
+            loaded_functions = {
+                name: load(name, function_definition)
+                for name, function_definition in to_load
+            }
+        logger.info(
+            "Resolved project functions",
+            project=self.metadata.name,
+            functions=len(to_load),
+            workers=workers,
+            duration=round(time.monotonic() - start, 3),
+        )
+        return loaded_functions
+
     def with_secrets(self, kind, source, prefix=""):
         """register a secrets source (file, env or dict)
 
@@ -5152,7 +5217,30 @@ def _init_function_from_dict(
     relative_url = url
     url, in_context = project.get_item_absolute_path(url)
 
-    if "spec" in f:
+    # Functions that are resolved from local files are reused from the cache while their file did not change
+    functions_cache = get_functions_cache()
+    cache_key = None
+    if (
+        functions_cache
+        and "spec" not in f
+        and url
+        and (
+            is_yaml_path(url)
+            or url.endswith(".ipynb")
+            or (url.endswith(".py") and not (in_context and with_repo))
+        )
+    ):
+        cache_key = functions_cache.get_key(f, name, url)
+    cached_function = functions_cache.get(cache_key) if cache_key else None
+
+    if cached_function:
+        func = new_function(name, runtime=cached_function)
+        if not is_yaml_path(url):
+            # The code origin holds the current commit of the file repository, which may change while the file did not
+            code_origin = mlrun.runtimes.utils.add_code_metadata(url)
+            func.spec.build.code_origin = f"{code_origin}:{url}" if code_origin else url
+
+    elif "spec" in f:
         if "spec" in f["spec"]:
             # Functions are stored in the project yaml as a dict with a spec key where the spec is the function
             func = new_function(name, runtime=f["spec"])
@@ -5221,6 +5309,9 @@ def _init_function_from_dict(
     else:
         raise ValueError(f"Unsupported function url:handler {url}:{handler} or no spec")
 
+    if cache_key and not cached_function:
+        functions_cache.set(cache_key, func)
+
     if with_repo:
         # mark source to be enriched before run with project source (enrich_function_object)
         func.spec.build.source = "./"
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import importlib.util as imputil
 import json
 import os
@@ -1175,30 +1176,108 @@ def wait_for_runs_completion(
         )
         completed = wait_for_runs_completion([run1, run2])
 
+    The states of the runs are read in bulk (a single request per project), and when all the runs are of the same
+    project the API holds the request until any of the runs changes its state (long poll). Otherwise, the runs are
+    checked with an interval that grows while no run changes its state, up to `sleep` seconds.
+
     :param runs:    list of run objects (the returned values of function.run())
-    :param sleep:   time to sleep between checks (in seconds)
+    :param sleep:   maximal time to sleep between checks (in seconds)
     :param timeout: maximum time to wait in seconds (0 for unlimited)
     :param silent:  set to True for silent exit on timeout
     :return: list of completed runs
     """
     completed = []
-    total_time = 0
+    runs = list(runs)
+    db = mlrun.db.get_run_db()
+    bulk = True
+    min_interval = min(
+        float(mlconf.httpdb.runs_states.client_min_check_interval), sleep
+    )
+    interval = min_interval
+    start_time = time.monotonic()
     while True:
+        previous_states = [run.status.state for run in runs]
+        waited = False
+        if bulk:
+            wait_timeout = int(mlconf.httpdb.runs_states.client_wait_timeout)
+            if timeout:
+                remaining = timeout - (time.monotonic() - start_time)
+                wait_timeout = max(min(wait_timeout, int(remaining)), 0)
+            request_start_time = time.monotonic()
+            try:
+                waited = _update_runs_states(db, runs, wait_timeout)
+            except Exception as exc:
+                logger.debug(
+                    "Failed to read the runs states in bulk, reading each run instead",
+                    error=mlrun.errors.err_to_str(exc),
+                )
+                bulk = False
+            # a wait that ended before its timeout without a change (e.g. on a missing run) is not counted as a wait
+            waited = waited and time.monotonic() - request_start_time >= wait_timeout
+
+        terminal_states = mlrun.common.runtimes.constants.RunStates.terminal_states()
         running = []
-        for run in runs:
-            state = run.state()
-            if state in mlrun.common.runtimes.constants.RunStates.terminal_states():
+        for run, previous_state in zip(runs, previous_states):
+            state = run.status.state if bulk else run.state()
+            if state in terminal_states:
+                if bulk and previous_state not in terminal_states:
+                    # only the state was read, read the full status (results, error) of the completed run
+                    run.refresh()
                 completed.append(run)
             else:
                 running.append(run)
         if len(running) == 0:
             break
-        time.sleep(sleep)
-        total_time += sleep
-        if timeout and total_time > timeout:
+
+        changed = any(
+            run.status.state != state for run, state in zip(runs, previous_states)
+        )
+        if changed:
+            interval = min_interval
+        elif not waited:
+            time.sleep(interval)
+            interval = min(interval * 2, sleep)
+        if timeout and time.monotonic() - start_time > timeout:
             if silent:
                 break
             raise MLRunTimeoutError("some runs did not reach terminal state on time")
         runs = running
 
     return completed
+
+
+def _update_runs_states(db, runs: list, wait_timeout: int) -> bool:
+    """
+    Update the states of the runs with a single request per project.
+
+    :param db:           The run DB.
+    :param runs:         The run objects to update.
+    :param wait_timeout: Seconds to wait for a state change, used only when all the runs are of the same project.
+
+    :return: Whether the request waited for a state change.
+    """
+    runs_by_project = collections.defaultdict(dict)
+    for run in runs:
+        project = run.metadata.project or mlconf.default_project
+        runs_by_project[project][run.metadata.uid] = run
+    if len(runs_by_project) > 1:
+        wait_timeout = 0
+
+    for project, project_runs in runs_by_project.items():
+        runs_states = db.list_runs_states(
+            list(project_runs),
+            project,
+            known_states={
+                uid: run.status.state
+                for uid, run in project_runs.items()
+                if run.status.state
+            },
+            timeout=wait_timeout,
+        )
+        for run_state in runs_states:
+            run = project_runs.get(run_state.uid)
+            if run and run_state.state:
+                run.status.state = run_state.state
+                if run_state.last_update:
+                    run.status.last_update = run_state.last_update.isoformat()
+    return bool(wait_timeout)
@@ -25,7 +25,7 @@ import traceback
 from contextlib import redirect_stdout
 from copy import copy
 from io import StringIO
-from os import environ, remove
+from os import environ
 from pathlib import Path
 from subprocess import PIPE, Popen
 from sys import executable
@@ -37,7 +37,7 @@ import mlrun.common.constants as mlrun_constants
 from mlrun.lists import RunList
 
 from ..errors import err_to_str
-from ..execution import MLClientCtx
+from ..execution import MLClientCtx, read_run_tmpfile, remove_run_tmpfile
 from ..model import RunObject
 from ..utils import get_handler_extended, get_in, logger, set_paths
 from ..utils.clones import extract_source
@@ -363,11 +363,10 @@ class LocalRuntime(BaseRuntime, ParallelRunner):
 
             run_obj_dict = runobj.to_dict()  # default value
             if os.path.isfile(tmp):
-                with open(tmp) as fp:
-                    resp = fp.read()
-                remove(tmp)
+                resp = read_run_tmpfile(tmp)
+                remove_run_tmpfile(tmp)
                 if resp:
-                    run_obj_dict = json.loads(resp)
+                    run_obj_dict = resp
                 else:
                     logger.debug("Empty context tmp file")
             else:
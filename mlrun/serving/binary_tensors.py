@@ -0,0 +1,204 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Binary tensor data of model server requests and responses, following the KServe v2 binary data extension:
+the body is a JSON header followed by the raw tensor buffers, and the length of the JSON header is given in the
+`Inference-Header-Content-Length` HTTP header. Each tensor in the JSON header has a name, a shape, a datatype and
+its buffer size in `parameters.binary_data_size`, for example::
+
+    {
+        "id": "1",
+        "inputs": [
+            {
+                "name": "input-0",
+                "shape": [2, 3],
+                "datatype": "FP32",
+                "parameters": {"binary_data_size": 24},
+            }
+        ],
+    }
+"""
+
+import json
+import typing
+
+import numpy as np
+
+import mlrun.errors
+
+header_length_key = "Inference-Header-Content-Length"
+content_type = "application/octet-stream"
+
+_datatypes = {
+    "BOOL": np.dtype(np.bool_),
+    "UINT8": np.dtype(np.uint8),
+    "UINT16": np.dtype(np.uint16),
+    "UINT32": np.dtype(np.uint32),
+    "UINT64": np.dtype(np.uint64),
+    "INT8": np.dtype(np.int8),
+    "INT16": np.dtype(np.int16),
+    "INT32": np.dtype(np.int32),
+    "INT64": np.dtype(np.int64),
+    "FP16": np.dtype(np.float16),
+    "FP32": np.dtype(np.float32),
+    "FP64": np.dtype(np.float64),
+}
+_dtype_to_datatype = {dtype: datatype for datatype, dtype in _datatypes.items()}
+
+
+def get_header_length(event) -> typing.Optional[int]:
+    """Get the JSON header length of an event with binary tensor data, or None if the event body is not binary"""
+    headers = getattr(event, "headers", None)
+    if not headers or not isinstance(event.body, (bytes, bytearray, memoryview)):
+        return None
+    # HTTP headers are case-insensitive
+    for key, value in headers.items():
+        if key.lower() == header_length_key.lower():
+            return int(value)
+    return None
+
+
+def decode_request(body: bytes, header_length: int) -> dict:
+    """
+    Decode a request with binary tensor data. The tensors are read-only numpy arrays over the request body (no copy).
+    A single input tensor is set as the request "inputs" (e.g. a batch of rows), multiple input tensors are set as a
+    list of arrays.
+
+    :param body:          The request body.
+    :param header_length: The length of the JSON header at the beginning of the body.
+
+    :return: The request dictionary.
+    """
+    return _decode(body, header_length, "inputs")
+
+
+def encode_response(response: dict) -> tuple[bytes, int]:
+    """
+    Encode a response with binary tensor data. The "outputs" are encoded as a single tensor when they are a numpy
+    array (or convertible to a numeric one), and as a tensor per array when they are a list of numpy arrays; other
+    outputs are kept as is in the JSON header.
+
+    :param response: The response dictionary.
+
+    :return: The response body and the length of its JSON header.
+    """
+    return _encode(response, "outputs")
+
+
+def encode_request(request: dict) -> tuple[bytes, int]:
+    """
+    Encode a request with binary tensor data, e.g. for sending it to a model server with the
+    `Inference-Header-Content-Length` header. The "inputs" are encoded like the response outputs (see
+    `encode_response`).
+
+    :param request: The request dictionary.
+
+    :return: The request body and the length of its JSON header.
+    """
+    return _encode(request, "inputs")
+
+
+def decode_response(body: bytes, header_length: int) -> dict:
+    """Decode a response with binary tensor data (see `decode_request`)"""
+    return _decode(body, header_length, "outputs")
+
+
+def _get_dtype(tensor: dict) -> np.dtype:
+    datatype = tensor.get("datatype")
+    if datatype not in _datatypes:
+        raise mlrun.errors.MLRunInvalidArgumentError(
+            f"Unsupported binary tensor datatype {datatype}, supported: {list(_datatypes)}"
+        )
+    return _datatypes[datatype]
+
+
+def _decode(body: bytes, header_length: int, key: str) -> dict:
+    body = memoryview(body)
+    message = json.loads(bytes(body[:header_length]))
+    tensors = message.get(key)
+    if not isinstance(tensors, list) or not all(
+        isinstance(tensor, dict) and "datatype" in tensor for tensor in tensors
+    ):
+        if key == "inputs":
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f'Expected a list of tensors in the "{key}" of the binary data header'
+            )
+        # Outputs that were not encoded as tensors
+        return message
+
+    offset = header_length
+    arrays = []
+    for tensor in tensors:
+        dtype = _get_dtype(tensor)
+        if "data" in tensor:
+            # A tensor that was sent in the JSON header
+            arrays.append(
+                np.asarray(tensor["data"], dtype=dtype).reshape(tensor["shape"])
+            )
+            continue
+        size = int(tensor.get("parameters", {}).get("binary_data_size", 0))
+        if offset + size > len(body):
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"The binary data of tensor {tensor.get('name')} exceeds the body length"
+            )
+        arrays.append(
+            np.frombuffer(body[offset : offset + size], dtype=dtype).reshape(
+                tensor["shape"]
+            )
+        )
+        offset += size
+
+    message[key] = arrays[0] if len(arrays) == 1 else arrays
+    return message
+
+
+def _encode(message: dict, key: str) -> tuple[bytes, int]:
+    values = message.get(key)
+    if isinstance(values, list) and values and isinstance(values[0], np.ndarray):
+        arrays = values
+    elif values is None:
+        arrays = []
+    else:
+        try:
+            array = np.asarray(values)
+        except ValueError:
+            # Ragged lists are kept in the JSON header
+            array = None
+        arrays = (
+            [array] if array is not None and array.dtype in _dtype_to_datatype else []
+        )
+
+    header = dict(message)
+    buffers = []
+    if arrays:
+        prefix = key[:-1]
+        header[key] = []
+        for i, array in enumerate(arrays):
+            array = np.ascontiguousarray(array)
+            if array.dtype not in _dtype_to_datatype:
+                raise mlrun.errors.MLRunInvalidArgumentError(
+                    f"Unsupported binary tensor data type {array.dtype}"
+                )
+            header[key].append(
+                {
+                    "name": f"{prefix}-{i}",
+                    "shape": list(array.shape),
+                    "datatype": _dtype_to_datatype[array.dtype],
+                    "parameters": {"binary_data_size": array.nbytes},
+                }
+            )
+            buffers.append(array.data)
+
+    header_bytes = json.dumps(header).encode()
+    return b"".join([header_bytes, *buffers]), len(header_bytes)
@@ -31,6 +31,7 @@ import mlrun.common.schemas.model_monitoring
 from mlrun.utils import logger, now_date
 
 from ..common.schemas.model_monitoring import ModelEndpointSchema
+from . import binary_tensors
 from .server import GraphServer
 from .utils import RouterToDict, _extract_input_data, _update_result_body
 from .v2_serving import _ModelLogPusher
@@ -83,6 +84,9 @@ class BaseModelRouter(RouterToDict):
         self.kwargs = kwargs
 
     def parse_event(self, event):
+        if binary_tensors.get_header_length(event) is not None:
+            # Binary tensor data is decoded by the model server
+            return event.body
         parsed_event = {}
         try:
             if not isinstance(event.body, dict):
@@ -1738,6 +1738,42 @@ def params_to_step(
     return name, step
 
 
+# Step classes whose on_termination() hook is called when the async flow is terminated
+_terminating_step_classes = ["mlrun.model_monitoring.writer.ModelMonitoringWriter"]
+
+
+class _TerminatingMap(storey.Map):
+    """storey Map which calls the on_termination() hook of a step class when the flow is terminated (e.g. when the
+    worker shuts down), so the class can flush or release what it holds. storey has no public termination hook for
+    Map steps, so the termination object is matched"""
+
+    def __init__(self, fn, on_termination, **kwargs):
+        super().__init__(fn, **kwargs)
+        self._on_termination = on_termination
+
+    async def _do(self, event):
+        if event is storey.dtypes._termination_obj:
+            try:
+                self._on_termination()
+            except Exception as exc:
+                if self.logger:
+                    self.logger.error(
+                        f"step {self.name} failed on termination: {err_to_str(exc)}"
+                    )
+        return await super()._do(event)
+
+
+def _get_on_termination(step):
+    step_object = getattr(step, "_object", None)
+    if (
+        step_object is not None
+        and f"{type(step_object).__module__}.{type(step_object).__name__}"
+        in _terminating_step_classes
+    ):
+        return step_object.on_termination
+    return None
+
+
 def _init_async_objects(context, steps):
     try:
         import storey
@@ -1796,7 +1832,13 @@ def _init_async_objects(context, steps):
 
             elif not step.async_object or not hasattr(step.async_object, "_outlets"):
                 # if regular class, wrap with storey Map
-                step._async_object = storey.Map(
+                map_class = storey.Map
+                map_kwargs = {}
+                on_termination = _get_on_termination(step)
+                if on_termination:
+                    map_class = _TerminatingMap
+                    map_kwargs["on_termination"] = on_termination
+                step._async_object = map_class(
                     step._handler,
                     full_event=step.full_event or step._call_with_event,
                     input_path=step.input_path,
@@ -1804,6 +1846,7 @@ def _init_async_objects(context, steps):
                     name=step.name,
                     context=context,
                     pass_context=step._inject_context,
+                    **map_kwargs,
                 )
             if (
                 respond_supported
@@ -17,6 +17,8 @@ import time
 import traceback
 from typing import Optional, Union
 
+import numpy as np
+
 import mlrun.artifacts
 import mlrun.common.model_monitoring.helpers
 import mlrun.common.schemas.model_monitoring
@@ -24,6 +26,7 @@ import mlrun.model_monitoring
 from mlrun.utils import logger, now_date
 
 from ..common.schemas.model_monitoring import ModelEndpointSchema
+from . import binary_tensors
 from .server import GraphServer
 from .utils import StepToDict, _extract_input_data, _update_result_body
 
@@ -252,7 +255,12 @@ class V2ModelServer(StepToDict):
         """main model event handler method"""
         start = now_date()
         original_body = event.body
-        event_body = _extract_input_data(self._input_path, event.body)
+        # Binary tensor data (KServe v2 binary data extension) is decoded into numpy arrays without copying
+        binary_header_length = binary_tensors.get_header_length(event)
+        if binary_header_length is not None:
+            event_body = binary_tensors.decode_request(event.body, binary_header_length)
+        else:
+            event_body = _extract_input_data(self._input_path, event.body)
         event_id = event.id
         op = event.path.strip("/")
 
@@ -281,7 +289,7 @@ class V2ModelServer(StepToDict):
                 if self._model_logger:
                     self._model_logger.push(
                         start,
-                        request,
+                        _with_tensors_as_lists(request, "inputs"),
                         op=op,
                         error=exc,
                         partition_key=partition_key,
@@ -344,7 +352,7 @@ class V2ModelServer(StepToDict):
                 if self._model_logger:
                     self._model_logger.push(
                         start,
-                        request,
+                        _with_tensors_as_lists(request, "inputs"),
                         op=op,
                         error=exc,
                         partition_key=partition_key,
@@ -373,7 +381,11 @@ class V2ModelServer(StepToDict):
             inputs, outputs = self.logged_results(request, response, op)
             if inputs is None and outputs is None:
                 self._model_logger.push(
-                    start, request, response, op, partition_key=partition_key
+                    start,
+                    _with_tensors_as_lists(request, "inputs"),
+                    _with_tensors_as_lists(response, "outputs"),
+                    op,
+                    partition_key=partition_key,
                 )
             else:
                 track_request = {"id": event_id, "inputs": inputs or []}
@@ -386,6 +398,14 @@ class V2ModelServer(StepToDict):
                     op,
                     partition_key=partition_key,
                 )
+        if binary_header_length is not None:
+            body, header_length = binary_tensors.encode_response(response)
+            event.body = self.context.Response(
+                headers={binary_tensors.header_length_key: str(header_length)},
+                body=body,
+                content_type=binary_tensors.content_type,
+            )
+            return event
         event.body = _update_result_body(self._result_path, original_body, response)
         return event
 
@@ -413,7 +433,8 @@ class V2ModelServer(StepToDict):
             if "inputs" not in request:
                 raise Exception('Expected key "inputs" in request body')
 
-            if not isinstance(request["inputs"], list):
+            # numpy arrays are decoded from binary tensor data
+            if not isinstance(request["inputs"], (list, np.ndarray)):
                 raise Exception('Expected "inputs" to be a list')
 
         return request
@@ -474,6 +495,16 @@ class V2ModelServer(StepToDict):
         return request
 
 
+def _with_tensors_as_lists(body: dict, key: str) -> dict:
+    """Convert the numpy arrays of binary tensor data to lists, as the monitoring stream records are JSON"""
+    value = body.get(key)
+    if isinstance(value, np.ndarray):
+        return {**body, key: value.tolist()}
+    if isinstance(value, list) and value and isinstance(value[0], np.ndarray):
+        return {**body, key: [array.tolist() for array in value]}
+    return body
+
+
 class _ModelLogPusher:
     def __init__(self, model: V2ModelServer, context, output_stream=None):
         self.model = model
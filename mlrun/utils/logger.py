@@ -11,9 +11,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import atexit
 import datetime
 import logging
+import logging.handlers
 import os
+import queue
 import string
 import sys
 import typing
@@ -249,6 +252,92 @@ class HumanReadableExtendedFormatter(HumanReadableFormatter):
         return stdout.isatty()
 
 
+class LazyField:
+    """
+    A log field that is evaluated only when the log line is formatted, i.e. not at all when the level is disabled.
+    The function is called by the formatter, or by the caller when the queue handler is used.
+
+    Example::
+
+        logger.debug("Mapped event", event=LazyField(lambda: event.to_dict()))
+    """
+
+    __slots__ = ("_func",)
+
+    def __init__(self, func: typing.Callable[[], typing.Any]):
+        self._func = func
+
+    def __log__(self):
+        return self._func()
+
+
+class _QueueListener(logging.handlers.QueueListener):
+    def enqueue_sentinel(self):
+        # The queue may be full, wait for the listener to make room instead of dropping the sentinel
+        while self._thread is not None and self._thread.is_alive():
+            try:
+                self.queue.put(self._sentinel, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+
+class QueueHandler(logging.handlers.QueueHandler):
+    def __init__(self, handlers: list[logging.Handler], max_size: int):
+        """
+        Non-blocking handler - the logged fields are rendered to plain values by the caller, and the records are put
+        on a bounded queue and written by the given handlers in a background thread. When the queue is full, the
+        records are dropped (and counted) instead of blocking the caller.
+
+        :param handlers: The handlers that handle the records in the background.
+        :param max_size: The maximum number of records in the queue.
+        """
+        super().__init__(queue.Queue(maxsize=max_size))
+        self.enqueued = 0
+        self.dropped = 0
+        self._closed = False
+        self._renderer = _BaseFormatter()
+        self._listener = _QueueListener(
+            self.queue, *handlers, respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self.close)
+
+    @property
+    def handlers(self) -> tuple[logging.Handler, ...]:
+        return self._listener.handlers
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+            self.enqueued += 1
+        except queue.Full:
+            self.dropped += 1
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The logged objects may be changed by the caller after the log call, so they are rendered here, in the
+        # calling thread. The handlers in the background thread only format the plain values and write them
+        record_with = dict(getattr(record, "with", {}))
+        if record.exc_info:
+            record_with.update(exc_info=format_exception(*record.exc_info))
+            record.exc_info = None
+            record.exc_text = None
+        if record_with:
+            setattr(
+                record, "with", orjson.loads(self._renderer._json_dump(record_with))
+            )
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def close(self) -> None:
+        """Write the queued records and stop the background thread"""
+        if not self._closed:
+            self._closed = True
+            self._listener.stop()
+        super().close()
+
+
 class Logger:
     def __init__(
         self,
@@ -280,6 +369,17 @@ class Logger:
             if handler.name == handler_name:
                 self._logger.removeHandler(handler)
                 break
+            if isinstance(handler, QueueHandler) and any(
+                queued_handler.name == handler_name
+                for queued_handler in handler.handlers
+            ):
+                # the new handler is not queued, the other queued handlers are set back on the logger
+                self._logger.removeHandler(handler)
+                handler.close()
+                for queued_handler in handler.handlers:
+                    if queued_handler.name != handler_name:
+                        self._logger.addHandler(queued_handler)
+                break
 
         # create a stream handler from the file
         stream_handler = logging.StreamHandler(file)
@@ -324,8 +424,36 @@ class Logger:
         for handler in self._logger.handlers:
             if handler.name == name:
                 return handler
+            # the handlers that the queue handler writes to
+            if isinstance(handler, QueueHandler):
+                for queued_handler in handler.handlers:
+                    if queued_handler.name == name:
+                        return queued_handler
         raise ValueError(f"Logger does not have a handler named '{name}'")
 
+    def set_queue_handler(self, max_size: int = 10000) -> QueueHandler:
+        """
+        Move the handlers of the logger behind a non-blocking queue handler, so the log lines are formatted and written
+        in a background thread. When more than `max_size` records are waiting, new records are dropped and counted
+        (see `QueueHandler.dropped`).
+
+        :param max_size: The maximum number of records waiting to be written.
+
+        :returns: The queue handler.
+        """
+        handlers = [
+            handler
+            for handler in self._logger.handlers
+            if not isinstance(handler, QueueHandler)
+        ]
+        for handler in list(self._logger.handlers):
+            self._logger.removeHandler(handler)
+            if isinstance(handler, QueueHandler):
+                handler.close()
+        queue_handler = QueueHandler(handlers, max_size=max_size)
+        self._logger.addHandler(queue_handler)
+        return queue_handler
+
     def debug(self, message, *args, **kw_args):
         self._update_bound_vars_and_log(logging.DEBUG, message, *args, **kw_args)
 
@@ -352,7 +480,12 @@ class Logger:
     def _update_bound_vars_and_log(
         self, level, message, *args, exc_info=None, **kw_args
     ):
-        kw_args.update(self._bound_variables)
+        # Skip building the record when the level is disabled
+        if not self._logger.isEnabledFor(level):
+            return
+
+        if self._bound_variables:
+            kw_args.update(self._bound_variables)
 
         if kw_args:
             self._logger.log(
@@ -402,8 +535,11 @@ def create_logger(
     formatter_kind: str = FormatterKinds.HUMAN.name,
     name: str = "mlrun",
     stream: IO[str] = stdout,
+    non_blocking: Optional[bool] = None,
 ) -> Logger:
     level = level or config.log_level or "info"
+    if non_blocking is None:
+        non_blocking = config.log_queue.enabled
 
     level = logging.getLevelName(level.upper())
 
@@ -418,4 +554,7 @@ def create_logger(
     # set handler
     logger_instance.set_handler("default", stream or stdout, formatter_instance())
 
+    if non_blocking:
+        logger_instance.set_queue_handler(max_size=int(config.log_queue.max_size))
+
     return logger_instance
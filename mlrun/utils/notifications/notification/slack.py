@@ -14,13 +14,12 @@
 
 import typing
 
-import aiohttp
-
 import mlrun.common.schemas
 import mlrun.lists
 import mlrun.utils.helpers
 
 from .base import NotificationBase
+from .transport import NotificationTransport
 
 
 class SlackNotification(NotificationBase):
@@ -35,6 +34,9 @@ class SlackNotification(NotificationBase):
         "skipped": ":zzz:",
     }
 
+    # slack doesn't allow more than 50 blocks in a single message
+    max_message_blocks = 50
+
     @classmethod
     def validate_params(cls, params):
         webhook = params.get("webhook", None) or mlrun.get_secret_or_env(
@@ -66,9 +68,32 @@ class SlackNotification(NotificationBase):
 
         data = self._generate_slack_data(message, severity, runs, alert, event_data)
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(webhook, json=data) as response:
-                response.raise_for_status()
+        # notifications to the same webhook are sent as a single message
+        await NotificationTransport().send_batched(
+            webhook, data, self._merge_slack_data
+        )
+
+    @classmethod
+    def _merge_slack_data(cls, messages_data: list[dict]) -> list[tuple[dict, int]]:
+        merged = []
+        blocks = []
+        merged_count = 0
+        for data in messages_data:
+            separator = [{"type": "divider"}] if blocks else []
+            if (
+                blocks
+                and len(blocks) + len(separator) + len(data["blocks"])
+                > cls.max_message_blocks
+            ):
+                merged.append(({"blocks": blocks}, merged_count))
+                blocks = []
+                merged_count = 0
+                separator = []
+            blocks += separator + data["blocks"]
+            merged_count += 1
+        if merged_count:
+            merged.append(({"blocks": blocks}, merged_count))
+        return merged
 
     def _generate_slack_data(
         self,
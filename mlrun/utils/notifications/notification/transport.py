@@ -0,0 +1,262 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import random
+import threading
+import typing
+
+import aiohttp
+
+import mlrun.config
+import mlrun.errors
+import mlrun.utils.singleton
+from mlrun.utils import logger
+
+# merges the payloads of notifications to the same target into (payload, number of merged notifications) pairs, in order
+PayloadsMerger = typing.Callable[[list[dict]], list[tuple[dict, int]]]
+
+
+class NotificationTransport(metaclass=mlrun.utils.singleton.Singleton):
+    """
+    Process-wide http transport of the notifications.
+    Connections are pooled (a single client session, created lazily) and limited per host, failed requests are
+    retried with jittered exponential backoff, and notifications to the same target can be merged into a single request.
+    The requests run on an event loop thread that the transport owns for the lifetime of the process, whichever event
+    loop they are sent from, so the session is never bound to an event loop that is closed before it. The thread is
+    also used for pushing notifications from a synchronous context, so that a push does not create an event loop of
+    its own.
+    """
+
+    def __init__(self):
+        self._session: typing.Optional[aiohttp.ClientSession] = None
+        # url -> the payloads to merge and the futures of their notifications
+        self._batches: dict[str, list[tuple[dict, asyncio.Future]]] = {}
+        self._flush_tasks: set[asyncio.Task] = set()
+        self._loop: typing.Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def run(self, coroutine: typing.Coroutine):
+        """Run a coroutine on the transport's event loop thread and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._get_loop()).result()
+
+    async def send(self, method: str, url: str, **kwargs):
+        """
+        Send a request on the pooled session.
+        Connection errors and responses with a retryable status code are retried, a failed response raises.
+
+        :param method: The http method.
+        :param url:    The request url.
+        :param kwargs: Passed as is to the request (e.g. headers, json, ssl).
+        """
+        await self._run_on_loop(self._send(method, url, **kwargs))
+
+    async def send_batched(
+        self,
+        url: str,
+        payload: dict,
+        merge_payloads: PayloadsMerger,
+        **kwargs,
+    ):
+        """
+        POST a payload to the given url, merged with the payloads that are sent to the same url in the batch window
+        (mlrun.mlconf.notifications.transport.batch_window). Returns once the request that carries the payload is sent,
+        and raises if it failed.
+
+        :param url:            The request url, notifications are batched by it.
+        :param payload:        The json payload of the notification.
+        :param merge_payloads: Merges the payloads of a batch into requests.
+        :param kwargs:         Passed as is to the request (e.g. headers), must be the same for the whole batch.
+        """
+        await self._run_on_loop(
+            self._send_batched(url, payload, merge_payloads, **kwargs)
+        )
+
+    async def close(self):
+        """Close the pooled session, a new one is created by the next request"""
+        await self._run_on_loop(self._close())
+
+    def stop(self):
+        """
+        Close the pooled session and stop the event loop thread, a new thread is started by the next request.
+        Must not be called from the transport's event loop thread.
+        """
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._close(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+
+    async def _run_on_loop(self, coroutine: typing.Coroutine):
+        loop = self._get_loop()
+        if asyncio.get_running_loop() is loop:
+            return await coroutine
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(coroutine, loop)
+        )
+
+    async def _send(self, method: str, url: str, **kwargs):
+        transport_config = mlrun.mlconf.notifications.transport
+        max_retries = int(transport_config.max_retries)
+        session = self._get_session()
+        attempt = 0
+        while True:
+            try:
+                response = await getattr(session, method.lower())(url, **kwargs)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exc:
+                if attempt >= max_retries:
+                    raise
+                retry_after = None
+                logger.debug(
+                    "Notification request failed, retrying",
+                    url=url,
+                    attempt=attempt,
+                    exc=mlrun.errors.err_to_str(exc),
+                )
+            else:
+                try:
+                    if (
+                        attempt >= max_retries
+                        or response.status not in transport_config.retry_status_codes
+                    ):
+                        response.raise_for_status()
+                        return
+                    retry_after = self._get_retry_after(response)
+                    logger.debug(
+                        "Notification request failed on a retryable status, retrying",
+                        url=url,
+                        attempt=attempt,
+                        status_code=response.status,
+                    )
+                finally:
+                    # return the connection to the pool
+                    response.release()
+
+            await asyncio.sleep(self._get_backoff(attempt, retry_after))
+            attempt += 1
+
+    async def _send_batched(
+        self,
+        url: str,
+        payload: dict,
+        merge_payloads: PayloadsMerger,
+        **kwargs,
+    ):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._batches.get(url)
+        if batch is None:
+            batch = self._batches[url] = []
+            task = loop.create_task(self._flush_batch(url, merge_payloads, **kwargs))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        batch.append((payload, future))
+        await future
+
+    async def _close(self):
+        session, self._session = self._session, None
+        if session is not None:
+            await session.close()
+
+    async def _flush_batch(
+        self,
+        url: str,
+        merge_payloads: PayloadsMerger,
+        **kwargs,
+    ):
+        # yield at least once, so the notifications that are pushed together join the batch
+        await asyncio.sleep(float(mlrun.mlconf.notifications.transport.batch_window))
+        batch = self._batches.pop(url)
+        futures = [future for _, future in batch]
+
+        requests = []
+        try:
+            start = 0
+            for payload, count in merge_payloads([payload for payload, _ in batch]):
+                requests.append(
+                    (
+                        self._send("post", url, json=payload, **kwargs),
+                        futures[start : start + count],
+                    )
+                )
+                start += count
+        except Exception as exc:
+            for future in futures:
+                future.set_exception(exc)
+            return
+
+        if len(batch) > 1:
+            logger.debug(
+                "Sending batched notifications",
+                notifications_amount=len(batch),
+                requests_amount=len(requests),
+            )
+        results = await asyncio.gather(
+            *[request for request, _ in requests], return_exceptions=True
+        )
+        for result, (_, request_futures) in zip(results, requests):
+            for future in request_futures:
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(None)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # called on the transport's event loop thread only
+        if self._session is None or self._session.closed:
+            transport_config = mlrun.mlconf.notifications.transport
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=int(transport_config.max_connections),
+                    limit_per_host=int(transport_config.max_connections_per_host),
+                ),
+                timeout=aiohttp.ClientTimeout(total=float(transport_config.timeout)),
+            )
+        return self._session
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._run_loop,
+                    args=(self._loop,),
+                    name="notifications-transport",
+                    daemon=True,
+                ).start()
+            return self._loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop):
+        loop.run_forever()
+        loop.close()
+
+    @staticmethod
+    def _get_retry_after(response: aiohttp.ClientResponse) -> typing.Optional[float]:
+        try:
+            return float(response.headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _get_backoff(attempt: int, retry_after: typing.Optional[float]) -> float:
+        transport_config = mlrun.mlconf.notifications.transport
+        max_backoff = float(transport_config.retry_max_backoff)
+        if retry_after is not None:
+            return min(retry_after, max_backoff)
+        backoff = float(transport_config.retry_backoff) * (2**attempt)
+        return random.uniform(0, min(backoff, max_backoff))
@@ -14,13 +14,12 @@
 
 import typing
 
-import aiohttp
-
 import mlrun.common.schemas
 import mlrun.lists
 import mlrun.utils.helpers
 
 from .base import NotificationBase
+from .transport import NotificationTransport
 
 
 class WebhookNotification(NotificationBase):
@@ -85,11 +84,9 @@ class WebhookNotification(NotificationBase):
         # we automatically handle it as `ssl=None` for their convenience.
         verify_ssl = verify_ssl and None if url.startswith("https") else None
 
-        async with aiohttp.ClientSession() as session:
-            response = await getattr(session, method)(
-                url, headers=headers, json=request_body, ssl=verify_ssl
-            )
-            response.raise_for_status()
+        await NotificationTransport().send(
+            method, url, headers=headers, json=request_body, ssl=verify_ssl
+        )
 
     @staticmethod
     def _serialize_runs_in_request_body(override_body, runs):
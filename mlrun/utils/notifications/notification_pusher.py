@@ -18,7 +18,6 @@ import os
 import re
 import traceback
 import typing
-from concurrent.futures import ThreadPoolExecutor
 
 import mlrun.common.constants as mlrun_constants
 import mlrun.common.runtimes.constants as runtimes_constants
@@ -31,6 +30,7 @@ import mlrun.model
 import mlrun.utils.helpers
 import mlrun.utils.notifications.notification as notification_module
 import mlrun.utils.notifications.notification.base as base
+import mlrun.utils.notifications.notification.transport as transport
 import mlrun_pipelines.common.ops
 import mlrun_pipelines.models
 import mlrun_pipelines.utils
@@ -53,14 +53,17 @@ class _NotificationPusherBase:
                 coroutine_method=async_push_callback
             )
         else:
-            # Either running in mlrun api or sdk. in case of mlrun api we are in a separated thread, thus creating
-            # a new event loop. in case of sdk, we are most likely in main thread, thus using the main event loop.
+            # Either running in mlrun api or sdk. in case of mlrun api we are in a separated thread, thus using the
+            # event loop of the notifications transport. in case of sdk, we are most likely in main thread, thus using
+            # the main event loop.
             try:
                 event_loop = asyncio.get_event_loop()
             except RuntimeError:
-                event_loop = asyncio.new_event_loop()
+                event_loop = None
 
-            if not event_loop.is_running():
+            if event_loop is None:
+                transport.NotificationTransport().run(async_push_callback())
+            elif not event_loop.is_running():
                 event_loop.run_until_complete(async_push_callback())
             else:
                 asyncio.run_coroutine_threadsafe(async_push_callback(), event_loop)
@@ -73,9 +76,8 @@ class _NotificationPusherBase:
         """
         Execute a coroutine in a Jupyter Notebook environment.
 
-        This function creates a new thread pool executor with a single thread and a new event loop.
-        It sets the created event loop as the current event loop.
-        Then, it submits the coroutine to the event loop and waits for its completion.
+        This function submits the coroutine to the event loop of the notifications transport, which runs in a separate
+        thread (created once per process), and waits for its completion.
 
         This approach is used in Jupyter Notebook to ensure the proper execution of the event loop in a separate thread,
         allowing for the asynchronous push operation to be executed while the notebook is running.
@@ -83,13 +85,7 @@ class _NotificationPusherBase:
         :param coroutine_method: The coroutine method to be executed.
         :return: The result of the executed coroutine.
         """
-        thread_pool_executor = ThreadPoolExecutor(1)
-        async_event_loop = asyncio.new_event_loop()
-        thread_pool_executor.submit(asyncio.set_event_loop, async_event_loop).result()
-        result = thread_pool_executor.submit(
-            async_event_loop.run_until_complete, coroutine_method()
-        ).result()
-        return result
+        return transport.NotificationTransport().run(coroutine_method())
 
 
 class NotificationPusher(_NotificationPusherBase):
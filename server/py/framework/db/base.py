@@ -133,9 +133,16 @@ class DBInterface(ABC):
         with_notifications: bool = False,
         offset: Optional[int] = None,
         limit: Optional[int] = None,
+        keyset_page=None,
     ) -> mlrun.lists.RunList:
         pass
 
+    @abstractmethod
+    def list_runs_states(
+        self, session, uids: list[str], project: str
+    ) -> list[mlrun.common.schemas.RunState]:
+        pass
+
     @abstractmethod
     def del_run(self, session, uid, project="", iter=0):
         pass
@@ -246,6 +253,7 @@ class DBInterface(ABC):
         partition_order: Optional[
             mlrun.common.schemas.OrderType
         ] = mlrun.common.schemas.OrderType.desc,
+        keyset_page=None,
     ) -> typing.Union[list, mlrun.lists.ArtifactList]:
         pass
 
@@ -964,6 +972,10 @@ class DBInterface(ABC):
     def get_alert_state_dict(self, session, alert_id: int) -> dict:
         pass
 
+    @abstractmethod
+    def update_alert_states_objects(self, session, objects: dict[int, dict]):
+        pass
+
     @abstractmethod
     def get_num_configured_alerts(self, session) -> int:
         pass
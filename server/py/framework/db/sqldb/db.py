@@ -22,6 +22,7 @@ import typing
 import urllib.parse
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
+from inspect import signature as get_signature
 from typing import Any, Optional, Union
 
 import fastapi.concurrency
@@ -46,6 +47,7 @@ from sqlalchemy.orm import Session, aliased
 
 import mlrun
 import mlrun.common.constants as mlrun_constants
+import mlrun.common.db.sql_session
 import mlrun.common.formatters
 import mlrun.common.model_monitoring
 import mlrun.common.runtimes.constants
@@ -82,6 +84,7 @@ import framework.db.session
 import framework.utils.helpers
 from framework.db.base import DBInterface
 from framework.db.sqldb.helpers import (
+    KeysetPage,
     MemoizationCache,
     generate_query_for_name_with_wildcard,
     generate_query_predicate_for_name,
@@ -120,9 +123,16 @@ from framework.db.sqldb.models import (
     _tagged,
     _with_notifications,
 )
+from framework.utils.query_cache import (
+    ALL_PROJECTS,
+    QueryCacheNamespaces,
+    QueryResultCache,
+)
 
 NULL = None  # Avoid flake8 issuing warnings when comparing in filter
 unversioned_tagged_object_uid_prefix = "unversioned-"
+# the session info key of the projects whose summaries are marked as dirty when the session is committed
+dirty_project_summaries_session_key = "dirty_project_summaries"
 
 conflict_messages = [
     "(sqlite3.IntegrityError) UNIQUE constraint failed",
@@ -177,10 +187,185 @@ def retry_on_conflict(function):
     return wrapper
 
 
+def cache_query_result(
+    namespace: QueryCacheNamespaces,
+    bypass_cache: typing.Optional[typing.Callable[[dict], bool]] = None,
+):
+    """
+    Serve the decorated list_x function from the query result cache (when enabled - see
+    mlrun.config.httpdb.query_cache). The cache key is built from the normalized call arguments (excluding the session).
+    The cache is bypassed when bypass_cache returns True for the call arguments, e.g. for calls which return DB records,
+    as those are bound to the session.
+    A keyset_page argument (see framework.db.sqldb.helpers.KeysetPage) is keyed by its position and its row keys are
+    restored on cache hits.
+    """
+
+    def decorator(function):
+        signature = get_signature(function)
+
+        @functools.wraps(function)
+        def wrapper(self, session, *args, **kwargs):
+            query_cache = self._get_query_result_cache()
+            if not query_cache:
+                return function(self, session, *args, **kwargs)
+
+            bound_args = signature.bind(self, session, *args, **kwargs)
+            bound_args.apply_defaults()
+            params = dict(bound_args.arguments)
+            params.pop("self")
+            params.pop("session")
+            if bypass_cache and bypass_cache(params):
+                return function(self, session, *args, **kwargs)
+
+            params["project"] = params.get("project") or config.default_project
+            keyset_page = params.pop("keyset_page", None)
+            if keyset_page is None:
+                return query_cache.get_or_compute(
+                    namespace,
+                    params["project"],
+                    params,
+                    lambda: function(self, session, *args, **kwargs),
+                )
+
+            # the keyset page is an output argument as well, so its row keys are cached along with the result
+            def _list_with_row_keys():
+                return (
+                    function(self, session, *args, **kwargs),
+                    keyset_page.row_keys,
+                )
+
+            params["keyset_after"] = keyset_page.after
+            result, keyset_page.row_keys = query_cache.get_or_compute(
+                namespace,
+                params["project"],
+                params,
+                _list_with_row_keys,
+            )
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate_query_cache(*namespaces: QueryCacheNamespaces, project_arg="project"):
+    """
+    Invalidate the query result cache entries of the project the decorated function writes to (given by the
+    project_arg argument). Writes without a project invalidate the entire namespace.
+    The invalidation is done after the function returns (or fails, as a partial write may have been committed).
+    """
+
+    def decorator(function):
+        signature = get_signature(function)
+
+        @functools.wraps(function)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return function(self, *args, **kwargs)
+            finally:
+                query_cache = self._get_query_result_cache()
+                if query_cache:
+                    project = ALL_PROJECTS
+                    if project_arg in signature.parameters:
+                        bound_args = signature.bind(self, *args, **kwargs)
+                        project = (
+                            bound_args.arguments.get(project_arg)
+                            or config.default_project
+                        )
+                    for namespace in namespaces:
+                        query_cache.invalidate(namespace, project)
+
+        return wrapper
+
+    return decorator
+
+
+def mark_project_summary_dirty(project_arg="project"):
+    """
+    Mark the summary of the project the decorated function writes to (given by the project_arg argument) as dirty, so
+    its counters are recalculated by the next incremental project summaries refresh. Writes without a project mark
+    the summaries of all the projects.
+    The summary is marked by the transaction of the write itself (see _update_dirty_project_summaries).
+    """
+
+    def decorator(function):
+        signature = get_signature(function)
+
+        @functools.wraps(function)
+        def wrapper(self, session, *args, **kwargs):
+            project = ALL_PROJECTS
+            if project_arg in signature.parameters:
+                bound_args = signature.bind(self, session, *args, **kwargs)
+                project = (
+                    bound_args.arguments.get(project_arg) or config.default_project
+                )
+            self._mark_project_summaries_dirty(session, project)
+            return function(self, session, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _update_dirty_project_summaries(session: Session):
+    """
+    Mark the project summaries that were modified by the session (see SQLDB._mark_project_summaries_dirty) as dirty
+    right before its transaction is committed, so the flag is committed together with the write, without a
+    transaction of its own.
+    """
+    projects = session.info.get(dirty_project_summaries_session_key)
+    if not projects:
+        return
+
+    # filtering out summaries which are already dirty makes repeated writes to the same project a no-op
+    query = session.query(ProjectSummary).filter(
+        or_(ProjectSummary.dirty.is_(False), ProjectSummary.dirty.is_(None))
+    )
+    if not projects & {ALL_PROJECTS, "*"}:
+        query = query.filter(ProjectSummary.project.in_(projects))
+    query.update({ProjectSummary.dirty: True}, synchronize_session=False)
+
+
+def _clear_dirty_project_summaries(session: Session):
+    # the marks are kept after a rollback, so a write which is retried (see retry_on_conflict) still marks them
+    session.info.pop(dirty_project_summaries_session_key, None)
+
+
+# registered on the session makers of the DB sessions, not on all the sqlalchemy sessions of the process
+mlrun.common.db.sql_session.listen_to_session_events(
+    "before_commit", _update_dirty_project_summaries
+)
+mlrun.common.db.sql_session.listen_to_session_events(
+    "after_commit", _clear_dirty_project_summaries
+)
+
+
 class SQLDB(DBInterface):
     def __init__(self, dsn=""):
         self.dsn = dsn
         self._name_with_iter_regex = re.compile("^[0-9]+-.+$")
+        self._query_result_cache: typing.Optional[QueryResultCache] = None
+
+    def _get_query_result_cache(self) -> typing.Optional[QueryResultCache]:
+        if (
+            config.httpdb.query_cache.mode
+            != mlrun.common.schemas.QueryCacheMode.enabled
+        ):
+            return None
+        # getattr for SQLDB subclasses / instances which were not initialized through SQLDB.__init__
+        if getattr(self, "_query_result_cache", None) is None:
+            self._query_result_cache = QueryResultCache(
+                ttl=config.httpdb.query_cache.ttl,
+                maxsize=config.httpdb.query_cache.max_entries,
+                max_size_bytes=config.httpdb.query_cache.max_size_bytes,
+            )
+        return self._query_result_cache
+
+    def get_query_result_cache_info(
+        self,
+    ) -> typing.Optional[QueryResultCache.CacheInfo]:
+        query_cache = self._get_query_result_cache()
+        return query_cache.cache_info() if query_cache else None
 
     def initialize(self, session):
         if self.dsn and self.dsn.startswith("sqlite:///"):
@@ -203,6 +388,8 @@ class SQLDB(DBInterface):
         raise NotImplementedError("DB should not be used for logs storage")
 
     # ---- Runs ----
+    @mark_project_summary_dirty()
+    @invalidate_query_cache(QueryCacheNamespaces.runs)
     @retry_on_conflict
     def store_run(
         self,
@@ -235,6 +422,8 @@ class SQLDB(DBInterface):
         self._enrich_run_model(now, run, run_data)
         self._upsert(session, [run], ignore=True)
 
+    @mark_project_summary_dirty()
+    @invalidate_query_cache(QueryCacheNamespaces.runs)
     def create_or_get_run(
         self,
         session: Session,
@@ -274,6 +463,8 @@ class SQLDB(DBInterface):
             return self.read_run(session, uid=uid, project=project, iter=iter)
         return run_data
 
+    @mark_project_summary_dirty()
+    @invalidate_query_cache(QueryCacheNamespaces.runs)
     def update_run(self, session, updates: dict, uid, project="", iter=0):
         project = project or config.default_project
         run = self._get_run(session, uid, project, iter, with_for_update=True)
@@ -354,6 +545,7 @@ class SQLDB(DBInterface):
         # from each row we expect to get a tuple of (uid,) so we need to extract the uid from the tuple
         return [uid for (uid,) in query.all()]
 
+    @invalidate_query_cache(QueryCacheNamespaces.runs)
     def update_runs_requested_logs(
         self, session, uids: list[str], requested_logs: bool = True
     ):
@@ -396,6 +588,10 @@ class SQLDB(DBInterface):
             self._fill_run_struct_with_notifications(run.notifications, run_struct)
         return run_struct
 
+    @cache_query_result(
+        QueryCacheNamespaces.runs,
+        bypass_cache=lambda params: not params["return_as_run_structs"],
+    )
     def list_runs(
         self,
         session,
@@ -421,8 +617,13 @@ class SQLDB(DBInterface):
         with_notifications: bool = False,
         offset: typing.Optional[int] = None,
         limit: typing.Optional[int] = None,
+        keyset_page: typing.Optional[KeysetPage] = None,
     ) -> RunList:
         project = project or config.default_project
+        # keyset pagination is done over (start_time, id), so it requires the default sorting and no partitioning
+        paginate_by_keyset = (
+            keyset_page is not None and sort and not last and not partition_by
+        )
         query = self._find_runs(session, uid, project, labels)
         if name is not None:
             query = self._add_run_name_query(query, name)
@@ -436,7 +637,7 @@ class SQLDB(DBInterface):
             query = query.filter(Run.updated >= last_update_time_from)
         if last_update_time_to is not None:
             query = query.filter(Run.updated <= last_update_time_to)
-        if sort:
+        if sort and not paginate_by_keyset:
             query = query.order_by(Run.start_time.desc())
         if last:
             if not sort:
@@ -468,7 +669,25 @@ class SQLDB(DBInterface):
                 max_partitions,
             )
 
-        query = self._paginate_query(query, offset, limit)
+        if paginate_by_keyset:
+            query = self._paginate_query_by_keyset(
+                query,
+                [
+                    (Run.start_time, mlrun.common.schemas.OrderType.desc),
+                    (Run.id, mlrun.common.schemas.OrderType.desc),
+                ],
+                keyset_after=[
+                    KeysetPage.parse_datetime_key(keyset_page.after[0]),
+                    keyset_page.after[1],
+                ]
+                if keyset_page.after
+                else None,
+                offset=offset,
+                limit=limit,
+            )
+            keyset_page.row_keys = []
+        else:
+            query = self._paginate_query(query, offset, limit)
 
         if not return_as_run_structs:
             return query.all()
@@ -479,14 +698,44 @@ class SQLDB(DBInterface):
             if with_notifications:
                 self._fill_run_struct_with_notifications(run.notifications, run_struct)
             runs.append(run_struct)
+            if paginate_by_keyset:
+                keyset_page.row_keys.append(
+                    [KeysetPage.datetime_key(run.start_time), run.id]
+                )
 
         return runs
 
+    def list_runs_states(
+        self, session, uids: list[str], project: str
+    ) -> list[mlrun.common.schemas.RunState]:
+        """List the states of the given runs (their first iteration), without loading the run bodies"""
+        if not uids:
+            return []
+        query = session.query(Run.uid, Run.state, Run.updated).filter(
+            Run.project == project,
+            Run.uid.in_(uids),
+            Run.iteration == 0,
+        )
+        return [
+            mlrun.common.schemas.RunState(
+                uid=uid,
+                state=state,
+                last_update=updated.replace(tzinfo=timezone.utc)
+                if updated and not updated.tzinfo
+                else updated,
+            )
+            for uid, state, updated in query
+        ]
+
+    @mark_project_summary_dirty()
+    @invalidate_query_cache(QueryCacheNamespaces.runs)
     def del_run(self, session, uid, project=None, iter=0):
         project = project or config.default_project
         # We currently delete *all* iterations
         self._delete(session, Run, uid=uid, project=project)
 
+    @mark_project_summary_dirty()
+    @invalidate_query_cache(QueryCacheNamespaces.runs)
     def del_runs(
         self, session, name=None, project=None, labels=None, state=None, days_ago=0
     ):
@@ -573,6 +822,8 @@ class SQLDB(DBInterface):
         run_dict.setdefault("status", {})["state"] = state
 
     # ---- Artifacts ----
+    @mark_project_summary_dirty()
+    @invalidate_query_cache(QueryCacheNamespaces.artifacts)
     @retry_on_conflict
     def store_artifact(
         self,
@@ -682,6 +933,8 @@ class SQLDB(DBInterface):
             best_iteration,
         )
 
+    @mark_project_summary_dirty()
+    @invalidate_query_cache(QueryCacheNamespaces.artifacts)
     def create_artifact(
         self,
         session,
@@ -741,6 +994,10 @@ class SQLDB(DBInterface):
 
         return uid
 
+    @cache_query_result(
+        QueryCacheNamespaces.artifacts,
+        bypass_cache=lambda params: params["as_records"],
+    )
     def list_artifacts(
         self,
         session,
@@ -772,8 +1029,12 @@ class SQLDB(DBInterface):
         partition_order: typing.Optional[
             mlrun.common.schemas.OrderType
         ] = mlrun.common.schemas.OrderType.desc,
+        keyset_page: typing.Optional[KeysetPage] = None,
     ) -> typing.Union[list, ArtifactList]:
         project = project or config.default_project
+        # keyset pagination is done over (updated, id, tag), so it requires the default sorting and no partitioning
+        if as_records or partition_by:
+            keyset_page = None
 
         if best_iteration and iter is not None:
             raise mlrun.errors.MLRunInvalidArgumentError(
@@ -803,6 +1064,7 @@ class SQLDB(DBInterface):
             rows_per_partition=rows_per_partition,
             partition_sort_by=partition_sort_by,
             partition_order=partition_order,
+            keyset_page=keyset_page,
         )
         if as_records:
             return artifact_records
@@ -817,6 +1079,12 @@ class SQLDB(DBInterface):
                 )
             )
 
+        if keyset_page:
+            keyset_page.row_keys = [
+                [KeysetPage.datetime_key(artifact.updated), artifact.id, tag or ""]
+                for artifact, tag in artifact_records
+            ]
+
         return artifacts
 
     def list_artifacts_for_producer_id(
@@ -918,6 +1186,8 @@ class SQLDB(DBInterface):
 
         return mlrun.common.formatters.ArtifactFormat.format_obj(artifact, format_)
 
+    @mark_project_summary_dirty()
+    @invalidate_query_cache(QueryCacheNamespaces.artifacts)
     def del_artifact(
         self, session, key, tag="", project="", uid=None, producer_id=None, iter=None
     ):
@@ -933,6 +1203,8 @@ class SQLDB(DBInterface):
             iteration=iter,
         )
 
+    @mark_project_summary_dirty()
+    @invalidate_query_cache(QueryCacheNamespaces.artifacts)
     def del_artifacts(
         self,
         session,
@@ -1020,6 +1292,7 @@ class SQLDB(DBInterface):
         # the query returns a list of tuples, we need to extract the tag from each tuple
         return [tag for (tag,) in query]
 
+    @invalidate_query_cache(QueryCacheNamespaces.artifacts)
     @retry_on_conflict
     def overwrite_artifacts_with_tag(
         self,
@@ -1046,6 +1319,7 @@ class SQLDB(DBInterface):
         # tag artifacts with tag
         self.tag_artifacts(session, tag, artifacts, project)
 
+    @invalidate_query_cache(QueryCacheNamespaces.artifacts)
     @retry_on_conflict
     def append_tag_to_artifacts(
         self,
@@ -1064,6 +1338,7 @@ class SQLDB(DBInterface):
             )
         self.tag_artifacts(session, tag, artifacts, project)
 
+    @invalidate_query_cache(QueryCacheNamespaces.artifacts)
     def delete_tag_from_artifacts(
         self,
         session: Session,
@@ -1081,6 +1356,7 @@ class SQLDB(DBInterface):
             )
         self._delete_artifacts_tags(session, project, artifacts, tags=[tag])
 
+    @invalidate_query_cache(QueryCacheNamespaces.artifacts)
     def tag_artifacts(
         self,
         session,
@@ -1413,7 +1689,7 @@ class SQLDB(DBInterface):
     def _find_artifacts(
         self,
         session: Session,
-        project: str,
+        project: typing.Optional[typing.Union[str, list[str]]],
         ids: typing.Optional[typing.Union[list[str], str]] = None,
         tag: typing.Optional[str] = None,
         labels: typing.Optional[typing.Union[list[str], str]] = None,
@@ -1442,12 +1718,13 @@ class SQLDB(DBInterface):
         partition_order: typing.Optional[
             mlrun.common.schemas.OrderType
         ] = mlrun.common.schemas.OrderType.desc,
+        keyset_page: typing.Optional[KeysetPage] = None,
     ) -> typing.Union[list[Any],]:
         """
         Find artifacts by the given filters.
 
         :param session: DB session
-        :param project: Project name
+        :param project: Project name, or a list of project names
         :param ids: Artifact IDs to filter by
         :param tag: Tag to filter by
         :param labels: Labels to filter by
@@ -1475,6 +1752,8 @@ class SQLDB(DBInterface):
         :param partition_order: Order of sorting within partitions - `asc` or `desc`. Default is `desc`.
         :param offset: SQL query offset.
         :param limit: SQL query limit.
+        :param keyset_page: When given, paginate by the (updated, id, tag) keyset instead of the offset. Requires
+            attach_tags and no partitioning.
 
         :return: May return:
             1. a list of tuples of (ArtifactV2, tag_name)
@@ -1493,7 +1772,9 @@ class SQLDB(DBInterface):
             ArtifactV2.Tag.name,
         )
 
-        if project:
+        if isinstance(project, list):
+            query = query.filter(ArtifactV2.project.in_(project))
+        elif project:
             query = query.filter(ArtifactV2.project == project)
         if ids and ids != "*":
             query = query.filter(ArtifactV2.id.in_(ids))
@@ -1526,7 +1807,7 @@ class SQLDB(DBInterface):
         elif category:
             query = self._add_artifact_category_query(category, query)
         if most_recent:
-            query = self._attach_most_recent_artifact_query(session, query)
+            query = self._attach_most_recent_artifact_query(session, query, project)
 
         # join on tags
         if tag and tag != "*":
@@ -1556,7 +1837,28 @@ class SQLDB(DBInterface):
                 with_tagged=True,
             )
 
-        if limit:
+        keyset_columns = [
+            (ArtifactV2.updated, mlrun.common.schemas.OrderType.desc),
+            (ArtifactV2.id, mlrun.common.schemas.OrderType.desc),
+            (
+                func.coalesce(ArtifactV2.Tag.name, ""),
+                mlrun.common.schemas.OrderType.asc,
+            ),
+        ]
+        if keyset_page:
+            query = self._paginate_query_by_keyset(
+                query,
+                keyset_columns,
+                keyset_after=[
+                    KeysetPage.parse_datetime_key(keyset_page.after[0]),
+                    *keyset_page.after[1:],
+                ]
+                if keyset_page.after
+                else None,
+                offset=offset,
+                limit=limit,
+            )
+        elif limit:
             # Order the results before applying the limit to ensure that the limit is applied to the correctly
             # ordered results.
             query = self._paginate_query(
@@ -1573,7 +1875,14 @@ class SQLDB(DBInterface):
 
         outer_query = outer_query.join(subquery, ArtifactV2.id == subquery.c.id)
 
-        if not limit:
+        if keyset_page:
+            # the join does not preserve the order of the sub query
+            outer_query = outer_query.order_by(
+                ArtifactV2.updated.desc(),
+                ArtifactV2.id.desc(),
+                func.coalesce(subquery.c.name, "").asc(),
+            )
+        elif not limit:
             # When a limit is applied, the results are ordered before limiting, so no additional ordering is needed.
             # If no limit is specified, ensure the results are ordered after all filtering and joins have been applied.
             outer_query = self._paginate_query(
@@ -1686,6 +1995,8 @@ class SQLDB(DBInterface):
             return False
         return True
 
+    @mark_project_summary_dirty()
+    @invalidate_query_cache(QueryCacheNamespaces.artifacts)
     def store_artifact_v1(
         self,
         session,
@@ -1879,6 +2190,7 @@ class SQLDB(DBInterface):
         return updated, key, labels
 
     # ---- Functions ----
+    @invalidate_query_cache(QueryCacheNamespaces.functions)
     @retry_on_conflict
     def store_function(
         self,
@@ -1950,6 +2262,7 @@ class SQLDB(DBInterface):
         self.tag_objects_v2(session, [fn], project, tag)
         return hash_key
 
+    @cache_query_result(QueryCacheNamespaces.functions)
     def list_functions(
         self,
         session: Session,
@@ -2032,6 +2345,7 @@ class SQLDB(DBInterface):
             else:
                 raise exc
 
+    @invalidate_query_cache(QueryCacheNamespaces.functions)
     def delete_function(self, session: Session, project: str, name: str):
         logger.debug("Removing function from db", project=project, name=name)
 
@@ -2042,6 +2356,7 @@ class SQLDB(DBInterface):
         )
         self._delete(session, Function, project=project, name=name)
 
+    @invalidate_query_cache(QueryCacheNamespaces.functions)
     def delete_functions(
         self, session: Session, project: str, names: typing.Union[str, list[str]]
     ) -> None:
@@ -2055,6 +2370,7 @@ class SQLDB(DBInterface):
             main_table_identifier_values=names,
         )
 
+    @invalidate_query_cache(QueryCacheNamespaces.functions)
     def update_function(
         self,
         session,
@@ -2082,6 +2398,7 @@ class SQLDB(DBInterface):
             function.struct = struct
             self._upsert(session, [function])
 
+    @invalidate_query_cache(QueryCacheNamespaces.functions)
     def update_function_external_invocation_url(
         self,
         session,
@@ -2667,6 +2984,9 @@ class SQLDB(DBInterface):
             q = q.limit(limit)
         return [name for (name,) in q.all()]
 
+    @invalidate_query_cache(
+        QueryCacheNamespaces.artifacts, QueryCacheNamespaces.functions
+    )
     def tag_objects_v2(
         self,
         session,
@@ -2934,6 +3254,17 @@ class SQLDB(DBInterface):
 
         orphaned_summaries = existing_summaries_query.filter(Project.id.is_(None)).all()
 
+        # the summaries pending a refresh are clean once stored (committed together with them below), unless they
+        # were modified while being calculated - the flag is not set through the summary objects, so a concurrent
+        # write's mark is not overridden
+        if associated_summaries:
+            session.query(ProjectSummary).filter(
+                ProjectSummary.project.in_(
+                    [summary.project for summary in associated_summaries]
+                ),
+                ProjectSummary.dirty.is_(None),
+            ).update({ProjectSummary.dirty: False}, synchronize_session=False)
+
         # Update the summaries of projects that have associated projects
         for project_summary in associated_summaries:
             project_summary.summary = summary_dicts.get(project_summary.project)
@@ -2955,6 +3286,60 @@ class SQLDB(DBInterface):
 
         self._commit(session, associated_summaries + orphaned_summaries)
 
+    def get_project_summaries_to_refresh(
+        self,
+        session: Session,
+    ) -> tuple[dict[str, mlrun.common.schemas.ProjectSummary], list[str]]:
+        """
+        Get the current project summaries and the names of the projects whose resources counters need to be
+        recalculated by an incremental refresh - projects which were marked as dirty since the last refresh, and
+        projects with counters of a time window (e.g. runs that failed in the last 24 hours) that may have expired.
+        The dirty projects are marked as pending a refresh (null), and are marked as clean only once their refreshed
+        summaries are stored (see refresh_project_summaries). Modifications done while their counters are being
+        calculated mark them as dirty again, and a failed refresh leaves them pending for the next one.
+        """
+        summaries = {}
+        projects_to_refresh = []
+        for project_summary in self._query(session, ProjectSummary).all():
+            summary = mlrun.common.schemas.ProjectSummary(**project_summary.summary)
+            summaries[project_summary.project] = summary
+            if project_summary.dirty is not False or any(
+                [
+                    summary.runs_completed_recent_count,
+                    summary.runs_failed_recent_count,
+                    summary.endpoint_alerts_count,
+                    summary.job_alerts_count,
+                    summary.other_alerts_count,
+                ]
+            ):
+                projects_to_refresh.append(project_summary.project)
+
+        if projects_to_refresh:
+            session.query(ProjectSummary).filter(
+                ProjectSummary.project.in_(projects_to_refresh),
+                ProjectSummary.dirty.is_(True),
+            ).update({ProjectSummary.dirty: None}, synchronize_session=False)
+            session.commit()
+        return summaries, projects_to_refresh
+
+    @staticmethod
+    def _mark_project_summaries_dirty(
+        session: Session,
+        project: typing.Optional[typing.Union[str, list[str]]] = ALL_PROJECTS,
+    ):
+        """
+        Mark the summaries of the given project(s) as dirty when the session's transaction is committed.
+        Must be called before the transaction of the write is committed.
+        """
+        if (
+            config.monitoring.projects.summaries.refresh_mode
+            != mlrun.common.schemas.ProjectSummariesRefreshMode.incremental
+        ):
+            return
+
+        projects = session.info.setdefault(dirty_project_summaries_session_key, set())
+        projects.update(project if isinstance(project, list) else [project])
+
     def _delete_project_summary(
         self,
         session: Session,
@@ -2966,6 +3351,7 @@ class SQLDB(DBInterface):
     async def get_project_resources_counters(
         self,
         projects_with_creation_time: list[tuple[str, datetime]],
+        projects: typing.Optional[list[str]] = None,
     ) -> tuple[
         dict[str, int],
         dict[str, int],
@@ -2980,10 +3366,23 @@ class SQLDB(DBInterface):
         dict[str, int],
         dict[str, int],
     ]:
+        """
+        Calculate the resources counters of the projects.
+        :param projects_with_creation_time: The names and creation times of all the projects.
+        :param projects:                    Calculate the counters of these projects only (schedules counters are
+                                            always calculated for all the projects). None for all the projects.
+        """
+        if projects is not None:
+            projects_with_creation_time = [
+                (project, created)
+                for project, created in projects_with_creation_time
+                if project in projects
+            ]
         results = await asyncio.gather(
             fastapi.concurrency.run_in_threadpool(
                 framework.db.session.run_function_with_new_db_session,
                 self._calculate_files_counters,
+                projects,
             ),
             fastapi.concurrency.run_in_threadpool(
                 framework.db.session.run_function_with_new_db_session,
@@ -2992,14 +3391,17 @@ class SQLDB(DBInterface):
             fastapi.concurrency.run_in_threadpool(
                 framework.db.session.run_function_with_new_db_session,
                 self._calculate_feature_sets_counters,
+                projects,
             ),
             fastapi.concurrency.run_in_threadpool(
                 framework.db.session.run_function_with_new_db_session,
                 self._calculate_models_counters,
+                projects,
             ),
             fastapi.concurrency.run_in_threadpool(
                 framework.db.session.run_function_with_new_db_session,
                 self._calculate_runs_counters,
+                projects,
             ),
             fastapi.concurrency.run_in_threadpool(
                 framework.db.session.run_function_with_new_db_session,
@@ -3122,10 +3524,17 @@ class SQLDB(DBInterface):
             project_to_schedule_pending_workflows_count,
         )
 
-    @staticmethod
-    def _calculate_feature_sets_counters(session) -> dict[str, int]:
+    def _calculate_feature_sets_counters(
+        self, session, projects: typing.Optional[list[str]] = None
+    ) -> dict[str, int]:
         feature_sets_count_per_project = (
-            session.query(FeatureSet.project, func.count(distinct(FeatureSet.name)))
+            self._filter_query_by_resource_project(
+                session.query(
+                    FeatureSet.project, func.count(distinct(FeatureSet.name))
+                ),
+                FeatureSet,
+                projects,
+            )
             .group_by(FeatureSet.project)
             .all()
         )
@@ -3134,91 +3543,101 @@ class SQLDB(DBInterface):
         }
         return project_to_feature_set_count
 
-    def _calculate_models_counters(self, session) -> dict[str, int]:
+    def _calculate_models_counters(
+        self, session, projects: typing.Optional[list[str]] = None
+    ) -> dict[str, int]:
         # We're using the "most_recent" which gives us only one version of each artifact key, which is what we want to
         # count (artifact count, not artifact versions count)
         model_artifacts = self._find_artifacts(
             session,
-            None,
+            projects,
             kind=mlrun.common.schemas.ArtifactCategories.model,
             most_recent=True,
+            # only the project is needed (along with the id to deduplicate tagged artifacts)
+            with_entities=[ArtifactV2.id, ArtifactV2.project],
         )
         project_to_models_count = collections.defaultdict(int)
-        for model_artifact in model_artifacts:
-            project_to_models_count[model_artifact.project] += 1
+        for _, project in model_artifacts:
+            project_to_models_count[project] += 1
         return project_to_models_count
 
-    def _calculate_files_counters(self, session) -> dict[str, int]:
+    def _calculate_files_counters(
+        self, session, projects: typing.Optional[list[str]] = None
+    ) -> dict[str, int]:
         # We're using the "most_recent" flag which gives us only one version of each artifact key, which is what we
         # want to count (artifact count, not artifact versions count)
         file_artifacts = self._find_artifacts(
             session,
-            None,
+            projects,
             category=mlrun.common.schemas.ArtifactCategories.other,
             most_recent=True,
+            # only the project is needed (along with the id to deduplicate tagged artifacts)
+            with_entities=[ArtifactV2.id, ArtifactV2.project],
         )
         project_to_files_count = collections.defaultdict(int)
-        for file_artifact in file_artifacts:
-            project_to_files_count[file_artifact.project] += 1
+        for _, project in file_artifacts:
+            project_to_files_count[project] += 1
         return project_to_files_count
 
-    @staticmethod
     def _calculate_runs_counters(
+        self,
         session,
+        projects: typing.Optional[list[str]] = None,
     ) -> tuple[
         dict[str, int],
         dict[str, int],
         dict[str, int],
     ]:
-        running_runs_count_per_project = (
-            session.query(Run.project, func.count(distinct(Run.name)))
-            .filter(
-                Run.state.in_(
-                    mlrun.common.runtimes.constants.RunStates.non_terminal_states()
-                )
-            )
-            .group_by(Run.project)
-            .all()
-        )
-        project_to_running_runs_count = {
-            result[0]: result[1] for result in running_runs_count_per_project
-        }
-
         one_day_ago = datetime.now() - timedelta(hours=24)
-        recent_failed_runs_count_per_project = (
-            session.query(Run.project, func.count(distinct(Run.name)))
-            .filter(
-                Run.state.in_(
-                    [
-                        mlrun.common.runtimes.constants.RunStates.error,
-                        mlrun.common.runtimes.constants.RunStates.aborted,
-                    ]
-                )
-            )
-            .filter(Run.start_time >= one_day_ago)
-            .group_by(Run.project)
-            .all()
+        is_running = Run.state.in_(
+            mlrun.common.runtimes.constants.RunStates.non_terminal_states()
+        )
+        is_recent = Run.start_time >= one_day_ago
+        is_recent_failed = and_(
+            Run.state.in_(
+                [
+                    mlrun.common.runtimes.constants.RunStates.error,
+                    mlrun.common.runtimes.constants.RunStates.aborted,
+                ]
+            ),
+            is_recent,
+        )
+        is_recent_completed = and_(
+            Run.state == mlrun.common.runtimes.constants.RunStates.completed,
+            is_recent,
         )
-        project_to_recent_failed_runs_count = {
-            result[0]: result[1] for result in recent_failed_runs_count_per_project
-        }
 
-        recent_completed_runs_count_per_project = (
-            session.query(Run.project, func.count(distinct(Run.name)))
-            .filter(
-                Run.state.in_(
-                    [
-                        mlrun.common.runtimes.constants.RunStates.completed,
-                    ]
-                )
-            )
-            .filter(Run.start_time >= one_day_ago)
+        # count the 3 counters in a single pass over the runs, labels are added to improve readability
+        query = session.query(
+            Run.project,
+            func.count(distinct(case((is_recent_completed, Run.name)))).label(
+                "recent_completed_runs_count"
+            ),
+            func.count(distinct(case((is_recent_failed, Run.name)))).label(
+                "recent_failed_runs_count"
+            ),
+            func.count(distinct(case((is_running, Run.name)))).label(
+                "running_runs_count"
+            ),
+        ).filter(or_(is_running, is_recent_failed, is_recent_completed))
+        query_results = (
+            self._filter_query_by_resource_project(query, Run, projects)
             .group_by(Run.project)
             .all()
         )
-        project_to_recent_completed_runs_count = {
-            result[0]: result[1] for result in recent_completed_runs_count_per_project
-        }
+
+        project_to_recent_completed_runs_count = {}
+        project_to_recent_failed_runs_count = {}
+        project_to_running_runs_count = {}
+        for (
+            project,
+            recent_completed_count,
+            recent_failed_count,
+            running_count,
+        ) in query_results:
+            project_to_recent_completed_runs_count[project] = recent_completed_count
+            project_to_recent_failed_runs_count[project] = recent_failed_count
+            project_to_running_runs_count[project] = running_count
         return (
             project_to_recent_completed_runs_count,
             project_to_recent_failed_runs_count,
@@ -3413,6 +3832,12 @@ class SQLDB(DBInterface):
                 name, notifications, "notifications"
             )
 
+    @invalidate_query_cache(
+        QueryCacheNamespaces.runs,
+        QueryCacheNamespaces.artifacts,
+        QueryCacheNamespaces.functions,
+        project_arg="name",
+    )
     def delete_project_related_resources(self, session: Session, name: str):
         self.delete_model_endpoints(session, project=name)
         self._delete_project_artifacts(session, project=name)
@@ -3466,6 +3891,7 @@ class SQLDB(DBInterface):
         return computed_tag, object_tag_uid, query.one_or_none()
 
     # ---- Feature sets ----
+    @mark_project_summary_dirty()
     def create_feature_set(
         self,
         session,
@@ -3490,6 +3916,7 @@ class SQLDB(DBInterface):
 
         return uid
 
+    @mark_project_summary_dirty()
     def patch_feature_set(
         self,
         session,
@@ -4262,6 +4689,7 @@ class SQLDB(DBInterface):
         labels = common_object_dict["metadata"].pop("labels", {}) or {}
         update_labels(db_object, labels)
 
+    @mark_project_summary_dirty()
     @retry_on_conflict
     def store_feature_set(
         self,
@@ -4456,6 +4884,7 @@ class SQLDB(DBInterface):
             q = q.limit(limit)
         return [name for (name,) in q.all()]
 
+    @mark_project_summary_dirty()
     def delete_feature_set(self, session, project, name, tag=None, uid=None):
         self._delete_tagged_object(
             session,
@@ -4781,20 +5210,22 @@ class SQLDB(DBInterface):
                 uids.append(obj.uid)
         return uids
 
-    def _attach_most_recent_artifact_query(self, session, query):
-        # Create a sub query of latest uid (by updated) per (project,key)
-        subq = (
-            session.query(
-                ArtifactV2.project,
-                ArtifactV2.key,
-                func.max(ArtifactV2.updated).label("max_updated"),
-            )
-            .group_by(
-                ArtifactV2.project,
-                ArtifactV2.key,
-            )
-            .subquery()
+    def _attach_most_recent_artifact_query(self, session, query, project=None):
+        # Create a sub query of latest uid (by updated) per (project,key), scoped to the queried project(s) so the
+        # grouping does not scan the artifacts of all the projects
+        subq = session.query(
+            ArtifactV2.project,
+            ArtifactV2.key,
+            func.max(ArtifactV2.updated).label("max_updated"),
         )
+        if isinstance(project, list):
+            subq = subq.filter(ArtifactV2.project.in_(project))
+        elif project:
+            subq = subq.filter(ArtifactV2.project == project)
+        subq = subq.group_by(
+            ArtifactV2.project,
+            ArtifactV2.key,
+        ).subquery()
 
         # Join current query with sub query on (project, key)
         return query.join(
@@ -6072,6 +6503,30 @@ class SQLDB(DBInterface):
         if state is not None:
             return state.to_dict()
 
+    def update_alert_states_objects(self, session, objects: dict[int, dict]):
+        """
+        Update the objects of multiple alert states in a single transaction.
+        :param objects: A mapping of an alert id to the keys to update in its state object. A key with a None value is
+                        removed from the object.
+        """
+        if not objects:
+            return
+
+        states = (
+            session.query(AlertState)
+            .filter(AlertState.parent_id.in_(list(objects.keys())))
+            .all()
+        )
+        for state in states:
+            full_object = state.full_object or {}
+            for key, value in objects[state.parent_id].items():
+                if value is None:
+                    full_object.pop(key, None)
+                else:
+                    full_object[key] = value
+            state.full_object = full_object
+        self._upsert(session, states)
+
     def create_alert_state(self, session, alert_record):
         state = AlertState(count=0, parent_id=alert_record.id)
         self._upsert(session, [state])
@@ -6136,10 +6591,13 @@ class SQLDB(DBInterface):
             data=extra_data,
         )
 
+        self._mark_project_summaries_dirty(session, alert_data.project)
+
         # if reset_policy is MANUAL, we need to keep id to be able to update number_of_events
         # when the alert is reset
+        activation_id = None
         if alert_data.reset_policy == mlrun.common.schemas.alert.ResetPolicy.MANUAL:
-            return self._upsert_object_and_flush_to_get_field(
+            activation_id = self._upsert_object_and_flush_to_get_field(
                 session, alert_activation_record, "id"
             )
         else:
@@ -6148,6 +6606,8 @@ class SQLDB(DBInterface):
             alert_activation_record.reset_time = alert_activation_record.activation_time
             self._upsert(session, [alert_activation_record])
 
+        return activation_id
+
     def update_alert_activation(
         self,
         session,
@@ -6457,6 +6917,7 @@ class SQLDB(DBInterface):
         return background_task_record
 
     # ---- Run Notifications ----
+    @invalidate_query_cache(QueryCacheNamespaces.runs)
     def store_run_notifications(
         self,
         session,
@@ -6565,6 +7026,7 @@ class SQLDB(DBInterface):
             ).all()
         ]
 
+    @invalidate_query_cache(QueryCacheNamespaces.runs)
     def delete_run_notifications(
         self,
         session,
@@ -6595,6 +7057,7 @@ class SQLDB(DBInterface):
         if commit:
             session.commit()
 
+    @invalidate_query_cache(QueryCacheNamespaces.runs)
     def set_run_notifications(
         self,
         session: Session,
@@ -7118,6 +7581,48 @@ class SQLDB(DBInterface):
         metadata.reflect()
         return table_name in metadata.tables.keys()
 
+    @staticmethod
+    def _paginate_query_by_keyset(
+        query,
+        keyset_columns: list[tuple[Any, mlrun.common.schemas.OrderType]],
+        keyset_after: typing.Optional[list] = None,
+        offset: typing.Optional[int] = None,
+        limit: typing.Optional[int] = None,
+    ):
+        """
+        Order the query by the keyset columns and continue right after the given keyset values.
+        The keyset must be unique (usually ending with the id column) for the pagination to be deterministic.
+        The offset is used only for the first page of a keyset pagination, e.g. when a specific page is requested.
+        """
+        query = query.order_by(
+            *[
+                column.desc()
+                if order == mlrun.common.schemas.OrderType.desc
+                else column.asc()
+                for column, order in keyset_columns
+            ]
+        )
+        if keyset_after:
+            # (c1, c2, c3) after (v1, v2, v3) <=> c1 after v1 OR (c1 == v1 AND (c2 after v2 OR (c2 == v2 AND ...)))
+            condition = None
+            for (column, order), value in reversed(
+                list(zip(keyset_columns, keyset_after))
+            ):
+                is_after = (
+                    column < value
+                    if order == mlrun.common.schemas.OrderType.desc
+                    else column > value
+                )
+                condition = (
+                    is_after
+                    if condition is None
+                    else or_(is_after, and_(column == value, condition))
+                )
+            query = query.filter(condition)
+            offset = None
+
+        return SQLDB._paginate_query(query, offset, limit)
+
     @staticmethod
     def _paginate_query(
         query, offset: typing.Optional[int] = None, limit: typing.Optional[int] = None
@@ -178,3 +178,62 @@ class MemoizationCache:
             result = self._function(*args, **kwargs)
             self._cache[memo_key] = result
         return result
+
+
+class KeysetPage:
+    """
+    Keyset (cursor) pagination state of a single list query.
+    Instead of skipping `offset` rows, the query continues right after the sort key values of the last row of the
+    previous page, so retrieving the N-th page costs the same as retrieving the first one.
+    The sort key values are JSON serializable, so they can be embedded in a stateless page token.
+
+    :param after: The sort key values of the last row of the previous page, `None` for the first page.
+    """
+
+    def __init__(self, after: typing.Optional[list] = None):
+        self.after = after
+        # filled by the DB layer with the sort key values of each returned row,
+        # stays None when the query cannot be paginated by keyset (e.g. partitioned queries)
+        self.row_keys: typing.Optional[list[list]] = None
+
+    @staticmethod
+    def datetime_key(value: typing.Optional[datetime]) -> typing.Optional[str]:
+        return value.isoformat() if value else None
+
+    @staticmethod
+    def parse_datetime_key(value: typing.Optional[str]) -> typing.Optional[datetime]:
+        return datetime.fromisoformat(value) if value else None
+
+
+def iterate_in_keyset_batches(
+    list_method: typing.Callable,
+    session,
+    batch_size: int,
+    **list_kwargs,
+) -> typing.Iterator[list]:
+    """
+    Iterate over the results of a list method (which accepts offset, limit and keyset_page) in batches of up to
+    batch_size objects, so the complete result is never held in memory.
+    Each batch continues right after the last row of the previous one. When the query cannot be paginated by keyset
+    (e.g. partitioned queries), the batches fall back to offset pagination.
+    """
+    keyset_page = KeysetPage()
+    offset = 0
+    while True:
+        batch = list_method(
+            session,
+            **list_kwargs,
+            offset=offset,
+            limit=batch_size,
+            keyset_page=keyset_page,
+        )
+        if batch:
+            yield batch
+        if len(batch) < batch_size:
+            return
+
+        offset += batch_size
+        last_row_keys = keyset_page.row_keys[-1] if keyset_page.row_keys else None
+        keyset_page = KeysetPage(
+            after=last_row_keys if last_row_keys and None not in last_row_keys else None
+        )
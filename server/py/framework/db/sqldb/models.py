@@ -885,6 +885,9 @@ with warnings.catch_warnings():
         )
         updated = Column(SQLTypesUtil.datetime())
         summary = Column(JSON)
+        # marks that the project's resources were modified since the summary was calculated - null marks a summary
+        # which is pending a refresh and is treated as dirty (see SQLDB.get_project_summaries_to_refresh)
+        dirty = Column(BOOLEAN, default=True)
 
         def get_identifier_string(self) -> str:
             return f"{self.project}"
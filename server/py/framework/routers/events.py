@@ -48,3 +48,25 @@ async def post_event(
         auth_info,
         db_session,
     )
+
+
+@router.post("/projects/{project}/events")
+@inject
+async def post_events(
+    request: Request,
+    project: str,
+    events: list[mlrun.common.schemas.Event],
+    auth_info: mlrun.common.schemas.AuthInfo = Depends(deps.authenticate_request),
+    db_session: Session = Depends(deps.get_db_session),
+    service: framework.service.Service = Depends(
+        Provide[framework.service.ServiceContainer.service]
+    ),
+):
+    return await service.handle_request(
+        "post_events",
+        request,
+        project,
+        events,
+        auth_info,
+        db_session,
+    )
@@ -170,6 +170,15 @@ class SQLRunDB(RunDBInterface):
             with_notifications=with_notifications,
         )
 
+    def list_runs_states(
+        self,
+        uids: list[str],
+        project: str = "",
+        known_states: Optional[dict[str, str]] = None,
+        timeout: int = 0,
+    ) -> list[mlrun.common.schemas.RunState]:
+        raise NotImplementedError()
+
     def paginated_list_runs(
         self,
         *args,
@@ -180,6 +189,9 @@ class SQLRunDB(RunDBInterface):
     ):
         raise NotImplementedError()
 
+    def iter_runs(self, *args, **kwargs):
+        raise NotImplementedError()
+
     async def del_run(self, uid, project=None, iter=None):
         return await self._transform_db_error(
             services.api.crud.Runs().delete_run,
@@ -296,6 +308,9 @@ class SQLRunDB(RunDBInterface):
     ):
         raise NotImplementedError()
 
+    def iter_artifacts(self, *args, **kwargs):
+        raise NotImplementedError()
+
     def del_artifact(
         self,
         key,
@@ -1264,6 +1279,13 @@ class SQLRunDB(RunDBInterface):
     ):
         pass
 
+    def generate_events(
+        self,
+        events: list[Union[dict, mlrun.common.schemas.Event]],
+        project="",
+    ):
+        pass
+
     def store_alert_config(
         self,
         alert_name: str,
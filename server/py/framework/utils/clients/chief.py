@@ -267,6 +267,16 @@ class Client(
             "POST", f"projects/{project}/events/{name}", request, json
         )
 
+    async def set_events(
+        self, project: str, request: fastapi.Request, json: list
+    ) -> fastapi.Response:
+        """
+        Events are running only on chief
+        """
+        return await self._proxy_request_to_chief(
+            "POST", f"projects/{project}/events", request, json
+        )
+
     async def set_schedule_notifications(
         self, project: str, schedule_name: str, request: fastapi.Request, json: dict
     ) -> fastapi.Response:
@@ -0,0 +1,272 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import collections
+import enum
+import hashlib
+import pickle
+import threading
+import time
+import typing
+from copy import deepcopy
+
+import mlrun.common.types
+import mlrun.errors
+from mlrun.utils import logger
+
+# used to mark entries that were cached for a query that was not scoped to specific projects (e.g. project="*")
+ALL_PROJECTS = None
+
+
+class QueryResultCache:
+    """
+    Write-through result cache for hot read queries (list runs / artifacts / functions).
+    Entries are keyed by a namespace (usually the table name) and the normalized query parameters, and are bounded by
+    TTL, number of entries and total (serialized) size in bytes. Writes to a namespace invalidate the entries of the
+    affected project(s) - entries which were cached for queries across all projects are invalidated by any write.
+    Results are kept pickled, so every hit returns a fresh copy and callers can safely mutate the returned object.
+    Modeled after framework.utils.lru_cache.LRUCache, including the emulated lru_cache statistics API.
+    """
+
+    class CacheInfo:
+        def __init__(self, maxsize: int, max_size_bytes: int):
+            self.maxsize = maxsize
+            self.max_size_bytes = max_size_bytes
+            self.reset()
+
+        def reset(self):
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.expirations = 0
+            self.invalidations = 0
+            self.currsize = 0
+            self.size_bytes = 0
+
+    class _Entry:
+        __slots__ = ("namespace", "projects", "value", "size", "expires_at")
+
+        def __init__(
+            self,
+            namespace: str,
+            projects: typing.Optional[frozenset],
+            value: bytes,
+            expires_at: float,
+        ):
+            self.namespace = namespace
+            self.projects = projects
+            self.value = value
+            self.size = len(value)
+            self.expires_at = expires_at
+
+    def __init__(
+        self,
+        ttl: float = 5,
+        maxsize: int = 1024,
+        max_size_bytes: int = 64 * 1024 * 1024,
+    ):
+        """
+        Initialize a query result cache instance
+        :param ttl:            Seconds after which a cached result is considered stale
+        :param maxsize:        Maximum number of cached results
+        :param max_size_bytes: Maximum total size of the (serialized) cached results
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.max_size_bytes = max_size_bytes
+        self._cache: collections.OrderedDict[str, QueryResultCache._Entry] = (
+            collections.OrderedDict()
+        )
+        # every invalidation bumps the namespace generation, a result that was computed while the generation changed
+        # may be stale (the write committed in the middle of the query) and is therefore not stored
+        self._generations: dict[str, int] = collections.defaultdict(int)
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+        self._cache_info = self.CacheInfo(maxsize, max_size_bytes)
+
+    def get_or_compute(
+        self,
+        namespace: str,
+        projects: typing.Optional[typing.Union[str, list[str]]],
+        params: dict,
+        func: typing.Callable,
+    ):
+        """
+        Return the cached result of the query, or compute it by calling `func` and cache the result
+        :param namespace: The cache namespace, writes to it invalidate its entries
+        :param projects:  The project(s) the query is scoped to, `None` or `*` for all projects
+        :param params:    The query parameters, used (normalized) as the cache key
+        :param func:      A function without arguments which computes the result
+        """
+        key = self.generate_key(namespace, params)
+        hit, value = self._get(key)
+        if hit:
+            return value
+
+        generation = self._generations[namespace]
+        result = func()
+        self._set(key, namespace, projects, result, generation)
+        return result
+
+    def invalidate(
+        self,
+        namespace: str,
+        projects: typing.Optional[typing.Union[str, list[str]]] = ALL_PROJECTS,
+    ) -> None:
+        """
+        Invalidate the cached results of a namespace
+        :param namespace: The namespace to invalidate
+        :param projects:  The project(s) that were modified, `None` or `*` invalidates the entire namespace
+        """
+        projects = self._normalize_projects(projects)
+        with self._lock:
+            self._generations[namespace] += 1
+            for key in [
+                key
+                for key, entry in self._cache.items()
+                if entry.namespace == namespace
+                and (
+                    projects is ALL_PROJECTS
+                    or entry.projects is ALL_PROJECTS
+                    or entry.projects & projects
+                )
+            ]:
+                self._pop(key)
+                self._cache_info.invalidations += 1
+
+    def cache_info(self) -> CacheInfo:
+        """Get cache statistics. We emulate lru_cache API.
+        We return a deep copy of our internal CacheInfo object to make sure user
+        does not accidentally modify our internal structures"""
+        with self._lock:
+            self._cache_info.currsize = len(self._cache)
+            self._cache_info.size_bytes = self._size_bytes
+            return deepcopy(self._cache_info)
+
+    def cache_clear(self) -> None:
+        """Remove all values from cache and reset statistics"""
+        with self._lock:
+            self._cache.clear()
+            self._generations.clear()
+            self._size_bytes = 0
+            self._cache_info.reset()
+
+    @staticmethod
+    def generate_key(namespace: str, params: dict) -> str:
+        normalized_params = sorted(
+            (name, QueryResultCache._normalize_value(value))
+            for name, value in params.items()
+        )
+        return hashlib.sha256(f"{namespace}/{normalized_params}".encode()).hexdigest()
+
+    def _get(self, key: str) -> tuple[bool, typing.Any]:
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self._cache_info.misses += 1
+                return False, None
+            if entry.expires_at <= time.monotonic():
+                self._pop(key)
+                self._cache_info.expirations += 1
+                self._cache_info.misses += 1
+                return False, None
+            self._cache.move_to_end(key)
+            self._cache_info.hits += 1
+            value = entry.value
+
+        # deserialize outside the lock, every hit gets its own copy of the result
+        return True, pickle.loads(value)
+
+    def _set(
+        self,
+        key: str,
+        namespace: str,
+        projects: typing.Optional[typing.Union[str, list[str]]],
+        result: typing.Any,
+        generation: int,
+    ) -> None:
+        try:
+            value = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as exc:
+            logger.debug(
+                "Query result is not cacheable, skipping",
+                namespace=namespace,
+                err=mlrun.errors.err_to_str(exc),
+            )
+            return
+
+        if len(value) > self.max_size_bytes:
+            return
+
+        entry = self._Entry(
+            namespace=namespace,
+            projects=self._normalize_projects(projects),
+            value=value,
+            expires_at=time.monotonic() + self.ttl,
+        )
+        with self._lock:
+            if self._generations[namespace] != generation:
+                # the namespace was written to while the query was running
+                return
+            if key in self._cache:
+                self._pop(key)
+            self._cache[key] = entry
+            self._size_bytes += entry.size
+            while self._cache and (
+                len(self._cache) > self.maxsize
+                or self._size_bytes > self.max_size_bytes
+            ):
+                self._pop(next(iter(self._cache)))
+                self._cache_info.evictions += 1
+
+    def _pop(self, key: str) -> None:
+        entry = self._cache.pop(key)
+        self._size_bytes -= entry.size
+
+    @staticmethod
+    def _normalize_projects(
+        projects: typing.Optional[typing.Union[str, list[str]]],
+    ) -> typing.Optional[frozenset]:
+        if not projects or projects == "*":
+            return ALL_PROJECTS
+        if isinstance(projects, str):
+            return frozenset([projects])
+        projects = frozenset(projects)
+        return ALL_PROJECTS if "*" in projects else projects
+
+    @staticmethod
+    def _normalize_value(value):
+        if isinstance(value, enum.Enum):
+            return value.value
+        if isinstance(value, (list, tuple, set, frozenset)):
+            values = [QueryResultCache._normalize_value(item) for item in value]
+            # filters such as labels or states are order insensitive
+            if all(isinstance(item, str) for item in values):
+                values = sorted(values)
+            return tuple(values)
+        if isinstance(value, dict):
+            return tuple(
+                sorted(
+                    (key, QueryResultCache._normalize_value(item))
+                    for key, item in value.items()
+                )
+            )
+        return value
+
+
+class QueryCacheNamespaces(mlrun.common.types.StrEnum):
+    runs = "runs"
+    artifacts = "artifacts"
+    functions = "functions"
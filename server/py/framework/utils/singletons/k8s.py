@@ -16,11 +16,13 @@ import hashlib
 import json
 import random
 import string
+import threading
 import time
 import typing
 
 import kubernetes.client.rest as k8s_client_rest
 import kubernetes.dynamic.exceptions as k8s_dynamic_exceptions
+import kubernetes.watch
 from kubernetes import client, config
 
 import mlrun
@@ -37,6 +39,7 @@ from mlrun.utils import logger
 from mlrun.utils.helpers import run_with_retry, to_non_empty_values_dict
 
 import framework.utils.runtimes.mpijob
+import framework.utils.ttl_cache
 
 _k8s = None
 
@@ -82,6 +85,14 @@ class K8sHelper(mlsecrets.SecretProviderInterface):
         self.namespace = namespace or mlrun.mlconf.namespace
         self.config_file = mlrun.mlconf.kubernetes.kubeconfig_path or None
         self.running_inside_kubernetes_cluster = False
+        # the data of the secrets that were read, by (namespace, secret name), kept in memory only
+        secrets_cache_config = mlrun.mlconf.secret_stores.kubernetes.cache
+        self._secrets_cache = framework.utils.ttl_cache.TTLCache(
+            ttl=float(secrets_cache_config.ttl),
+            maxsize=int(secrets_cache_config.max_size),
+        )
+        self._watched_secrets_namespaces = set()
+        self._secrets_watch_lock = threading.Lock()
         try:
             self._init_k8s_config(log)
             self.v1api = client.CoreV1Api()
@@ -439,7 +450,7 @@ class K8sHelper(mlsecrets.SecretProviderInterface):
         namespace = self.resolve_namespace(namespace)
 
         try:
-            secret_data = self.v1api.read_namespaced_secret(secret_name, namespace).data
+            secret_data = self._read_secret_data_cached(secret_name, namespace)
         except k8s_client_rest.ApiException as exc:
             logger.error(
                 "Failed to read secret",
@@ -604,10 +615,23 @@ class K8sHelper(mlsecrets.SecretProviderInterface):
     def read_secret_data(
         self, secret_name: str, namespace: str = "", load_as_json=False, silent=False
     ) -> typing.Optional[dict[str, str]]:
-        k8s_secret = self.read_secret(secret_name, namespace, silent)
-        if k8s_secret is None:
-            return
-        return self._decode_secret_data(k8s_secret.data, load_as_json=load_as_json)
+        namespace = self.resolve_namespace(namespace)
+        try:
+            secret_data = self._read_secret_data_cached(secret_name, namespace)
+        except k8s_client_rest.ApiException as exc:
+            if silent:
+                return
+            logger.error(
+                "Failed to retrieve k8s secret",
+                secret_name=secret_name,
+                exc=mlrun.errors.err_to_str(exc),
+            )
+            raise k8s_dynamic_exceptions.api_exception(exc)
+        return self._decode_secret_data(secret_data, load_as_json=load_as_json)
+
+    def secrets_cache_info(self) -> framework.utils.ttl_cache.TTLCache.CacheInfo:
+        """Get the statistics (hits, misses, evictions, ...) of the secrets cache"""
+        return self._secrets_cache.cache_info()
 
     def _create_secret(
         self,
@@ -642,6 +666,8 @@ class K8sHelper(mlsecrets.SecretProviderInterface):
                     exc=mlrun.errors.err_to_str(exc),
                 )
             raise exc
+        finally:
+            self._invalidate_cached_secret(secret_name, namespace)
 
     def _update_secret(
         self,
@@ -659,6 +685,8 @@ class K8sHelper(mlsecrets.SecretProviderInterface):
             self.v1api.replace_namespaced_secret(secret_name, namespace, k8s_secret)
         except k8s_client_rest.ApiException as exc:
             raise k8s_dynamic_exceptions.api_exception(exc)
+        finally:
+            self._invalidate_cached_secret(secret_name, namespace)
 
     def delete_project_secrets(
         self, project, secrets, namespace=""
@@ -710,6 +738,7 @@ class K8sHelper(mlsecrets.SecretProviderInterface):
                 secret_name=secret_name,
             )
             self.v1api.delete_namespaced_secret(secret_name, namespace)
+            self._invalidate_cached_secret(secret_name, namespace)
             return mlrun.common.schemas.SecretEventActions.deleted
 
         # Create a copy of the k8s secret data, filtering out specified secrets if any
@@ -734,10 +763,12 @@ class K8sHelper(mlsecrets.SecretProviderInterface):
             # Update the existing secret with modified data
             k8s_secret.data = secret_data
             self.v1api.replace_namespaced_secret(secret_name, namespace, k8s_secret)
+            self._invalidate_cached_secret(secret_name, namespace)
             return mlrun.common.schemas.SecretEventActions.updated
 
         # No secrets left, so delete the secret
         self.v1api.delete_namespaced_secret(secret_name, namespace)
+        self._invalidate_cached_secret(secret_name, namespace)
         return mlrun.common.schemas.SecretEventActions.deleted
 
     @raise_for_status_code
@@ -879,11 +910,68 @@ class K8sHelper(mlsecrets.SecretProviderInterface):
         namespace = self.resolve_namespace(namespace)
 
         try:
-            k8s_secret = self.v1api.read_namespaced_secret(secret_name, namespace)
+            return self._read_secret_data_cached(secret_name, namespace)
         except k8s_client_rest.ApiException:
             return None
 
-        return k8s_secret.data
+    def _read_secret_data_cached(self, secret_name: str, namespace: str) -> dict:
+        """
+        Read the (encoded) data of a secret through the secrets cache, failing to read the secret raises the api
+        exception. The returned data is shared with the cache and must not be modified.
+        """
+        self._ensure_secrets_watch(namespace)
+        return self._secrets_cache.get(
+            (namespace, secret_name),
+            lambda: self.v1api.read_namespaced_secret(secret_name, namespace).data
+            or {},
+        )
+
+    def _invalidate_cached_secret(self, secret_name: str, namespace: str):
+        self._secrets_cache.invalidate((self.resolve_namespace(namespace), secret_name))
+
+    def _ensure_secrets_watch(self, namespace: str):
+        """Start watching the secrets of the namespace, when enabled, to invalidate them in the cache on change"""
+        if (
+            not mlrun.mlconf.secret_stores.kubernetes.cache.watch
+            or namespace in self._watched_secrets_namespaces
+        ):
+            return
+        with self._secrets_watch_lock:
+            if namespace in self._watched_secrets_namespaces:
+                return
+            self._watched_secrets_namespaces.add(namespace)
+            threading.Thread(
+                target=self._watch_secrets,
+                args=(namespace,),
+                name=f"k8s-secrets-watch-{namespace}",
+                daemon=True,
+            ).start()
+
+    def _watch_secrets(self, namespace: str):
+        retry_interval = 1
+        while True:
+            try:
+                watch = kubernetes.watch.Watch()
+                for event in watch.stream(
+                    self.v1api.list_namespaced_secret, namespace=namespace
+                ):
+                    # only the name is used, the secret data of the event is dropped
+                    self._invalidate_cached_secret(
+                        event["object"].metadata.name, namespace
+                    )
+                    retry_interval = 1
+            except Exception as exc:
+                logger.warning(
+                    "Secrets watch failed, restarting it",
+                    namespace=namespace,
+                    retry_interval=retry_interval,
+                    exc=mlrun.errors.err_to_str(exc),
+                )
+                time.sleep(retry_interval)
+                retry_interval = min(retry_interval * 2, 60)
+
+            # changes may have been missed while the watch was down
+            self._secrets_cache.cache_clear()
 
     def get_project_secret_keys(self, project, namespace="", filter_internal=False):
         secrets_data = self._get_project_secrets_raw_data(project, namespace)
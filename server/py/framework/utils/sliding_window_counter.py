@@ -0,0 +1,123 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import datetime
+import math
+import typing
+
+
+class SlidingWindowCounter:
+    """
+    Counts events in a sliding time window using a ring of time buckets, instead of keeping the event timestamps.
+    Adding an event and counting the events of the window are O(1) (amortized), and the memory is bounded by the
+    number of buckets regardless of the number of events.
+    The window is accurate to the resolution of a bucket - an event is counted for at least the window duration, and
+    for at most one bucket longer.
+    A counter without a window counts all the events.
+    """
+
+    def __init__(
+        self, window: typing.Optional[datetime.timedelta] = None, buckets: int = 60
+    ):
+        self._window_seconds = window.total_seconds() if window else None
+        self._total = 0
+        if self._window_seconds:
+            self._bucket_seconds = max(self._window_seconds / buckets, 1.0)
+            # an additional bucket for the one that is partially out of the window
+            self._size = math.ceil(self._window_seconds / self._bucket_seconds) + 1
+            self._counts = [0] * self._size
+            self._last_epoch = None
+
+    def add(self, timestamp: datetime.datetime, count: int = 1):
+        """Add events that occurred at the given time"""
+        if not self._window_seconds:
+            self._total += count
+            return
+
+        epoch = self._get_epoch(timestamp)
+        self._advance(epoch)
+        if epoch <= self._last_epoch - self._size:
+            # a late event that is already out of the window
+            return
+        self._counts[epoch % self._size] += count
+        self._total += count
+
+    def count(self, now: typing.Optional[datetime.datetime] = None) -> int:
+        """Get the number of events in the window that ends at the given time (the current time by default)"""
+        if self._window_seconds:
+            self._advance(
+                self._get_epoch(now or datetime.datetime.now(tz=datetime.timezone.utc))
+            )
+        return self._total
+
+    def to_dict(self) -> dict:
+        """A compact snapshot of the counter, the non-empty buckets only"""
+        if not self._window_seconds:
+            return {"window_seconds": None, "total": self._total}
+
+        buckets = []
+        if self._last_epoch is not None:
+            for epoch in range(self._last_epoch - self._size + 1, self._last_epoch + 1):
+                count = self._counts[epoch % self._size]
+                if count:
+                    buckets.append([epoch, count])
+        return {
+            "window_seconds": self._window_seconds,
+            "bucket_seconds": self._bucket_seconds,
+            "buckets": buckets,
+        }
+
+    @classmethod
+    def from_dict(
+        cls,
+        snapshot: typing.Optional[dict],
+        window: typing.Optional[datetime.timedelta] = None,
+        buckets: int = 60,
+    ) -> "SlidingWindowCounter":
+        """
+        Restore a counter from its snapshot. The snapshot is ignored (an empty counter is returned) when it is missing
+        or when it was taken with a different window or bucket size.
+        """
+        counter = cls(window, buckets)
+        if not snapshot or snapshot.get("window_seconds") != counter._window_seconds:
+            return counter
+
+        if not counter._window_seconds:
+            counter._total = snapshot.get("total", 0)
+        elif snapshot.get("bucket_seconds") == counter._bucket_seconds:
+            for epoch, count in snapshot.get("buckets", []):
+                counter._advance(epoch)
+                counter._counts[epoch % counter._size] += count
+                counter._total += count
+        return counter
+
+    def _get_epoch(self, timestamp: datetime.datetime) -> int:
+        return int(timestamp.timestamp() // self._bucket_seconds)
+
+    def _advance(self, epoch: int):
+        """Move the window to end at the given bucket, clearing the buckets that left the window"""
+        if self._last_epoch is None:
+            self._last_epoch = epoch
+            return
+        if epoch <= self._last_epoch:
+            return
+        if epoch - self._last_epoch >= self._size:
+            self._counts = [0] * self._size
+            self._total = 0
+        else:
+            for expired_epoch in range(self._last_epoch + 1, epoch + 1):
+                index = expired_epoch % self._size
+                self._total -= self._counts[index]
+                self._counts[index] = 0
+        self._last_epoch = epoch
@@ -0,0 +1,108 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import collections
+import threading
+import time
+import typing
+from copy import deepcopy
+
+
+class TTLCache:
+    """
+    Thread-safe in-memory cache whose values expire after a time to live, bounded in size by evicting the least
+    recently used values. Values are loaded by the caller on a miss, see get().
+    The API and statistics are similar to framework.utils.lru_cache.LRUCache.
+    """
+
+    class CacheInfo:
+        def __init__(self, maxsize: int):
+            self.maxsize = maxsize
+            self.reset()
+
+        def reset(self):
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.invalidations = 0
+            self.currsize = 0
+
+    def __init__(self, ttl: float, maxsize: int = 128):
+        """
+        Initialize a ttl cache instance
+        :param ttl:     Time to live of the values in seconds, 0 disables the cache (every get() is a miss)
+        :param maxsize: Maximum number of values in the cache
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # key -> (expiration time, value)
+        self.cache: collections.OrderedDict[
+            typing.Hashable, tuple[float, typing.Any]
+        ] = collections.OrderedDict()
+        self._cache_info = self.CacheInfo(maxsize)
+        self._lock = threading.Lock()
+        # incremented on every invalidation, so a value that was loaded before an invalidation is not cached
+        self._generation = 0
+
+    def get(self, key: typing.Hashable, loader: typing.Callable[[], typing.Any]):
+        """
+        Get the value of a key, loading it with the loader when it is not cached or expired.
+        A value of None (e.g. not found) is returned but not cached, and errors of the loader are raised.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry is not None and entry[0] > now:
+                self._cache_info.hits += 1
+                self.cache.move_to_end(key)
+                return entry[1]
+            self._cache_info.misses += 1
+            generation = self._generation
+
+        value = loader()
+        if value is not None and self.ttl > 0:
+            with self._lock:
+                if generation == self._generation:
+                    self._set(key, value)
+        return value
+
+    def set(self, key: typing.Hashable, value):
+        with self._lock:
+            self._set(key, value)
+
+    def invalidate(self, key: typing.Hashable):
+        """Remove a key from the cache, so it is loaded again on its next get()"""
+        with self._lock:
+            self._generation += 1
+            if self.cache.pop(key, None) is not None:
+                self._cache_info.invalidations += 1
+
+    def cache_clear(self) -> None:
+        """Remove all values from cache, the statistics are kept"""
+        with self._lock:
+            self._generation += 1
+            self.cache.clear()
+
+    def cache_info(self) -> CacheInfo:
+        """Get a copy of the cache statistics"""
+        with self._lock:
+            self._cache_info.currsize = len(self.cache)
+            return deepcopy(self._cache_info)
+
+    def _set(self, key: typing.Hashable, value):
+        self.cache[key] = (time.monotonic() + self.ttl, value)
+        self.cache.move_to_end(key)
+        while len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)
+            self._cache_info.evictions += 1
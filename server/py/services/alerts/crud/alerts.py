@@ -13,8 +13,8 @@
 # limitations under the License.
 #
 
-import datetime
 import re
+import threading
 import typing
 
 import sqlalchemy.orm
@@ -29,12 +29,17 @@ import framework.utils.lru_cache
 import framework.utils.singletons.db
 import services.alerts.crud
 from framework.utils.notifications.notification_pusher import AlertNotificationPusher
+from framework.utils.sliding_window_counter import SlidingWindowCounter
 
 
 class Alerts(
     metaclass=mlrun.utils.singleton.Singleton,
 ):
     _states = dict()
+    # ids of the alerts whose events counter changed since the last snapshot
+    _dirty_states = set()
+    # guards the events states, which are updated by the events while the periodic snapshot serializes them
+    _states_lock = threading.RLock()
     _alert_cache = None
     _alert_state_cache = None
 
@@ -186,24 +191,46 @@ class Alerts(
         if not self._event_entity_matches(alert.entities, event_data.entity):
             return
 
-        state_obj = self._states.get(alert.id, {"event_timestamps": []})
-        state_obj["event_timestamps"].append(event_data.timestamp)
-
-        # Exit early if state is active (no further processing needed)
-        if state["active"]:
-            self._states[alert.id] = state_obj
+        with self._states_lock:
+            state_obj = self._get_events_state(alert, state)
+            state_obj["events_counter"].add(event_data.timestamp)
+            self._dirty_states.add(alert.id)
+
+            # Exit early if state is active (no further processing needed)
+            if state["active"]:
+                state_obj["number_of_events"] = state_obj.get("number_of_events", 0) + 1
+                return
+
+            should_send_notification = self._should_send_notification(alert, state_obj)
+
+        if should_send_notification:
+            self._handle_notification(session, alert, state, state_obj, event_data)
+
+    def snapshot_events_counters(self, session: sqlalchemy.orm.Session):
+        """
+        Persist the events counters of the alerts that received events since the last snapshot, in a single batch,
+        so they survive a restart without writing the alert state on every event
+        """
+        objects = {}
+        with self._states_lock:
+            alert_ids = set(self._dirty_states)
+            self._dirty_states.clear()
+            for alert_id in alert_ids:
+                state_obj = self._states.get(alert_id)
+                if state_obj is None:
+                    # the alert was reset or deleted since
+                    continue
+                objects[alert_id] = {
+                    "events_counter": state_obj["events_counter"].to_dict(),
+                    "number_of_events": state_obj.get("number_of_events"),
+                }
+        if not objects:
             return
 
-        send_notification = self._should_send_notification(alert, state_obj)
-        update_state_cache = True
-        if send_notification:
-            update_state_cache = self._handle_notification(
-                session, alert, state, state_obj, event_data
-            )
-
-        if update_state_cache:
-            # we don't want to update the state if reset_alert() was called, as we will override the reset
-            self._states[alert.id] = state_obj
+        framework.utils.singletons.db.get_db().update_alert_states_objects(
+            session, objects
+        )
+        logger.debug("Stored alerts events counters", alerts_count=len(objects))
 
     def populate_event_cache(self, session: sqlalchemy.orm.Session):
         try:
@@ -219,22 +246,45 @@ class Alerts(
         services.alerts.crud.Events().cache_initialized = True
         logger.debug("Finished populating event cache")
 
+    @staticmethod
     def _should_send_notification(
-        self, alert: mlrun.common.schemas.AlertConfig, state_obj: dict
+        alert: mlrun.common.schemas.AlertConfig, state_obj: dict
     ) -> bool:
+        return state_obj["events_counter"].count() >= alert.criteria.count
+
+    def _get_events_state(
+        self, alert: mlrun.common.schemas.AlertConfig, state: dict
+    ) -> dict:
+        if alert.id in self._states:
+            return self._states[alert.id]
+
+        # restore the last snapshot of the counter (e.g. after a restart), it is ignored if the period was changed
+        full_object = state.get("full_object") or {}
+        window = None
         if alert.criteria.period:
-            offset = self._get_event_offset(alert)
-            self._normalize_events(
-                state_obj,
-                framework.utils.helpers.string_to_timedelta(
-                    alert.criteria.period, offset, raise_on_error=False
-                ),
+            window = framework.utils.helpers.string_to_timedelta(
+                alert.criteria.period,
+                self._get_event_offset(alert),
+                raise_on_error=False,
             )
-        return len(state_obj["event_timestamps"]) >= alert.criteria.count
+        state_obj = {
+            "events_counter": SlidingWindowCounter.from_dict(
+                full_object.get("events_counter"),
+                window,
+                int(mlconfig.alerts.events_counter.buckets),
+            )
+        }
+        if state["active"] and full_object.get("number_of_events"):
+            state_obj["number_of_events"] = full_object["number_of_events"]
+        self._states[alert.id] = state_obj
+        return state_obj
 
     def _get_number_of_events(self, alert_id: int) -> int:
-        state_obj = self._states.get(alert_id, {"event_timestamps": []})
-        return len(state_obj["event_timestamps"])
+        with self._states_lock:
+            state_obj = self._states.get(alert_id)
+            if not state_obj:
+                return 0
+            return state_obj.get("number_of_events", 0)
 
     @staticmethod
     def _get_event_offset(alert: mlrun.common.schemas.AlertConfig) -> int:
@@ -249,9 +299,10 @@ class Alerts(
         state: dict,
         state_obj: dict,
         event_data: mlrun.common.schemas.Event,
-    ) -> bool:
-        keep_cache = True
+    ):
         active = False
+        # the events counter is persisted by the periodic snapshots, the activation only stores its own details
+        activation_obj = {}
         state["count"] += 1
         logger.debug("Sending notifications for alert", name=alert.name)
         AlertNotificationPusher().push(alert, event_data)
@@ -261,7 +312,6 @@ class Alerts(
             services.alerts.crud.AlertActivation().store_alert_activation(
                 session, alert, event_data
             )
-            keep_cache = False
         else:
             active = True
             state["active"] = True
@@ -270,7 +320,9 @@ class Alerts(
                     session, alert, event_data
                 )
             )
-            state_obj["last_activation_id"] = activation_id
+            activation_obj["last_activation_id"] = activation_id
+            with self._states_lock:
+                state_obj["number_of_events"] = state_obj["events_counter"].count()
 
         framework.utils.singletons.db.get_db().store_alert_state(
             session,
@@ -278,10 +330,9 @@ class Alerts(
             alert.name,
             count=state["count"],
             last_updated=event_data.timestamp,
-            obj=state_obj,
+            obj=activation_obj,
             active=active,
         )
-        return keep_cache
 
     @classmethod
     def _get_alert_by_id_cached(cls):
@@ -395,18 +446,6 @@ class Alerts(
                 f"Invalid alert name '{name}'. Alert names can only contain alphanumeric characters and hyphens."
             )
 
-    @staticmethod
-    def _normalize_events(obj, period):
-        now = datetime.datetime.now(tz=datetime.timezone.utc)
-        events = obj["event_timestamps"]
-        for event in events:
-            if isinstance(event, str):
-                event_time = datetime.datetime.fromisoformat(event)
-            else:
-                event_time = event
-            if now > event_time + period:
-                events.remove(event)
-
     def reset_alert(self, session: sqlalchemy.orm.Session, project: str, name: str):
         alert = framework.utils.singletons.db.get_db().get_alert(session, project, name)
         if alert is None:
@@ -423,6 +462,10 @@ class Alerts(
         framework.utils.singletons.db.get_db().store_alert_state(
             session, project, name, last_updated=None
         )
+        # drop the snapshot of the events counter so it is not restored
+        framework.utils.singletons.db.get_db().update_alert_states_objects(
+            session, {alert.id: {"events_counter": None, "number_of_events": None}}
+        )
         self._get_alert_state_cached().cache_remove(session, alert.id)
         self._clear_alert_states(alert)
 
@@ -521,5 +564,6 @@ class Alerts(
         ]
 
     def _clear_alert_states(self, alert):
-        if alert.id in self._states:
-            self._states.pop(alert.id)
+        with self._states_lock:
+            self._states.pop(alert.id, None)
+            self._dirty_states.discard(alert.id)
@@ -72,7 +72,31 @@ class Events(
             )
 
         event_data.timestamp = datetime.datetime.now(datetime.timezone.utc)
+        self._process_event(session, event_data, event_name, project)
 
+    def process_events(
+        self,
+        session: sqlalchemy.orm.Session,
+        events: list[mlrun.common.schemas.Event],
+        project: Optional[str] = None,
+    ):
+        """
+        Process a batch of events, each is processed under its kind as the event name.
+        All the events of the batch are stamped with the same occurrence time.
+        """
+        project = project or mlrun.mlconf.default_project
+        timestamp = datetime.datetime.now(datetime.timezone.utc)
+        for event_data in events:
+            event_data.timestamp = timestamp
+            self._process_event(session, event_data, event_data.kind, project)
+
+    def _process_event(
+        self,
+        session: sqlalchemy.orm.Session,
+        event_data: mlrun.common.schemas.Event,
+        event_name: str,
+        project: str,
+    ):
         if not self.cache_initialized:
             services.alerts.crud.Alerts().process_event_no_cache(
                 session, event_name, event_data
@@ -298,6 +298,60 @@ class Service(framework.service.Service):
             project,
         )
 
+    async def post_events(
+        self,
+        request: fastapi.Request,
+        project: str,
+        events: list[mlrun.common.schemas.Event],
+        auth_info: mlrun.common.schemas.AuthInfo,
+        db_session: sqlalchemy.orm.Session = None,
+    ):
+        await run_in_threadpool(
+            framework.utils.singletons.project_member.get_project_member().ensure_project,
+            db_session,
+            project,
+            auth_info=auth_info,
+        )
+        # events are authorized by their name, which is their kind
+        for name in sorted({event.kind for event in events}):
+            await framework.utils.auth.verifier.AuthVerifier().query_project_resource_permissions(
+                mlrun.common.schemas.AuthorizationResourceTypes.event,
+                project,
+                name,
+                mlrun.common.schemas.AuthorizationAction.store,
+                auth_info,
+            )
+
+        if mlrun.mlconf.alerts.mode == mlrun.common.schemas.alert.AlertsModes.disabled:
+            self._logger.debug(
+                "Alerts are disabled, skipping events processing",
+                project=project,
+                events_count=len(events),
+            )
+            return
+
+        if not self._is_chief_or_standalone():
+            data = await request.json()
+            chief_client = framework.utils.clients.chief.Client()
+            return await chief_client.set_events(
+                project=project, request=request, json=data
+            )
+
+        self._logger.debug("Got events", project=project, events_count=len(events))
+
+        for event_data in events:
+            if not services.alerts.crud.Events().is_valid_event(project, event_data):
+                raise fastapi.HTTPException(
+                    status_code=http.HTTPStatus.BAD_REQUEST.value
+                )
+
+        await run_in_threadpool(
+            services.alerts.crud.Events().process_events,
+            db_session,
+            events,
+            project,
+        )
+
     async def store_alert_template(
         self,
         request: fastapi.Request,
@@ -495,6 +549,7 @@ class Service(framework.service.Service):
 
     async def _start_periodic_functions(self):
         self._start_periodic_events_generation()
+        self._start_periodic_events_counters_snapshot()
 
     def _start_periodic_events_generation(self):
         interval = int(mlconf.alerts.events_generation_interval)
@@ -507,6 +562,31 @@ class Service(framework.service.Service):
                 self._generate_events,
             )
 
+    def _start_periodic_events_counters_snapshot(self):
+        interval = int(mlconf.alerts.events_counter.snapshot_interval)
+        if interval > 0:
+            self._logger.info("Starting events counters snapshot", interval=interval)
+            framework.utils.periodic.run_function_periodically(
+                interval,
+                self._snapshot_events_counters.__name__,
+                False,
+                self._snapshot_events_counters,
+            )
+
+    async def _snapshot_events_counters(self):
+        db_session = await fastapi.concurrency.run_in_threadpool(create_session)
+        try:
+            await fastapi.concurrency.run_in_threadpool(
+                services.alerts.crud.Alerts().snapshot_events_counters, db_session
+            )
+        except Exception as exc:
+            self._logger.warning(
+                "Failed storing events counters snapshot. Ignoring",
+                exc=mlrun.errors.err_to_str(exc),
+            )
+        finally:
+            await fastapi.concurrency.run_in_threadpool(close_session, db_session)
+
     async def _generate_events(self):
         db_session = await fastapi.concurrency.run_in_threadpool(create_session)
         try:
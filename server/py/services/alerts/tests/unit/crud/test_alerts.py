@@ -417,3 +417,86 @@ class TestAlerts(TestAlertsBase):
         )
         assert alert.updated is not None
         assert alert.updated > alert.created.replace(tzinfo=timezone.utc)
+
+    @pytest.mark.asyncio
+    @unittest.mock.patch.object(
+        framework.utils.singletons.db.SQLDB, "update_alert_activation"
+    )
+    @unittest.mock.patch.object(
+        services.alerts.crud.AlertActivation, "store_alert_activation"
+    )
+    async def test_events_counter_snapshot(
+        self,
+        mocked_update_alert_activation,
+        mocked_store_alert_activation,
+        db: sqlalchemy.orm.Session,
+        k8s_secrets_mock: K8sSecretsMock,
+        reset_alert_caches,
+    ):
+        mocked_update_alert_activation.return_value = None
+        mocked_store_alert_activation.return_value = None
+        project = "project-name"
+        alert_name = "my-alert"
+        alert_entity = alert_objects.EventEntities(
+            kind=alert_objects.EventEntityKind.MODEL_ENDPOINT_RESULT,
+            project=project,
+            ids=[123],
+        )
+        event_kind = alert_objects.EventKind.DATA_DRIFT_SUSPECTED
+
+        alert_data = services.alerts.tests.unit.crud.utils.generate_alert_data(
+            project=project,
+            name=alert_name,
+            entity=alert_entity,
+            event_kind=event_kind,
+            criteria=alert_objects.AlertCriteria(count=3, period="1h"),
+            reset_policy=alert_objects.ResetPolicy.MANUAL,
+        )
+        alert = services.alerts.crud.Alerts().store_alert(
+            session=db,
+            project=project,
+            name=alert_name,
+            alert_data=alert_data,
+        )
+
+        event = alert_objects.Event(kind=event_kind, entity=alert_entity)
+        await fastapi.concurrency.run_in_threadpool(
+            services.alerts.crud.Events().process_events,
+            db,
+            [event, event.copy()],
+            project,
+        )
+        services.alerts.crud.Alerts().snapshot_events_counters(db)
+
+        state = framework.utils.singletons.db.get_db().get_alert_state_dict(
+            db, alert.id
+        )
+        assert not state["active"]
+        assert (
+            sum(count for _, count in state["full_object"]["events_counter"]["buckets"])
+            == 2
+        )
+
+        # simulate a restart, the counter is restored from its snapshot
+        services.alerts.crud.Alerts()._states.clear()
+        services.alerts.crud.Alerts()._alert_state_cache.cache_clear()
+
+        await fastapi.concurrency.run_in_threadpool(
+            services.alerts.crud.Events().process_events,
+            db,
+            [event.copy()],
+            project,
+        )
+        alert = services.alerts.crud.Alerts().get_enriched_alert(
+            session=db,
+            project=project,
+            name=alert_name,
+        )
+        assert alert.state == alert_objects.AlertActiveState.ACTIVE
+
+        # the reset drops the snapshot of the counter
+        services.alerts.crud.Alerts().reset_alert(db, project, alert_name)
+        state = framework.utils.singletons.db.get_db().get_alert_state_dict(
+            db, alert.id
+        )
+        assert "events_counter" not in (state["full_object"] or {})
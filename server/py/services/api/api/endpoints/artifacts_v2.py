@@ -15,12 +15,14 @@
 from http import HTTPStatus
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query, Response
+from fastapi import APIRouter, Depends, Header, Query, Response
 from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 import mlrun.common.formatters
 import mlrun.common.schemas
+import mlrun.errors
 from mlrun.common.schemas.artifact import ArtifactsDeletionStrategies
 from mlrun.utils import logger
 
@@ -182,6 +184,7 @@ async def list_artifacts(
     page: int = Query(None, gt=0),
     page_size: int = Query(None, alias="page-size", gt=0),
     page_token: str = Query(None, alias="page-token"),
+    accept: Optional[str] = Header(None),
     auth_info: mlrun.common.schemas.AuthInfo = Depends(deps.authenticate_request),
     db_session: Session = Depends(deps.get_db_session),
 ):
@@ -207,14 +210,7 @@ async def list_artifacts(
             auth_info,
         )
 
-    artifacts, page_info = await paginator.paginate_permission_filtered_request(
-        db_session,
-        services.api.crud.Artifacts().list_artifacts,
-        _filter_artifacts,
-        auth_info,
-        token=page_token,
-        page=page,
-        page_size=page_size,
+    list_artifacts_kwargs = dict(
         project=project,
         name=name,
         tag=tag,
@@ -228,12 +224,37 @@ async def list_artifacts(
         format_=format_,
         producer_id=tree,
         producer_uri=producer_uri,
-        limit=limit,
         partition_by=partition_by,
         rows_per_partition=rows_per_partition,
         partition_sort_by=partition_sort_by,
         partition_order=partition_order,
     )
+
+    if accept == mlrun.common.schemas.MediaTypes.ndjson:
+        if page or page_size or page_token or limit:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "Pagination is not supported when streaming the artifacts"
+            )
+        return StreamingResponse(
+            paginator.stream_permission_filtered_request(
+                services.api.crud.Artifacts().iterate_artifacts,
+                _filter_artifacts,
+                **list_artifacts_kwargs,
+            ),
+            media_type=mlrun.common.schemas.MediaTypes.ndjson,
+        )
+
+    artifacts, page_info = await paginator.paginate_permission_filtered_request(
+        db_session,
+        services.api.crud.Artifacts().list_artifacts,
+        _filter_artifacts,
+        auth_info,
+        token=page_token,
+        page=page,
+        page_size=page_size,
+        limit=limit,
+        **list_artifacts_kwargs,
+    )
     return {
         "artifacts": artifacts,
         "pagination": page_info,
@@ -17,13 +17,24 @@ import uuid
 from http import HTTPStatus
 from typing import Optional
 
-from fastapi import APIRouter, BackgroundTasks, Body, Depends, Query, Request, Response
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Body,
+    Depends,
+    Header,
+    Query,
+    Request,
+    Response,
+)
 from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 import mlrun.common.formatters
 import mlrun.common.runtimes.constants
 import mlrun.common.schemas
+import mlrun.errors
 from mlrun.utils import logger
 
 import framework.utils.auth.verifier
@@ -233,6 +244,7 @@ async def list_runs(
     page: int = Query(None, gt=0),
     page_size: int = Query(None, alias="page-size", gt=0),
     page_token: str = Query(None, alias="page-token"),
+    accept: Optional[str] = Header(None),
     auth_info: mlrun.common.schemas.AuthInfo = Depends(deps.authenticate_request),
     db_session: Session = Depends(deps.get_db_session),
 ):
@@ -255,14 +267,7 @@ async def list_runs(
             auth_info,
         )
 
-    runs, page_info = await paginator.paginate_permission_filtered_request(
-        db_session,
-        services.api.crud.Runs().list_runs,
-        _filter_runs,
-        auth_info,
-        token=page_token,
-        page=page,
-        page_size=page_size,
+    list_runs_kwargs = dict(
         name=name,
         uid=uid,
         project=allowed_project_names,
@@ -282,12 +287,68 @@ async def list_runs(
         max_partitions=max_partitions,
         with_notifications=with_notifications,
     )
+
+    if accept == mlrun.common.schemas.MediaTypes.ndjson:
+        if page or page_size or page_token:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "Pagination is not supported when streaming the runs"
+            )
+        return StreamingResponse(
+            paginator.stream_permission_filtered_request(
+                services.api.crud.Runs().iterate_runs,
+                _filter_runs,
+                **list_runs_kwargs,
+            ),
+            media_type=mlrun.common.schemas.MediaTypes.ndjson,
+        )
+
+    runs, page_info = await paginator.paginate_permission_filtered_request(
+        db_session,
+        services.api.crud.Runs().list_runs,
+        _filter_runs,
+        auth_info,
+        token=page_token,
+        page=page,
+        page_size=page_size,
+        **list_runs_kwargs,
+    )
     return {
         "runs": runs,
         "pagination": page_info,
     }
 
 
+@router.post(
+    "/projects/{project}/runs-states",
+    response_model=mlrun.common.schemas.RunsStatesOutput,
+)
+async def list_runs_states(
+    project: str,
+    runs_states_request: mlrun.common.schemas.RunsStatesRequest = Body(...),
+    auth_info: mlrun.common.schemas.AuthInfo = Depends(deps.authenticate_request),
+    db_session: Session = Depends(deps.get_db_session),
+):
+    uids = await framework.utils.auth.verifier.AuthVerifier().filter_project_resources_by_permissions(
+        mlrun.common.schemas.AuthorizationResourceTypes.run,
+        runs_states_request.uids,
+        lambda uid: (project, uid),
+        auth_info,
+    )
+    allowed_uids = set(uids)
+    runs_states = await services.api.crud.Runs().list_runs_states(
+        db_session,
+        project,
+        uids,
+        known_states={
+            uid: state
+            for uid, state in runs_states_request.known_states.items()
+            if uid in allowed_uids
+        },
+        timeout=runs_states_request.timeout,
+    )
+    return mlrun.common.schemas.RunsStatesOutput(runs=runs_states)
+
+
 # TODO: remove /runs in 1.8.0
 @router.delete(
     "/runs",
@@ -29,6 +29,7 @@ import mlrun.utils.singleton
 from mlrun.errors import err_to_str
 from mlrun.utils import logger
 
+import framework.db.sqldb.helpers
 import framework.utils.singletons.db
 import services.api.crud
 
@@ -171,6 +172,7 @@ class Artifacts(
         partition_order: typing.Optional[
             mlrun.common.schemas.OrderType
         ] = mlrun.common.schemas.OrderType.desc,
+        keyset_page: typing.Optional[framework.db.sqldb.helpers.KeysetPage] = None,
     ) -> list:
         project = project or mlrun.mlconf.default_project
         if labels is None:
@@ -196,9 +198,27 @@ class Artifacts(
             rows_per_partition=rows_per_partition,
             partition_sort_by=partition_sort_by,
             partition_order=partition_order,
+            keyset_page=keyset_page,
         )
         return artifacts
 
+    def iterate_artifacts(
+        self,
+        db_session: sqlalchemy.orm.Session,
+        batch_size: typing.Optional[int] = None,
+        **list_artifacts_kwargs,
+    ) -> typing.Iterator[list]:
+        """
+        Iterate over the artifacts in batches, used for streaming large list responses.
+        See list_artifacts for the filter arguments.
+        """
+        return framework.db.sqldb.helpers.iterate_in_keyset_batches(
+            self.list_artifacts,
+            db_session,
+            batch_size or mlrun.mlconf.httpdb.pagination.stream_batch_size,
+            **list_artifacts_kwargs,
+        )
+
     def list_artifacts_for_producer_id(
         self,
         db_session: sqlalchemy.orm.Session,
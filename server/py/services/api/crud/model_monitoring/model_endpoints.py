@@ -482,6 +482,7 @@ class ModelEndpoints:
         tsdb_metrics: typing.Optional[bool] = None,
         uids: typing.Optional[list[str]] = None,
         latest_only: typing.Optional[bool] = None,
+        feature_analysis: bool = False,
     ) -> mlrun.common.schemas.ModelEndpointList:
         """
         List model endpoints based on the provided filters.
@@ -498,6 +499,8 @@ class ModelEndpoints:
         :param tsdb_metrics:        When True, the time series metrics will be added to the output of the resulting
         :param uids:                A list of unique ids of the model endpoints.
         :param latest_only:         When True, only the latest model endpoint will be returned.
+        :param feature_analysis:    When True, the base feature statistics and current feature statistics will be
+                                    added to the model endpoints.
         :return:                    A list of `ModelEndpoint` objects.
         """
 
@@ -519,6 +522,7 @@ class ModelEndpoints:
             tsdb_metrics=tsdb_metrics,
             uids=uids,
             latest_only=latest_only,
+            feature_analysis=feature_analysis,
         )
 
         # Initialize an empty model endpoints list
@@ -542,6 +546,23 @@ class ModelEndpoints:
                 model_endpoint_objects=endpoint_list.endpoints,
                 project=project,
             )
+        if feature_analysis and endpoint_list.endpoints:
+            endpoint_list.endpoints = self._add_feature_analysis(
+                model_endpoint_objects=endpoint_list.endpoints
+            )
+            for model_endpoint_object in endpoint_list.endpoints:
+                if not model_endpoint_object.spec.model_uri:
+                    continue
+                try:
+                    self._add_feature_stats(
+                        session=db_session, model_endpoint_object=model_endpoint_object
+                    )
+                except mlrun.errors.MLRunNotFoundError:
+                    logger.warning(
+                        "The model of the model endpoint was not found, listing it without feature stats",
+                        endpoint_id=model_endpoint_object.metadata.uid,
+                        model_uri=model_endpoint_object.spec.model_uri,
+                    )
 
         return endpoint_list
 
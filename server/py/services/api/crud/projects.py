@@ -15,6 +15,7 @@
 import asyncio
 import collections
 import datetime
+import time
 import typing
 
 import fastapi.concurrency
@@ -47,6 +48,17 @@ class Projects(
     project_follower.Member,
     metaclass=mlrun.utils.singleton.AbstractSingleton,
 ):
+    # summary counters which are recalculated for all the projects on every refresh, also in incremental refresh mode,
+    # since they are cheap to calculate, or are not derived from the projects' resources in the DB
+    _summary_fields_refreshed_for_all_projects = [
+        "distinct_schedules_count",
+        "distinct_scheduled_jobs_pending_count",
+        "distinct_scheduled_pipelines_pending_count",
+        "pipelines_completed_recent_count",
+        "pipelines_failed_recent_count",
+        "pipelines_running_count",
+    ]
+
     def create_project(
         self, session: sqlalchemy.orm.Session, project: mlrun.common.schemas.Project
     ):
@@ -449,9 +461,34 @@ class Projects(
             format_=mlrun.common.formatters.ProjectFormat.name_and_creation_time,
         )
 
+        # in incremental mode, only the counters of the projects which may have changed since the last refresh are
+        # recalculated, and the counters of the rest of the projects are kept from their current summaries
+        current_summaries, projects_to_refresh = {}, None
+        if (
+            mlrun.mlconf.monitoring.projects.summaries.refresh_mode
+            == mlrun.common.schemas.ProjectSummariesRefreshMode.incremental
+        ):
+            (
+                current_summaries,
+                projects_to_refresh,
+            ) = await fastapi.concurrency.run_in_threadpool(
+                framework.utils.singletons.db.get_db().get_project_summaries_to_refresh,
+                session,
+            )
+            if self._is_full_summaries_refresh_required():
+                projects_to_refresh = None
+            else:
+                logger.debug(
+                    "Refreshing project summaries incrementally",
+                    projects_to_refresh_count=len(projects_to_refresh),
+                    projects_count=len(projects_output.projects),
+                )
+        if projects_to_refresh is None:
+            self._last_full_summaries_refresh = time.monotonic()
+
         project_counters, pipeline_counters = await asyncio.gather(
             framework.utils.singletons.db.get_db().get_project_resources_counters(
-                projects_output.projects
+                projects_output.projects, projects_to_refresh
             ),
             self._calculate_pipelines_counters(),
         )
@@ -478,58 +515,69 @@ class Projects(
         project_summaries = []
         for project_data in projects_output.projects:
             project_name = project_data[0]
-            project_summaries.append(
-                mlrun.common.schemas.ProjectSummary(
-                    name=project_name,
-                    files_count=project_to_files_count.get(project_name, 0),
-                    distinct_schedules_count=project_to_schedule_count.get(
-                        project_name, 0
-                    ),
-                    feature_sets_count=project_to_feature_set_count.get(
-                        project_name, 0
-                    ),
-                    models_count=project_to_models_count.get(project_name, 0),
-                    runs_completed_recent_count=project_to_recent_completed_runs_count.get(
-                        project_name, 0
-                    ),
-                    runs_failed_recent_count=project_to_recent_failed_runs_count.get(
-                        project_name, 0
-                    ),
-                    runs_running_count=project_to_running_runs_count.get(
-                        project_name, 0
-                    ),
-                    # the following are defaultdict so it will return None if using dict.get()
-                    # and the key wasn't set yet, so we need to use the [] operator to get the default value of the dict
-                    pipelines_completed_recent_count=project_to_recent_completed_pipelines_count[
-                        project_name
-                    ],
-                    pipelines_failed_recent_count=project_to_recent_failed_pipelines_count[
-                        project_name
-                    ],
-                    pipelines_running_count=project_to_running_pipelines_count[
-                        project_name
-                    ],
-                    distinct_scheduled_jobs_pending_count=project_to_schedule_pending_jobs_count[
-                        project_name
-                    ],
-                    distinct_scheduled_pipelines_pending_count=project_to_schedule_pending_workflows_count[
-                        project_name
-                    ],
-                    endpoint_alerts_count=project_to_endpoint_alerts_count.get(
-                        project_name, 0
-                    ),
-                    job_alerts_count=project_to_job_alerts_count.get(project_name, 0),
-                    other_alerts_count=project_to_other_alerts_count.get(
-                        project_name, 0
-                    ),
-                )
+            project_summary = mlrun.common.schemas.ProjectSummary(
+                name=project_name,
+                files_count=project_to_files_count.get(project_name, 0),
+                distinct_schedules_count=project_to_schedule_count.get(project_name, 0),
+                feature_sets_count=project_to_feature_set_count.get(project_name, 0),
+                models_count=project_to_models_count.get(project_name, 0),
+                runs_completed_recent_count=project_to_recent_completed_runs_count.get(
+                    project_name, 0
+                ),
+                runs_failed_recent_count=project_to_recent_failed_runs_count.get(
+                    project_name, 0
+                ),
+                runs_running_count=project_to_running_runs_count.get(project_name, 0),
+                # the following are defaultdict so it will return None if using dict.get()
+                # and the key wasn't set yet, so we need to use the [] operator to get the default value of the dict
+                pipelines_completed_recent_count=project_to_recent_completed_pipelines_count[
+                    project_name
+                ],
+                pipelines_failed_recent_count=project_to_recent_failed_pipelines_count[
+                    project_name
+                ],
+                pipelines_running_count=project_to_running_pipelines_count[
+                    project_name
+                ],
+                distinct_scheduled_jobs_pending_count=project_to_schedule_pending_jobs_count[
+                    project_name
+                ],
+                distinct_scheduled_pipelines_pending_count=project_to_schedule_pending_workflows_count[
+                    project_name
+                ],
+                endpoint_alerts_count=project_to_endpoint_alerts_count.get(
+                    project_name, 0
+                ),
+                job_alerts_count=project_to_job_alerts_count.get(project_name, 0),
+                other_alerts_count=project_to_other_alerts_count.get(project_name, 0),
             )
+            if (
+                projects_to_refresh is not None
+                and project_name not in projects_to_refresh
+            ):
+                current_summary = current_summaries.get(project_name)
+                if not current_summary:
+                    # summaries are refreshed only for projects that have one
+                    continue
+                project_summary = current_summary.copy(
+                    update={
+                        field: getattr(project_summary, field)
+                        for field in self._summary_fields_refreshed_for_all_projects
+                    }
+                )
+            project_summaries.append(project_summary)
         await fastapi.concurrency.run_in_threadpool(
             framework.utils.singletons.db.get_db().refresh_project_summaries,
             session,
             project_summaries,
         )
 
+    def _is_full_summaries_refresh_required(self) -> bool:
+        last_full_refresh = getattr(self, "_last_full_summaries_refresh", None)
+        return last_full_refresh is None or time.monotonic() - last_full_refresh >= int(
+            mlrun.mlconf.monitoring.projects.summaries.full_refresh_interval
+        )
+
     @staticmethod
     def _list_pipelines(
         session,
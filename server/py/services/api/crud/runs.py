@@ -14,6 +14,7 @@
 #
 import asyncio
 import datetime
+import time
 import typing
 
 import sqlalchemy.orm
@@ -33,6 +34,7 @@ from mlrun.utils import logger
 
 import framework.constants
 import framework.db.session
+import framework.db.sqldb.helpers
 import framework.utils.background_tasks
 import framework.utils.clients.log_collector
 import framework.utils.notifications
@@ -173,6 +175,7 @@ class Runs(
         with_notifications: bool = False,
         offset: typing.Optional[int] = None,
         limit: typing.Optional[int] = None,
+        keyset_page: typing.Optional[framework.db.sqldb.helpers.KeysetPage] = None,
     ) -> mlrun.lists.RunList:
         project = project or mlrun.mlconf.default_project
         if (
@@ -236,8 +239,64 @@ class Runs(
             with_notifications=with_notifications,
             offset=offset,
             limit=limit,
+            keyset_page=keyset_page,
         )
 
+    def iterate_runs(
+        self,
+        db_session: sqlalchemy.orm.Session,
+        batch_size: typing.Optional[int] = None,
+        **list_runs_kwargs,
+    ) -> typing.Iterator[mlrun.lists.RunList]:
+        """
+        Iterate over the runs in batches, used for streaming large list responses.
+        See list_runs for the filter arguments.
+        """
+        return framework.db.sqldb.helpers.iterate_in_keyset_batches(
+            self.list_runs,
+            db_session,
+            batch_size or mlrun.mlconf.httpdb.pagination.stream_batch_size,
+            **list_runs_kwargs,
+        )
+
+    async def list_runs_states(
+        self,
+        db_session: sqlalchemy.orm.Session,
+        project: str,
+        uids: list[str],
+        known_states: typing.Optional[dict[str, str]] = None,
+        timeout: int = 0,
+    ) -> list[mlrun.common.schemas.RunState]:
+        """
+        List the states of the given runs. When the known states of the runs are given with a timeout, waits until the
+        state of any of the runs differs from its known state (long poll), or until the timeout passes (capped by
+        httpdb.runs_states.max_wait_timeout).
+        """
+        project = project or mlrun.mlconf.default_project
+        timeout = min(timeout, int(mlrun.mlconf.httpdb.runs_states.max_wait_timeout))
+        check_interval = float(mlrun.mlconf.httpdb.runs_states.wait_check_interval)
+        deadline = time.monotonic() + timeout
+        db = framework.utils.singletons.db.get_db()
+        while True:
+            runs_states = await run_in_threadpool(
+                db.list_runs_states, db_session, uids, project
+            )
+            remaining = deadline - time.monotonic()
+            if not known_states or remaining <= 0:
+                return runs_states
+
+            current_states = {
+                run_state.uid: run_state.state for run_state in runs_states
+            }
+            if any(
+                current_states.get(uid) != state for uid, state in known_states.items()
+            ):
+                return runs_states
+
+            # end the read transaction, so the next check sees the updates that were committed meanwhile
+            await run_in_threadpool(db_session.commit)
+            await asyncio.sleep(min(check_interval, remaining))
+
     async def delete_run(
         self,
         db_session: sqlalchemy.orm.Session,
@@ -1058,7 +1058,9 @@ def test_list_artifacts_with_time_filters(db: Session, unversioned_client: TestC
     assert len(artifacts) == 0, "since now filter returned artifacts unexpectedly"
 
 
-def test_list_artifacts_with_pagination(db: Session, unversioned_client: TestClient):
+def test_list_artifacts_with_pagination(
+    db: Session, unversioned_client: TestClient, monkeypatch: pytest.MonkeyPatch
+):
     """
     Test list artifacts with pagination.
     Create 25 artifacts, request the first page, then use token to request 2nd and 3rd pages.
@@ -1066,6 +1068,12 @@ def test_list_artifacts_with_pagination(db: Session, unversioned_client: TestCli
     The 4th request with the token will return 404 as the token is now expired.
     Requesting the 4th page without token will return 0 artifacts.
     """
+    # the pagination cache tokens are stateful, keyset tokens are tested in test_list_artifacts_with_keyset_pagination
+    monkeypatch.setattr(
+        mlrun.mlconf.httpdb.pagination.keyset,
+        "mode",
+        mlrun.common.schemas.KeysetPaginationMode.disabled,
+    )
     _create_project(unversioned_client)
 
     # Create artifacts
@@ -1148,6 +1156,49 @@ def test_list_artifacts_with_pagination(db: Session, unversioned_client: TestCli
     assert response.json()["pagination"]["page-token"] is None
 
 
+def test_list_artifacts_with_keyset_pagination(
+    db: Session, unversioned_client: TestClient
+):
+    """
+    Test list artifacts with keyset pagination.
+    Create 15 artifacts, follow the stateless page token to the 2nd page, and verify that the token is rejected by
+    the runs endpoint.
+    """
+    _create_project(unversioned_client)
+    for counter in range(15):
+        artifact_name = f"artifact-{counter}"
+        resp = unversioned_client.put(
+            STORE_API_ARTIFACTS_V2_PATH.format(project=PROJECT) + f"/{artifact_name}",
+            json=_generate_artifact_body(key=artifact_name),
+        )
+        assert resp.status_code == HTTPStatus.OK.value
+
+    page_size = 10
+    artifact_path = LIST_API_ARTIFACTS_V2_PATH.format(project=PROJECT)
+    response = unversioned_client.get(
+        artifact_path, params={"page": 1, "page-size": page_size}
+    )
+    page_token = response.json()["pagination"]["page-token"]
+    assert page_token.startswith("ks1.")
+
+    response = unversioned_client.get(artifact_path, params={"page-token": page_token})
+    services.api.tests.unit.api.utils.assert_pagination_info(
+        response=response,
+        expected_page=2,
+        expected_results_count=5,
+        expected_page_size=page_size,
+        expected_first_result_name="artifact-4",
+        entity_name="artifacts",
+        entity_identifier_name="key",
+    )
+
+    # the token of list artifacts can not be used to list runs
+    response = unversioned_client.get(
+        f"v1/projects/{PROJECT}/runs", params={"page-token": page_token}
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST.value
+
+
 def test_list_artifacts_partition_by(db: Session, unversioned_client: TestClient):
     projects = ["project-1", "project-2"]
     artifact_keys = ["artifact-1", "artifact-2"]
@@ -42,6 +42,7 @@ import mlrun.errors
 import mlrun_pipelines.common.models
 
 import framework.api.utils
+import framework.db.session
 import framework.utils.auth.verifier
 import framework.utils.background_tasks
 import framework.utils.clients.log_collector
@@ -468,6 +469,103 @@ async def test_list_and_get_project_summaries(
     )
 
 
+@pytest.mark.asyncio
+async def test_refresh_project_summaries_incrementally(
+    db: Session, client: TestClient, project_member_mode: str, monkeypatch
+) -> None:
+    monkeypatch.setattr(
+        mlrun.mlconf.monitoring.projects.summaries,
+        "refresh_mode",
+        mlrun.common.schemas.ProjectSummariesRefreshMode.incremental,
+    )
+    monkeypatch.setattr(
+        mlrun.mlconf.monitoring.projects.summaries, "full_refresh_interval", "3600"
+    )
+    # mock alert activations logic as it requires MySQL-specific logic not supported by SQLite.
+    monkeypatch.setattr(
+        framework.utils.singletons.db.SQLDB,
+        "_calculate_alert_activations_counters",
+        unittest.mock.Mock(return_value=({}, {}, {})),
+    )
+    project_name = "project-with-resources"
+    other_project_name = "other-project"
+    _create_project(client, project_name)
+    _create_project(client, other_project_name)
+    _create_artifacts(client, project_name, 2, mlrun.artifacts.PlotArtifact.kind)
+
+    db_instance = framework.utils.singletons.db.get_db()
+    get_project_resources_counters = unittest.mock.Mock(
+        wraps=db_instance.get_project_resources_counters
+    )
+    monkeypatch.setattr(
+        db_instance, "get_project_resources_counters", get_project_resources_counters
+    )
+    projects_crud = services.api.crud.Projects()
+
+    def _refreshed_projects():
+        return get_project_resources_counters.call_args.args[1]
+
+    def _files_count(name):
+        response = client.get(f"project-summaries/{name}")
+        return mlrun.common.schemas.ProjectSummary(**response.json()).files_count
+
+    # the first refresh is a full one
+    monkeypatch.setattr(
+        projects_crud, "_last_full_summaries_refresh", None, raising=False
+    )
+    await projects_crud.refresh_project_resources_counters_cache(db)
+    assert _refreshed_projects() is None
+    assert _files_count(project_name) == 2
+
+    # nothing changed, no project is recalculated
+    await projects_crud.refresh_project_resources_counters_cache(db)
+    assert _refreshed_projects() == []
+
+    # only the modified project is recalculated, the other keeps its summary
+    _create_artifacts(client, project_name, 3, mlrun.artifacts.PlotArtifact.kind)
+    await projects_crud.refresh_project_resources_counters_cache(db)
+    assert _refreshed_projects() == [project_name]
+    assert _files_count(project_name) == 3
+    assert _files_count(other_project_name) == 0
+
+    # a failed refresh leaves the modified project to the next refresh
+    _create_artifacts(client, other_project_name, 1, mlrun.artifacts.PlotArtifact.kind)
+    with unittest.mock.patch.object(
+        db_instance,
+        "refresh_project_summaries",
+        side_effect=RuntimeError("failed storing the summaries"),
+    ):
+        with pytest.raises(RuntimeError):
+            await projects_crud.refresh_project_resources_counters_cache(db)
+    await projects_crud.refresh_project_resources_counters_cache(db)
+    assert _refreshed_projects() == [other_project_name]
+    assert _files_count(other_project_name) == 1
+
+    # a project which is modified while its counters are calculated is recalculated again by the next refresh
+    _create_artifacts(client, project_name, 1, mlrun.artifacts.PlotArtifact.kind)
+
+    async def _get_counters_with_concurrent_write(*args, **kwargs):
+        counters = await get_project_resources_counters(*args, **kwargs)
+        write_session = framework.db.session.create_session()
+        try:
+            db_instance._mark_project_summaries_dirty(write_session, project_name)
+            write_session.commit()
+        finally:
+            framework.db.session.close_session(write_session)
+        return counters
+
+    with unittest.mock.patch.object(
+        db_instance,
+        "get_project_resources_counters",
+        side_effect=_get_counters_with_concurrent_write,
+    ):
+        await projects_crud.refresh_project_resources_counters_cache(db)
+    await projects_crud.refresh_project_resources_counters_cache(db)
+    assert _refreshed_projects() == [project_name]
+    await projects_crud.refresh_project_resources_counters_cache(db)
+    assert _refreshed_projects() == []
+
+
 @pytest.mark.asyncio
 async def test_list_project_summaries_different_installation_modes(
     db: Session, client: TestClient, project_member_mode: str
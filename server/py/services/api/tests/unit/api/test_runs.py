@@ -21,6 +21,8 @@ from datetime import datetime, timedelta, timezone
 from http import HTTPStatus
 
 import fastapi
+import orjson
+import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
@@ -32,6 +34,7 @@ from mlrun.config import config
 import framework.utils.auth.verifier
 import framework.utils.background_tasks
 import services.api.crud
+import services.api.utils.pagination
 from framework.db.sqldb.models import Run
 from framework.utils.singletons.db import get_db
 
@@ -578,7 +581,9 @@ def test_list_runs_single_and_multiple_uids(db: Session, client: TestClient):
         expected_uids.remove(run["metadata"]["uid"])
 
 
-def test_list_runs_with_pagination(db: Session, client: TestClient):
+def test_list_runs_with_pagination(
+    db: Session, client: TestClient, monkeypatch: pytest.MonkeyPatch
+):
     """
     Test list runs with pagination.
     Create 25 runs, request the first page, then use token to request 2nd and 3rd pages.
@@ -586,6 +591,13 @@ def test_list_runs_with_pagination(db: Session, client: TestClient):
     The 4th request with the token will return 404 as the token is now expired.
     Requesting the 4th page without token will return 0 runs.
     """
+    # the pagination cache tokens are stateful, keyset tokens are tested in test_list_runs_with_keyset_pagination
+    monkeypatch.setattr(
+        config.httpdb.pagination.keyset,
+        "mode",
+        mlrun.common.schemas.KeysetPaginationMode.disabled,
+    )
+
     # Create runs
     number_of_runs = 25
     project = "my_project"
@@ -664,6 +676,150 @@ def test_list_runs_with_pagination(db: Session, client: TestClient):
     assert not runs
 
 
+def test_list_runs_with_keyset_pagination(db: Session, client: TestClient):
+    """
+    Test list runs with keyset pagination.
+    Create 25 runs, and iterate the pages by following the stateless page tokens while new runs are created.
+    Then verify that a token can still be used to request a specific page.
+    """
+    number_of_runs = 25
+    project = "my_project"
+    for counter in range(number_of_runs):
+        _store_run(db, uid=f"uid_{counter}", project=project, name=f"run_{counter}")
+
+    runs, pagination = _list_and_assert_objects(
+        client, {"page": 1, "page-size": 10}, 10, project=project
+    )
+    assert pagination["page"] == 1
+    assert runs[0]["metadata"]["name"] == "run_24"
+    first_page_token = pagination["page-token"]
+    # keyset tokens are not signed, so they are not bound to the user which requested them
+    paginator = services.api.utils.pagination.Paginator()
+    assert "user" not in paginator._decode_keyset_token(first_page_token, "list_runs")
+
+    # a token is only honored by the method it was issued for
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+        paginator._decode_keyset_token(first_page_token, "list_artifacts")
+
+    # runs that are created while paginating are not shifting the pages
+    _store_run(db, uid="uid_new", project=project, name="run_new")
+
+    runs, pagination = _list_and_assert_objects(
+        client, {"page-token": first_page_token}, 10, project=project
+    )
+    assert pagination["page"] == 2
+    assert pagination["page-size"] == 10
+    assert runs[0]["metadata"]["name"] == "run_14"
+
+    runs, pagination = _list_and_assert_objects(
+        client, {"page-token": pagination["page-token"]}, 5, project=project
+    )
+    assert pagination["page"] == 3
+    assert pagination["page-token"] is None
+    assert [run["metadata"]["name"] for run in runs] == [
+        f"run_{counter}" for counter in range(4, -1, -1)
+    ]
+
+    # requesting a page other than the next one falls back to the offset
+    runs, pagination = _list_and_assert_objects(
+        client, {"page-token": first_page_token, "page": 3}, 6, project=project
+    )
+    assert pagination["page"] == 3
+    assert runs[0]["metadata"]["name"] == "run_5"
+
+    response = client.get(
+        RUNS_API_ENDPOINT.format(project=project), params={"page-token": "ks1.invalid"}
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST.value
+
+
+def test_list_runs_stream(
+    db: Session, client: TestClient, monkeypatch: pytest.MonkeyPatch
+):
+    number_of_runs = 7
+    project = "my_project"
+    for counter in range(number_of_runs):
+        _store_run(db, uid=f"uid_{counter}", project=project, name=f"run_{counter}")
+
+    # make the runs being retrieved from the db in multiple batches
+    monkeypatch.setattr(config.httpdb.pagination, "stream_batch_size", 3)
+    headers = {"Accept": mlrun.common.schemas.MediaTypes.ndjson}
+    response = client.get(
+        RUNS_API_ENDPOINT.format(project=project),
+        params={"name": "~run"},
+        headers=headers,
+    )
+    assert response.status_code == HTTPStatus.OK.value, response.text
+    assert response.headers["content-type"].startswith(
+        mlrun.common.schemas.MediaTypes.ndjson
+    )
+    runs = [orjson.loads(line) for line in response.text.splitlines()]
+    assert [run["metadata"]["name"] for run in runs] == [
+        f"run_{counter}" for counter in reversed(range(number_of_runs))
+    ]
+
+    response = client.get(
+        RUNS_API_ENDPOINT.format(project=project),
+        params={"name": "~run", "page-size": 3},
+        headers=headers,
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST.value
+
+
+def test_list_runs_states(
+    db: Session, client: TestClient, monkeypatch: pytest.MonkeyPatch
+):
+    project = "my_project"
+    running = mlrun.common.runtimes.constants.RunStates.running
+    for counter in range(3):
+        uid = f"uid_{counter}"
+        run = {
+            "metadata": {"name": f"run_{counter}", "uid": uid, "project": project},
+            "status": {"state": running},
+        }
+        services.api.crud.Runs().store_run(db, run, uid, project=project)
+
+    endpoint = f"/projects/{project}/runs-states"
+    response = client.post(endpoint, json={"uids": ["uid_0", "uid_1", "uid_xx"]})
+    assert response.status_code == HTTPStatus.OK.value, response.text
+    runs_states = {run["uid"]: run for run in response.json()["runs"]}
+    assert set(runs_states) == {"uid_0", "uid_1"}
+    for run_state in runs_states.values():
+        assert run_state["state"] == running
+        assert run_state["last_update"]
+
+    # no run changes its state - the request waits until the timeout
+    monkeypatch.setattr(config.httpdb.runs_states, "wait_check_interval", 0.1)
+    body = {
+        "uids": ["uid_0", "uid_1"],
+        "known_states": {"uid_0": running, "uid_1": running},
+        "timeout": 1,
+    }
+    start_time = time.monotonic()
+    response = client.post(endpoint, json=body)
+    assert response.status_code == HTTPStatus.OK.value, response.text
+    assert time.monotonic() - start_time >= 1
+
+    # a run changed its state - the request returns without waiting
+    services.api.crud.Runs().update_run(
+        db,
+        project,
+        "uid_1",
+        0,
+        {"status.state": mlrun.common.runtimes.constants.RunStates.completed},
+    )
+    body["timeout"] = 30
+    start_time = time.monotonic()
+    response = client.post(endpoint, json=body)
+    assert response.status_code == HTTPStatus.OK.value, response.text
+    assert time.monotonic() - start_time < 5
+    runs_states = {run["uid"]: run["state"] for run in response.json()["runs"]}
+    assert runs_states == {
+        "uid_0": running,
+        "uid_1": mlrun.common.runtimes.constants.RunStates.completed,
+    }
+
+
 def test_delete_runs_with_permissions(db: Session, client: TestClient):
     framework.utils.auth.verifier.AuthVerifier().query_project_resource_permissions = (
         unittest.mock.AsyncMock()
@@ -34,6 +34,7 @@ from mlrun.artifacts.model import ModelArtifact
 from mlrun.artifacts.plots import PlotArtifact, PlotlyArtifact
 from mlrun.common.schemas.artifact import ArtifactCategories
 
+import framework.db.sqldb.helpers
 import framework.db.sqldb.models
 import services.api.initial_data
 from framework.db.sqldb.models import ArtifactV2
@@ -1346,6 +1347,52 @@ class TestArtifacts(TestDatabaseBase):
                 artifact_name == expected_name
             ), f"Expected {expected_name}, got {artifact_name}"
 
+    def test_list_artifacts_with_keyset_page(self):
+        project = "artifact_project"
+        number_of_artifacts = 10
+        for counter in range(number_of_artifacts):
+            artifact_key = f"artifact-{counter}"
+            artifact_body = self._generate_artifact(artifact_key, project=project)
+            self._db.store_artifact(
+                self._db_session, artifact_key, artifact_body, project=project
+            )
+
+        # every artifact has the "latest" tag as well, so each artifact row is listed twice
+        self._db.tag_artifacts(
+            self._db_session,
+            "v1",
+            self._db.list_artifacts(self._db_session, project=project, as_records=True),
+            project,
+        )
+        expected_artifacts = [
+            (f"artifact-{counter}", tag)
+            for counter in reversed(range(number_of_artifacts))
+            for tag in ["latest", "v1"]
+        ]
+
+        page_size = 3
+        keyset_after = None
+        listed_artifacts = []
+        while True:
+            keyset_page = framework.db.sqldb.helpers.KeysetPage(after=keyset_after)
+            artifacts = self._db.list_artifacts(
+                self._db_session,
+                project=project,
+                offset=0,
+                limit=page_size,
+                keyset_page=keyset_page,
+            )
+            assert len(keyset_page.row_keys) == len(artifacts)
+            listed_artifacts.extend(
+                (artifact["metadata"]["key"], artifact["metadata"]["tag"])
+                for artifact in artifacts
+            )
+            if len(artifacts) < page_size:
+                break
+            keyset_after = keyset_page.row_keys[-1]
+
+        assert listed_artifacts == expected_artifacts
+
     def test_list_artifacts_producer_uri(self):
         project = "artifact_project"
         artifact_key = "dummy-artifact"
@@ -17,6 +17,7 @@ from datetime import datetime, timezone
 
 import pytest
 
+import mlrun
 import mlrun.common.runtimes.constants
 import mlrun.common.schemas
 import mlrun.model
@@ -57,6 +58,36 @@ class TestRuns(TestDatabaseBase):
         runs = self._db.list_runs(self._db_session, name="~RUN_naMe", project=project)
         assert len(runs) == 2
 
+    def test_list_runs_query_cache(self):
+        project = "project"
+        self._db.store_run(
+            self._db_session, {"metadata": {"name": "run-1"}}, "uid1", project
+        )
+        mlrun.mlconf.httpdb.query_cache.mode = (
+            mlrun.common.schemas.QueryCacheMode.enabled
+        )
+        runs = self._db.list_runs(self._db_session, project=project)
+        assert len(runs) == 1
+        runs = self._db.list_runs(self._db_session, project=project)
+        assert len(runs) == 1
+        cache_info = self._db.get_query_result_cache_info()
+        assert cache_info.hits == 1
+        assert cache_info.misses == 1
+
+        # writing to the project invalidates the cached result
+        self._db.store_run(
+            self._db_session, {"metadata": {"name": "run-2"}}, "uid2", project
+        )
+        runs = self._db.list_runs(self._db_session, project=project)
+        assert len(runs) == 2
+
+        self._db.del_run(self._db_session, "uid1", project)
+        runs = self._db.list_runs(self._db_session, project=project)
+        assert len(runs) == 1
+        cache_info = self._db.get_query_result_cache_info()
+        assert cache_info.hits == 1
+        assert cache_info.invalidations == 2
+
     def test_runs_with_notifications(self):
         project_name = "project"
         run_uids = ["uid1", "uid2", "uid3"]
@@ -0,0 +1,119 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import unittest.mock
+
+import mlrun.common.schemas
+
+import framework.utils.query_cache
+
+
+def test_query_cache_hit_and_copy():
+    query_cache = framework.utils.query_cache.QueryResultCache()
+    func = unittest.mock.Mock(return_value=[{"name": "a"}])
+
+    result = query_cache.get_or_compute("runs", "p1", {"project": "p1"}, func)
+    result[0]["name"] = "mutated"
+    result = query_cache.get_or_compute("runs", "p1", {"project": "p1"}, func)
+
+    assert func.call_count == 1
+    # cached results are copies, mutating a result does not affect the cache
+    assert result == [{"name": "a"}]
+    info = query_cache.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+    assert info.currsize == 1
+
+
+def test_query_cache_key_normalization():
+    query_cache = framework.utils.query_cache.QueryResultCache()
+    func = unittest.mock.Mock(return_value=[])
+
+    query_cache.get_or_compute(
+        "runs",
+        "p1",
+        {
+            "project": "p1",
+            "labels": ["a", "b"],
+            "partition_order": mlrun.common.schemas.OrderType.desc,
+        },
+        func,
+    )
+    query_cache.get_or_compute(
+        "runs",
+        "p1",
+        {"partition_order": "desc", "labels": ["b", "a"], "project": "p1"},
+        func,
+    )
+    assert func.call_count == 1
+
+
+def test_query_cache_invalidation():
+    query_cache = framework.utils.query_cache.QueryResultCache()
+    func = unittest.mock.Mock(return_value=[])
+
+    query_cache.get_or_compute("runs", "p1", {"project": "p1"}, func)
+    query_cache.get_or_compute("runs", "p2", {"project": "p2"}, func)
+    query_cache.get_or_compute("runs", "*", {"project": "*"}, func)
+    query_cache.get_or_compute("artifacts", "p1", {"project": "p1"}, func)
+    assert func.call_count == 4
+
+    # writes to p1 runs invalidate p1 runs and the cross project query only
+    query_cache.invalidate("runs", "p1")
+    query_cache.get_or_compute("runs", "p1", {"project": "p1"}, func)
+    query_cache.get_or_compute("runs", "p2", {"project": "p2"}, func)
+    query_cache.get_or_compute("runs", "*", {"project": "*"}, func)
+    query_cache.get_or_compute("artifacts", "p1", {"project": "p1"}, func)
+    assert func.call_count == 6
+    assert query_cache.cache_info().invalidations == 2
+
+    # writes without a project invalidate the whole namespace
+    query_cache.invalidate("runs")
+    assert query_cache.cache_info().currsize == 1
+
+
+def test_query_cache_write_during_query_is_not_cached():
+    query_cache = framework.utils.query_cache.QueryResultCache()
+
+    def _query_with_concurrent_write():
+        query_cache.invalidate("runs", "p1")
+        return []
+
+    query_cache.get_or_compute(
+        "runs", "p1", {"project": "p1"}, _query_with_concurrent_write
+    )
+    assert query_cache.cache_info().currsize == 0
+
+
+def test_query_cache_ttl_and_bounds():
+    query_cache = framework.utils.query_cache.QueryResultCache(ttl=0, maxsize=2)
+    func = unittest.mock.Mock(return_value=[])
+
+    query_cache.get_or_compute("runs", "p1", {"project": "p1"}, func)
+    query_cache.get_or_compute("runs", "p1", {"project": "p1"}, func)
+    assert func.call_count == 2
+    assert query_cache.cache_info().expirations == 1
+
+    query_cache.ttl = 60
+    for project in ["p1", "p2", "p3"]:
+        query_cache.get_or_compute("runs", project, {"project": project}, func)
+    info = query_cache.cache_info()
+    assert info.currsize == 2
+    assert info.evictions == 1
+
+    # results larger than the memory bound are not cached
+    query_cache.max_size_bytes = 10
+    query_cache.cache_clear()
+    query_cache.get_or_compute("runs", "p1", {"project": "p1"}, lambda: ["x" * 100])
+    assert query_cache.cache_info().currsize == 0
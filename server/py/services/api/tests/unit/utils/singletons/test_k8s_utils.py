@@ -284,6 +284,38 @@ def test_delete_secrets(
         assert data == expected_secret_data
 
 
+def test_secrets_cache(k8s_helper):
+    k8s_helper.v1api.read_namespaced_secret.return_value = unittest.mock.MagicMock(
+        data={"key1": "dmFsdWUx"}
+    )
+    for _ in range(3):
+        assert k8s_helper.get_secret_data("my-secret") == {"key1": "value1"}
+        assert k8s_helper.read_secret_data("my-secret") == {"key1": "value1"}
+    k8s_helper.v1api.read_namespaced_secret.assert_called_once_with(
+        "my-secret", k8s_helper.namespace
+    )
+
+    # the helper's own writes invalidate the cached secret
+    k8s_helper.delete_secrets("my-secret", ["key1", "key2"])
+    k8s_helper.v1api.read_namespaced_secret.return_value = unittest.mock.MagicMock(
+        data={"key2": "dmFsdWUy"}
+    )
+    assert k8s_helper.get_secret_data("my-secret") == {"key2": "value2"}
+
+    # a secret that failed to be read is not cached
+    k8s_helper.v1api.read_namespaced_secret.side_effect = k8s_client_rest.ApiException(
+        status=404
+    )
+    assert k8s_helper.get_secret_data("other-secret") == {}
+    assert k8s_helper.read_secret_data("other-secret", silent=True) is None
+
+    info = k8s_helper.secrets_cache_info()
+    assert info.hits == 5
+    assert info.misses == 4
+    assert info.invalidations == 1
+    assert info.currsize == 1
+
+
 @pytest.mark.parametrize(
     "side_effect, expectation, expected_result",
     [
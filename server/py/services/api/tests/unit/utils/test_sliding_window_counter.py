@@ -0,0 +1,75 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import datetime
+
+from framework.utils.sliding_window_counter import SlidingWindowCounter
+
+start = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def _after(seconds: int) -> datetime.datetime:
+    return start + datetime.timedelta(seconds=seconds)
+
+
+def test_sliding_window_counter():
+    counter = SlidingWindowCounter(datetime.timedelta(minutes=1), buckets=6)
+    for second in range(0, 60, 5):
+        counter.add(_after(second))
+    assert counter.count(_after(59)) == 12
+
+    # the first bucket (0-10 seconds) is still partially in the window
+    assert counter.count(_after(65)) == 12
+    # events leave the window together with their bucket
+    assert counter.count(_after(70)) == 10
+    assert counter.count(_after(100)) == 4
+
+    # a late event that is out of the window is ignored
+    counter.add(_after(10))
+    assert counter.count(_after(100)) == 4
+
+    # a gap longer than the window expires all the events
+    assert counter.count(_after(1000)) == 0
+    counter.add(_after(1000), count=3)
+    assert counter.count(_after(1000)) == 3
+
+
+def test_sliding_window_counter_without_window():
+    counter = SlidingWindowCounter()
+    counter.add(_after(0))
+    counter.add(_after(10000), count=2)
+    assert counter.count(_after(100000)) == 3
+
+    restored = SlidingWindowCounter.from_dict(counter.to_dict())
+    assert restored.count() == 3
+
+
+def test_sliding_window_counter_snapshot():
+    window = datetime.timedelta(minutes=10)
+    counter = SlidingWindowCounter(window, buckets=10)
+    for second in range(0, 600, 30):
+        counter.add(_after(second))
+
+    snapshot = counter.to_dict()
+    assert len(snapshot["buckets"]) == 10
+
+    restored = SlidingWindowCounter.from_dict(snapshot, window, buckets=10)
+    assert restored.count(_after(599)) == 20
+    assert restored.count(_after(660)) == 18
+
+    # a snapshot of a different window is ignored
+    restored = SlidingWindowCounter.from_dict(
+        snapshot, datetime.timedelta(minutes=5), buckets=10
+    )
+    assert restored.count(_after(599)) == 0
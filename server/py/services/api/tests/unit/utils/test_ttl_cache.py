@@ -0,0 +1,70 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import unittest.mock
+
+import framework.utils.ttl_cache
+
+
+def test_ttl_cache():
+    cache = framework.utils.ttl_cache.TTLCache(ttl=10, maxsize=2)
+    loader = unittest.mock.Mock(side_effect=lambda: "value")
+
+    with unittest.mock.patch("time.monotonic", return_value=100):
+        assert cache.get("a", loader) == "value"
+        assert cache.get("a", loader) == "value"
+        assert loader.call_count == 1
+
+        # a value of None is not cached
+        assert cache.get("b", lambda: None) is None
+        assert cache.get("b", loader) == "value"
+
+        # the least recently used value is evicted
+        cache.get("c", loader)
+        assert list(cache.cache.keys()) == ["b", "c"]
+
+    # the values expire after the ttl
+    with unittest.mock.patch("time.monotonic", return_value=110):
+        cache.get("c", loader)
+    assert loader.call_count == 4
+
+    cache.invalidate("c")
+    assert "c" not in cache.cache
+
+    info = cache.cache_info()
+    assert info.hits == 1
+    assert info.misses == 5
+    assert info.evictions == 1
+    assert info.invalidations == 1
+    assert info.currsize == 1
+
+
+def test_ttl_cache_invalidated_while_loading():
+    cache = framework.utils.ttl_cache.TTLCache(ttl=10)
+
+    def loader():
+        # e.g. the value was updated while it was read
+        cache.invalidate("a")
+        return "stale value"
+
+    assert cache.get("a", loader) == "stale value"
+    assert cache.get("a", lambda: "value") == "value"
+    assert cache.get("a", lambda: "other value") == "value"
+
+
+def test_ttl_cache_disabled():
+    cache = framework.utils.ttl_cache.TTLCache(ttl=0)
+    cache.get("a", lambda: "value")
+    assert cache.get("a", lambda: "other value") == "other value"
+    assert cache.cache_info().currsize == 0
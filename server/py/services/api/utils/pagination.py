@@ -12,12 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import base64
+import binascii
 import inspect
 import typing
+import zlib
 
 import orjson
 import pydantic.v1
 import sqlalchemy.orm
+from fastapi.concurrency import run_in_threadpool
 
 import mlrun.common.schemas
 import mlrun.errors
@@ -25,6 +29,8 @@ import mlrun.utils.singleton
 from mlrun import mlconf
 from mlrun.utils import logger
 
+import framework.db.session
+import framework.db.sqldb.helpers
 import framework.utils.asyncio
 import services.alerts.crud
 import services.api.crud
@@ -67,6 +73,11 @@ class PaginatedMethods:
         services.api.crud.Artifacts().list_artifacts,
         services.alerts.crud.AlertActivation().list_alert_activations,
     ]
+    # methods which accept a keyset_page and can be paginated with stateless keyset tokens
+    _keyset_methods: list[typing.Callable] = [
+        services.api.crud.Runs().list_runs,
+        services.api.crud.Artifacts().list_artifacts,
+    ]
     _method_map = {
         method.__name__: {
             "method": method,
@@ -80,6 +91,11 @@ class PaginatedMethods:
         method_name = method if isinstance(method, str) else method.__name__
         return method_name in cls._method_map
 
+    @classmethod
+    def method_supports_keyset(cls, method: typing.Union[str, typing.Callable]) -> bool:
+        method_name = method if isinstance(method, str) else method.__name__
+        return method_name in [method.__name__ for method in cls._keyset_methods]
+
     @classmethod
     def get_method(cls, method_name: str) -> typing.Callable:
         return cls._method_map[method_name]["method"]
@@ -90,6 +106,8 @@ class PaginatedMethods:
 
 
 class Paginator(metaclass=mlrun.utils.singleton.Singleton):
+    keyset_token_prefix = "ks1."
+
     def __init__(self):
         self._logger = logger.get_child("paginator")
         self._pagination_cache = services.api.crud.PaginationCache()
@@ -137,10 +155,46 @@ class Paginator(metaclass=mlrun.utils.singleton.Singleton):
 
             last_pagination_info = pagination_info
             current_page = last_pagination_info.page + 1
+            # keyset tokens are stateless, continue from the latest one so the cursor of the last page is used
+            token = last_pagination_info.page_token or token
             page_size = last_pagination_info.page_size
 
         return result, last_pagination_info.dict(by_alias=True)
 
+    async def stream_permission_filtered_request(
+        self,
+        iterate_method: typing.Callable,
+        filter_: typing.Callable,
+        **method_kwargs,
+    ) -> typing.AsyncIterator[bytes]:
+        """
+        Stream the results of a request as newline-delimited JSON (one object per line), filtered by the provided
+        filter function. The objects are retrieved and filtered in batches (see iterate_method), so the memory usage
+        does not depend on the size of the result.
+        The streaming outlives the request's DB session, therefore it uses a session of its own.
+        """
+        session = await run_in_threadpool(framework.db.session.create_session)
+        try:
+            batches = iterate_method(session, **method_kwargs)
+            while True:
+                batch = await run_in_threadpool(next, batches, None)
+                if batch is None:
+                    break
+                batch = await framework.utils.asyncio.await_or_call_in_threadpool(
+                    filter_, batch
+                )
+                if batch:
+                    yield b"".join(
+                        orjson.dumps(
+                            item,
+                            # run results may be keyed by non string (e.g. iteration) keys
+                            option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+                        )
+                        for item in batch
+                    )
+        finally:
+            await run_in_threadpool(framework.db.session.close_session, session)
+
     async def paginate_request(
         self,
         session: sqlalchemy.orm.Session,
@@ -169,6 +223,16 @@ class Paginator(metaclass=mlrun.utils.singleton.Singleton):
 
         page_size = page_size or mlconf.httpdb.pagination.default_page_size
 
+        if self._is_keyset_pagination(method, token):
+            return await self._paginate_request_by_keyset(
+                session,
+                method,
+                token,
+                page,
+                page_size,
+                **method_kwargs,
+            )
+
         (
             token,
             page,
@@ -214,6 +278,132 @@ class Paginator(metaclass=mlrun.utils.singleton.Singleton):
         items = items[:page_size]
         return items, pagination_info
 
+    async def _paginate_request_by_keyset(
+        self,
+        session: sqlalchemy.orm.Session,
+        method: typing.Callable,
+        token: typing.Optional[str] = None,
+        page: typing.Optional[int] = None,
+        page_size: typing.Optional[int] = None,
+        **method_kwargs,
+    ) -> tuple[
+        typing.Any, typing.Optional[mlrun.common.schemas.pagination.PaginationInfo]
+    ]:
+        """
+        Paginate a request using a stateless keyset token.
+        The token holds the request itself along with the sort key values of the last item of the page (the cursor),
+        so the next page is retrieved by a single query which continues right after the cursor, regardless of the page
+        number. Requesting any other page (e.g. going back) falls back to offset pagination.
+        Keyset tokens are not signed and carry no user, so they are not bound to the user which requested them -
+        a token only encodes a request which the client could make anyway, and the returned items are permission
+        filtered for the requesting user like any other list request.
+        """
+        cursor = None
+        if token:
+            self._logger.debug("Keyset token provided, decoding it")
+            token_payload = self._decode_keyset_token(token, method.__name__)
+            method_kwargs = token_payload["kwargs"]
+            page_size = token_payload["page_size"]
+            next_page = token_payload["page"] + 1
+            page = page or next_page
+            if page == next_page:
+                cursor = token_payload.get("cursor")
+
+        page = page or 1
+        method_schema = PaginatedMethods.get_method_schema(method.__name__)
+        kwargs_schema = method_schema(**method_kwargs)
+        kwargs_schema.offset = None
+        kwargs_schema.limit = None
+        kwargs_schema.keyset_page = None
+
+        self._logger.debug(
+            "Retrieving page by keyset",
+            page=page,
+            page_size=page_size,
+            method=method.__name__,
+            with_cursor=cursor is not None,
+        )
+        offset, limit = self._calculate_offset_and_limit(page, page_size)
+        keyset_page = framework.db.sqldb.helpers.KeysetPage(after=cursor)
+        items = await framework.utils.asyncio.await_or_call_in_threadpool(
+            method,
+            session,
+            **kwargs_schema.dict(exclude_none=True),
+            offset=offset,
+            limit=limit,
+            keyset_page=keyset_page,
+        )
+
+        if len(items) == 0:
+            return [], None
+
+        pagination_info = mlrun.common.schemas.pagination.PaginationInfo(
+            page=page, page_size=page_size
+        )
+        if len(items) > page_size:
+            # there are more items, the token of the next page continues after the last item of this page
+            # if the query could not be paginated by keyset, the next page falls back to the offset
+            next_cursor = (
+                keyset_page.row_keys[page_size - 1] if keyset_page.row_keys else None
+            )
+            if next_cursor and None in next_cursor:
+                next_cursor = None
+            pagination_info.page_token = self._encode_keyset_token(
+                {
+                    "method": method.__name__,
+                    "kwargs": orjson.loads(kwargs_schema.json(exclude_none=True)),
+                    "page": page,
+                    "page_size": page_size,
+                    "cursor": next_cursor,
+                }
+            )
+
+        # truncate the items to the page size
+        items = items[:page_size]
+        return items, pagination_info
+
+    def _is_keyset_pagination(
+        self, method: typing.Callable, token: typing.Optional[str]
+    ) -> bool:
+        if token:
+            # tokens are self-describing, keyset tokens are honored even if keyset pagination was disabled since
+            return token.startswith(self.keyset_token_prefix)
+        return (
+            mlconf.httpdb.pagination.keyset.mode
+            == mlrun.common.schemas.KeysetPaginationMode.enabled
+            and PaginatedMethods.method_supports_keyset(method)
+        )
+
+    def _encode_keyset_token(self, payload: dict) -> str:
+        encoded_payload = base64.urlsafe_b64encode(
+            zlib.compress(orjson.dumps(payload))
+        ).decode()
+        return f"{self.keyset_token_prefix}{encoded_payload}"
+
+    def _decode_keyset_token(self, token: str, method_name: str) -> dict:
+        """Decode a keyset token, which must have been issued by a request of the given method"""
+        try:
+            payload = orjson.loads(
+                zlib.decompress(
+                    base64.urlsafe_b64decode(
+                        token.removeprefix(self.keyset_token_prefix)
+                    )
+                )
+            )
+        except (binascii.Error, zlib.error, orjson.JSONDecodeError) as exc:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"Invalid page token {token}"
+            ) from exc
+
+        if not PaginatedMethods.method_supports_keyset(payload.get("method", "")):
+            raise mlrun.errors.MLRunInvalidArgumentError(f"Invalid page token {token}")
+        if payload["method"] != method_name:
+            # e.g. a token of list artifacts which is used to list runs
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"Page token {token} was not issued for {method_name}"
+            )
+        return payload
+
     def _create_or_update_pagination_cache_record(
         self,
         session: sqlalchemy.orm.Session,
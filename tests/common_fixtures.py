@@ -43,6 +43,7 @@ import mlrun.k8s_utils
 import mlrun.launcher.factory
 import mlrun.projects.project
 import mlrun.utils
+import mlrun.utils.notifications.notification.transport
 import mlrun.utils.singleton
 from mlrun import new_function
 from mlrun.common.schemas import ModelMonitoringMode
@@ -73,6 +74,8 @@ def config_test_base():
     environ["MLRUN_HTTPDB__PROJECTS__PERIODIC_SYNC_INTERVAL"] = "0 seconds"
     environ["MLRUN_HTTPDB__PROJECTS__COUNTERS_CACHE_TTL"] = "0 seconds"
     environ["MLRUN_EXEC_CONFIG"] = ""
+    # the resolved project functions should not be reused between tests
+    environ["MLRUN_PROJECT_FUNCTIONS__CACHE_ENABLED"] = "false"
     global_context.set(None)
     log_level = "DEBUG"
     environ["MLRUN_LOG_LEVEL"] = log_level
@@ -93,6 +96,12 @@ def config_test_base():
     # remove the is_running_as_api cache, so it won't pass between tests
     mlrun.config._is_running_as_api = None
     # remove singletons in case they were changed (we don't want changes to pass between tests)
+    notification_transport = mlrun.utils.singleton.Singleton._instances.get(
+        mlrun.utils.notifications.notification.transport.NotificationTransport
+    )
+    if notification_transport is not None:
+        # close the pooled session of the previous test
+        notification_transport.stop()
     mlrun.utils.singleton.Singleton._instances = {}
 
     mlrun.runtimes.runtime_handler_instances_cache = {}
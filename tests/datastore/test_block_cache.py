@@ -0,0 +1,126 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import pandas as pd
+import pytest
+
+import mlrun
+from mlrun.datastore.base import DataItem
+from mlrun.datastore.filestore import FileStore
+
+
+class RemoteStore(FileStore):
+    """A file store that is treated as a remote store, and counts its reads"""
+
+    def __init__(self):
+        super().__init__(None, "remote", "remote")
+        self.kind = "remote"
+        self.reads = []
+
+    def get(self, key, size=None, offset=0):
+        self.reads.append((offset, size))
+        return super().get(key, size=size, offset=offset)
+
+    def download(self, key, target_path):
+        self.reads.append("download")
+        return super().download(key, target_path)
+
+
+@pytest.fixture
+def cache_config(tmp_path):
+    cache_config = mlrun.mlconf.storage.cache
+    old_config = cache_config.to_dict()
+    cache_config.enabled = True
+    cache_config.path = str(tmp_path / "cache")
+    cache_config.block_size = 100
+    yield cache_config
+    mlrun.mlconf.storage.cache = old_config
+
+
+def _data_item(file_path, store) -> DataItem:
+    return DataItem(os.path.basename(file_path), store, str(file_path), str(file_path))
+
+
+def test_block_cache_get(tmp_path, cache_config):
+    file_path = tmp_path / "data.bin"
+    data = os.urandom(450)
+    file_path.write_bytes(data)
+    store = RemoteStore()
+
+    assert _data_item(file_path, store).get(size=100, offset=150) == data[150:250]
+    assert store.reads == [(100, 100), (200, 100)]
+
+    # the cache is shared by the data items of the object
+    data_item = _data_item(file_path, store)
+    assert data_item.get(size=150, offset=180) == data[180:330]
+    assert store.reads[2:] == [(300, 100)]
+    assert data_item.get() == data
+    assert store.reads[3:] == [(0, 100), (400, 50)]
+    assert data_item.get(offset=440, size=100) == data[440:]
+    assert len(store.reads) == 5
+
+    # a modified object is a new version in the cache
+    file_path.write_bytes(data[:200])
+    assert _data_item(file_path, store).get(offset=150) == data[150:200]
+    assert store.reads[5:] == [(100, 100)]
+
+
+def test_block_cache_local(tmp_path, cache_config):
+    file_path = tmp_path / "data.csv"
+    df = pd.DataFrame({"a": range(100), "b": range(100, 200)})
+    df.to_csv(file_path, index=False)
+    store = RemoteStore()
+
+    data_item = _data_item(file_path, store)
+    local_path = data_item.local()
+    assert local_path.startswith(cache_config.path)
+    assert local_path.endswith(".csv")
+    data_item.remove_local()
+    assert os.path.exists(local_path)
+
+    data_item = _data_item(file_path, store)
+    pd.testing.assert_frame_equal(data_item.as_df(), df)
+    with data_item.open("r") as file_obj:
+        assert file_obj.readline() == "a,b\n"
+    # the cached copy also serves the byte range reads
+    assert data_item.get(size=3, encoding="utf-8") == "a,b"
+    assert store.reads == ["download"]
+
+
+def test_block_cache_eviction(tmp_path, cache_config):
+    cache_config.max_size = 300
+    store = RemoteStore()
+    file_paths = []
+    for index in range(5):
+        file_path = tmp_path / f"data-{index}.bin"
+        file_path.write_bytes(os.urandom(100))
+        file_paths.append(file_path)
+        _data_item(file_path, store).get()
+
+    cached_sizes = [
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(cache_config.path)
+        for name in names
+    ]
+    assert sum(cached_sizes) == 300
+
+    # the least recently used objects were evicted
+    store.reads.clear()
+    for file_path in file_paths[2:]:
+        _data_item(file_path, store).get()
+    assert store.reads == []
+    _data_item(file_paths[0], store).get()
+    assert store.reads == [(0, 100)]
@@ -14,7 +14,9 @@
 #
 import os.path
 import tempfile
+from datetime import datetime
 
+import pandas as pd
 import pytest
 
 import mlrun
@@ -63,3 +65,56 @@ class TestFileStore:
                 match="Unable to put a value of type FileStore",
             ):
                 data_item.put(123)
+
+
+@pytest.mark.parametrize("read_workers", [1, 4])
+def test_as_df_csv_directory(tmp_path, monkeypatch, read_workers):
+    monkeypatch.setattr(mlrun.mlconf.storage, "read_workers", read_workers)
+    time_column = "timestamp"
+    for file_index in range(6):
+        pd.DataFrame(
+            {
+                "file": [file_index] * 10,
+                "value": range(10),
+                time_column: pd.date_range(
+                    datetime(2024, 1, 1 + file_index), periods=10, freq="h"
+                ),
+            }
+        ).to_csv(tmp_path / f"part-{file_index}.csv", index=False)
+
+    data_item = mlrun.datastore.store_manager.object(f"file://{tmp_path}")
+    files_order = [
+        int(entry["name"].split("-")[-1].split(".")[0])
+        for entry in data_item.store.filesystem.listdir(str(tmp_path))
+    ]
+    start_time = datetime(2024, 1, 2)
+    end_time = datetime(2024, 1, 4, 5)
+    filter_kwargs = {
+        "format": "csv",
+        "time_column": time_column,
+        "start_time": start_time,
+        "end_time": end_time,
+    }
+
+    df = data_item.as_df(**filter_kwargs)
+    # the first hour of the 2nd day is excluded, the 4th day is included until 5 o'clock
+    assert len(df) == 9 + 10 + 6
+    assert df[time_column].between(start_time, end_time).all()
+    assert list(df["file"].unique()) == [
+        file_index for file_index in files_order if 1 <= file_index <= 3
+    ]
+
+    # chunks are filtered while reading, in the files order
+    chunks = list(data_item.as_df(chunksize=4, **filter_kwargs))
+    assert all(len(chunk) <= 4 for chunk in chunks)
+    pd.testing.assert_frame_equal(pd.concat(chunks), df)
+
+    # per-file frames, the time column is dropped when it wasn't requested
+    files_dfs = list(
+        data_item.as_df(columns=["file", "value"], iterate_files=True, **filter_kwargs)
+    )
+    assert [file_df["file"].iloc[0] for file_df in files_dfs if len(file_df)] == list(
+        df["file"].unique()
+    )
+    assert len(files_dfs) == 6
+    assert all(list(file_df.columns) == ["file", "value"] for file_df in files_dfs)
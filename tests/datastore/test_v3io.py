@@ -0,0 +1,155 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import re
+import threading
+
+import pytest
+import werkzeug
+
+import mlrun
+import mlrun.errors
+from mlrun.datastore.v3io import V3ioStore
+
+object_path = "/bigdata/path/to/object.bin"
+
+
+class V3ioObjectsStandIn:
+    """A minimal in-memory stand-in of the v3io objects web api (get/head/put, including ranged and appending puts)"""
+
+    def __init__(self):
+        self.objects: dict[str, bytearray] = {}
+        self.requests: list[tuple[str, str]] = []
+        self.fail_ranged_puts = False
+        self._lock = threading.Lock()
+
+    def handle(self, request: werkzeug.Request) -> werkzeug.Response:
+        range_header = request.headers.get("Range", "")
+        with self._lock:
+            self.requests.append((request.method, range_header))
+            if request.method == "PUT":
+                return self._put(request.path, range_header, request.get_data())
+            if request.path not in self.objects:
+                return werkzeug.Response(status=404)
+            data = bytes(self.objects[request.path])
+
+        if range_header:
+            start, end = re.match(r"bytes=(\d+)-(\d*)", range_header).groups()
+            data = data[int(start) : int(end) + 1 if end else None]
+        return werkzeug.Response(
+            data, headers={"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+        )
+
+    def _put(self, path: str, range_header: str, body: bytes) -> werkzeug.Response:
+        if not range_header:
+            self.objects[path] = bytearray(body)
+        elif range_header == "-1":
+            self.objects.setdefault(path, bytearray()).extend(body)
+        else:
+            if self.fail_ranged_puts:
+                return werkzeug.Response("write failed", status=500)
+            start = int(re.match(r"bytes=(\d+)-", range_header).group(1))
+            data = self.objects.setdefault(path, bytearray())
+            if len(data) < start:
+                data.extend(bytes(start - len(data)))
+            data[start : start + len(body)] = body
+        return werkzeug.Response(status=200)
+
+
+@pytest.fixture
+def v3io_stand_in(httpserver):
+    stand_in = V3ioObjectsStandIn()
+    httpserver.expect_request(re.compile(".*")).respond_with_handler(stand_in.handle)
+    return stand_in
+
+
+@pytest.fixture
+def store(monkeypatch, httpserver, v3io_stand_in) -> V3ioStore:
+    monkeypatch.setattr(
+        mlrun.mlconf, "v3io_api", f"http://{httpserver.host}:{httpserver.port}"
+    )
+    store, _, _ = mlrun.store_manager.get_or_create_store(
+        f"v3io://{object_path}",
+        secrets={"V3IO_ACCESS_KEY": "access-key"},
+    )
+    return store
+
+
+@pytest.fixture
+def transfer_config():
+    old_concurrency = mlrun.mlconf.storage.v3io.transfer_concurrency
+    old_chunk_size = mlrun.mlconf.storage.v3io.transfer_chunk_size
+    mlrun.mlconf.storage.v3io.transfer_concurrency = 4
+    mlrun.mlconf.storage.v3io.transfer_chunk_size = 1000
+    yield mlrun.mlconf.storage.v3io
+    mlrun.mlconf.storage.v3io.transfer_concurrency = old_concurrency
+    mlrun.mlconf.storage.v3io.transfer_chunk_size = old_chunk_size
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_v3io_chunked_transfers(
+    tmp_path, store, v3io_stand_in, transfer_config, concurrency
+):
+    transfer_config.transfer_concurrency = concurrency
+    data = os.urandom(4500)
+    src_path = tmp_path / "src.bin"
+    src_path.write_bytes(data)
+
+    store.upload(object_path, str(src_path))
+    assert v3io_stand_in.objects[object_path] == data
+    ranged_puts = [
+        range_header
+        for method, range_header in v3io_stand_in.requests
+        if method == "PUT" and range_header.startswith("bytes=")
+    ]
+    if concurrency == 1:
+        assert ranged_puts == []
+    else:
+        # the first chunk creates the object and the rest are written at their offsets
+        assert sorted(ranged_puts) == [
+            "bytes=1000-1999",
+            "bytes=2000-2999",
+            "bytes=3000-3999",
+            "bytes=4000-4499",
+        ]
+
+    store.put(object_path, data[::-1])
+    assert v3io_stand_in.objects[object_path] == data[::-1]
+    store.put(object_path, data)
+
+    v3io_stand_in.requests.clear()
+    assert store.get(object_path) == data
+    assert store.get(object_path, size=2500, offset=1500) == data[1500:4000]
+    target_path = tmp_path / "target.bin"
+    store.download(object_path, str(target_path))
+    assert target_path.read_bytes() == data
+
+    ranged_gets = [
+        range_header
+        for method, range_header in v3io_stand_in.requests
+        if method == "GET" and range_header
+    ]
+    if concurrency == 1:
+        assert ranged_gets == ["bytes=1500-3999"]
+    else:
+        # the object is read as 5 ranges, by get() and by download(), and the partial read as 3 ranges
+        assert len(ranged_gets) == 13
+        assert "bytes=3500-3999" in ranged_gets
+
+
+def test_v3io_parallel_put_failure(store, v3io_stand_in, transfer_config):
+    v3io_stand_in.fail_ranged_puts = True
+    with pytest.raises(mlrun.errors.MLRunInternalServerError, match="write failed"):
+        store.put(object_path, os.urandom(2500))
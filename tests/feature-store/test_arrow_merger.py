@@ -0,0 +1,216 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+import mlrun.feature_store as fstore
+from mlrun.feature_store.feature_vector import JoinGraph
+from mlrun.feature_store.retrieval.arrow_merger import (
+    ArrowFeatureMerger,
+    _query_to_expression,
+    _UnsupportedQueryError,
+)
+from mlrun.feature_store.retrieval.base import _parse_query
+from mlrun.feature_store.retrieval.local_merger import LocalFeatureMerger
+from mlrun.features import Feature
+from mlrun.model import DataTarget
+
+
+@pytest.fixture
+def feature_sets(tmp_path):
+    rng = np.random.default_rng(0)
+    stocks = pd.DataFrame(
+        {
+            "ticker": [f"t{index}" for index in range(20)],
+            "name": [f"n{index}" for index in range(20)],
+            "exchange": ["NYSE", "NASDAQ"] * 10,
+        }
+    )
+    quotes = pd.DataFrame(
+        {
+            # some of the tickers have no stock
+            "ticker": [f"t{index}" for index in rng.integers(0, 25, 200)],
+            "time": pd.Timestamp("2024-01-01")
+            + pd.to_timedelta(rng.integers(0, 10**6, 200), unit="s"),
+            "price": rng.uniform(0, 100, 200),
+            "volume": rng.integers(0, 1000, 200),
+        }
+    )
+    quotes.loc[quotes.index[::17], "price"] = np.nan
+
+    result = {}
+    for name, df, timestamp_key in [
+        ("stocks", stocks, None),
+        ("quotes", quotes, "time"),
+    ]:
+        feature_set = fstore.FeatureSet(
+            name, entities=["ticker"], timestamp_key=timestamp_key
+        )
+        for column in df.columns:
+            if column not in ["ticker", timestamp_key]:
+                feature_set.add_feature(Feature(name=column))
+        path = str(tmp_path / f"{name}.parquet")
+        df.to_parquet(path, index=False)
+        feature_set.status.update_target(
+            DataTarget(kind="parquet", name="parquet", path=path)
+        )
+        result[name] = feature_set
+    return result
+
+
+def get_offline_features(merger_class, feature_sets, features, join_graph=None, **kw):
+    vector = fstore.FeatureVector("vector", features)
+    # the feature sets are not stored in the DB, hand them to the vector directly
+    vector.feature_set_objects = {
+        name: feature_set
+        for name, feature_set in feature_sets.items()
+        if any(feature.startswith(f"{name}.") for feature in features)
+    }
+    if join_graph:
+        vector.spec.join_graph = join_graph
+    return merger_class(vector).start(**kw).to_dataframe()
+
+
+def sort_rows(df):
+    index_names = [name for name in df.index.names if name]
+    df = df.reset_index(drop=not index_names)
+    df = df.sort_values(list(df.columns), ignore_index=True)
+    return df.set_index(index_names) if index_names else df
+
+
+@pytest.mark.parametrize(
+    "features, kwargs",
+    [
+        (["quotes.*"], {}),
+        (["quotes.*"], {"with_indexes": True}),
+        (["stocks.*", "quotes.price", "quotes.volume as vol"], {}),
+        (["stocks.*", "quotes.*"], {"query": "exchange == 'NYSE' & price > 20"}),
+        (["quotes.*"], {"query": "price > 50 and volume < 500", "order_by": "price"}),
+        # not row-wise, filtered with pandas
+        (["quotes.*"], {"query": "price > price.mean()"}),
+        # row-wise but not supported by arrow, filtered with pandas by record batch
+        (["stocks.*", "quotes.*"], {"query": "volume % 1000 == 5000"}),
+        (["stocks.*", "quotes.*"], {"query": "volume % 7 == 3"}),
+        (
+            ["quotes.*"],
+            {"start_time": "2024-01-03", "end_time": "2024-01-08"},
+        ),
+        (["quotes.*"], {"additional_filters": [("volume", ">", 500)]}),
+        (
+            ["stocks.*", "quotes.*"],
+            {
+                "join_graph": JoinGraph(first_feature_set="stocks").outer("quotes"),
+                "with_indexes": True,
+            },
+        ),
+        (
+            ["stocks.*", "quotes.*"],
+            {
+                "join_graph": JoinGraph(first_feature_set="stocks").left(
+                    "quotes", asof_join=False
+                ),
+            },
+        ),
+    ],
+)
+def test_arrow_merger_matches_local_merger(feature_sets, features, kwargs):
+    expected = get_offline_features(
+        LocalFeatureMerger, feature_sets, features, **kwargs
+    )
+    result = get_offline_features(ArrowFeatureMerger, feature_sets, features, **kwargs)
+
+    result = result[expected.columns]
+    # the arrow engine keeps the row order only when order_by is given
+    if "order_by" not in kwargs:
+        expected, result = sort_rows(expected), sort_rows(result)
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_arrow_merger_asof_join_with_entity_rows(feature_sets):
+    entity_rows = pd.DataFrame(
+        {
+            "ticker": ["t1", "t2", "t3", "t1"],
+            "time": pd.to_datetime(
+                ["2024-01-05", "2024-01-06", "2024-01-01", "2024-01-12"]
+            ),
+        }
+    )
+    kwargs = {
+        "entity_rows": entity_rows,
+        "entity_timestamp_column": "time",
+        "with_indexes": True,
+    }
+    expected = get_offline_features(
+        LocalFeatureMerger, feature_sets, ["quotes.*"], **kwargs
+    ).sort_index()
+    result = get_offline_features(
+        ArrowFeatureMerger, feature_sets, ["quotes.*"], **kwargs
+    ).sort_index()
+    pd.testing.assert_frame_equal(result[expected.columns], expected, check_dtype=False)
+
+
+def test_arrow_merger_writes_parquet_target(feature_sets, tmp_path):
+    paths = {}
+    for merger_class in [LocalFeatureMerger, ArrowFeatureMerger]:
+        vector = fstore.FeatureVector("vector", ["stocks.*", "quotes.*"])
+        vector.feature_set_objects = feature_sets
+        paths[merger_class.engine] = str(tmp_path / f"{merger_class.engine}.parquet")
+        merger_class(vector).start(order_by=["price", "volume"]).to_parquet(
+            paths[merger_class.engine]
+        )
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(paths["arrow"]),
+        pd.read_parquet(paths["local"]),
+        check_dtype=False,
+    )
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "a > 1 and b == 'x'",
+        "a > 1 | b == 'x'",
+        "~(a > 1)",
+        "1 <= a < 3",
+        "b in ['x', 'y']",
+        "b not in ['x']",
+        "a / 2 > 0.25 and -a < 0",
+        # comparisons with missing values
+        "c > 0",
+        "c != 1",
+    ],
+)
+def test_query_to_expression(query):
+    table = pa.table(
+        {
+            "index": [0, 1, 2],
+            "a": [2, 1, None],
+            "b": ["z", "x", "y"],
+            "c": [1.0, np.nan, None],
+        },
+    )
+    result = table.filter(_query_to_expression(_parse_query(query)))
+    expected = table.to_pandas().query(query)
+    assert result["index"].to_pylist() == expected["index"].tolist()
+
+
+@pytest.mark.parametrize("query", ["a > a.mean()", "abs(a) > 1", "a > @value"])
+def test_query_to_expression_unsupported(query):
+    node = _parse_query(query)
+    if node is not None:
+        with pytest.raises(_UnsupportedQueryError):
+            _query_to_expression(node)
@@ -0,0 +1,126 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pandas as pd
+import pytest
+
+import mlrun.feature_store as fstore
+from mlrun.feature_store.retrieval.base import _split_query
+from mlrun.feature_store.retrieval.local_merger import LocalFeatureMerger
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("a > 1 & b < 2", [("a > 1", {"a"}), ("b < 2", {"b"})]),
+        (
+            "(a > 1) and (b == 'x' or c < 3)",
+            [("a > 1", {"a"}), ("b == 'x' or c < 3", {"b", "c"})],
+        ),
+        ("x in [1, 2] & ~(y > 3)", [("x in [1, 2]", {"x"}), ("~(y > 3)", {"y"})]),
+        # only row-wise predicates are pushed down
+        ("a > b.mean() and abs(c) > 1 and 1 < d < 3", [("1 < d < 3", {"d"})]),
+        ("a > 1 | b < 2", [("a > 1 or b < 2", {"a", "b"})]),
+        ("a > @value", []),
+        ("`a b` > 1", []),
+        ("a >", []),
+    ],
+)
+def test_split_query(query, expected):
+    assert _split_query(query) == expected
+
+
+class CountingLocalFeatureMerger(LocalFeatureMerger):
+    def __init__(self, vector, feature_set_dfs, **engine_args):
+        super().__init__(vector, **engine_args)
+        self.feature_set_dfs = feature_set_dfs
+        self.joined_rows = []
+
+    def _get_engine_df(self, feature_set, feature_set_name, *args, **kwargs):
+        return self.feature_set_dfs[feature_set_name].copy()
+
+    def _join(
+        self,
+        entity_df,
+        entity_timestamp_column,
+        featureset_name,
+        featureset_timestamp,
+        featureset_df,
+        *args,
+    ):
+        self.joined_rows.append((len(entity_df), len(featureset_df)))
+        return super()._join(
+            entity_df,
+            entity_timestamp_column,
+            featureset_name,
+            featureset_timestamp,
+            featureset_df,
+            *args,
+        )
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "exchange == 'NYSE' and price > 90",
+        "price > 90 & volume < 50 & (exchange == 'NASDAQ' or price < 95)",
+        "price > volume.mean()",
+        "name == 'b'",
+    ],
+)
+@pytest.mark.parametrize("push_down", [True, False])
+def test_local_merger_query_pushdown(monkeypatch, query, push_down):
+    stocks = pd.DataFrame(
+        {
+            "ticker": [f"t{index}" for index in range(20)],
+            "name": [chr(ord("a") + index) for index in range(20)],
+            "exchange": ["NYSE", "NASDAQ"] * 10,
+        }
+    )
+    quotes = pd.DataFrame(
+        {
+            "ticker": [f"t{index % 20}" for index in range(100)],
+            "price": [float(index) for index in range(100)],
+            "volume": list(range(100, 0, -1)),
+        }
+    )
+    feature_set_objects = {
+        "stocks": fstore.FeatureSet("stocks", entities=["ticker"]),
+        "quotes": fstore.FeatureSet("quotes", entities=["ticker"]),
+    }
+    feature_set_fields = {
+        "stocks": [("name", None), ("exchange", None)],
+        "quotes": [("price", None), ("volume", None)],
+    }
+    vector = fstore.FeatureVector(
+        "vector", ["stocks.name", "stocks.exchange", "quotes.*"]
+    )
+    monkeypatch.setattr(
+        vector,
+        "parse_features",
+        lambda **kwargs: (feature_set_objects, feature_set_fields),
+    )
+    monkeypatch.setattr(CountingLocalFeatureMerger, "support_query_pushdown", push_down)
+
+    merger = CountingLocalFeatureMerger(vector, {"stocks": stocks, "quotes": quotes})
+    result = merger.start(query=query, order_by="price").to_dataframe()
+
+    joined = stocks.merge(quotes, on="ticker").drop(columns="ticker")
+    expected = joined.query(query).sort_values("price", ignore_index=True)
+    pd.testing.assert_frame_equal(result, expected[result.columns])
+    if push_down and "mean" not in query:
+        # the rows were filtered before the join
+        assert sum(merger.joined_rows[0]) < len(stocks) + len(quotes)
+    else:
+        assert merger.joined_rows == [(len(stocks), len(quotes))]
@@ -545,6 +545,84 @@ def test_mapvalues_combined_mapping_validator(rundb_mock):
         )
 
 
+def test_pandas_mapvalues_vectorized():
+    df = pd.DataFrame(
+        {
+            "score": [-5.5, 0.0, 12.0, 99.9, 100.0, 7.0],
+            "level": ["low", None, "high", "mid", "high", "unknown"],
+            "code": [1, 2, 3, 1, 2, 3],
+        },
+        index=pd.Index(list("abcdef"), name="id"),
+    )
+    step = MapValues(
+        mapping={
+            # unsorted ranges
+            "score": {
+                "ranges": {
+                    "high": [50.5, "inf"],
+                    "negative": ["-inf", -0.5],
+                    "low": [0, 50],
+                }
+            },
+            "level": {"low": 0, "mid": 1, "high": 2},
+            "code": {1: "one", 2: "two"},
+        }
+    )
+    result = step._do_pandas(df)
+
+    expected = pd.DataFrame(
+        {
+            "score": ["negative", "low", "low", "high", "high", "low"],
+            "level": [0.0, np.nan, 2.0, 1.0, 2.0, np.nan],
+            "code": ["one", "two", None, "one", "two", None],
+        },
+        index=df.index,
+    )
+    pd.testing.assert_frame_equal(result, expected)
+
+    # a value that is out of the ranges raises
+    step = MapValues(mapping={"score": {"ranges": {"low": [0, 50]}}})
+    with pytest.raises(KeyError):
+        step._do_pandas(df)
+
+
+def test_pandas_onehot_wide_mapping():
+    df = pd.DataFrame(
+        {
+            "first": [1, 2, 3],
+            "color": ["dark red", "light-blue", "black"],
+            "middle": [4, 5, 6],
+            "size": [3, 1, 2],
+            "last": [7, 8, 9],
+        }
+    )
+    step = OneHotEncoder(
+        mapping={
+            "size": list(range(1, 100)),
+            "color": ["dark red", "light-blue", "green"],
+        }
+    )
+    result = step._do_pandas(df)
+
+    # the binary columns replace the encoded column in place
+    assert list(result.columns) == (
+        ["first", "color_dark_red", "color_light_blue", "color_green", "middle"]
+        + [f"size_{size}" for size in range(1, 100)]
+        + ["last"]
+    )
+    assert (result.dtypes.iloc[1:4] == np.int64).all()
+    assert result[
+        ["color_dark_red", "color_light_blue", "color_green"]
+    ].values.tolist() == [
+        [1, 0, 0],
+        [0, 1, 0],
+        [0, 0, 0],
+    ]
+    assert result["size_3"].tolist() == [1, 0, 0]
+    assert result.iloc[:, 5:-1].sum(axis=1).tolist() == [1, 1, 1]
+    pd.testing.assert_series_equal(result["last"], df["last"])
+
+
 @pytest.mark.parametrize("set_index_before", [True, False, 0])
 @pytest.mark.parametrize("entities", [["id"], ["id", "name"]])
 def test_pandas_step_data_validator(rundb_mock, entities, set_index_before):
@@ -0,0 +1,117 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import concurrent.futures
+import threading
+
+import numpy as np
+import pytest
+
+from mlrun.frameworks._common import RequestsBatcher
+
+
+class StubModel:
+    """Records the inputs of each run, the outputs are given by `predict`"""
+
+    def __init__(self, predict):
+        self._predict = predict
+        self._lock = threading.Lock()
+        self.calls = []
+
+    def run(self, inputs: list[np.ndarray]) -> list[np.ndarray]:
+        with self._lock:
+            self.calls.append(inputs)
+        return self._predict(inputs)
+
+
+def run_concurrently(batcher: RequestsBatcher, requests: list[list[np.ndarray]]):
+    with concurrent.futures.ThreadPoolExecutor(len(requests)) as executor:
+        futures = [executor.submit(batcher.run, inputs) for inputs in requests]
+    return futures
+
+
+def make_batcher(model: StubModel, max_batch_size: int) -> RequestsBatcher:
+    # The batch is run once it is full, long before the timeout
+    return RequestsBatcher(
+        run=model.run, max_batch_size=max_batch_size, timeout_seconds=30
+    )
+
+
+def test_requests_are_merged_and_split_back():
+    model = StubModel(lambda inputs: [inputs[0] * 2, inputs[1].sum(axis=1)])
+    requests = [
+        [np.full((rows, 2), rows, dtype=float), np.ones((rows, 3))]
+        for rows in [1, 2, 3]
+    ]
+    futures = run_concurrently(make_batcher(model, len(requests)), requests)
+
+    assert len(model.calls) == 1
+    assert [merged.shape for merged in model.calls[0]] == [(6, 2), (6, 3)]
+    for (features, ones), future in zip(requests, futures):
+        doubled, sums = future.result()
+        np.testing.assert_array_equal(doubled, features * 2)
+        np.testing.assert_array_equal(sums, np.full(len(ones), 3.0))
+
+
+def test_single_request_is_run_as_is():
+    model = StubModel(lambda inputs: [inputs[0] + 1])
+    batcher = RequestsBatcher(run=model.run, max_batch_size=4, timeout_seconds=0.01)
+
+    (result,) = batcher.run([np.zeros((2, 2))])
+
+    assert len(model.calls) == 1
+    np.testing.assert_array_equal(result, np.ones((2, 2)))
+
+
+def test_requests_that_can_not_be_concatenated_are_run_one_by_one():
+    model = StubModel(lambda inputs: [inputs[0].sum(axis=1)])
+    requests = [[np.ones((1, 2))], [np.ones((1, 3))]]
+    futures = run_concurrently(make_batcher(model, len(requests)), requests)
+
+    assert len(model.calls) == 2
+    assert sorted(future.result()[0][0] for future in futures) == [2.0, 3.0]
+
+
+@pytest.mark.parametrize(
+    "predict",
+    [
+        # a scalar output
+        lambda inputs: [np.array(inputs[0].sum())],
+        # an output of a different number of rows than the inputs
+        lambda inputs: [inputs[0].sum(axis=0, keepdims=True)],
+    ],
+)
+def test_outputs_that_are_not_per_row_are_computed_per_request(predict):
+    model = StubModel(predict)
+    requests = [[np.full((rows, 2), rows, dtype=float)] for rows in [1, 2]]
+    futures = run_concurrently(make_batcher(model, len(requests)), requests)
+
+    # the merged run, then a run per request
+    assert len(model.calls) == 3
+    for inputs, future in zip(requests, futures):
+        np.testing.assert_array_equal(future.result()[0], predict(inputs)[0])
+
+
+def test_run_error_is_raised_to_every_request():
+    def predict(inputs):
+        raise RuntimeError("inference failed")
+
+    model = StubModel(predict)
+    requests = [[np.ones((1, 2))] for _ in range(3)]
+    futures = run_concurrently(make_batcher(model, len(requests)), requests)
+
+    assert len(model.calls) == 1
+    for future in futures:
+        with pytest.raises(RuntimeError, match="inference failed"):
+            future.result()
@@ -15,16 +15,20 @@
 import os
 import uuid
 from collections.abc import Iterator
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
 
 import pytest
 import taosws
 
+import mlrun
 from mlrun.common.schemas.model_monitoring import (
     ModelEndpointMonitoringMetric,
     ModelEndpointMonitoringMetricType,
 )
 from mlrun.model_monitoring.db.tsdb.tdengine import TDEngineConnector
+from mlrun.model_monitoring.db.tsdb.tdengine.schemas import AppResultTable
+from mlrun.model_monitoring.db.tsdb.tdengine.write_buffer import TDEngineWriteBuffer
 
 project = "test-tdengine-connector"
 connection_string = os.getenv("MLRUN_MODEL_ENDPOINT_MONITORING__TSDB_CONNECTION")
@@ -110,3 +114,202 @@ def test_write_application_event(
 
     # ML-8062
     connector.delete_tsdb_resources()
+
+
+@pytest.mark.skipif(not is_tdengine_defined(), reason="TDEngine is not defined")
+def test_write_buffered_application_events(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        mlrun.mlconf.model_endpoint_monitoring.tdengine.write_buffer, "max_rows", 5
+    )
+    connection = taosws.connect()
+    drop_database(connection)
+    connector = TDEngineConnector(
+        project, connection_string=connection_string, database=database
+    )
+    try:
+        connector.create_tables()
+        start_infer_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        for i in range(7):
+            connector.write_application_event(
+                {
+                    "endpoint_id": "1",
+                    "application_name": "my_app",
+                    "result_name": f"result_{i % 2}",
+                    "result_kind": 0,
+                    "start_infer_time": start_infer_time + timedelta(minutes=i),
+                    "end_infer_time": start_infer_time + timedelta(minutes=i + 1),
+                    "result_status": 0,
+                    "result_extra_data": "{}",
+                    "result_value": i,
+                }
+            )
+        # the first 5 rows were flushed on the size limit, the rest are flushed explicitly
+        assert connector._write_buffer.stats()["rows_written"] == 5
+        connector.flush_application_events()
+        assert connector._write_buffer.stats()["rows_written"] == 7
+
+        read_back_results = connector.read_metrics_data(
+            endpoint_id="1",
+            start=datetime(2023, 1, 1, 1, 0, 0),
+            end=datetime(2025, 1, 1, 1, 0, 0),
+            metrics=[
+                ModelEndpointMonitoringMetric(
+                    project=project,
+                    app="my_app",
+                    name=f"result_{i}",
+                    type=ModelEndpointMonitoringMetricType.RESULT,
+                )
+                for i in range(2)
+            ],
+            type="results",
+        )
+        assert sorted(len(result.values) for result in read_back_results) == [3, 4]
+    finally:
+        drop_database(connection)
+
+
+def test_write_buffer_groups_rows_per_subtable() -> None:
+    write_rows = Mock()
+    write_buffer = TDEngineWriteBuffer(
+        write_rows=write_rows, max_rows=3, flush_interval=60
+    )
+    table = AppResultTable(project=project)
+
+    write_buffer.append(table=table, subtable="a", row={"value": 1})
+    write_buffer.append(table=table, subtable="b", row={"value": 2})
+    write_rows.assert_not_called()
+    write_buffer.append(table=table, subtable="a", row={"value": 3})
+
+    write_rows.assert_called_once_with(
+        {
+            (table.super_table, "a"): (table, [{"value": 1}, {"value": 3}]),
+            (table.super_table, "b"): (table, [{"value": 2}]),
+        }
+    )
+    assert write_buffer.stats()["rows_written"] == 3
+
+    # the timer flushes the rows that did not reach the size limit
+    write_buffer.flush_interval = 0.2
+    write_buffer.append(table=table, subtable="a", row={"value": 4})
+    timer = write_buffer._timer
+    timer.join()
+    assert write_rows.call_count == 2
+    assert write_buffer.stats()["flushes"] == 2
+
+
+def test_write_buffer_keeps_rows_of_failed_writes() -> None:
+    write_rows = Mock(side_effect=[RuntimeError("TDEngine is down"), None])
+    write_buffer = TDEngineWriteBuffer(
+        write_rows=write_rows, max_rows=2, flush_interval=60
+    )
+    table = AppResultTable(project=project)
+
+    write_buffer.append(table=table, subtable="a", row={"value": 1})
+    # the size triggered flush fails, the error is not raised by the append and the rows are kept
+    write_buffer.append(table=table, subtable="a", row={"value": 2})
+    assert write_rows.call_count == 1
+    # the size limit does not trigger flushes until the timer writes the failed rows
+    write_buffer.append(table=table, subtable="b", row={"value": 3})
+    assert write_rows.call_count == 1
+
+    write_buffer.flush()
+    write_rows.assert_called_with(
+        {
+            (table.super_table, "a"): (table, [{"value": 1}, {"value": 2}]),
+            (table.super_table, "b"): (table, [{"value": 3}]),
+        }
+    )
+    assert write_buffer.stats()["rows_written"] == 3
+    assert write_buffer._timer is None
+
+    # an explicit flush raises the error, and the timer retries the rows
+    write_rows.side_effect = [RuntimeError("TDEngine is down"), None]
+    write_buffer.append(table=table, subtable="a", row={"value": 4})
+    with pytest.raises(RuntimeError):
+        write_buffer.flush()
+    write_buffer._timer.cancel()
+    write_buffer._timer = None
+    write_buffer.flush_interval = 0.2
+    write_buffer.append(table=table, subtable="a", row={"value": 5})
+    write_buffer._timer.join()
+    write_rows.assert_called_with(
+        {(table.super_table, "a"): (table, [{"value": 4}, {"value": 5}])}
+    )
+    assert write_buffer.stats()["rows_written"] == 5
+
+
+def test_write_buffer_retries_failing_subtables_on_their_own() -> None:
+    table = AppResultTable(project=project)
+
+    def write_rows(subtables_rows) -> None:
+        if (table.super_table, "bad") in subtables_rows:
+            raise RuntimeError("Invalid row")
+
+    write_buffer = TDEngineWriteBuffer(
+        write_rows=Mock(side_effect=write_rows),
+        max_rows=10,
+        flush_interval=60,
+        max_retries=2,
+    )
+    write_buffer.append(table=table, subtable="a", row={"value": 1})
+    write_buffer.append(table=table, subtable="bad", row={"value": 2})
+
+    # the rows of the other subtables are written, the failing subtable is kept
+    with pytest.raises(RuntimeError):
+        write_buffer.flush()
+    assert write_buffer.stats()["rows_written"] == 1
+    assert list(write_buffer._pending) == [(table.super_table, "bad")]
+
+    # the rows of a subtable that failed max_retries flushes in a row are dropped
+    with pytest.raises(RuntimeError):
+        write_buffer.flush()
+    assert not write_buffer._pending
+    assert write_buffer._pending_rows == 0
+    assert write_buffer._timer is None
+
+
+def test_write_buffer_drops_rows_over_max_pending_rows() -> None:
+    write_rows = Mock(side_effect=RuntimeError("TDEngine is down"))
+    write_buffer = TDEngineWriteBuffer(
+        write_rows=write_rows, max_rows=2, flush_interval=60, max_pending_rows=3
+    )
+    table = AppResultTable(project=project)
+
+    for value in range(5):
+        write_buffer.append(table=table, subtable="a", row={"value": value})
+    write_buffer._timer.cancel()
+    assert write_buffer._pending_rows == 3
+    assert write_buffer.rows_dropped == 2
+
+    write_rows.side_effect = None
+    write_buffer.flush()
+    write_rows.assert_called_with(
+        {
+            (table.super_table, "a"): (
+                table,
+                [{"value": 0}, {"value": 1}, {"value": 2}],
+            )
+        }
+    )
+    assert write_buffer.rows_dropped == 0
+
+
+def test_failed_write_forgets_the_existing_subtables() -> None:
+    conn = TDEngineConnector(
+        project, connection_string="taosws://localhost:6041", database=database
+    )
+    conn._connection = Mock()
+    table = AppResultTable(project=project)
+    conn._existing_subtables = {(table.super_table, "a"), (table.super_table, "b")}
+    subtables_rows = {(table.super_table, "a"): (table, [{"value": 1}])}
+
+    conn._write_subtables_rows(subtables_rows)
+    assert len(conn._existing_subtables) == 2
+
+    # the subtable may have been dropped, so it is created again on the next write
+    conn._connection.run.side_effect = RuntimeError("Table does not exist")
+    with pytest.raises(RuntimeError):
+        conn._write_subtables_rows(subtables_rows)
+    assert conn._existing_subtables == {(table.super_table, "b")}
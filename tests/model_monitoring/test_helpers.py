@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import datetime
+import os
 from collections.abc import Iterator
 from typing import NamedTuple
 from unittest.mock import patch
@@ -39,6 +40,10 @@ from mlrun.model_monitoring.controller import (
     _Interval,
 )
 from mlrun.model_monitoring.db._schedules import ModelMonitoringSchedulesFile
+from mlrun.model_monitoring.db._window_histograms import (
+    WindowHistograms,
+    get_window_feature_stats,
+)
 from mlrun.model_monitoring.helpers import (
     _BatchDict,
     _get_monitoring_time_window_from_controller_run,
@@ -186,6 +191,84 @@ def test_calculate_input_statistics(
     ]
 
 
+def test_window_histograms_match_input_statistics(
+    feature_stats: FeatureStats,
+) -> None:
+    """The histograms counted per bucket and merged should match the input statistics of the whole sample"""
+    input_data = generate_sample_data(feature_stats, num_samples=90)
+    # values on the edges of the reference bins and outside them
+    input_data.loc[0, "feat0"] = 3.3
+    input_data.loc[1, "feat0"] = 1.1
+    input_data.loc[2, "feat1"] = 500
+    expected_stats = mlrun.model_monitoring.helpers.calculate_inputs_statistics(
+        sample_set_statistics=feature_stats,
+        inputs=input_data,
+    )
+
+    merged = WindowHistograms.from_feature_stats(feature_stats)
+    for bucket_data in np.array_split(input_data, 3):
+        bucket = WindowHistograms.from_feature_stats(feature_stats)
+        bucket.add(list(bucket_data.columns), bucket_data.to_numpy())
+        merged.merge(WindowHistograms.from_dict(bucket.to_dict()))
+    window_stats = merged.to_feature_stats()
+
+    assert window_stats.keys() == expected_stats.keys()
+    for feature, stats in window_stats.items():
+        assert stats["hist"] == expected_stats[feature]["hist"]
+        for stat in ["count", "mean", "std", "min", "max"]:
+            assert stats[stat] == pytest.approx(expected_stats[feature][stat])
+
+
+def test_get_window_feature_stats(
+    feature_stats: FeatureStats, tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        mlrun.model_monitoring.db._window_histograms,
+        "get_monitoring_stats_directory_path",
+        lambda project: str(tmp_path),
+    )
+    monkeypatch.setattr(
+        mlrun.mlconf.model_endpoint_monitoring.window_histograms, "bucket_seconds", 60
+    )
+    files = mlrun.model_monitoring.db._window_histograms.WindowHistogramsFiles(
+        "project", "endpoint"
+    )
+    for bucket_start, value in [(60, 2.0), (60, 3.0), (120, 102.0), (180, 1.5)]:
+        histograms = WindowHistograms.from_feature_stats(feature_stats)
+        histograms.add(["feat0", "feat1"], np.array([[value, value]]))
+        files.write(bucket_start, histograms)
+
+    window_stats = get_window_feature_stats(
+        "project", "endpoint", feature_stats, start=60, end=180
+    )
+    # the bucket of 180 is not in the window, 102 is out of the bins of feat0
+    assert window_stats["feat0"]["hist"][0] == [1, 1]
+    assert window_stats["feat0"]["count"] == 3
+    assert window_stats["feat1"]["hist"][0] == [2, 0, 0, 0, 1]
+
+    # windows that are not aligned to the buckets, or with missing buckets, are not merged
+    assert (
+        get_window_feature_stats("project", "endpoint", feature_stats, 30, 180) is None
+    )
+    assert (
+        get_window_feature_stats("project", "endpoint", feature_stats, 240, 300) is None
+    )
+    assert (
+        get_window_feature_stats("project", "endpoint", feature_stats, 0, 180) is None
+    )
+
+    # the buckets are partitioned by the hour, old partitions are deleted
+    files.write(3600, histograms)
+    files.delete_before(3600)
+    assert sorted(os.listdir(tmp_path / "window_histograms" / "endpoint")) == ["3600"]
+    assert (
+        get_window_feature_stats("project", "endpoint", feature_stats, 60, 180) is None
+    )
+    assert get_window_feature_stats(
+        "project", "endpoint", feature_stats, 3600, 3660
+    ).keys() == {"feat0", "feat1"}
+
+
 class TestBatchInterval:
     @staticmethod
     @pytest.fixture
@@ -26,6 +26,7 @@ from mlrun.model_monitoring.metrics.histogram_distance import (
     HistogramDistanceMetric,
     KullbackLeiblerDivergence,
     TotalVarianceDistance,
+    compute_histogram_distances,
 )
 
 
@@ -98,6 +99,51 @@ def test_histogram_metric_calculation(
     )
 
 
+def test_compute_histogram_distances_matches_per_feature() -> None:
+    rng = np.random.default_rng(seed=7)
+    distribs_t = rng.random((50, 20))
+    distribs_u = rng.random((50, 20))
+    # a feature with empty bins in both distributions
+    distribs_t[0, :5] = distribs_u[0, 10:] = 0
+    distribs_t /= distribs_t.sum(axis=1, keepdims=True)
+    distribs_u /= distribs_u.sum(axis=1, keepdims=True)
+    metrics = HistogramDistanceMetric.__subclasses__()
+    features = [f"f{i}" for i in range(50)]
+
+    result = compute_histogram_distances(
+        distribs_t=distribs_t,
+        distribs_u=distribs_u,
+        metrics=metrics,
+        features=features,
+    )
+
+    assert list(result.index) == features
+    assert list(result.columns) == [metric.NAME for metric in metrics]
+    for index, feature in enumerate(features):
+        for metric in metrics:
+            assert np.isclose(
+                result.loc[feature, metric.NAME],
+                metric(
+                    distrib_t=distribs_t[index], distrib_u=distribs_u[index]
+                ).compute(),
+            )
+
+
+def test_compute_batch_defaults_to_per_feature_compute() -> None:
+    class MaxDistance(HistogramDistanceMetric, metric_name="max"):
+        def compute(self) -> float:
+            return float(np.max(np.abs(self.distrib_t - self.distrib_u)))
+
+    distribs_t = np.array([[0.5, 0.5, 0.0], [0.2, 0.2, 0.6]])
+    distribs_u = np.array([[0.5, 0.5, 0.0], [0.1, 0.6, 0.3]])
+
+    result = compute_histogram_distances(
+        distribs_t=distribs_t, distribs_u=distribs_u, metrics=[MaxDistance]
+    )
+
+    assert np.allclose(result["max"], [0.0, 0.4])
+
+
 def _norm_arr(arr: np.ndarray) -> np.ndarray:
     """
     Normalize a nonnegative array to sum 1.
@@ -0,0 +1,122 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Iterator
+from unittest.mock import Mock, patch
+
+import pytest
+
+import mlrun.errors
+from mlrun.model_monitoring.model_endpoints_cache import ModelEndpointsCache
+
+
+def _endpoint(uid: str) -> Mock:
+    endpoint = Mock()
+    endpoint.metadata.uid = uid
+    endpoint.flat_dict.return_value = {"uid": uid, "feature_names": ["f0"]}
+    endpoint.spec.feature_stats = {"f0": {"hist": [[1, 2], [0, 1, 2]]}}
+    return endpoint
+
+
+@pytest.fixture
+def rundb() -> Iterator[Mock]:
+    with patch("mlrun.db.get_run_db") as get_run_db:
+        get_run_db.return_value.get_model_endpoint.side_effect = (
+            lambda endpoint_id, **kwargs: _endpoint(endpoint_id)
+        )
+        get_run_db.return_value.list_model_endpoints.return_value.endpoints = [
+            _endpoint("ep-1"),
+            _endpoint("ep-2"),
+        ]
+        yield get_run_db.return_value
+
+
+def test_prefetch_and_ttl(rundb: Mock) -> None:
+    cache = ModelEndpointsCache("project", ttl_seconds=60)
+    cache.prefetch()
+    assert cache.get("ep-1", "model")["uid"] == "ep-1"
+    assert cache.get("ep-2", "model")["uid"] == "ep-2"
+    rundb.get_model_endpoint.assert_not_called()
+
+    # not prefetched - fetched once, then cached
+    assert cache.get("ep-3", "model")["uid"] == "ep-3"
+    assert cache.get("ep-3", "model")["uid"] == "ep-3"
+    assert rundb.get_model_endpoint.call_count == 1
+
+    # expired records are fetched again
+    cache.ttl_seconds = 0
+    cache.get("ep-1", "model")
+    assert rundb.get_model_endpoint.call_count == 2
+
+
+def test_updates_are_coalesced(rundb: Mock) -> None:
+    cache = ModelEndpointsCache("project", patch_interval_seconds=3600)
+    cache.prefetch()
+    cache.update("ep-1", "model", {"first_request": "2024-01-01 00:00:00"})
+    cache.update("ep-1", "model", {"feature_names": ["a"]})
+    cache.update("ep-2", "model", {"label_names": ["label"]})
+
+    # the cached records are updated before the API
+    assert cache.get("ep-1", "model")["feature_names"] == ["a"]
+    rundb.patch_model_endpoint.assert_not_called()
+
+    cache.flush()
+    assert rundb.patch_model_endpoint.call_count == 2
+    rundb.patch_model_endpoint.assert_any_call(
+        project="project",
+        endpoint_id="ep-1",
+        attributes={"first_request": "2024-01-01 00:00:00", "feature_names": ["a"]},
+        name="model",
+    )
+
+    # nothing is pending after the flush
+    cache.flush()
+    assert rundb.patch_model_endpoint.call_count == 2
+
+
+def test_failed_updates_are_retried(rundb: Mock) -> None:
+    cache = ModelEndpointsCache("project", patch_interval_seconds=3600)
+    rundb.patch_model_endpoint.side_effect = [
+        mlrun.errors.MLRunInternalServerError("API is down"),
+        None,
+    ]
+    cache.update("ep-1", "model", {"first_request": "2024-01-01 00:00:00"})
+    cache.flush()
+    cache.flush()
+    assert rundb.patch_model_endpoint.call_count == 2
+    assert rundb.patch_model_endpoint.call_args.kwargs["attributes"] == {
+        "first_request": "2024-01-01 00:00:00"
+    }
+
+
+def test_feature_stats(rundb: Mock) -> None:
+    cache = ModelEndpointsCache("project", ttl_seconds=60)
+    cache.prefetch(feature_analysis=True)
+    assert rundb.list_model_endpoints.call_args.kwargs["feature_analysis"]
+    assert cache.get_feature_stats("ep-1", "model") == {
+        "f0": {"hist": [[1, 2], [0, 1, 2]]}
+    }
+    rundb.get_model_endpoint.assert_not_called()
+
+    # endpoints without reference stats are fetched again once the TTL passed
+    rundb.get_model_endpoint.side_effect = mlrun.errors.MLRunNotFoundError("")
+    assert cache.get_feature_stats("ep-3", "model") is None
+    assert cache.get_feature_stats("ep-3", "model") is None
+    assert rundb.get_model_endpoint.call_count == 1
+    cache.ttl_seconds = 0
+    rundb.get_model_endpoint.side_effect = lambda endpoint_id, **kwargs: _endpoint(
+        endpoint_id
+    )
+    assert cache.get_feature_stats("ep-3", "model") is not None
+    assert rundb.get_model_endpoint.call_count == 2
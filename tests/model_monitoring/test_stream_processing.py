@@ -12,14 +12,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import datetime
+from unittest.mock import Mock, patch
+
+import pandas as pd
 import pytest
+import storey
 
 import mlrun
-from mlrun.model_monitoring.stream_processing import EventStreamProcessor
+from mlrun.common.schemas.model_monitoring.constants import EndpointType
+from mlrun.model_monitoring.stream_processing import (
+    AccumulateWindowHistograms,
+    ColumnarEventBatch,
+    EventStreamProcessor,
+    MapFeatureNames,
+    ProcessBeforeParquet,
+    ProcessEndpointEvent,
+)
 
 
 @pytest.mark.parametrize("tsdb_connector", ["v3io", "taosws"])
-def test_plot_monitoring_serving_graph(tsdb_connector):
+@pytest.mark.parametrize("columnar_batches", [False, True])
+def test_plot_monitoring_serving_graph(tsdb_connector, columnar_batches):
     project_name = "test-stream-processing"
     project = mlrun.get_or_create_project(project_name)
 
@@ -28,6 +43,7 @@ def test_plot_monitoring_serving_graph(tsdb_connector):
         1000,
         10,
         "mytarget",
+        columnar_batches=columnar_batches,
     )
 
     fn = project.set_function(
@@ -48,3 +64,100 @@ def test_plot_monitoring_serving_graph(tsdb_connector):
     print("Feed this to graphviz, or to https://dreampuf.github.io/GraphvizOnline")
     print()
     print(graph)
+
+
+def test_columnar_batch_matches_row_events():
+    endpoint_record = Mock()
+    endpoint_record.flat_dict.return_value = {
+        "feature_names": ["a", "b"],
+        "label_names": ["label"],
+        "endpoint_type": EndpointType.NODE_EP.value,
+        "first_request": "2024-01-01 00:00:00",
+    }
+    event = {
+        "endpoint_id": "ep-1",
+        "function_uri": "my-project/my-fn",
+        "model": "my-model",
+        "when": str(datetime.datetime(2024, 1, 1, 12)),
+        "microsec": 120,
+        "request": {"id": "req-1", "inputs": [[1, 2], [3, 4], [5, 6]]},
+        "resp": {"id": "req-1", "outputs": [0, 1, 0]},
+        "labels": {"env": "test"},
+    }
+
+    def process(columnar: bool):
+        body = (
+            ProcessEndpointEvent(project="my-project", columnar=columnar)
+            .do(storey.Event(body=copy.deepcopy(event)))
+            .body
+        )
+        map_feature_names = MapFeatureNames(project="my-project")
+        if columnar:
+            return map_feature_names.do(body)
+        return [map_feature_names.do(row) for row in body]
+
+    with patch("mlrun.db.get_run_db") as get_run_db:
+        get_run_db.return_value.get_model_endpoint.return_value = endpoint_record
+        rows = process(columnar=False)
+        batch = process(columnar=True)
+
+    assert isinstance(batch, ColumnarEventBatch)
+    assert len(batch) == 3
+    assert batch.to_rows() == rows
+    assert rows[1]["a"] == 3.0 and isinstance(rows[1]["a"], float)
+
+    expected_df = pd.DataFrame(
+        [ProcessBeforeParquet().do(copy.deepcopy(row)) for row in rows * 2]
+    )
+    df = ColumnarEventBatch.to_dataframe([batch, batch])
+    pd.testing.assert_frame_equal(
+        df[sorted(df.columns)], expected_df[sorted(expected_df.columns)]
+    )
+
+
+def test_window_histograms_failed_write_is_retried():
+    with (
+        patch(
+            "mlrun.model_monitoring.stream_processing.get_model_endpoints_cache"
+        ) as get_model_endpoints_cache,
+        patch(
+            "mlrun.model_monitoring.stream_processing.WindowHistogramsFiles"
+        ) as files,
+    ):
+        get_model_endpoints_cache.return_value.get_feature_stats.return_value = {
+            "a": {"hist": [[1, 1], [0, 5, 10]]}
+        }
+        files.return_value.write.side_effect = [OSError("storage is down"), None]
+        step = AccumulateWindowHistograms(
+            project="my-project", bucket_seconds=3600, flush_delay_seconds=3600
+        )
+        timestamp = datetime.datetime(2024, 1, 1, 12, tzinfo=datetime.timezone.utc)
+
+        def count(value: float) -> None:
+            step.do(
+                {
+                    "endpoint_id": "ep-1",
+                    "endpoint_name": "my-model",
+                    "timestamp": timestamp,
+                    "features": [value],
+                    "named_features": ["a"],
+                    "prediction": [],
+                    "named_predictions": [],
+                }
+            )
+
+        # the events are only counted, the buckets are written by the timer
+        count(1)
+        files.return_value.write.assert_not_called()
+
+        # the bucket is kept when its write fails, and written with the later events
+        step.flush()
+        count(7)
+        step.flush()
+        step._timer.cancel()
+
+    assert files.return_value.write.call_count == 2
+    bucket_start, histograms = files.return_value.write.call_args.args
+    assert bucket_start == int(timestamp.timestamp())
+    assert histograms.counts["a"].tolist() == [1, 1]
+    assert not step._buckets
@@ -89,6 +89,22 @@ class TestTDEngineSchema:
             with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
                 super_table._create_subtable_sql(subtable=subtable, values=values)
 
+    def test_create_sub_tables(
+        self,
+        super_table: TDEngineSchema,
+        values: dict[str, Union[str, int, float, datetime.datetime]],
+    ):
+        other_values = {**values, "tag1": 2}
+        assert (
+            super_table._create_subtables_sql(
+                subtables={"subtable_1": values, "subtable_2": other_values}
+            )
+            == f"CREATE TABLE if NOT EXISTS {_MODEL_MONITORING_DATABASE}.subtable_1 "
+            f"USING {super_table.super_table} TAGS ('{values['tag1']}', '{values['tag2']}') "
+            f"if NOT EXISTS {_MODEL_MONITORING_DATABASE}.subtable_2 "
+            f"USING {super_table.super_table} TAGS ('2', '{values['tag2']}');"
+        )
+
     @pytest.mark.parametrize(
         ("subtable", "remove_tag"), [("subtable_1", False), ("subtable_2", True)]
     )
@@ -296,3 +296,12 @@ class TestTSDB:
     ) -> None:
         event, kind = ModelMonitoringWriter._reconstruct_event(event)
         writer._tsdb_connector.write_application_event(event, kind)
+
+
+def test_writer_flushes_buffered_events_on_termination() -> None:
+    with patch("mlrun.model_monitoring.get_tsdb_connector") as get_tsdb_connector:
+        writer = ModelMonitoringWriter(project=TEST_PROJECT)
+    tsdb_connector = get_tsdb_connector.return_value
+    tsdb_connector.flush_application_events.assert_not_called()
+    writer.on_termination()
+    tsdb_connector.flush_application_events.assert_called_once()
@@ -131,6 +131,61 @@ def test_sync_functions_unavailable_file():
         project.sync_functions()
 
 
+def test_sync_functions_from_cache(tmp_path):
+    mlrun.mlconf.project_functions.cache_enabled = True
+    mlrun.mlconf.project_functions.cache_path = str(tmp_path / "cache")
+    context = tmp_path / "project"
+    context.mkdir()
+    code_path = context / "handler.py"
+    code_path.write_text("def func(context):\n    pass\n")
+
+    project = mlrun.new_project("project-name", context=str(context), save=False)
+    for i in range(3):
+        project.set_function(
+            "handler.py", f"func-{i}", kind="job", image="mlrun/mlrun", handler="func"
+        )
+    project.sync_functions()
+    assert len(list((tmp_path / "cache").iterdir())) == 3
+    expected_functions = {
+        name: func.to_dict() for name, func in project.spec._function_objects.items()
+    }
+
+    # unchanged files are not resolved again
+    with unittest.mock.patch(
+        "mlrun.projects.project.code_to_function",
+        side_effect=AssertionError("function should be loaded from the cache"),
+    ):
+        project.sync_functions()
+    for name, func in project.spec._function_objects.items():
+        assert deepdiff.DeepDiff(func.to_dict(), expected_functions[name]) == {}
+
+    # a change of the function defaults configuration resolves the functions again
+    mlrun.mlconf.function_defaults.preemption_mode = "allow"
+    with unittest.mock.patch(
+        "mlrun.projects.project.code_to_function",
+        wraps=mlrun.projects.project.code_to_function,
+    ) as code_to_function:
+        project.sync_functions()
+    assert code_to_function.call_count == 3
+
+    # changed files are resolved again
+    code_path.write_text("def func(context):\n    print('changed')\n")
+    with unittest.mock.patch(
+        "mlrun.projects.project.code_to_function",
+        wraps=mlrun.projects.project.code_to_function,
+    ) as code_to_function:
+        project.sync_functions()
+    assert code_to_function.call_count == 3
+    # the entries of the previous file content are replaced
+    assert len(list((tmp_path / "cache").iterdir())) == 3
+
+    # the least recently used entries are deleted above the limit
+    mlrun.mlconf.project_functions.cache_max_entries = 2
+    code_path.write_text("def func(context):\n    print('changed again')\n")
+    project.sync_functions()
+    assert len(list((tmp_path / "cache").iterdir())) == 2
+
+
 def test_export_project_dir_doesnt_exist():
     project_name = "project-name"
     project_file_path = (
@@ -20,6 +20,7 @@ from unittest.mock import MagicMock, Mock
 import pytest
 
 import mlrun
+import mlrun.common.schemas
 import mlrun.errors
 import mlrun.launcher.factory
 from mlrun import new_function, new_task
@@ -389,3 +390,61 @@ def test_code_to_function_file_include_invalid_handler_name_for_nuclio_mlrun_run
             image="mlrun/mlrun",
             kind="nuclio:mlrun",
         )
+
+
+@pytest.mark.parametrize("bulk", [True, False])
+def test_wait_for_runs_completion(monkeypatch, bulk):
+    final_states = {"uid-0": "completed", "uid-1": "error", "uid-2": "completed"}
+    runs = [
+        mlrun.RunObject.from_dict(
+            {
+                "metadata": {"uid": uid, "project": "some-project"},
+                "status": {"state": "running"},
+            }
+        )
+        for uid in final_states
+    ]
+    bulk_states = iter(
+        [
+            [
+                mlrun.common.schemas.RunState(uid="uid-0", state="completed"),
+                mlrun.common.schemas.RunState(uid="uid-1", state="running"),
+                mlrun.common.schemas.RunState(uid="uid-2", state="running"),
+            ],
+            [
+                mlrun.common.schemas.RunState(uid="uid-1", state="error"),
+                mlrun.common.schemas.RunState(uid="uid-2", state="completed"),
+            ],
+        ]
+    )
+    db = Mock()
+    if bulk:
+        db.list_runs_states.side_effect = lambda *args, **kwargs: next(bulk_states)
+    else:
+        # e.g. an API without the runs states endpoint
+        db.list_runs_states.side_effect = mlrun.errors.MLRunNotFoundError("not found")
+    db.read_run.side_effect = lambda uid, project, iter: {
+        "status": {"state": final_states[uid], "results": {"uid": uid}}
+    }
+    monkeypatch.setattr(mlrun.db, "get_run_db", lambda: db)
+    monkeypatch.setattr(mlrun, "get_run_db", lambda: db)
+
+    completed = mlrun.run.wait_for_runs_completion(runs)
+
+    assert sorted(run.metadata.uid for run in completed) == list(final_states)
+    for run in completed:
+        # the full status of the completed runs is read
+        assert run.status.state == final_states[run.metadata.uid]
+        assert run.status.results == {"uid": run.metadata.uid}
+    if bulk:
+        assert db.list_runs_states.call_count == 2
+        # the second request waits for a change of the runs that are still running
+        assert db.list_runs_states.call_args.kwargs == {
+            "known_states": {"uid-1": "running", "uid-2": "running"},
+            "timeout": mlrun.mlconf.httpdb.runs_states.client_wait_timeout,
+        }
+        # a single read of each run once it is completed
+        assert db.read_run.call_count == len(runs)
+    else:
+        assert db.list_runs_states.call_count == 1
+        assert db.read_run.call_count == len(runs)
@@ -16,6 +16,7 @@
 # currently we are running it in the integration tests CI step so adding this file for unit tests for the httpdb
 import enum
 import io
+import json
 import unittest.mock
 
 import pytest
@@ -24,6 +25,7 @@ import requests_mock
 import urllib3.exceptions
 
 import mlrun.artifacts.base
+import mlrun.common.schemas
 import mlrun.config
 import mlrun.db.httpdb
 
@@ -313,3 +315,64 @@ def test_watch_logs_continue():
     assert (
         adapter.call_count == len(log_lines) + 1
     ), "should have called the adapter once per log line, and one more time at the end of log"
+
+
+def test_iter_runs_streams_ndjson():
+    db = mlrun.db.httpdb.HTTPRunDB("https://wherever.com")
+    project = "some-project"
+    runs = [
+        {"metadata": {"name": f"run-{index}", "uid": f"uid-{index}"}}
+        for index in range(3)
+    ]
+    adapter = requests_mock.Adapter()
+    adapter.register_uri(
+        "GET",
+        f"https://wherever.com/api/v1/projects/{project}/runs",
+        content=b"".join(json.dumps(run).encode() + b"\n" for run in runs),
+        headers={"Content-Type": mlrun.common.schemas.MediaTypes.ndjson},
+    )
+    db.session = db._init_session()
+    db.session.mount("https://", adapter)
+
+    runs_iterator = db.iter_runs(project=project, name="run")
+    assert adapter.call_count == 1
+    request = adapter.last_request
+    assert request.headers["Accept"] == mlrun.common.schemas.MediaTypes.ndjson
+    assert request.qs["name"] == ["run"]
+    assert "page-size" not in request.qs
+
+    assert list(runs_iterator) == runs
+
+
+def _paginated_list_numbers(page_size=2, page_token=None, total=5):
+    # emulates a paginated list method, the token is the index of the next page
+    start = int(page_token or 0)
+    end = start + page_size
+    next_token = str(end) if end < total else None
+    return list(range(start, min(end, total))), next_token
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_pages(prefetch):
+    db = mlrun.db.httpdb.HTTPRunDB("https://wherever.com")
+    pages = list(db.iter_pages(_paginated_list_numbers, page_size=2, prefetch=prefetch))
+    assert pages == [[0, 1], [2, 3], [4]]
+
+
+def test_iter_pages_stop_early():
+    db = mlrun.db.httpdb.HTTPRunDB("https://wherever.com")
+    paginated_list_method = unittest.mock.Mock(side_effect=_paginated_list_numbers)
+    pages = db.iter_pages(paginated_list_method, total=100)
+    assert next(pages) == [0, 1]
+    pages.close()
+
+    # the first page and at most one prefetched page were requested
+    assert paginated_list_method.call_count <= 2
+
+
+async def test_async_iter_pages():
+    db = mlrun.db.httpdb.HTTPRunDB("https://wherever.com")
+    pages = [
+        page async for page in db.async_iter_pages(_paginated_list_numbers, page_size=2)
+    ]
+    assert pages == [[0, 1], [2, 3], [4]]
@@ -64,6 +64,23 @@ class ChainWithContext(BaseClass):
         return x
 
 
+class BufferingStep(BaseClass):
+    def __init__(self, context=None, name=None, fail_on_termination=False):
+        super().__init__(context, name)
+        self.fail_on_termination = fail_on_termination
+        self.events = []
+        self.flushed_events = None
+
+    def do(self, x):
+        self.events.append(x)
+        return x
+
+    def on_termination(self):
+        self.flushed_events = list(self.events)
+        if self.fail_on_termination:
+            raise RuntimeError("failed to flush")
+
+
 class Message(BaseClass):
     def __init__(self, msg="", context=None, name=None):
         self.msg = msg
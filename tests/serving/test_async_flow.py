@@ -64,6 +64,35 @@ def test_async_basic():
     }, "flow didnt visit expected states"
 
 
+@pytest.mark.parametrize(
+    "terminating, fail_on_termination", [(True, False), (True, True), (False, False)]
+)
+def test_async_step_on_termination(monkeypatch, terminating, fail_on_termination):
+    if terminating:
+        monkeypatch.setattr(
+            mlrun.serving.states,
+            "_terminating_step_classes",
+            ["tests.serving.demo_states.BufferingStep"],
+        )
+    function = mlrun.new_function("tests", kind="serving")
+    flow = function.set_topology("flow", engine="async")
+    flow.to(
+        name="s1",
+        class_name="BufferingStep",
+        fail_on_termination=fail_on_termination,
+    ).respond()
+
+    server = function.to_mock_server()
+    server.test(body=1)
+    server.test(body=2)
+    step = server.graph["s1"]._object
+    assert step.flushed_events is None
+
+    # a failing hook is logged, and does not fail the termination of the flow
+    server.wait_for_completion()
+    assert step.flushed_events == ([1, 2] if terminating else None)
+
+
 def test_async_error_on_missing_function_parameter():
     function = mlrun.new_function("tests", kind="serving")
     flow = function.set_topology("flow", engine="async")
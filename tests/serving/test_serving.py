@@ -17,6 +17,7 @@ import os
 import pathlib
 import time
 
+import numpy as np
 import pandas as pd
 import pytest
 from nuclio_sdk import Context as NuclioContext
@@ -25,7 +26,7 @@ from sklearn.datasets import load_iris
 import mlrun
 from mlrun.runtimes import nuclio_init_hook
 from mlrun.runtimes.nuclio.serving import serving_subkind
-from mlrun.serving import V2ModelServer
+from mlrun.serving import V2ModelServer, binary_tensors
 from mlrun.serving.server import (
     GraphContext,
     MockEvent,
@@ -439,6 +440,42 @@ def test_v2_infer():
     run_model("m3/versions/v2", 2000)
 
 
+def test_v2_infer_binary():
+    context = init_ctx()
+    inputs = np.array([[5, 6], [7, 8]], dtype=np.float32)
+    body, header_length = binary_tensors.encode_request({"id": "1", "inputs": inputs})
+    event = MockEvent(
+        body,
+        content_type=binary_tensors.content_type,
+        headers={binary_tensors.header_length_key: str(header_length)},
+        path="/v2/models/m1/infer",
+    )
+    resp = context.mlrun_handler(context, event)
+    assert resp.content_type == binary_tensors.content_type
+    data = binary_tensors.decode_response(
+        resp.body, int(resp.headers[binary_tensors.header_length_key])
+    )
+    assert data["id"] == "1"
+    assert data["outputs"].dtype == np.float32
+    np.testing.assert_array_equal(data["outputs"], [500, 600])
+
+
+def test_binary_tensors_decoding():
+    arrays = [np.arange(6, dtype=np.int64).reshape(2, 3), np.array([True, False])]
+    body, header_length = binary_tensors.encode_request({"inputs": arrays})
+    request = binary_tensors.decode_request(body, header_length)
+    for decoded, array in zip(request["inputs"], arrays):
+        np.testing.assert_array_equal(decoded, array)
+        assert decoded.dtype == array.dtype
+        # the arrays are views over the request body
+        assert not decoded.flags.owndata
+
+    # outputs that are not numeric are kept in the JSON header
+    body, header_length = binary_tensors.encode_response({"outputs": ["a", "b"]})
+    assert len(body) == header_length
+    assert binary_tensors.decode_response(body, header_length)["outputs"] == ["a", "b"]
+
+
 def test_v2_stream_mode():
     # model and operation are specified inside the message body
     context = init_ctx()
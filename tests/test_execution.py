@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import datetime
+import json
+import os
 import unittest.mock
 
 import numpy as np
@@ -256,6 +258,35 @@ def test_artifact_owner(rundb_mock, owner):
     assert artifact.producer.get("owner") == owner
 
 
+def test_context_tmpfile_journal(rundb_mock, tmp_path):
+    tmpfile = str(tmp_path / "run.json")
+    context = mlrun.MLClientCtx.from_dict(_generate_run_dict(), tmp=tmpfile)
+    context.set_state("running", commit=False)
+
+    context.log_result("accuracy", 0.8)
+    context.log_results({"accuracy": 0.9, "loss": 0.1})
+    context.get_param("p3", "default")
+
+    # the updates are journaled and applied on top of the run when it is read
+    assert os.path.isfile(f"{tmpfile}.journal")
+    run = mlrun.execution.read_run_tmpfile(tmpfile)
+    assert run["status"]["results"] == {"accuracy": 0.9, "loss": 0.1}
+    assert run["spec"]["parameters"]["p3"] == "default"
+    assert run["metadata"]["name"] == "test-context-from-run-dict"
+
+    # the journal is compacted on commit
+    context.commit(completed=True)
+    assert not os.path.isfile(f"{tmpfile}.journal")
+    assert mlrun.execution.read_run_tmpfile(tmpfile) == json.loads(open(tmpfile).read())
+    assert mlrun.execution.read_run_tmpfile(tmpfile)["status"]["results"] == {
+        "accuracy": 0.9,
+        "loss": 0.1,
+    }
+
+    mlrun.execution.remove_run_tmpfile(tmpfile)
+    assert mlrun.execution.read_run_tmpfile(tmpfile) is None
+
+
 def _generate_run_dict():
     return {
         "metadata": {
@@ -14,6 +14,9 @@
 #
 import dataclasses
 import datetime
+import json
+import logging
+import threading
 from collections.abc import Generator
 from io import StringIO
 
@@ -22,7 +25,14 @@ import pytest
 
 import mlrun
 from mlrun.utils.helpers import now_date
-from mlrun.utils.logger import FormatterKinds, Logger, create_logger
+from mlrun.utils.logger import (
+    FormatterKinds,
+    JSONFormatter,
+    LazyField,
+    Logger,
+    QueueHandler,
+    create_logger,
+)
 
 
 class ArbitraryClassForLogging:
@@ -148,6 +158,97 @@ def test_exception_with_stack(make_stream_logger):
     assert "This is just a test" in stream.getvalue()
 
 
+def test_lazy_field(make_stream_logger):
+    stream, test_logger = make_stream_logger
+    calls = []
+
+    def render():
+        calls.append(1)
+        return {"rendered": "value"}
+
+    test_logger.set_logger_level("INFO")
+    test_logger.debug("Disabled", field=LazyField(render))
+    assert not calls
+    assert "Disabled" not in stream.getvalue()
+
+    test_logger.info("Enabled", field=LazyField(render))
+    assert len(calls) == 1
+    assert "rendered" in stream.getvalue()
+
+
+def test_queue_handler(make_stream_logger):
+    stream, test_logger = make_stream_logger
+    queue_handler = test_logger.set_queue_handler(max_size=100)
+    for i in range(10):
+        test_logger.info(f"Queued {i}", field=LazyField(lambda: "rendered"))
+    queue_handler.close()
+
+    log = stream.getvalue()
+    assert all(f"Queued {i}" in log for i in range(10))
+    assert log.count("rendered") == 10
+    assert queue_handler.enqueued == 10 and queue_handler.dropped == 0
+    # the default handler is still reachable behind the queue
+    assert test_logger.get_handler("default").stream is stream
+
+
+def test_queue_handler_renders_fields_on_log_call():
+    class BlockingHandler(logging.Handler):
+        def __init__(self):
+            super().__init__()
+            self.unblock = threading.Event()
+
+        def handle(self, record):
+            self.unblock.wait()
+            return super().handle(record)
+
+        def emit(self, record):
+            pass
+
+    stream = StringIO()
+    handler = BlockingHandler()
+    stream_handler = logging.StreamHandler(stream)
+    stream_handler.setFormatter(JSONFormatter())
+    queue_handler = QueueHandler([handler, stream_handler], max_size=10)
+    test_logger = Logger("DEBUG", name="test-queue-render-logger", propagate=False)
+    test_logger._logger.addHandler(queue_handler)
+    event = {"state": "before"}
+    test_logger.info("Logged event", event=event)
+    # the listener waits while the logged object is changed by the caller
+    event["state"] = "after"
+    handler.unblock.set()
+    queue_handler.close()
+    test_logger._logger.removeHandler(queue_handler)
+
+    assert json.loads(stream.getvalue())["with"] == {"event": {"state": "before"}}
+
+
+def test_queue_handler_drops_when_full():
+    class BlockingHandler(logging.Handler):
+        def __init__(self):
+            super().__init__()
+            self.unblock = threading.Event()
+            self.records = []
+
+        def emit(self, record):
+            self.unblock.wait()
+            self.records.append(record)
+
+    handler = BlockingHandler()
+    queue_handler = QueueHandler([handler], max_size=2)
+    test_logger = Logger("DEBUG", name="test-queue-logger", propagate=False)
+    test_logger._logger.addHandler(queue_handler)
+    for i in range(10):
+        test_logger.info(f"Queued {i}")
+    handler.unblock.set()
+    queue_handler.close()
+    test_logger._logger.removeHandler(queue_handler)
+
+    # the first record is held by the blocked handler, two wait in the queue, the rest are dropped
+    assert queue_handler.dropped >= 10 - 3
+    assert queue_handler.enqueued + queue_handler.dropped == 10
+    assert len(handler.records) == queue_handler.enqueued
+
+
 # Regression test for duplicate logs bug fixed in PR #3381
 def test_redundant_logger_creation():
     stream = StringIO()
@@ -26,6 +26,7 @@ import mlrun.common.schemas.notification
 import mlrun.utils.notifications
 import mlrun.utils.notifications.notification.mail as mail
 from mlrun.utils import logger
+from mlrun.utils.notifications.notification.transport import NotificationTransport
 from mlrun.utils.notifications.notification.webhook import WebhookNotification
 
 
@@ -938,6 +939,102 @@ def test_enrich_unmasked_secret_params_from_project_secret(
             assert notification.secret_params == expected_params
 
 
+async def test_slack_notifications_batched(httpserver):
+    httpserver.expect_request("/slack-webhook", method="POST").respond_with_data("ok")
+    webhook = httpserver.url_for("/slack-webhook")
+    notifications = [
+        mlrun.utils.notifications.slack.SlackNotification(
+            f"slack-{index}", {"webhook": webhook}
+        )
+        for index in range(3)
+    ]
+
+    await asyncio.gather(
+        *[notification.push("test-message", "info") for notification in notifications]
+    )
+    await NotificationTransport().close()
+
+    # the notifications to the same webhook are sent as a single message
+    assert len(httpserver.log) == 1
+    blocks = httpserver.log[0][0].get_json()["blocks"]
+    assert [block["type"] for block in blocks] == [
+        "header",
+        "section",
+        "divider",
+        "header",
+        "section",
+        "divider",
+        "header",
+        "section",
+    ]
+
+
+@pytest.mark.parametrize(
+    "messages_blocks_count, expected_merged",
+    [
+        ([1], [(1, 1)]),
+        ([2, 3], [(6, 2)]),
+        ([30, 30, 10], [(30, 1), (41, 2)]),
+        ([60, 1], [(60, 1), (1, 1)]),
+    ],
+)
+def test_merge_slack_data(messages_blocks_count, expected_merged):
+    messages_data = [
+        {"blocks": [{"type": "section"}] * blocks_count}
+        for blocks_count in messages_blocks_count
+    ]
+    merged = mlrun.utils.notifications.slack.SlackNotification._merge_slack_data(
+        messages_data
+    )
+    assert [(len(data["blocks"]), count) for data, count in merged] == expected_merged
+
+
+async def test_webhook_notification_retry(httpserver, monkeypatch):
+    monkeypatch.setattr(mlrun.mlconf.notifications.transport, "retry_backoff", 0)
+    httpserver.expect_ordered_request("/webhook").respond_with_data(status=503)
+    httpserver.expect_ordered_request("/webhook").respond_with_data("ok")
+    webhook_notification = WebhookNotification(
+        "webhook", {"url": httpserver.url_for("/webhook")}
+    )
+
+    await webhook_notification.push("test-message", "info")
+    await NotificationTransport().close()
+
+    assert len(httpserver.log) == 2
+    httpserver.check_assertions()
+
+
+async def test_webhook_notification_retries_exhausted(httpserver, monkeypatch):
+    monkeypatch.setattr(mlrun.mlconf.notifications.transport, "retry_backoff", 0)
+    monkeypatch.setattr(mlrun.mlconf.notifications.transport, "max_retries", 1)
+    httpserver.expect_request("/webhook").respond_with_data(status=500)
+    webhook_notification = WebhookNotification(
+        "webhook", {"url": httpserver.url_for("/webhook")}
+    )
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        await webhook_notification.push("test-message", "info")
+    await NotificationTransport().close()
+
+    assert len(httpserver.log) == 2
+
+
+def test_notification_transport_outlives_event_loops(httpserver):
+    httpserver.expect_request("/webhook").respond_with_data("ok")
+    transport = NotificationTransport()
+    sessions = []
+    for _ in range(2):
+        # each push runs on an event loop that is closed once it is done
+        asyncio.run(transport.send("post", httpserver.url_for("/webhook"), json={}))
+        sessions.append(transport._session)
+
+    # the requests run on the transport's event loop, with a single session
+    assert len(httpserver.log) == 2
+    assert sessions[0] is sessions[1] and not sessions[0].closed
+    transport.stop()
+    assert sessions[0].closed
+
+
 def _mock_async_response(monkeypatch, method, result):
     response_json_future = asyncio.Future()
     response_json_future.set_result(result)